@@ -0,0 +1,75 @@
+"""
+App State - remembers where the user was (tournament, round, window) between runs.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict
+
+STATE_KEY = '_app_state'  # Internal key in app_settings when stored in the settings database
+
+
+def write_atomic(path: str, text: str) -> None:
+    """
+    Replace `path` with `text` so readers see either the old or the new
+    file, never a half-written one (temp file in the same folder, fsync,
+    os.replace).
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _parse(text: str) -> Dict[str, Any]:
+    try:
+        state = json.loads(text)
+    except ValueError:
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+class AppStateStore:
+    """
+    Reads and writes the app state dict, in a JSON file or in the settings
+    database (`storage` is 'file' or 'settings').
+
+    load() never raises: a missing, unreadable, truncated or foreign file
+    yields {}, and callers check each value themselves.
+    When the settings database holds no state yet, load() falls back to the
+    file, so switching storage keeps the last session.
+    """
+
+    def __init__(self, path: str, settings_manager, storage: str = 'file'):
+        self.path = path
+        self.settings_manager = settings_manager
+        self.storage = storage
+
+    def load(self) -> Dict[str, Any]:
+        if self.storage == 'settings':
+            stored = self.settings_manager.get_internal(STATE_KEY)
+            if stored:
+                return _parse(stored)
+        try:
+            with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+                return _parse(f.read())
+        except OSError:
+            return {}
+
+    def save(self, state: Dict[str, Any]) -> None:
+        text = json.dumps(state, sort_keys=True)
+        if self.storage == 'settings':
+            self.settings_manager.set_internal(STATE_KEY, text)
+        else:
+            write_atomic(self.path, text)
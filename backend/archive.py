@@ -0,0 +1,234 @@
+"""
+Tournament Archive - moves finished tournaments out of the working database.
+"""
+
+import json
+import lzma
+import os
+import shutil
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .database import Database
+
+FORMAT = 1
+
+# Rows of one tournament, per table: (table, WHERE clause selecting them)
+_TOURNAMENT_ROWS = (
+    ('tournaments', "id = :tid"),
+    ('players', "tournament_id = :tid"),
+    ('rounds', "tournament_id = :tid"),
+    ('pairings', "round_id IN (SELECT id FROM rounds WHERE tournament_id = :tid)"),
+    ('games', "tournament_id = :tid"),  # Only in databases that have game scores (GameStore)
+)
+
+_INDEX_COLUMNS = ('id', 'name', 'type', 'status', 'created_at', 'venue', 'total_rounds', 'current_round',
+                  'player_count', 'archived_at')
+
+
+def _has_table(conn, table: str) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+
+def default_archive_path(db_path: str) -> str:
+    root, _ = os.path.splitext(db_path)
+    return root + "_archive.db"
+
+
+class TournamentArchive:
+    """
+    Archive of finished tournaments in a separate database file.
+
+    Each archived tournament is one lzma-compressed row in the archive file
+    holding all its tournament, player, round, pairing and game rows. The working
+    database keeps only a small `archived_tournaments` index for listing.
+    open() materializes one archived tournament into a temporary database
+    with the normal schema, so reports and clone read it like a live one.
+    """
+
+    def __init__(self, db: Database, archive_path: Optional[str] = None):
+        self.db = db
+        self.archive_path = archive_path or default_archive_path(db.db_path)
+        self._init_tables()
+
+    def _init_tables(self) -> None:
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS archived_tournaments (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    status TEXT,
+                    created_at TIMESTAMP,
+                    venue TEXT,
+                    total_rounds INTEGER,
+                    current_round INTEGER,
+                    player_count INTEGER,
+                    archived_at TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_archived_created ON archived_tournaments(created_at)"
+            )
+
+    @contextmanager
+    def _archive_connection(self, readonly: bool = False):
+        if readonly:
+            conn = sqlite3.connect(f"file:{self.archive_path}?mode=ro", uri=True)
+        else:
+            conn = sqlite3.connect(self.archive_path)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS archive (
+                    tournament_id INTEGER PRIMARY KEY,
+                    format INTEGER NOT NULL,
+                    payload BLOB NOT NULL
+                )
+            """)
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    # --- Queries ---
+
+    def list(self) -> List[Dict]:
+        """Archived tournaments, newest first (reads only the working database)."""
+        rows = self.db.execute_query(
+            f"SELECT {', '.join(_INDEX_COLUMNS)} FROM archived_tournaments ORDER BY created_at DESC"
+        )
+        return [dict(zip(_INDEX_COLUMNS, row)) for row in rows]
+
+    def contains(self, tournament_id: int) -> bool:
+        return bool(self.db.execute_query(
+            "SELECT 1 FROM archived_tournaments WHERE id = ?", (tournament_id,)
+        ))
+
+    def load(self, tournament_id: int) -> Dict:
+        """
+        Decompressed rows of an archived tournament:
+        {table: {'columns': [...], 'rows': [[...], ...]}}
+
+        Raises:
+            ValueError: If the tournament isn't in the archive
+        """
+        if not os.path.exists(self.archive_path):
+            raise ValueError(f"Tournament {tournament_id} is not archived")
+        with self._archive_connection(readonly=True) as conn:
+            row = conn.execute(
+                "SELECT format, payload FROM archive WHERE tournament_id = ?", (tournament_id,)
+            ).fetchone()
+        if not row:
+            raise ValueError(f"Tournament {tournament_id} is not archived")
+        if row[0] != FORMAT:
+            raise ValueError(f"Unsupported archive format {row[0]}")
+        return json.loads(lzma.decompress(row[1]))
+
+    @contextmanager
+    def open(self, tournament_id: int) -> Iterator[Database]:
+        """Temporary database holding just this archived tournament (deleted afterwards)."""
+        tables = self.load(tournament_id)
+        folder = tempfile.mkdtemp(prefix="archived_tournament_")
+        try:
+            db = Database(os.path.join(folder, "tournament.db"))
+            with db.get_connection() as conn:
+                # Registry rows stay in the working database
+                conn.execute("PRAGMA foreign_keys = OFF")
+                self._insert(conn, tables)
+            yield db
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    # --- Archiving ---
+
+    def archive(self, tournament_id: int) -> bool:
+        """
+        Move one FINISHED tournament into the archive.
+
+        Returns:
+            False if the tournament doesn't exist or isn't finished
+        """
+        status = self.db.execute_query("SELECT status FROM tournaments WHERE id = ?", (tournament_id,))
+        if not status or status[0][0] != 'FINISHED':
+            return False
+
+        with self.db.get_connection() as conn:
+            tables = {}
+            for table, where in _TOURNAMENT_ROWS:
+                if not _has_table(conn, table):
+                    continue
+                cursor = conn.execute(f"SELECT * FROM {table} WHERE {where}", {'tid': tournament_id})
+                rows = cursor.fetchall()
+                # BLOB columns (compressed game scores) go into the JSON as hex
+                binary = sorted({i for row in rows for i, v in enumerate(row) if isinstance(v, bytes)})
+                if binary:
+                    rows = [[v.hex() if isinstance(v, bytes) else v for v in row] for row in rows]
+                tables[table] = {
+                    'columns': [c[0] for c in cursor.description],
+                    'rows': rows,
+                }
+                if binary:
+                    tables[table]['binary'] = binary
+        payload = lzma.compress(json.dumps(tables, separators=(',', ':')).encode('utf-8'))
+
+        # Written to the archive first: a crash in between leaves the tournament in both places
+        with self._archive_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO archive (tournament_id, format, payload) VALUES (?, ?, ?)",
+                (tournament_id, FORMAT, payload)
+            )
+
+        t = dict(zip(tables['tournaments']['columns'], tables['tournaments']['rows'][0]))
+        with self.db.get_connection() as conn:
+            conn.execute(f"""
+                INSERT OR REPLACE INTO archived_tournaments ({', '.join(_INDEX_COLUMNS)})
+                VALUES ({', '.join('?' * len(_INDEX_COLUMNS))})
+            """, (
+                t['id'], t['name'], t['type'], t['status'], t['created_at'], t.get('venue'),
+                t['total_rounds'], t['current_round'], len(tables['players']['rows']),
+                datetime.now().isoformat()
+            ))
+            conn.execute("DELETE FROM pairings WHERE round_id IN (SELECT id FROM rounds WHERE tournament_id = ?)",
+                         (tournament_id,))
+            conn.execute("DELETE FROM tournaments WHERE id = ?", (tournament_id,))
+        return True
+
+    def archive_finished(self, exclude: Iterable[int] = ()) -> List[int]:
+        """Archive every FINISHED tournament except `exclude`. Returns the archived ids."""
+        skip = set(exclude)
+        ids = [row[0] for row in self.db.execute_query("SELECT id FROM tournaments WHERE status = 'FINISHED'")]
+        return [tid for tid in ids if tid not in skip and self.archive(tid)]
+
+    def restore(self, tournament_id: int) -> None:
+        """Move an archived tournament back into the working database, keeping its ids."""
+        tables = self.load(tournament_id)
+        with self.db.get_connection() as conn:
+            self._insert(conn, tables)
+            conn.execute("DELETE FROM archived_tournaments WHERE id = ?", (tournament_id,))
+        with self._archive_connection() as conn:
+            conn.execute("DELETE FROM archive WHERE tournament_id = ?", (tournament_id,))
+
+    @staticmethod
+    def _insert(conn, tables: Dict) -> None:
+        """Insert archived rows, keeping only columns the target schema still has."""
+        for table, _ in _TOURNAMENT_ROWS:
+            data = tables.get(table)
+            if not data or not data['rows']:
+                continue
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if not existing:
+                continue  # Table not created in this database (e.g. games without a GameStore)
+            keep = [i for i, name in enumerate(data['columns']) if name in existing]
+            columns = ', '.join(data['columns'][i] for i in keep)
+            binary = set(data.get('binary', ()))
+            conn.executemany(
+                f"INSERT INTO {table} ({columns}) VALUES ({', '.join('?' * len(keep))})",
+                ([bytes.fromhex(row[i]) if i in binary and row[i] is not None else row[i] for i in keep]
+                 for row in data['rows'])
+            )
@@ -0,0 +1,135 @@
+"""
+Async Database - runs database work off the GUI thread.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .database import Database
+from .instrumentation import timed
+
+
+class AsyncDatabase:
+    """
+    Facade that runs database calls on worker threads and returns futures.
+
+    Writes run one at a time on a dedicated writer thread, in submission
+    order. Reads run on a small reader pool. Reads and writes may carry a
+    `key` (the tournament id): a keyed operation starts only after every
+    earlier read or write with the same key has finished, so a read sees
+    the writes before it and a write never lands under an earlier read.
+    Different keys don't wait on each other.
+
+    The futures are concurrent.futures.Future objects; use
+    asyncio.wrap_future() to await them, or add_done_callback() and a Qt
+    signal to get the result back on the GUI thread.
+    """
+
+    def __init__(self, db: Database, readers: int = 2):
+        self.db = db
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="db-reader")
+        self._tails: Dict[Hashable, Future] = {}  # Last submitted operation per key
+        self._last_write: Optional[Future] = None
+        self._lock = threading.RLock()
+
+    # --- Submission ---
+
+    def write(self, fn: Callable[..., Any], *args, key: Optional[Hashable] = None) -> Future:
+        """Run fn(*args) on the writer thread, after earlier writes and operations with the same key."""
+        fn = self._timed(fn)
+        with self._lock:
+            prior = [self._last_write, self._tails.get(key) if key is not None else None]
+            future = self._submit(self._writer, fn, args, prior)
+            self._last_write = future
+            if key is not None:
+                self._track(key, future)
+        return future
+
+    def read(self, fn: Callable[..., Any], *args, key: Optional[Hashable] = None) -> Future:
+        """Run fn(*args) on the reader pool, after earlier operations with the same key."""
+        fn = self._timed(fn)
+        with self._lock:
+            prior = [self._tails.get(key) if key is not None else None]
+            future = self._submit(self._readers, fn, args, prior)
+            if key is not None:
+                self._track(key, future)
+        return future
+
+    def query(self, sql: str, params=(), key: Optional[Hashable] = None) -> Future:
+        """execute_query on the reader pool; resolves to the fetched rows."""
+        return self.read(self.db.execute_query, sql, params, key=key)
+
+    def execute(self, sql: str, params=(), key: Optional[Hashable] = None) -> Future:
+        """execute_non_query on the writer thread; resolves to lastrowid."""
+        return self.write(self.db.execute_non_query, sql, params, key=key)
+
+    # --- Lifecycle ---
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until all writes submitted so far have finished."""
+        last = self._last_write
+        if last is not None:
+            try:
+                last.result(timeout)
+            except Exception:
+                pass  # Errors belong to whoever submitted the write
+
+    def close(self) -> None:
+        """Finish queued work and stop the threads."""
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+
+    # --- Internals ---
+
+    @staticmethod
+    def _timed(fn):
+        """Record the job as its own action (see backend.instrumentation)."""
+        return timed(f"async:{getattr(fn, '__name__', 'job')}", fn)
+
+    def _submit(self, pool: ThreadPoolExecutor, fn, args, prior) -> Future:
+        """Submit fn to `pool` now, or once every unfinished future in `prior` is done."""
+        pending = [f for f in prior if f is not None and not f.done()]
+        if not pending:
+            return pool.submit(fn, *args)
+        future = Future()
+        waiting = [len(pending)]
+
+        def ready(_):
+            with self._lock:
+                waiting[0] -= 1
+                if waiting[0]:
+                    return
+            self._start(future, pool, fn, args)
+        for f in pending:
+            f.add_done_callback(ready)
+        return future
+
+    def _start(self, future: Future, pool: ThreadPoolExecutor, fn, args) -> None:
+        """Run deferred work on its pool and copy its outcome into `future`."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            inner = pool.submit(fn, *args)
+        except RuntimeError as e:  # Pool shut down
+            future.set_exception(e)
+            return
+        inner.add_done_callback(lambda f: self._copy(f, future))
+
+    @staticmethod
+    def _copy(source: Future, target: Future) -> None:
+        exc = source.exception()
+        if exc is not None:
+            target.set_exception(exc)
+        else:
+            target.set_result(source.result())
+
+    def _track(self, key: Hashable, future: Future) -> None:
+        self._tails[key] = future
+
+        def forget(f, key=key):
+            with self._lock:
+                if self._tails.get(key) is f:
+                    del self._tails[key]
+        future.add_done_callback(forget)
@@ -0,0 +1,147 @@
+"""
+Backup Catalog - JSON manifest describing every backup in a folder.
+"""
+
+import json
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class BackupCatalog:
+    """
+    Manifest of the backups in one folder.
+
+    Keeps size, checksum, schema version, tournament counts and cached
+    validation results per file, so listing backups needs no directory scan
+    or database access. The manifest is reconciled with the folder only when
+    the folder's modification time changes (e.g. files copied in by hand).
+    """
+
+    FILENAME = "catalog.json"
+    VERSION = 1
+
+    def __init__(self, backup_folder: str):
+        self.backup_folder = backup_folder
+        self.path = os.path.join(backup_folder, self.FILENAME)
+        self._entries: Dict[str, Dict] = {}
+        self._file_mtime = None
+        self._dir_mtime = None
+        self._lock = threading.RLock()
+
+    # --- Persistence ---
+
+    def _load(self) -> None:
+        """(Re)load the manifest if it changed on disk."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime == self._file_mtime:
+            return
+
+        entries = {}
+        if mtime is not None:
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION:
+                    entries = data.get('backups', {})
+            except (OSError, ValueError):
+                entries = {}  # Corrupt manifest: rebuilt by refresh()
+        self._entries = entries
+        self._file_mtime = mtime
+        self._dir_mtime = None
+
+    def _save(self) -> None:
+        os.makedirs(self.backup_folder, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.VERSION, 'backups': self._entries}, f, indent=1)
+        os.replace(tmp_path, self.path)
+        self._file_mtime = os.stat(self.path).st_mtime_ns
+        self._dir_mtime = os.stat(self.backup_folder).st_mtime_ns
+
+    # --- Queries ---
+
+    def refresh(self, kind_of: Callable[[str], Optional[str]],
+                describe: Callable[[str, str], Dict]) -> None:
+        """
+        Reconcile with the folder if files were added or removed behind our back.
+
+        Args:
+            kind_of: Returns the backup kind of a filename, or None if not a backup
+            describe: Builds a minimal entry for an uncatalogued file (filename, kind)
+        """
+        with self._lock:
+            self._load()
+            try:
+                dir_mtime = os.stat(self.backup_folder).st_mtime_ns
+            except OSError:
+                self._entries = {}
+                return
+            if dir_mtime == self._dir_mtime:
+                return
+
+            on_disk = {name: kind_of(name) for name in os.listdir(self.backup_folder)}
+            on_disk = {name: kind for name, kind in on_disk.items() if kind}
+
+            changed = False
+            for name in list(self._entries):
+                if name not in on_disk:
+                    del self._entries[name]
+                    changed = True
+            for name, kind in on_disk.items():
+                if name not in self._entries:
+                    self._entries[name] = describe(name, kind)
+                    changed = True
+
+            if changed:
+                self._save()
+            else:
+                self._dir_mtime = dir_mtime
+
+    def entries(self) -> List[Dict]:
+        with self._lock:
+            return [dict(entry, filename=name) for name, entry in self._entries.items()]
+
+    def get(self, filename: str) -> Optional[Dict]:
+        with self._lock:
+            self._load()
+            entry = self._entries.get(filename)
+            return dict(entry) if entry else None
+
+    def cached(self, filename: str, field: str) -> Optional[bool]:
+        """
+        Return a cached check result if the file is unchanged since it was recorded.
+        """
+        entry = self.get(filename)
+        if not entry or entry.get(field) is None:
+            return None
+        try:
+            st = os.stat(os.path.join(self.backup_folder, filename))
+        except OSError:
+            return None
+        if st.st_size != entry.get('size_bytes') or st.st_mtime_ns != entry.get('mtime_ns'):
+            return None
+        return entry[field]
+
+    # --- Updates ---
+
+    def put(self, filename: str, **fields) -> None:
+        """Create or update an entry."""
+        with self._lock:
+            self._load()
+            entry = self._entries.setdefault(filename, {})
+            entry.update(fields)
+            self._save()
+
+    def remove(self, filenames: Iterable[str]) -> None:
+        with self._lock:
+            self._load()
+            removed = False
+            for name in filenames:
+                if self._entries.pop(name, None) is not None:
+                    removed = True
+            if removed:
+                self._save()
@@ -0,0 +1,302 @@
+"""
+Backup Chain - Compressed snapshots and page-level incremental backups.
+"""
+
+import base64
+import functools
+import glob
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import re
+import shutil
+import sqlite3
+import struct
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# compression name -> (file suffix, opener)
+COMPRESSORS = {
+    'gzip': ('.gz', functools.partial(gzip.open, compresslevel=6)),
+    'lzma': ('.xz', lzma.open),
+}
+
+
+class BackupChainStore:
+    """
+    Stores a compressed full snapshot followed by page-level deltas.
+
+    Each chain is described by a small `<snapshot>.chain.json` file holding
+    the ordered list of deltas and a hash per database page of the latest
+    state. A new incremental backup only writes pages whose hash changed;
+    restoring any point replays the snapshot plus deltas up to that point.
+    """
+
+    SNAPSHOT_EXTENSION = ".db"
+    DELTA_EXTENSION = ".delta"
+    CHAIN_EXTENSION = ".chain.json"
+    HASH_SIZE = 8
+    PAGE_HEADER = struct.Struct(">I")
+
+    def __init__(self, compression: str = 'lzma', max_deltas: int = 20):
+        if compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.compression = compression
+        self.max_deltas = max_deltas
+        self._members: Dict[str, Tuple[Tuple[int, int, int], Set[str]]] = {}  # chain path -> (stat, files)
+        self._members_lock = threading.Lock()
+
+    # Chain base name and its optional same-second suffix ("..._2")
+    SEQUENCE = re.compile(r'^(.*?)(?:_(\d+))?$')
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _opener(filename: str):
+        for suffix, opener in COMPRESSORS.values():
+            if filename.endswith(suffix):
+                return opener
+        raise ValueError(f"Not a compressed backup: {filename}")
+
+    @staticmethod
+    def _page_size(db_file: str) -> int:
+        conn = sqlite3.connect(db_file)
+        try:
+            return conn.execute("PRAGMA page_size").fetchone()[0]
+        finally:
+            conn.close()
+
+    def _page_hashes(self, db_file: str, page_size: int) -> bytes:
+        hashes = bytearray()
+        with open(db_file, 'rb') as f:
+            while True:
+                page = f.read(page_size)
+                if not page:
+                    break
+                hashes += hashlib.blake2b(page, digest_size=self.HASH_SIZE).digest()
+        return bytes(hashes)
+
+    @staticmethod
+    def _read_chain(chain_path: str) -> Dict:
+        with open(chain_path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_chain(chain_path: str, chain: Dict) -> None:
+        tmp_path = chain_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(chain, f)
+        os.replace(tmp_path, chain_path)
+
+    def _chain_order(self, chain_path: str) -> Tuple[str, int]:
+        """Sort key: timestamped base name, then the same-second suffix as a number (_2 before _10)."""
+        name = os.path.basename(chain_path)[:-len(self.CHAIN_EXTENSION)]
+        base, sequence = self.SEQUENCE.match(name).groups()
+        return base, int(sequence or 0)
+
+    def chain_paths(self, backup_folder: str) -> List[str]:
+        """All chain descriptors in the folder, oldest first."""
+        return sorted(glob.glob(os.path.join(glob.escape(backup_folder), "*" + self.CHAIN_EXTENSION)),
+                      key=self._chain_order)
+
+    def is_chain_file(self, filename: str) -> bool:
+        return any(
+            filename.endswith(ext + suffix)
+            for ext in (self.SNAPSHOT_EXTENSION, self.DELTA_EXTENSION)
+            for suffix, _ in COMPRESSORS.values()
+        )
+
+    def find_chain(self, backup_file: str) -> Optional[str]:
+        """Return the chain descriptor containing a snapshot or delta file."""
+        folder, filename = os.path.split(backup_file)
+        for chain_path in self.chain_paths(folder):
+            if filename in self._chain_members(chain_path):
+                return chain_path
+        return None
+
+    def _chain_members(self, chain_path: str) -> Set[str]:
+        """Snapshot and delta names of a chain, re-read only when its descriptor changed."""
+        try:
+            st = os.stat(chain_path)
+        except OSError:
+            return set()
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)  # Rewrites replace the file
+        with self._members_lock:
+            cached = self._members.get(chain_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        chain = self._read_chain(chain_path)
+        members = {chain['snapshot'], *chain['deltas']}
+        with self._members_lock:
+            self._members[chain_path] = (stamp, members)
+        return members
+
+    # --- Writing ---
+
+    def _compressor(self, compression: Optional[str]):
+        compression = compression or self.compression
+        if compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression: {compression}")
+        return COMPRESSORS[compression]
+
+    def write_snapshot(self, copy_path: str, backup_folder: str, base_name: str,
+                       compression: Optional[str] = None) -> str:
+        """Compress a consistent database copy into a new chain (`compression` overrides the default)."""
+        suffix, opener = self._compressor(compression)
+        filename = base_name + self.SNAPSHOT_EXTENSION + suffix
+        target = os.path.join(backup_folder, filename)
+
+        with open(copy_path, 'rb') as src, opener(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
+        page_size = self._page_size(copy_path)
+        self._write_chain(os.path.join(backup_folder, base_name + self.CHAIN_EXTENSION), {
+            'snapshot': filename,
+            'page_size': page_size,
+            'deltas': [],
+            'hashes': base64.b64encode(self._page_hashes(copy_path, page_size)).decode('ascii'),
+            'created_at': datetime.now().isoformat()
+        })
+        return target
+
+    def write_incremental(self, copy_path: str, backup_folder: str, base_name: str,
+                          compression: Optional[str] = None) -> str:
+        """
+        Write only the pages changed since the latest backup in the newest chain.
+
+        Starts a new chain (compressed snapshot) when there is none, when the
+        page size changed, or when the chain already holds `max_deltas` deltas.
+        """
+        chains = self.chain_paths(backup_folder)
+        page_size = self._page_size(copy_path)
+        if not chains:
+            return self.write_snapshot(copy_path, backup_folder, base_name, compression)
+
+        chain_path = chains[-1]
+        chain = self._read_chain(chain_path)
+        if chain['page_size'] != page_size or len(chain['deltas']) >= self.max_deltas:
+            return self.write_snapshot(copy_path, backup_folder, base_name, compression)
+
+        old_hashes = base64.b64decode(chain['hashes'])
+        new_hashes = self._page_hashes(copy_path, page_size)
+        page_count = len(new_hashes) // self.HASH_SIZE
+
+        suffix, opener = self._compressor(compression)
+        filename = base_name + self.DELTA_EXTENSION + suffix
+        target = os.path.join(backup_folder, filename)
+
+        header = {'page_size': page_size, 'page_count': page_count}
+        with open(copy_path, 'rb') as src, opener(target, 'wb') as dst:
+            dst.write(json.dumps(header).encode('utf-8') + b"\n")
+            h = self.HASH_SIZE
+            for pgno in range(page_count):
+                if new_hashes[pgno * h:(pgno + 1) * h] == old_hashes[pgno * h:(pgno + 1) * h]:
+                    continue
+                src.seek(pgno * page_size)
+                dst.write(self.PAGE_HEADER.pack(pgno))
+                dst.write(src.read(page_size))
+
+        chain['deltas'].append(filename)
+        chain['hashes'] = base64.b64encode(new_hashes).decode('ascii')
+        self._write_chain(chain_path, chain)
+        return target
+
+    # --- Reading ---
+
+    def _apply_delta(self, delta_path: str, target) -> None:
+        with self._opener(delta_path)(delta_path, 'rb') as src:
+            header = json.loads(src.readline())
+            page_size = header['page_size']
+            record = self.PAGE_HEADER.size + page_size
+            while True:
+                chunk = src.read(record)
+                if len(chunk) < record:
+                    break
+                pgno = self.PAGE_HEADER.unpack_from(chunk)[0]
+                target.seek(pgno * page_size)
+                target.write(chunk[self.PAGE_HEADER.size:])
+            target.truncate(header['page_count'] * page_size)
+
+    def reconstruct(self, backup_file: str, target_path: str) -> str:
+        """
+        Rebuild the database as of `backup_file` into `target_path`.
+
+        Raises:
+            ValueError: If the file is not part of a known chain
+        """
+        chain_path = self.find_chain(backup_file)
+        if not chain_path:
+            raise ValueError(f"Backup is not part of a chain: {backup_file}")
+
+        folder, filename = os.path.split(backup_file)
+        chain = self._read_chain(chain_path)
+        snapshot = os.path.join(folder, chain['snapshot'])
+
+        with self._opener(snapshot)(snapshot, 'rb') as src, open(target_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
+        if filename != chain['snapshot']:
+            with open(target_path, 'r+b') as dst:
+                for delta in chain['deltas']:
+                    self._apply_delta(os.path.join(folder, delta), dst)
+                    if delta == filename:
+                        break
+        return target_path
+
+    # --- Retention ---
+
+    def prune(self, backup_folder: str, keep_chains: int) -> List[str]:
+        """Delete whole chains beyond the newest `keep_chains`. Returns removed files."""
+        removed = []
+        chains = self.chain_paths(backup_folder)
+        for chain_path in chains[:max(0, len(chains) - max(1, keep_chains))]:
+            chain = self._read_chain(chain_path)
+            for filename in [chain['snapshot']] + chain['deltas']:
+                path = os.path.join(backup_folder, filename)
+                if os.path.exists(path):
+                    os.remove(path)
+                    removed.append(path)
+            os.remove(chain_path)
+        return removed
+
+    def delete_file(self, backup_file: str) -> None:
+        """
+        Delete a chain member. Removing a snapshot or delta invalidates
+        everything after it, so the rest of the chain is removed as well.
+        """
+        chain_path = self.find_chain(backup_file)
+        if not chain_path:
+            if os.path.exists(backup_file):
+                os.remove(backup_file)
+            return
+
+        folder, filename = os.path.split(backup_file)
+        chain = self._read_chain(chain_path)
+        if filename == chain['snapshot']:
+            doomed = [chain['snapshot']] + chain['deltas']
+            os.remove(chain_path)
+        else:
+            idx = chain['deltas'].index(filename)
+            doomed = chain['deltas'][idx:]
+            chain['deltas'] = chain['deltas'][:idx]
+            # Re-derive page hashes for the new chain tip
+            tmp_path = os.path.join(folder, ".chain_tip.tmp")
+            tip = chain['deltas'][-1] if chain['deltas'] else chain['snapshot']
+            try:
+                self.reconstruct(os.path.join(folder, tip), tmp_path)
+                chain['hashes'] = base64.b64encode(
+                    self._page_hashes(tmp_path, chain['page_size'])
+                ).decode('ascii')
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self._write_chain(chain_path, chain)
+
+        for name in doomed:
+            path = os.path.join(folder, name)
+            if os.path.exists(path):
+                os.remove(path)
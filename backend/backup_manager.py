@@ -2,13 +2,21 @@
 Backup Manager - Database snapshot utilities.
 """
 
+import hashlib
 import os
 import shutil
 import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from dataclasses import dataclass
 
+from .backup_catalog import BackupCatalog
+from .backup_chain import BackupChainStore
+
+
+class _TooManyRestarts(Exception):
+    """Raised from the progress callback to abandon a stepped copy."""
+
 
 @dataclass
 class BackupInfo:
@@ -18,6 +26,12 @@ class BackupInfo:
     created_at: str
     size_bytes: int
     size_display: str
+    kind: str = 'full'  # 'full', 'snapshot' (compressed), 'delta' (incremental)
+    checksum: Optional[str] = None  # sha256 of the stored file
+    schema_version: Optional[int] = None
+    tournament_count: Optional[int] = None
+    player_count: Optional[int] = None
+    validated: Optional[bool] = None  # None = not checked yet
     
     def to_dict(self) -> dict:
         return {
@@ -25,7 +39,13 @@ class BackupInfo:
             'filepath': self.filepath,
             'created_at': self.created_at,
             'size_bytes': self.size_bytes,
-            'size_display': self.size_display
+            'size_display': self.size_display,
+            'kind': self.kind,
+            'checksum': self.checksum or '',
+            'schema_version': self.schema_version,
+            'tournament_count': self.tournament_count,
+            'player_count': self.player_count,
+            'validated': self.validated
         }
 
 
@@ -36,6 +56,25 @@ class BackupManager:
     
     BACKUP_PREFIX = "backup_"
     BACKUP_EXTENSION = ".db"
+    TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+    MODES = ('full', 'compressed', 'incremental')
+    STEP_PAGES = 64        # pages copied per step when stepping (256 KB at the default page size)
+    STEP_SLEEP = 0.005     # seconds between steps, lets writers in
+    MAX_STEP_RESTARTS = 20 # restarts caused by writers before falling back to a single-step copy
+    
+    REQUIRED_TABLES = {'tournaments', 'players', 'rounds', 'pairings'}
+    RESTORE_LOCK_TIMEOUT = 10.0  # seconds to wait for other writers before restoring
+    
+    def __init__(self, compression: str = 'lzma', max_deltas: int = 20):
+        self.chain_store = BackupChainStore(compression, max_deltas)
+        self._catalogs: Dict[str, BackupCatalog] = {}
+    
+    def catalog(self, backup_folder: str) -> BackupCatalog:
+        """The manifest for a backup folder (one instance per folder)."""
+        key = os.path.abspath(backup_folder)
+        if key not in self._catalogs:
+            self._catalogs[key] = BackupCatalog(key)
+        return self._catalogs[key]
     
     @staticmethod
     def _format_size(size_bytes: int) -> str:
@@ -49,16 +88,145 @@ class BackupManager:
     @staticmethod
     def _generate_backup_filename() -> str:
         """Generate a timestamped backup filename."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        timestamp = datetime.now().strftime(BackupManager.TIMESTAMP_FORMAT)
         return f"{BackupManager.BACKUP_PREFIX}{timestamp}{BackupManager.BACKUP_EXTENSION}"
     
-    def create_backup(self, db_path: str, backup_folder: str) -> str:
+    def _generate_base_name(self, backup_folder: str) -> str:
+        """Timestamped name without extension, suffixed if several backups land in one second."""
+        base = self._generate_backup_filename()[:-len(self.BACKUP_EXTENSION)]
+        candidate, n = base, 1
+        while any(name.startswith(candidate + ".") for name in os.listdir(backup_folder)):
+            candidate = f"{base}_{n}"
+            n += 1
+        return candidate
+    
+    def _kind(self, filename: str) -> Optional[str]:
+        """Backup kind from a filename, or None if it is not a backup."""
+        if not filename.startswith(self.BACKUP_PREFIX):
+            return None
+        if filename.endswith(self.BACKUP_EXTENSION):
+            return 'full'
+        if self.chain_store.is_chain_file(filename):
+            if BackupChainStore.DELTA_EXTENSION + "." in filename:
+                return 'delta'
+            return 'snapshot'
+        return None
+    
+    def _created_at(self, filename: str) -> str:
+        """Creation time from a filename (ignoring any same-second suffix)."""
+        try:
+            timestamp_str = filename[len(self.BACKUP_PREFIX):len(self.BACKUP_PREFIX) + 19]
+            created_dt = datetime.strptime(timestamp_str, self.TIMESTAMP_FORMAT)
+            return created_dt.strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return "Unknown"
+    
+    @staticmethod
+    def _checksum(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _inspect(self, plain_path: str) -> Dict:
+        """Schema version, row counts and table check of a plain SQLite file."""
+        info = {'schema_version': None, 'tournament_count': None, 'player_count': None, 'validated': False}
+        try:
+            conn = sqlite3.connect(plain_path)
+            try:
+                tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+                info['schema_version'] = conn.execute("PRAGMA user_version").fetchone()[0]
+                if self.REQUIRED_TABLES.issubset(tables):
+                    info['tournament_count'] = conn.execute("SELECT COUNT(*) FROM tournaments").fetchone()[0]
+                    info['player_count'] = conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+                    info['validated'] = True
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+        return info
+    
+    def _file_fields(self, path: str) -> Dict:
+        st = os.stat(path)
+        return {'size_bytes': st.st_size, 'mtime_ns': st.st_mtime_ns}
+    
+    def _describe(self, backup_folder: str):
+        """Entry factory for files found in the folder but missing from the catalog."""
+        def describe(filename: str, kind: str) -> Dict:
+            entry = {'kind': kind, 'created_at': self._created_at(filename)}
+            entry.update(self._file_fields(os.path.join(backup_folder, filename)))
+            return entry
+        return describe
+    
+    def _record(self, backup_path: str, kind: str, plain_path: str) -> None:
+        """Add a freshly written backup to its folder's catalog."""
+        folder, filename = os.path.split(backup_path)
+        entry = {
+            'kind': kind,
+            'created_at': self._created_at(filename),
+            'checksum': self._checksum(backup_path),
+        }
+        entry.update(self._file_fields(backup_path))
+        entry.update(self._inspect(plain_path))
+        self.catalog(folder).put(filename, **entry)
+    
+    def _consistent_copy(self, db_path: str, target_path: str, stepped: bool = False,
+                         progress: Optional[Callable[[int, int, int], None]] = None) -> None:
+        """
+        Copy a live database with the SQLite backup API (handles in-progress transactions).
+        
+        When `stepped`, the copy runs STEP_PAGES at a time and releases the
+        source lock between steps, so writers are only held up for one step.
+        If a writer changes the source mid-copy, SQLite restarts the copy;
+        after MAX_STEP_RESTARTS restarts the copy is redone in a single step
+        so a busy database cannot keep the backup from ever finishing.
+        """
+        source_conn = sqlite3.connect(db_path)
+        backup_conn = sqlite3.connect(target_path)
+        
+        try:
+            if stepped:
+                try:
+                    source_conn.backup(backup_conn, pages=self.STEP_PAGES, sleep=self.STEP_SLEEP,
+                                       progress=self._restart_limit(progress))
+                    return
+                except _TooManyRestarts:
+                    pass
+            source_conn.backup(backup_conn, progress=progress)
+        finally:
+            source_conn.close()
+            backup_conn.close()
+    
+    def _restart_limit(self, progress: Optional[Callable[[int, int, int], None]]):
+        """Wrap a progress callback to abort a stepped copy that keeps restarting."""
+        state = {'remaining': None, 'restarts': 0}
+        
+        def step(status: int, remaining: int, total: int) -> None:
+            # Each step lowers `remaining` unless a writer made SQLite start over
+            if state['remaining'] is not None and remaining >= state['remaining']:
+                state['restarts'] += 1
+                if state['restarts'] > self.MAX_STEP_RESTARTS:
+                    raise _TooManyRestarts()
+            state['remaining'] = remaining
+            if progress:
+                progress(status, remaining, total)
+        return step
+    
+    def create_backup(self, db_path: str, backup_folder: str, mode: str = 'full',
+                      compression: Optional[str] = None, stepped: bool = False,
+                      progress: Optional[Callable[[int, int, int], None]] = None) -> str:
         """
         Create a backup of the database.
         
         Args:
             db_path: Path to the source database file
             backup_folder: Directory to store the backup
+            mode: 'full' (plain copy), 'compressed' (new compressed chain) or
+                'incremental' (changed pages since the last backup in the chain)
+            compression: 'lzma' or 'gzip' for compressed modes (defaults to the manager's setting)
+            stepped: Copy a few pages at a time so concurrent writers are not blocked
+            progress: Optional callback(status, remaining, total) from the SQLite backup API
             
         Returns:
             Full path to the created backup file
@@ -70,28 +238,72 @@ class BackupManager:
         if not os.path.exists(db_path):
             raise FileNotFoundError(f"Database not found: {db_path}")
         
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown backup mode: {mode}")
+        
         # Ensure backup folder exists
         os.makedirs(backup_folder, exist_ok=True)
         
-        # Generate backup filename and path
-        backup_filename = self._generate_backup_filename()
-        backup_path = os.path.join(backup_folder, backup_filename)
+        base_name = self._generate_base_name(backup_folder)
         
-        # Use SQLite backup API for consistency (handles in-progress transactions)
-        source_conn = sqlite3.connect(db_path)
-        backup_conn = sqlite3.connect(backup_path)
+        if mode == 'full':
+            backup_path = os.path.join(backup_folder, base_name + self.BACKUP_EXTENSION)
+            self._consistent_copy(db_path, backup_path, stepped, progress)
+            self._record(backup_path, 'full', backup_path)
+            return backup_path
         
+        # Compressed modes work from a consistent copy so pages can be read directly
+        temp_copy = os.path.join(backup_folder, base_name + ".tmp")
         try:
-            source_conn.backup(backup_conn)
+            self._consistent_copy(db_path, temp_copy, stepped, progress)
+            if mode == 'compressed':
+                backup_path = self.chain_store.write_snapshot(temp_copy, backup_folder, base_name, compression)
+            else:
+                backup_path = self.chain_store.write_incremental(temp_copy, backup_folder, base_name, compression)
+            self._record(backup_path, self._kind(os.path.basename(backup_path)), temp_copy)
+            return backup_path
         finally:
-            source_conn.close()
-            backup_conn.close()
+            if os.path.exists(temp_copy):
+                os.remove(temp_copy)
+    
+    def prune_backups(self, backup_folder: str, keep_chains: int) -> List[str]:
+        """
+        Apply the retention policy to compressed/incremental backups.
+        
+        Keeps the newest `keep_chains` chains (a snapshot plus its deltas) and
+        deletes older ones. Plain full backups are left alone.
         
-        return backup_path
+        Returns:
+            Paths of deleted files
+        """
+        if not os.path.exists(backup_folder):
+            return []
+        removed = self.chain_store.prune(backup_folder, keep_chains)
+        self.catalog(backup_folder).remove(os.path.basename(p) for p in removed)
+        return removed
+    
+    def materialize(self, backup_file: str, target_path: str) -> str:
+        """
+        Produce a plain SQLite file for any backup kind.
+        
+        Returns `backup_file` itself for full backups, otherwise rebuilds the
+        snapshot/delta chain into `target_path` and returns that.
+        """
+        if self._kind(os.path.basename(backup_file)) in ('snapshot', 'delta'):
+            return self.chain_store.reconstruct(backup_file, target_path)
+        return backup_file
     
     def restore_backup(self, backup_file: str, db_path: str) -> bool:
         """
-        Restore a database from a backup file.
+        Restore a backup into a (possibly live) database.
+        
+        The backup is staged (full backups copied, chain backups rebuilt into a
+        plain file) and the staged copy is checked afresh - tables and PRAGMA
+        quick_check, never cached results - before anything touches the live
+        file.
+        It is then copied in with a single-step SQLite backup, which runs as
+        one exclusive write transaction: other connections see either the old
+        or the restored database, and a failure leaves the old one intact.
         
         Args:
             backup_file: Path to the backup file
@@ -107,43 +319,40 @@ class BackupManager:
         if not os.path.exists(backup_file):
             raise FileNotFoundError(f"Backup file not found: {backup_file}")
         
-        # Validate backup before restoring
-        if not self.validate_backup(backup_file):
-            raise ValueError(f"Invalid or corrupted backup file: {backup_file}")
-        
-        # Create a temporary backup of current database (safety net)
-        temp_backup = None
-        if os.path.exists(db_path):
-            temp_backup = db_path + ".temp_restore_backup"
-            shutil.copy2(db_path, temp_backup)
-        
+        staged = db_path + ".staged_restore"
         try:
-            # Use SQLite backup API
-            source_conn = sqlite3.connect(backup_file)
-            target_conn = sqlite3.connect(db_path)
-            
             try:
-                source_conn.backup(target_conn)
-            finally:
-                source_conn.close()
-                target_conn.close()
+                if self.materialize(backup_file, staged) != staged:
+                    shutil.copyfile(backup_file, staged)
+                valid = self._inspect(staged)['validated'] and self._quick_check(staged)
+            except (sqlite3.Error, ValueError, OSError, EOFError):
+                valid = False
+            if not valid:
+                raise ValueError(f"Invalid or corrupted backup file: {backup_file}")
             
-            # Remove temp backup on success
-            if temp_backup and os.path.exists(temp_backup):
-                os.remove(temp_backup)
+            self._swap_in(staged, db_path)
             
+            folder, filename = os.path.split(backup_file)
+            self.catalog(folder).put(filename, last_restored_at=datetime.now().isoformat())
             return True
-            
-        except Exception as e:
-            # Restore from temp backup on failure
-            if temp_backup and os.path.exists(temp_backup):
-                shutil.copy2(temp_backup, db_path)
-                os.remove(temp_backup)
-            raise e
+        finally:
+            if os.path.exists(staged):
+                os.remove(staged)
+    
+    def _swap_in(self, source_file: str, db_path: str) -> None:
+        """Replace the contents of db_path with source_file in one transaction."""
+        source_conn = sqlite3.connect(source_file)
+        target_conn = sqlite3.connect(db_path, timeout=self.RESTORE_LOCK_TIMEOUT)
+        
+        try:
+            source_conn.backup(target_conn)
+        finally:
+            source_conn.close()
+            target_conn.close()
     
     def list_backups(self, backup_folder: str) -> List[BackupInfo]:
         """
-        List all backup files in the backup folder.
+        List all backups in the backup folder from its catalog.
         
         Args:
             backup_folder: Directory containing backups
@@ -156,62 +365,88 @@ class BackupManager:
         if not os.path.exists(backup_folder):
             return backups
         
-        for filename in os.listdir(backup_folder):
-            if filename.startswith(self.BACKUP_PREFIX) and filename.endswith(self.BACKUP_EXTENSION):
-                filepath = os.path.join(backup_folder, filename)
-                
-                # Extract timestamp from filename
-                try:
-                    timestamp_str = filename[len(self.BACKUP_PREFIX):-len(self.BACKUP_EXTENSION)]
-                    created_dt = datetime.strptime(timestamp_str, "%Y-%m-%d_%H-%M-%S")
-                    created_at = created_dt.strftime("%Y-%m-%d %H:%M:%S")
-                except ValueError:
-                    created_at = "Unknown"
-                
-                # Get file size
-                size_bytes = os.path.getsize(filepath)
-                
-                backups.append(BackupInfo(
-                    filename=filename,
-                    filepath=filepath,
-                    created_at=created_at,
-                    size_bytes=size_bytes,
-                    size_display=self._format_size(size_bytes)
-                ))
+        catalog = self.catalog(backup_folder)
+        catalog.refresh(self._kind, self._describe(catalog.backup_folder))
+        
+        for entry in catalog.entries():
+            filename = entry['filename']
+            size_bytes = entry.get('size_bytes', 0)
+            backups.append(BackupInfo(
+                filename=filename,
+                filepath=os.path.join(backup_folder, filename),
+                created_at=entry.get('created_at', 'Unknown'),
+                size_bytes=size_bytes,
+                size_display=self._format_size(size_bytes),
+                kind=entry.get('kind', 'full'),
+                checksum=entry.get('checksum'),
+                schema_version=entry.get('schema_version'),
+                tournament_count=entry.get('tournament_count'),
+                player_count=entry.get('player_count'),
+                validated=entry.get('validated')
+            ))
         
         # Sort by created_at descending (newest first)
-        backups.sort(key=lambda x: x.created_at, reverse=True)
+        backups.sort(key=lambda x: (x.created_at, x.filename), reverse=True)
         return backups
     
+    def _cached_check(self, backup_file: str, field: str, check) -> bool:
+        """Return a cached catalog result for `field`, running `check(plain_path)` on a miss."""
+        if not os.path.exists(backup_file):
+            return False
+        
+        folder, filename = os.path.split(backup_file)
+        catalog = self.catalog(folder)
+        cached = catalog.cached(filename, field)
+        if cached is not None:
+            return cached
+        
+        staged = backup_file + f".{field}.tmp"
+        try:
+            result = check(self.materialize(backup_file, staged))
+        except (sqlite3.Error, ValueError, OSError, EOFError):
+            result = False
+        finally:
+            if os.path.exists(staged):
+                os.remove(staged)
+        
+        if self._kind(filename):
+            fields = self._file_fields(backup_file)
+            fields[field] = result
+            catalog.put(filename, **fields)
+        return result
+    
     def validate_backup(self, backup_file: str) -> bool:
         """
         Validate that a backup file is a valid SQLite database.
         
+        Results are cached in the catalog until the file changes.
+        
         Args:
             backup_file: Path to the backup file
             
         Returns:
             True if the file is a valid SQLite database with expected tables
         """
-        if not os.path.exists(backup_file):
-            return False
+        return self._cached_check(backup_file, 'validated', lambda path: self._inspect(path)['validated'])
+    
+    def verify_backup(self, backup_file: str) -> bool:
+        """
+        Run PRAGMA quick_check on a backup (rebuilding chain backups first).
         
+        Results are cached in the catalog until the file changes.
+        
+        Returns:
+            True if SQLite reports the file as consistent
+        """
+        return self._cached_check(backup_file, 'quick_check', self._quick_check)
+    
+    @staticmethod
+    def _quick_check(plain_path: str) -> bool:
+        conn = sqlite3.connect(plain_path)
         try:
-            conn = sqlite3.connect(backup_file)
-            cursor = conn.cursor()
-            
-            # Check for expected tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = {row[0] for row in cursor.fetchall()}
-            
+            return conn.execute("PRAGMA quick_check").fetchall() == [('ok',)]
+        finally:
             conn.close()
-            
-            # Must have at least the core tables
-            required_tables = {'tournaments', 'players', 'rounds', 'pairings'}
-            return required_tables.issubset(tables)
-            
-        except sqlite3.Error:
-            return False
     
     def delete_backup(self, backup_file: str) -> bool:
         """
@@ -224,6 +459,14 @@ class BackupManager:
             True if deletion was successful
         """
         if os.path.exists(backup_file):
-            os.remove(backup_file)
+            folder, filename = os.path.split(backup_file)
+            if self._kind(filename) in ('snapshot', 'delta'):
+                # Later deltas depend on this file, so they go too
+                self.chain_store.delete_file(backup_file)
+            else:
+                os.remove(backup_file)
+            catalog = self.catalog(folder)
+            catalog.remove(e['filename'] for e in catalog.entries()
+                           if not os.path.exists(os.path.join(folder, e['filename'])))
             return True
         return False
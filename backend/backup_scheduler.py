@@ -0,0 +1,81 @@
+"""
+Backup Scheduler - Runs online backups on a background thread.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from .backup_manager import BackupManager
+
+
+class BackgroundBackup:
+    """
+    Runs one backup at a time on a worker thread.
+
+    The copy uses the stepped SQLite backup API so the database stays
+    writable while it runs, and each finished backup is verified with
+    PRAGMA quick_check. Callbacks are invoked on the worker thread.
+    """
+
+    def __init__(self, manager: BackupManager):
+        self.manager = manager
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.last_finished_at: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, db_path: str, backup_folder: str, mode: str = 'full',
+              compression: Optional[str] = None, keep_chains: Optional[int] = None,
+              on_progress: Optional[Callable[[int, int], None]] = None,
+              on_finished: Optional[Callable[[str, bool, str], None]] = None) -> bool:
+        """
+        Start a backup unless one is already running.
+
+        Args:
+            on_progress: callback(pages_done, pages_total)
+            on_finished: callback(backup_path, verified, error_message)
+
+        Returns:
+            False if a backup was already in progress
+        """
+        with self._lock:
+            if self.running:
+                return False
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(db_path, backup_folder, mode, compression, keep_chains, on_progress, on_finished),
+                name="backup-worker",
+                daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until the current backup (if any) finishes."""
+        thread = self._thread
+        if thread:
+            thread.join(timeout)
+
+    def _run(self, db_path, backup_folder, mode, compression, keep_chains, on_progress, on_finished):
+        def progress(status, remaining, total):
+            if on_progress:
+                on_progress(total - remaining, total)
+
+        try:
+            path = self.manager.create_backup(
+                db_path, backup_folder, mode, compression, stepped=True, progress=progress
+            )
+            verified = self.manager.verify_backup(path)
+            if keep_chains and mode != 'full':
+                self.manager.prune_backups(backup_folder, keep_chains)
+            result = (path, verified, "" if verified else "quick_check failed")
+        except Exception as e:
+            result = ("", False, str(e))
+
+        self.last_finished_at = time.time()
+        if on_finished:
+            on_finished(*result)
@@ -0,0 +1,149 @@
+"""
+Concurrency - optimistic writes and change detection for several app
+instances sharing one database file.
+"""
+
+import sqlite3
+from typing import Dict, Optional, Set
+
+from .database import Database
+
+
+class ConflictError(Exception):
+    """A row changed since the caller read it; `current` holds its latest values."""
+
+    def __init__(self, message: str, current: Optional[Dict] = None):
+        super().__init__(message)
+        self.current = current or {}
+
+
+class RoundLockedError(Exception):
+    """Results of a locked round can't be edited."""
+
+
+def update_result(db: Database, pairing_id: int, result: str,
+                  expected_version: Optional[int] = None) -> int:
+    """
+    Set a pairing's result if nobody changed it since `expected_version`.
+
+    Passing None skips the version check (last writer wins).
+
+    Returns:
+        The pairing's new version
+
+    Raises:
+        ValueError: If the pairing doesn't exist
+        RoundLockedError: If its round is locked
+        ConflictError: If the pairing was changed elsewhere
+    """
+    with db.get_connection() as conn:
+        row = conn.execute("""
+            SELECT p.result, p.version, r.status
+            FROM pairings p JOIN rounds r ON p.round_id = r.id
+            WHERE p.id = ?
+        """, (pairing_id,)).fetchone()
+        if not row:
+            raise ValueError(f"Pairing {pairing_id} not found")
+        current_result, version, round_status = row
+        if round_status == 'LOCKED':
+            raise RoundLockedError("Round is LOCKED. Unlock to edit results.")
+        if expected_version is not None and version != expected_version:
+            raise ConflictError(
+                f"Result was changed on another terminal to {current_result}",
+                {'id': pairing_id, 'result': current_result, 'version': version}
+            )
+
+        # The version predicate makes the check-and-set atomic across processes
+        cursor = conn.execute(
+            "UPDATE pairings SET result = ?, version = version + 1 WHERE id = ? AND version = ?",
+            (result, pairing_id, version)
+        )
+        if cursor.rowcount == 0:
+            latest = conn.execute("SELECT result, version FROM pairings WHERE id = ?", (pairing_id,)).fetchone()
+            raise ConflictError(
+                "Result was changed on another terminal",
+                {'id': pairing_id, 'result': latest[0], 'version': latest[1]} if latest else {}
+            )
+        return version + 1
+
+
+def set_round_status(db: Database, tournament_id: int, round_number: int, status: str,
+                     locked_at: Optional[str] = None, expected_version: Optional[int] = None) -> int:
+    """
+    Lock or unlock a round if nobody changed it since `expected_version`.
+
+    Returns:
+        The round's new version
+
+    Raises:
+        ValueError: If the round doesn't exist
+        ConflictError: If the round was changed elsewhere
+    """
+    with db.get_connection() as conn:
+        row = conn.execute(
+            "SELECT id, status, version FROM rounds WHERE tournament_id = ? AND round_number = ?",
+            (tournament_id, round_number)
+        ).fetchone()
+        if not row:
+            raise ValueError(f"Round {round_number} not found")
+        rid, current_status, version = row
+        if expected_version is not None and version != expected_version:
+            raise ConflictError(
+                f"Round {round_number} was changed on another terminal (now {current_status})",
+                {'id': rid, 'status': current_status, 'version': version}
+            )
+
+        cursor = conn.execute(
+            "UPDATE rounds SET status = ?, locked_at = ?, version = version + 1 WHERE id = ? AND version = ?",
+            (status, locked_at, rid, version)
+        )
+        if cursor.rowcount == 0:
+            raise ConflictError(f"Round {round_number} was changed on another terminal")
+        return version + 1
+
+
+class ChangeWatcher:
+    """
+    Cheap detection of commits made by other connections or processes.
+
+    Holds one idle connection and polls PRAGMA data_version, which only
+    changes when another connection commits. Only then does it read the
+    per-tournament counters in `score_versions` to tell which tournaments
+    changed.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._versions: Dict[int, int] = {}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._conn
+
+    def poll(self) -> Set[int]:
+        """Ids of tournaments whose data changed since the previous poll."""
+        conn = self._connection()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return set()
+        self._data_version = data_version
+
+        versions = dict(conn.execute("SELECT tournament_id, version FROM score_versions").fetchall())
+        changed = {tid for tid, v in versions.items() if self._versions.get(tid) != v}
+        changed |= set(self._versions) - set(versions)  # Deleted tournaments
+        self._versions = versions
+        return changed
+
+    def reset(self) -> None:
+        """Forget what was seen (e.g. after the file was replaced by a restore)."""
+        self.close()
+        self._data_version = None
+        self._versions = {}
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
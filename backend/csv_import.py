@@ -0,0 +1,252 @@
+"""
+CSV Import - Streaming player import with bulk insert.
+"""
+
+import codecs
+import csv
+import os
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .database import Database
+from .duplicate_index import DuplicateIndex
+
+
+# Accepted header spellings, normalized to lowercase with underscores
+COLUMN_ALIASES = {
+    'name': 'name',
+    'player': 'name',
+    'club': 'club',
+    'club/city': 'club',
+    'rating': 'rating',
+    'elo': 'rating',
+    'fide_id': 'fide_id',
+    'fideid': 'fide_id',
+    'fide': 'fide_id',
+}
+
+
+@dataclass
+class ImportRow:
+    """A validated, normalized CSV row."""
+    line: int  # Physical line the row starts on (quoted fields may span lines)
+    name: str
+    club: str
+    rating: int
+    fide_id: Optional[str]
+
+    @property
+    def key(self) -> str:
+        return self.name.lower()
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'club': self.club,
+            'rating': self.rating,
+            'fide_id': self.fide_id or ''
+        }
+
+
+@dataclass
+class ImportResult:
+    """Summary of a finished import."""
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+
+
+class CSVImporter:
+    """
+    Streams a CSV file through read -> normalize -> dedupe -> insert stages.
+
+    Only one chunk of rows is held in memory at a time. Duplicates are found
+    with indexed lookups on the players table rather than a scan of the
+    loaded tournament, and every chunk is inserted with executemany inside a
+    single transaction.
+    """
+
+    CHUNK_SIZE = 500  # keeps each IN (...) lookup under SQLite's 999 variable limit
+
+    def __init__(self, db: Database):
+        self.db = db
+        self._bytes_read = 0
+        self._init_indexes()
+
+    def _init_indexes(self) -> None:
+        with self.db.get_connection() as conn:
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_players_name ON players(tournament_id, name COLLATE NOCASE)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_players_fide ON players(tournament_id, fide_id)"
+            )
+
+    # --- Pipeline stages ---
+
+    def _counting_lines(self, f) -> Iterator[str]:
+        """Yield file lines while tracking how many bytes have been read."""
+        encoding = f.encoding if f.encoding != 'utf-8-sig' else 'utf-8'
+        for line in f:
+            self._bytes_read += len(line.encode(encoding, errors='replace'))
+            yield line
+
+    def iter_rows(self, f) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Read raw CSV rows with canonical column names, with the line each starts on."""
+        reader = csv.reader(self._counting_lines(f))
+        header = next(reader, None)
+        if not header:
+            return
+        columns = [COLUMN_ALIASES.get(h.strip().lower().replace(' ', '_')) for h in header]
+        if 'name' not in columns:
+            raise ValueError("CSV file has no 'Name' column")
+
+        start = reader.line_num + 1
+        for values in reader:
+            yield start, {col: val for col, val in zip(columns, values) if col}
+            start = reader.line_num + 1
+
+    def normalize(self, rows: Iterable[Tuple[int, Dict[str, str]]], stats: ImportResult) -> Iterator[ImportRow]:
+        """Validate and clean rows, dropping ones without a usable name or rating."""
+        for line, row in rows:
+            name = ' '.join(row.get('name', '').split())
+            if not name:
+                continue
+
+            rating_str = row.get('rating', '').strip()
+            try:
+                rating = int(float(rating_str)) if rating_str else 0
+            except ValueError:
+                stats.invalid += 1
+                continue
+
+            yield ImportRow(
+                line=line,
+                name=name,
+                club=row.get('club', '').strip(),
+                rating=max(0, rating),
+                fide_id=row.get('fide_id', '').strip() or None
+            )
+
+    @staticmethod
+    def chunks(rows: Iterable[ImportRow], size: int) -> Iterator[List[ImportRow]]:
+        it = iter(rows)
+        while True:
+            chunk = list(islice(it, size))
+            if not chunk:
+                return
+            yield chunk
+
+    def find_duplicates(self, conn, tournament_id: int, chunk: List[ImportRow]) -> List[bool]:
+        """Flag rows already in the tournament (by name or FIDE id) or repeated within the chunk."""
+        names = list({r.name for r in chunk})
+        fide_ids = list({r.fide_id for r in chunk if r.fide_id})
+
+        existing_names = set()
+        if names:
+            marks = ','.join('?' * len(names))
+            cursor = conn.execute(
+                f"SELECT name FROM players WHERE tournament_id = ? AND name COLLATE NOCASE IN ({marks})",
+                (tournament_id, *names)
+            )
+            existing_names = {row[0].lower() for row in cursor}
+
+        existing_fide = set()
+        if fide_ids:
+            marks = ','.join('?' * len(fide_ids))
+            cursor = conn.execute(
+                f"SELECT fide_id FROM players WHERE tournament_id = ? AND fide_id IN ({marks})",
+                (tournament_id, *fide_ids)
+            )
+            existing_fide = {row[0] for row in cursor}
+
+        flags = []
+        for r in chunk:
+            dup = r.key in existing_names or (r.fide_id is not None and r.fide_id in existing_fide)
+            flags.append(dup)
+            existing_names.add(r.key)
+            if r.fide_id:
+                existing_fide.add(r.fide_id)
+        return flags
+
+    # --- Public API ---
+
+    def preview(self, filepath: str, tournament_id: Optional[int] = None, limit: int = 100,
+                duplicate_index: Optional[DuplicateIndex] = None) -> List[dict]:
+        """
+        Parse only the first `limit` players and flag duplicates.
+
+        Exact duplicates (name or FIDE id) are marked `duplicate`; when a
+        DuplicateIndex is given, near matches are reported in `similar_to`
+        with their `similarity` score.
+        """
+        stats = ImportResult()
+        with open(filepath, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = list(islice(self.normalize(self.iter_rows(f), stats), limit))
+
+        if tournament_id is None:
+            flags = [False] * len(rows)
+            seen = set()
+            for i, r in enumerate(rows):
+                flags[i] = r.key in seen
+                seen.add(r.key)
+        else:
+            with self.db.get_connection() as conn:
+                flags = self.find_duplicates(conn, tournament_id, rows)
+
+        preview = []
+        for r, dup in zip(rows, flags):
+            entry = r.to_dict()
+            entry['duplicate'] = dup
+            entry['similar_to'] = ''
+            entry['similarity'] = 0.0
+            if duplicate_index is not None and not dup:
+                matches = duplicate_index.candidates(r.name, r.fide_id, limit=1)
+                if matches:
+                    entry['similar_to'] = matches[0].name
+                    entry['similarity'] = round(matches[0].score, 3)
+            preview.append(entry)
+        return preview
+
+    def import_players(self, filepath: str, tournament_id: int,
+                       progress: Optional[Callable[[int, float], None]] = None) -> ImportResult:
+        """
+        Import every valid, non-duplicate row in one transaction.
+
+        Args:
+            filepath: CSV file to import
+            tournament_id: Target tournament
+            progress: Optional callback(rows_processed, fraction_done) called after each chunk
+
+        Returns:
+            ImportResult with imported/duplicate/invalid counts
+        """
+        stats = ImportResult()
+        total_size = max(1, os.path.getsize(filepath))
+        processed = 0
+        with open(filepath, 'rb') as f:
+            # Decoding drops the byte order mark; count it as read
+            self._bytes_read = len(codecs.BOM_UTF8) if f.read(3) == codecs.BOM_UTF8 else 0
+
+        with open(filepath, 'r', encoding='utf-8-sig', newline='') as f, \
+                self.db.get_connection() as conn:
+            rows = self.normalize(self.iter_rows(f), stats)
+            for chunk in self.chunks(rows, self.CHUNK_SIZE):
+                flags = self.find_duplicates(conn, tournament_id, chunk)
+                batch = [
+                    (tournament_id, r.name, r.rating, r.fide_id, r.club)
+                    for r, dup in zip(chunk, flags) if not dup
+                ]
+                conn.executemany(
+                    "INSERT INTO players (tournament_id, name, rating, fide_id, club) VALUES (?, ?, ?, ?, ?)",
+                    batch
+                )
+                stats.imported += len(batch)
+                stats.duplicates += len(chunk) - len(batch)
+
+                processed += len(chunk)
+                if progress:
+                    progress(processed, min(1.0, self._bytes_read / total_size))
+
+        return stats
@@ -0,0 +1,229 @@
+"""
+Dashboard - paged tournament list with per-tournament summaries kept by triggers.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .archive import TournamentArchive
+from .database import Database
+
+PAGE_SIZE = 48
+
+STATUSES = ('SETUP', 'ACTIVE', 'FINISHED', 'ARCHIVED')
+
+SUMMARY_COLUMNS = ('player_count', 'rounds_done', 'results_pending')
+
+COLUMNS = ('id', 'name', 'type', 'status', 'created_at', 'total_rounds', 'current_round', 'venue',
+           'archived') + SUMMARY_COLUMNS
+
+TRIGGERS = (
+    'trg_summary_tournament_insert', 'trg_summary_tournament_delete',
+    'trg_summary_player_insert', 'trg_summary_player_delete',
+    'trg_summary_round_insert', 'trg_summary_round_status', 'trg_summary_round_delete',
+    'trg_summary_pairing_insert', 'trg_summary_pairing_delete', 'trg_summary_pairing_result',
+)
+
+_TOURNAMENT_OF_PAIRING = "(SELECT tournament_id FROM rounds WHERE id = {r}.round_id)"
+
+# Full recompute of one tournament's summary (:tid)
+_RECOMPUTE = """
+    SELECT t.id,
+           (SELECT COUNT(*) FROM players WHERE tournament_id = t.id),
+           (SELECT COUNT(*) FROM rounds WHERE tournament_id = t.id AND status = 'LOCKED'),
+           (SELECT COUNT(*) FROM pairings p JOIN rounds r ON r.id = p.round_id
+            WHERE r.tournament_id = t.id AND p.result = '*')
+    FROM tournaments t
+"""
+
+
+def _escape_like(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class TournamentSummaries:
+    """
+    Tournament list for the dashboard, one page at a time.
+
+    `tournament_summaries` holds player count, locked rounds and pending
+    results per tournament. Triggers on players, rounds and pairings apply
+    each change as a delta, so listing a page never scans players or
+    pairings. Pages are keyset-paged on (created_at, id), newest first, and
+    include archived tournaments from the archive's index table.
+    """
+
+    def __init__(self, db: Database, archive: Optional[TournamentArchive] = None):
+        self.db = db
+        self.archive = archive  # None: live tournaments only
+        self._init_tables()
+
+    def _init_tables(self) -> None:
+        exists = self.db.execute_query(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tournament_summaries'"
+        )
+        pending = "({r}.result = '*')"
+        with self.db.get_connection() as conn:
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS tournament_summaries (
+                    tournament_id INTEGER PRIMARY KEY,
+                    player_count INTEGER NOT NULL DEFAULT 0,
+                    rounds_done INTEGER NOT NULL DEFAULT 0,
+                    results_pending INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_tournaments_status_created ON tournaments(status, created_at);
+                CREATE INDEX IF NOT EXISTS idx_tournaments_type_created ON tournaments(type, created_at);
+                CREATE INDEX IF NOT EXISTS idx_rounds_tournament ON rounds(tournament_id);
+
+                CREATE TRIGGER IF NOT EXISTS trg_summary_tournament_insert AFTER INSERT ON tournaments
+                BEGIN
+                    INSERT OR IGNORE INTO tournament_summaries (tournament_id) VALUES (NEW.id);
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_summary_tournament_delete AFTER DELETE ON tournaments
+                BEGIN
+                    DELETE FROM tournament_summaries WHERE tournament_id = OLD.id;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_summary_player_insert AFTER INSERT ON players
+                BEGIN
+                    UPDATE tournament_summaries SET player_count = player_count + 1
+                    WHERE tournament_id = NEW.tournament_id;
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_summary_player_delete AFTER DELETE ON players
+                BEGIN
+                    UPDATE tournament_summaries SET player_count = player_count - 1
+                    WHERE tournament_id = OLD.tournament_id;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_summary_round_insert AFTER INSERT ON rounds
+                WHEN NEW.status = 'LOCKED'
+                BEGIN
+                    UPDATE tournament_summaries SET rounds_done = rounds_done + 1
+                    WHERE tournament_id = NEW.tournament_id;
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_summary_round_status AFTER UPDATE OF status ON rounds
+                WHEN (OLD.status = 'LOCKED') != (NEW.status = 'LOCKED')
+                BEGIN
+                    UPDATE tournament_summaries
+                    SET rounds_done = rounds_done + (CASE WHEN NEW.status = 'LOCKED' THEN 1 ELSE -1 END)
+                    WHERE tournament_id = NEW.tournament_id;
+                END;
+                -- Delete a round's pairings while the round still exists, so the
+                -- pairing trigger can still find their tournament
+                CREATE TRIGGER IF NOT EXISTS trg_summary_round_delete BEFORE DELETE ON rounds
+                BEGIN
+                    DELETE FROM pairings WHERE round_id = OLD.id;
+                    UPDATE tournament_summaries SET rounds_done = rounds_done - (OLD.status = 'LOCKED')
+                    WHERE tournament_id = OLD.tournament_id;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_summary_pairing_insert AFTER INSERT ON pairings
+                WHEN {pending.format(r='NEW')}
+                BEGIN
+                    UPDATE tournament_summaries SET results_pending = results_pending + 1
+                    WHERE tournament_id = {_TOURNAMENT_OF_PAIRING.format(r='NEW')};
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_summary_pairing_delete AFTER DELETE ON pairings
+                WHEN {pending.format(r='OLD')}
+                BEGIN
+                    UPDATE tournament_summaries SET results_pending = results_pending - 1
+                    WHERE tournament_id = {_TOURNAMENT_OF_PAIRING.format(r='OLD')};
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_summary_pairing_result AFTER UPDATE OF result, round_id ON pairings
+                WHEN {pending.format(r='OLD')} OR {pending.format(r='NEW')}
+                BEGIN
+                    UPDATE tournament_summaries SET results_pending = results_pending - 1
+                    WHERE {pending.format(r='OLD')} AND tournament_id = {_TOURNAMENT_OF_PAIRING.format(r='OLD')};
+                    UPDATE tournament_summaries SET results_pending = results_pending + 1
+                    WHERE {pending.format(r='NEW')} AND tournament_id = {_TOURNAMENT_OF_PAIRING.format(r='NEW')};
+                END;
+            """)
+        if not exists:
+            self.rebuild()
+
+    def rebuild(self, tournament_id: Optional[int] = None) -> None:
+        """Recompute summaries from players, rounds and pairings (all tournaments if no id)."""
+        with self.db.get_connection() as conn:
+            if tournament_id is None:
+                conn.execute("DELETE FROM tournament_summaries")
+                conn.execute(f"INSERT INTO tournament_summaries {_RECOMPUTE}")
+            else:
+                conn.execute("DELETE FROM tournament_summaries WHERE tournament_id = ?", (tournament_id,))
+                conn.execute(f"INSERT INTO tournament_summaries {_RECOMPUTE} WHERE t.id = ?", (tournament_id,))
+
+    def check(self, tournament_id: int) -> bool:
+        """True if the stored summary matches a full recompute."""
+        expected = self.db.execute_query(f"{_RECOMPUTE} WHERE t.id = ?", (tournament_id,))
+        stored = self.db.execute_query(
+            f"SELECT tournament_id, {', '.join(SUMMARY_COLUMNS)} FROM tournament_summaries WHERE tournament_id = ?",
+            (tournament_id,)
+        )
+        return [tuple(r) for r in expected] == [tuple(r) for r in stored]
+
+    # --- Queries ---
+
+    def _selects(self, search: str, type_: Optional[str], status: Optional[str]) -> Tuple[List[str], List]:
+        """One SELECT per source (live, archived) matching the filters, with their parameters."""
+        conditions, params = [], []
+        if search:
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            params.append(f"%{_escape_like(search)}%")
+        if type_:
+            conditions.append("type = ?")
+            params.append(type_)
+        where = " AND ".join(conditions) or "1"
+
+        selects, all_params = [], []
+        if status != 'ARCHIVED':
+            live_where = where + (" AND status = ?" if status else "")
+            selects.append(
+                "SELECT t.id, t.name, t.type, t.status, t.created_at, t.total_rounds, t.current_round, t.venue, "
+                "0 AS archived, s.player_count, s.rounds_done, s.results_pending "
+                "FROM tournaments t LEFT JOIN tournament_summaries s ON s.tournament_id = t.id "
+                f"WHERE {live_where}"
+            )
+            all_params += params + ([status] if status else [])
+        if self.archive is not None and status in (None, 'FINISHED', 'ARCHIVED'):
+            selects.append(
+                "SELECT id, name, type, status, created_at, total_rounds, current_round, venue, "
+                "1 AS archived, player_count, current_round AS rounds_done, 0 AS results_pending "
+                f"FROM archived_tournaments WHERE {where}"
+            )
+            all_params += params
+        return selects, all_params
+
+    def page(self, search: str = '', type_: Optional[str] = None, status: Optional[str] = None,
+             after: Optional[Sequence] = None, limit: int = PAGE_SIZE) -> List[Dict]:
+        """
+        Up to `limit` tournaments, newest first.
+
+        Args:
+            search: Case-insensitive part of the name
+            type_: 'SWISS' or 'ROUND_ROBIN' (None: any)
+            status: One of STATUSES (None: any); 'FINISHED' includes archived ones
+            after: (created_at, id) of the last row of the previous page
+        """
+        selects, params = self._selects(search, type_, status)
+        if not selects:
+            return []
+        keyset = ""
+        if after is not None:
+            keyset = "WHERE (created_at, id) < (?, ?)"
+            params += [after[0], after[1]]
+        rows = self.db.execute_query(
+            f"SELECT * FROM ({' UNION ALL '.join(selects)}) {keyset} "
+            f"ORDER BY created_at DESC, id DESC LIMIT ?",
+            tuple(params) + (limit,)
+        )
+        result = []
+        for row in rows:
+            entry = dict(zip(COLUMNS, row))
+            entry['archived'] = bool(entry['archived'])
+            result.append(entry)
+        return result
+
+    def count(self, search: str = '', type_: Optional[str] = None, status: Optional[str] = None) -> int:
+        """Number of tournaments matching the filters."""
+        selects, params = self._selects(search, type_, status)
+        if not selects:
+            return 0
+        counts = " + ".join(f"(SELECT COUNT(*) FROM ({s}))" for s in selects)
+        return self.db.execute_query(f"SELECT {counts}", tuple(params))[0][0]
@@ -1,9 +1,14 @@
+import logging
 import sqlite3
 import os
 from contextlib import contextmanager
 
 import sys
 
+from .instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
 if getattr(sys, 'frozen', False):
     PROJECT_ROOT = os.path.dirname(sys.executable)
 else:
@@ -11,16 +16,23 @@ else:
 
 DB_PATH = os.path.join(PROJECT_ROOT, "tournament.db")
 
+# Bump whenever init_db gains a migration; stored in PRAGMA user_version
+SCHEMA_VERSION = 4
+
 class Database:
     def __init__(self, db_path=DB_PATH):
         self.db_path = db_path
-        self.init_db()
+        self.migrate_if_needed()
 
     @contextmanager
     def get_connection(self):
         conn = sqlite3.connect(self.db_path)
         conn.execute("PRAGMA foreign_keys = ON;")
         conn.execute("PRAGMA journal_mode=WAL;")
+        # Count statements for the running action, if any (see backend.instrumentation)
+        traced = instrumentation.active()
+        if traced:
+            conn.set_trace_callback(instrumentation.tracer())
         try:
             yield conn
             conn.commit()
@@ -28,8 +40,21 @@ class Database:
             conn.rollback()
             raise e
         finally:
+            if traced:
+                instrumentation.rows(conn.total_changes)
             conn.close()
 
+    def schema_version(self) -> int:
+        with self.get_connection() as conn:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate_if_needed(self) -> bool:
+        """Run init_db only if the file predates SCHEMA_VERSION. Returns True if it ran."""
+        if self.schema_version() >= SCHEMA_VERSION:
+            return False
+        self.init_db()
+        return True
+
     def init_db(self):
         """Prepare database."""
         schema = """
@@ -53,7 +78,18 @@ class Database:
             club TEXT,
             status TEXT DEFAULT 'ACTIVE' CHECK(status IN ('ACTIVE', 'WITHDRAWN')),
             withdraw_round INTEGER,
-            FOREIGN KEY (tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE
+            registry_id INTEGER,
+            FOREIGN KEY (tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
+            FOREIGN KEY (registry_id) REFERENCES player_registry(id)
+        );
+
+        CREATE TABLE IF NOT EXISTS player_registry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            rating INTEGER DEFAULT 0,
+            fide_id TEXT,
+            club TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
 
         CREATE TABLE IF NOT EXISTS rounds (
@@ -63,6 +99,7 @@ class Database:
             status TEXT DEFAULT 'IN_PROGRESS' CHECK(status IN ('NOT_STARTED', 'IN_PROGRESS', 'LOCKED')),
             locked_at TIMESTAMP,
             pairing_mode TEXT DEFAULT 'AUTO' CHECK(pairing_mode IN ('AUTO', 'MANUAL')),
+            version INTEGER NOT NULL DEFAULT 0,
             FOREIGN KEY (tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
             UNIQUE(tournament_id, round_number)
         );
@@ -73,6 +110,7 @@ class Database:
             white_player_id INTEGER,
             black_player_id INTEGER,
             result TEXT DEFAULT '*' CHECK(result IN ('1-0', '0-1', '0.5-0.5', '*', 'BYE', 'FORFEIT')),
+            version INTEGER NOT NULL DEFAULT 0,
             FOREIGN KEY (round_id) REFERENCES rounds(id) ON DELETE CASCADE,
             FOREIGN KEY (white_player_id) REFERENCES players(id),
             FOREIGN KEY (black_player_id) REFERENCES players(id)
@@ -106,7 +144,7 @@ class Database:
                 cursor = conn.execute("PRAGMA table_info(players)")
                 columns = [info[1] for info in cursor.fetchall()]
                 if 'points' in columns:
-                    print("Updating schema: Removing legacy points column...")
+                    logger.info("Updating schema: Removing legacy points column...")
                     
                     conn.execute("ALTER TABLE players RENAME TO players_old")
                     
@@ -130,9 +168,76 @@ class Database:
                     """)
                     
                     conn.execute("DROP TABLE players_old")
-                    print("Schema update complete.")
+                    logger.info("Schema update complete.")
             except Exception as e:
-                print(f"Migration warning: {e}")
+                logger.warning("Migration warning: %s", e)
+
+            # Link to shared player registry (after the points rebuild above, which drops unknown columns)
+            try:
+                conn.execute("ALTER TABLE players ADD COLUMN registry_id INTEGER REFERENCES player_registry(id)")
+            except sqlite3.OperationalError: pass
+
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_players_registry ON players(registry_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pairings_round ON pairings(round_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tournaments_created ON tournaments(created_at)")
+
+            # Row versions for optimistic concurrency between several app instances
+            for table in ('rounds', 'pairings'):
+                try:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+                except sqlite3.OperationalError: pass
+
+            self._create_score_version_triggers(conn)
+            self._create_row_version_triggers(conn)
+
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _create_score_version_triggers(self, conn):
+        """
+        Keep a per-tournament counter that changes whenever anything affecting
+        standings changes. The scoring cache compares against it.
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS score_versions (
+                tournament_id INTEGER PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        bump = """
+            INSERT INTO score_versions (tournament_id, version)
+            SELECT {tid}, 1 WHERE {tid} IS NOT NULL
+            ON CONFLICT(tournament_id) DO UPDATE SET version = version + 1;
+        """
+        tournament_of = {
+            'players': "{row}.tournament_id",
+            'rounds': "{row}.tournament_id",
+            'pairings': "(SELECT tournament_id FROM rounds WHERE id = {row}.round_id)",
+        }
+        for table, expr in tournament_of.items():
+            for event, row in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_score_version_{table}_{event.lower()}
+                    AFTER {event} ON {table}
+                    BEGIN {bump.format(tid=expr.format(row=row))} END
+                """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_score_version_tournament_delete
+            AFTER DELETE ON tournaments
+            BEGIN DELETE FROM score_versions WHERE tournament_id = OLD.id; END
+        """)
+
+    def _create_row_version_triggers(self, conn):
+        """
+        Bump `version` on any update that didn't bump it itself, so writers
+        that don't know about versions (undo, older code) still invalidate
+        other instances' optimistic checks.
+        """
+        for table in ('rounds', 'pairings'):
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_version AFTER UPDATE ON {table}
+                WHEN NEW.version = OLD.version
+                BEGIN UPDATE {table} SET version = OLD.version + 1 WHERE id = NEW.id; END
+            """)
 
     def withdraw_player(self, player_id: int, current_round: int):
         """Marks a player as withdrawn from the tournament."""
@@ -145,7 +250,9 @@ class Database:
     def execute_query(self, query, params=()):
         with self.get_connection() as conn:
             cursor = conn.execute(query, params)
-            return cursor.fetchall()
+            rows = cursor.fetchall()
+            instrumentation.rows(len(rows))
+            return rows
             
             
     def execute_non_query(self, query, params=()):
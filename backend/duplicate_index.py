@@ -0,0 +1,221 @@
+"""
+Duplicate Index - Fuzzy player name matching for registration.
+"""
+
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from .database import Database
+
+
+@dataclass
+class DuplicateCandidate:
+    """A possible match for a player being registered."""
+    entry_id: int
+    name: str
+    club: str
+    score: float
+    source: str = 'player'  # 'player' or 'registry'
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.entry_id,
+            'name': self.name,
+            'club': self.club,
+            'score': round(self.score, 3),
+            'source': self.source
+        }
+
+
+_NON_ALPHA = re.compile(r"[^a-z\s]")
+
+_SOUNDEX_CODES = {}
+for _letters, _digit in (("bfpv", "1"), ("cgjkqsxz", "2"), ("dt", "3"), ("l", "4"), ("mn", "5"), ("r", "6")):
+    for _ch in _letters:
+        _SOUNDEX_CODES[_ch] = _digit
+
+
+def name_tokens(name: str) -> List[str]:
+    """
+    Split a name into comparable tokens.
+
+    Accents and punctuation are dropped and "Last, First" is reordered to
+    "First Last", so "Sharma, R." and "R Sharma" give the same tokens.
+    """
+    if ',' in name:
+        last, _, first = name.partition(',')
+        name = f"{first} {last}"
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch)).lower()
+    return _NON_ALPHA.sub(' ', name).split()
+
+
+def soundex(token: str) -> str:
+    """Classic American Soundex code for a single token."""
+    if not token:
+        return ""
+    code = token[0].upper()
+    last = _SOUNDEX_CODES.get(token[0], "")
+    for ch in token[1:]:
+        digit = _SOUNDEX_CODES.get(ch, "")
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        if ch not in "hw":
+            last = digit
+    return code.ljust(4, "0")
+
+
+def trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _token_similarity(a: str, b: str) -> float:
+    if a == b:
+        return 1.0
+    # Initials: "r" vs "rahul"
+    if len(a) == 1 or len(b) == 1:
+        return 0.8 if a[0] == b[0] else 0.0
+    if soundex(a) == soundex(b):
+        return 0.85
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb)
+
+
+def name_similarity(a: List[str], b: List[str]) -> float:
+    """Score two token lists in [0, 1] by greedy best-pair token alignment."""
+    if not a or not b:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    remaining = list(b)
+    total = 0.0
+    for tok in a:
+        best_idx, best = -1, 0.0
+        for i, other in enumerate(remaining):
+            sim = _token_similarity(tok, other)
+            if sim > best:
+                best_idx, best = i, sim
+        if best_idx >= 0:
+            remaining.pop(best_idx)
+        total += best
+    # Unmatched extra tokens (e.g. a middle name) cost a little, not a full miss
+    return total / (len(a) + 0.25 * len(remaining))
+
+
+class DuplicateIndex:
+    """
+    In-memory n-gram and phonetic index over player names.
+
+    Each name is posted under its token trigrams and Soundex codes, so a
+    lookup only scores entries sharing enough keys with the query instead of
+    comparing against every player.
+    """
+
+    DEFAULT_THRESHOLD = 0.75
+    MIN_SHARED_TRIGRAMS = 0.3  # fraction of query trigrams a candidate must share
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._entries: Dict[Tuple[str, int], Tuple[str, str, List[str], Optional[str]]] = {}
+        self._trigram_postings: Dict[str, Set[Tuple[str, int]]] = defaultdict(set)
+        self._phonetic_postings: Dict[str, Set[Tuple[str, int]]] = defaultdict(set)
+        self._fide_postings: Dict[str, Tuple[str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _keys(tokens: List[str]) -> Tuple[Set[str], Set[str]]:
+        grams = set()
+        codes = set()
+        for tok in tokens:
+            if len(tok) > 1:
+                grams |= trigrams(tok)
+                codes.add(soundex(tok))
+        return grams, codes
+
+    def add(self, entry_id: int, name: str, club: str = '', fide_id: Optional[str] = None,
+            source: str = 'player') -> None:
+        """Add or replace an entry."""
+        key = (source, entry_id)
+        if key in self._entries:
+            self.remove(entry_id, source)
+
+        tokens = name_tokens(name)
+        self._entries[key] = (name, club or '', tokens, fide_id or None)
+        grams, codes = self._keys(tokens)
+        for g in grams:
+            self._trigram_postings[g].add(key)
+        for c in codes:
+            self._phonetic_postings[c].add(key)
+        if fide_id:
+            self._fide_postings[fide_id] = key
+
+    def remove(self, entry_id: int, source: str = 'player') -> None:
+        key = (source, entry_id)
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return
+        grams, codes = self._keys(entry[2])
+        for g in grams:
+            self._trigram_postings[g].discard(key)
+        for c in codes:
+            self._phonetic_postings[c].discard(key)
+        if entry[3] and self._fide_postings.get(entry[3]) == key:
+            del self._fide_postings[entry[3]]
+
+    def candidates(self, name: str, fide_id: Optional[str] = None, limit: int = 5,
+                   threshold: Optional[float] = None) -> List[DuplicateCandidate]:
+        """Return likely duplicates of `name`, best match first."""
+        threshold = self.threshold if threshold is None else threshold
+        tokens = name_tokens(name)
+        grams, codes = self._keys(tokens)
+
+        hits: Counter = Counter()
+        for g in grams:
+            hits.update(self._trigram_postings.get(g, ()))
+        min_shared = max(1, int(len(grams) * self.MIN_SHARED_TRIGRAMS))
+        pool = {key for key, count in hits.items() if count >= min_shared}
+        for c in codes:
+            pool |= self._phonetic_postings.get(c, set())
+
+        scores: Dict[Tuple[str, int], float] = {}
+        for key in pool:
+            scores[key] = name_similarity(tokens, self._entries[key][2])
+
+        if fide_id and fide_id in self._fide_postings:
+            scores[self._fide_postings[fide_id]] = 1.0
+
+        ranked = sorted(
+            (item for item in scores.items() if item[1] >= threshold),
+            key=lambda item: (-item[1], item[0])  # Ties by source and id, so results are stable
+        )[:limit]
+
+        return [
+            DuplicateCandidate(entry_id=key[1], name=self._entries[key][0], club=self._entries[key][1],
+                               score=score, source=key[0])
+            for key, score in ranked
+        ]
+
+    @classmethod
+    def for_tournament(cls, db: Database, tournament_id: int,
+                       include_registry: bool = False) -> 'DuplicateIndex':
+        """Build an index over a tournament's players, optionally plus the global registry."""
+        index = cls()
+        rows = db.execute_query(
+            "SELECT id, name, club, fide_id FROM players WHERE tournament_id = ?", (tournament_id,)
+        )
+        for pid, name, club, fide_id in rows:
+            index.add(pid, name, club, fide_id)
+
+        if include_registry:
+            rows = db.execute_query("SELECT id, name, club, fide_id FROM player_registry")
+            for rid, name, club, fide_id in rows:
+                index.add(rid, name, club, fide_id, source='registry')
+        return index
@@ -0,0 +1,246 @@
+"""
+Games - full game scores (PGN) attached to pairings, with indexed search and streamed export.
+"""
+
+import json
+import os
+import zlib
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .database import Database
+from .ingest import FeedGame, RoundPairings
+from .pgn import PgnGame, iter_games
+
+# Exported first, in this order (PGN Seven Tag Roster)
+SEVEN_TAGS = ('Event', 'Site', 'Date', 'Round', 'White', 'Black', 'Result')
+
+_COLUMNS = ('pairing_id', 'tournament_id', 'round_number', 'board', 'white_player_id', 'black_player_id',
+            'white', 'black', 'result', 'eco', 'opening')
+
+
+@dataclass
+class GameImportResult:
+    """Summary of a PGN import."""
+    imported: int = 0
+    unmatched: int = 0  # Games with no pairing in the tournament
+    errors: List[str] = field(default_factory=list)  # First few reasons games were skipped
+
+    MAX_ERRORS = 20
+
+    def skip(self, reason: str) -> None:
+        self.unmatched += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append(reason)
+
+
+class GameStore:
+    """
+    Game scores in a `games` side table, one row per pairing.
+
+    Tags are kept as JSON and the move text zlib-compressed; the columns
+    searched on (round, players, ECO, result) are plain and indexed.
+    import_pgn() streams a file a game at a time and inserts in chunks in
+    one transaction; iter_pgn() streams a tournament back out row by row,
+    so neither holds more than a chunk of games in memory.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, db: Database):
+        self.db = db
+        self._bytes_read = 0
+        self._init_tables()
+
+    def _init_tables(self) -> None:
+        with self.db.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS games (
+                    pairing_id INTEGER PRIMARY KEY REFERENCES pairings(id) ON DELETE CASCADE,
+                    tournament_id INTEGER NOT NULL,
+                    round_number INTEGER NOT NULL,
+                    board INTEGER NOT NULL,
+                    white_player_id INTEGER,
+                    black_player_id INTEGER,
+                    white TEXT,
+                    black TEXT,
+                    result TEXT,
+                    eco TEXT,
+                    opening TEXT,
+                    headers TEXT NOT NULL,
+                    moves BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_games_round ON games(tournament_id, round_number, board);
+                CREATE INDEX IF NOT EXISTS idx_games_white ON games(white_player_id);
+                CREATE INDEX IF NOT EXISTS idx_games_black ON games(black_player_id);
+                CREATE INDEX IF NOT EXISTS idx_games_eco ON games(tournament_id, eco);
+                CREATE INDEX IF NOT EXISTS idx_games_result ON games(tournament_id, result);
+            """)
+
+    # --- Import ---
+
+    def _counting_lines(self, f) -> Iterator[str]:
+        for line in f:
+            self._bytes_read += len(line)
+            yield line
+
+    def import_pgn(self, filepath: str, tournament_id: int,
+                   progress: Optional[Callable[[int, float], None]] = None) -> GameImportResult:
+        """
+        Attach every game of a PGN file to its pairing, in one transaction.
+
+        Games are placed like results from the board feed: by round and
+        board (Round "3.12" or a Board tag), checked against the player
+        names, or by the names alone. A pairing's earlier game is replaced.
+
+        Args:
+            progress: Optional callback(games_processed, fraction_done) called after each chunk
+        """
+        stats = GameImportResult()
+        total_size = max(1, os.path.getsize(filepath))
+        self._bytes_read = 0
+        processed = 0
+        rounds: Dict[int, RoundPairings] = {}
+
+        with open(filepath, 'r', encoding='utf-8-sig', errors='replace') as f, \
+                self.db.get_connection() as conn:
+            games = iter_games(self._counting_lines(f))
+            while True:
+                chunk = list(islice(games, self.CHUNK_SIZE))
+                if not chunk:
+                    break
+                batch = []
+                for game in chunk:
+                    row = self._row(conn, game, tournament_id, rounds, stats)
+                    if row is not None:
+                        batch.append(row)
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO games ({', '.join(_COLUMNS)}, headers, moves) "
+                    f"VALUES ({', '.join('?' * (len(_COLUMNS) + 2))})",
+                    batch
+                )
+                stats.imported += len(batch)
+                processed += len(chunk)
+                if progress:
+                    progress(processed, min(1.0, self._bytes_read / total_size))
+        return stats
+
+    @staticmethod
+    def _row(conn, game: PgnGame, tournament_id: int, rounds: Dict[int, RoundPairings],
+             stats: GameImportResult) -> Optional[tuple]:
+        round_number, board = game.round_and_board()
+        label = f"{game.get('White', '?')} - {game.get('Black', '?')}"
+        if round_number is None:
+            stats.skip(f"{label}: no round number")
+            return None
+        if round_number not in rounds:
+            rounds[round_number] = RoundPairings.load(conn, tournament_id, round_number)
+        pairings = rounds[round_number]
+        found, reason = pairings.find(
+            FeedGame('', round_number, board, game.get('White'), game.get('Black'), game.get('Result', '*'))
+        )
+        if found is None:
+            stats.skip(f"round {round_number}: {reason}")
+            return None
+        pairing_id, white_id, black_id, _, _ = pairings.rows[found - 1]
+        return (
+            pairing_id, tournament_id, round_number, found, white_id, black_id,
+            game.get('White'), game.get('Black'), game.get('Result', '*'),
+            game.get('ECO') or None, game.get('Opening') or None,
+            json.dumps(game.headers, ensure_ascii=False, separators=(',', ':')),
+            zlib.compress(game.movetext.encode('utf-8')),
+        )
+
+    # --- Queries ---
+
+    def search(self, tournament_id: Optional[int] = None, player_id: Optional[int] = None,
+               round_number: Optional[int] = None, eco: str = '', result: str = '',
+               limit: int = 200) -> List[Dict]:
+        """
+        Games matching every given filter (without move text), by round and board.
+
+        Args:
+            player_id: Games of this player with either colour
+            eco: ECO code or prefix, e.g. "B9" for B90-B99
+            result: As in the Result tag ("1-0", "0-1", "1/2-1/2", "*")
+        """
+        conditions, params = [], []
+        if tournament_id is not None:
+            conditions.append("tournament_id = ?")
+            params.append(tournament_id)
+        if player_id is not None:
+            conditions.append("(white_player_id = ? OR black_player_id = ?)")
+            params += [player_id, player_id]
+        if round_number is not None:
+            conditions.append("round_number = ?")
+            params.append(round_number)
+        if eco:
+            conditions.append("eco GLOB ?")  # Prefix GLOB can use the index
+            params.append(eco.upper().replace('*', '').replace('?', '') + '*')
+        if result:
+            conditions.append("result = ?")
+            params.append(result)
+        where = " AND ".join(conditions) or "1"
+        rows = self.db.execute_query(
+            f"SELECT {', '.join(_COLUMNS)} FROM games WHERE {where} "
+            f"ORDER BY tournament_id, round_number, board LIMIT ?",
+            (*params, limit)
+        )
+        return [dict(zip(_COLUMNS, row)) for row in rows]
+
+    def count(self, tournament_id: int) -> int:
+        return self.db.execute_query("SELECT COUNT(*) FROM games WHERE tournament_id = ?", (tournament_id,))[0][0]
+
+    def pgn(self, pairing_id: int) -> Optional[str]:
+        """One game as PGN text, or None if the pairing has no game."""
+        rows = self.db.execute_query("SELECT headers, moves FROM games WHERE pairing_id = ?", (pairing_id,))
+        return _format(*rows[0]) if rows else None
+
+    # --- Export ---
+
+    def iter_pgn(self, tournament_id: int) -> Iterator[str]:
+        """PGN text of a tournament's games, one game at a time, by round and board."""
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT headers, moves FROM games WHERE tournament_id = ? ORDER BY round_number, board",
+                (tournament_id,)
+            )
+            for headers, moves in cursor:
+                yield _format(headers, moves)
+
+    def export_pgn(self, tournament_id: int, filepath: str) -> int:
+        """Write a tournament's games to a PGN file. Returns the number of games."""
+        count = 0
+        with open(filepath, 'w', encoding='utf-8', newline='\n') as f:
+            for text in self.iter_pgn(tournament_id):
+                f.write(text)
+                count += 1
+        return count
+
+
+def _format(headers_json: str, moves: bytes) -> str:
+    headers = json.loads(headers_json)
+    tags = [tag for tag in SEVEN_TAGS if tag in headers] + [tag for tag in headers if tag not in SEVEN_TAGS]
+    lines = []
+    for tag in tags:
+        value = str(headers[tag]).replace('\\', '\\\\').replace('"', '\\"')
+        lines.append(f'[{tag} "{value}"]')
+    movetext = zlib.decompress(moves).decode('utf-8')
+    lines.append("")
+    lines.append(_wrap(movetext) or "*")
+    return "\n".join(lines) + "\n\n"
+
+
+def _wrap(text: str, width: int = 79) -> str:
+    """Lines of at most `width` characters, broken at spaces (PGN export format)."""
+    lines, line = [], ""
+    for word in text.split():
+        if line and len(line) + 1 + len(word) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line:
+        lines.append(line)
+    return "\n".join(lines)
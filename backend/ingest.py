@@ -0,0 +1,316 @@
+"""
+Ingest - results dropped into a folder by electronic boards (JSON or PGN).
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .app_state import write_atomic
+from .concurrency import ConflictError, RoundLockedError
+from .database import Database
+from .pgn import iter_games
+from .results import normalize_result, result_error, set_results
+
+logger = logging.getLogger(__name__)
+
+PROCESSED_DIR = "processed"
+REJECTED_DIR = "rejected"
+
+COMPLETE_SUFFIXES = ('.json', '.pgn')  # Whole files, read once they stop changing
+TAILED_SUFFIXES = ('.jsonl', '.ndjson')  # Appended to; new lines are read on every poll
+PARTIAL_SUFFIXES = ('.tmp', '.part')  # Still being written by the dropper
+OFFSETS_FILE = ".offsets.json"  # Tailed file name -> bytes saved, kept across restarts
+
+
+@dataclass
+class FeedGame:
+    """One game result from the feed; board and names are whatever the file gave."""
+    source: str
+    round_number: Optional[int]
+    board: Optional[int]
+    white: str
+    black: str
+    result: str
+
+    def label(self) -> str:
+        if self.white or self.black:
+            return f"{self.white} - {self.black}"
+        return f"board {self.board}" if self.board is not None else "game without board or players"
+
+
+@dataclass
+class IngestReport:
+    """Outcome of one poll."""
+    files: int = 0
+    applied: int = 0  # Results that changed
+    unchanged: int = 0
+    in_progress: int = 0  # Games without a result yet ('*')
+    rejected: List[str] = field(default_factory=list)  # One reason per rejected game or file
+
+    @property
+    def changed(self) -> bool:
+        return self.applied > 0
+
+
+def name_key(name: str) -> str:
+    """Compare names regardless of case, punctuation and order ("Smith, Anna" == "anna smith")."""
+    words = ''.join(c if c.isalnum() else ' ' for c in name.casefold()).split()
+    return ' '.join(sorted(words))
+
+
+def _games_from_json(data, source: str) -> Iterator[FeedGame]:
+    if isinstance(data, dict):
+        data = data.get('games', [data])
+    if not isinstance(data, list):
+        raise ValueError("expected an object or a list of games")
+    for entry in data:
+        if not isinstance(entry, dict):
+            raise ValueError("expected an object per game")
+        round_number, board = entry.get('round'), entry.get('board')
+        yield FeedGame(
+            source,
+            int(round_number) if round_number is not None else None,
+            int(board) if board is not None else None,
+            str(entry.get('white') or ''),
+            str(entry.get('black') or ''),
+            str(entry.get('result') or '*'),
+        )
+
+
+def _games_from_pgn(f, source: str) -> Iterator[FeedGame]:
+    for game in iter_games(f):
+        round_number, board = game.round_and_board()
+        yield FeedGame(source, round_number, board, game.get('White'), game.get('Black'), game.get('Result', '*'))
+
+
+class RoundPairings:
+    """
+    Board lookup for one round: by board number, checked against names, or
+    by names alone. Boards are numbered in pairing id order from 1.
+    """
+
+    def __init__(self, rows: List[Tuple]):
+        """`rows`: (pairing id, white id, black id, white name, black name) in board order."""
+        self.rows = rows
+        self.boards = [(name_key(w or ''), name_key(b or '')) for _, _, _, w, b in rows]
+        self.by_names = {names: i + 1 for i, names in enumerate(self.boards)}
+
+    @classmethod
+    def load(cls, conn, tournament_id: int, round_number: int) -> 'RoundPairings':
+        return cls(conn.execute("""
+            SELECT p.id, p.white_player_id, p.black_player_id, wp.name, bp.name FROM pairings p
+            JOIN rounds r ON r.id = p.round_id
+            LEFT JOIN players wp ON wp.id = p.white_player_id
+            LEFT JOIN players bp ON bp.id = p.black_player_id
+            WHERE r.tournament_id = ? AND r.round_number = ?
+            ORDER BY p.id
+        """, (tournament_id, round_number)).fetchall())
+
+    def find(self, game: FeedGame) -> Tuple[Optional[int], str]:
+        """(board, '') or (None, reason)."""
+        names = (name_key(game.white), name_key(game.black))
+        if game.board is not None and 1 <= game.board <= len(self.boards):
+            expected = self.boards[game.board - 1]
+            if not (game.white or game.black) or names == expected:
+                return game.board, ''
+        board = self.by_names.get(names)
+        if board is not None:
+            return board, ''
+        if (names[1], names[0]) in self.by_names:
+            return None, f"{game.label()}: colours reversed against the pairing"
+        where = f"board {game.board}" if game.board is not None else "any board"
+        return None, f"{game.label()}: no matching pairing on {where}"
+
+
+class ResultFeed:
+    """
+    Watched folder of result files for one tournament.
+
+    Each poll lists only the inbox: finished .json/.pgn files are moved to
+    processed/ (or rejected/ when a game can't be placed), so the folder
+    never has to be rescanned. .jsonl/.ndjson files stay and are tailed
+    from the last saved offset. Games are matched to pairings by board,
+    checked against player names, or by names alone, and saved with
+    set_results - one transaction per round and poll. Games without a
+    result are skipped, so a board's live updates never clear a result.
+
+    A tailed file's offset only moves past lines whose results were saved
+    (or rejected for good), and is kept in .offsets.json in the folder, so
+    neither a write conflict nor a restart replays or loses lines.
+    """
+
+    def __init__(self, db: Database, folder: str, settle_seconds: float = 1.0, max_files: int = 500):
+        self.db = db
+        self.folder = folder
+        self.settle_seconds = settle_seconds  # A file unchanged this long is complete
+        self.max_files = max_files  # Per poll, so a flood doesn't hold the writer for long
+        self._offsets: Dict[str, int] = self._load_offsets()  # Tailed file name -> bytes saved
+
+    def _load_offsets(self) -> Dict[str, int]:
+        try:
+            with open(os.path.join(self.folder, OFFSETS_FILE), 'r', encoding='utf-8') as f:
+                offsets = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(offsets, dict):
+            return {}
+        return {name: offset for name, offset in offsets.items() if isinstance(offset, int)}
+
+    def _save_offsets(self) -> None:
+        try:
+            write_atomic(os.path.join(self.folder, OFFSETS_FILE), json.dumps(self._offsets, indent=1))
+        except OSError as e:
+            logger.warning("Could not save results feed offsets: %s", e)
+
+    def _ready_files(self) -> List[os.DirEntry]:
+        if not os.path.isdir(self.folder):
+            return []
+        now = time.time()
+        ready = []
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name.startswith('.') or name.endswith(PARTIAL_SUFFIXES) or not entry.is_file():
+                    continue
+                if name.endswith(TAILED_SUFFIXES):
+                    # A smaller file than the offset was replaced; it is read from the start
+                    if entry.stat().st_size != self._offsets.get(entry.name, 0):
+                        ready.append(entry)
+                elif name.endswith(COMPLETE_SUFFIXES) and now - entry.stat().st_mtime >= self.settle_seconds:
+                    ready.append(entry)
+        ready.sort(key=lambda e: e.stat().st_mtime)  # Oldest first: a later file wins for the same board
+        return ready[:self.max_files]
+
+    def _tail(self, path: str) -> Tuple[List[FeedGame], List[str], int]:
+        """
+        Complete lines added since the saved offset: their games, reasons
+        for lines that couldn't be read, and the offset after them.
+        """
+        source = os.path.basename(path)
+        games, bad = [], []
+        with open(path, 'rb') as f:
+            offset = self._offsets.get(source, 0)
+            if offset > os.fstat(f.fileno()).st_size:
+                offset = 0
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Half-written line; read again next poll
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    games.extend(_games_from_json(json.loads(line), source))
+                except (ValueError, TypeError) as e:
+                    bad.append(f"line ending at byte {offset} unreadable: {e}")  # Skipped on its own
+        return games, bad, offset
+
+    def _read(self, path: str) -> List[FeedGame]:
+        source = os.path.basename(path)
+        with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+            if path.lower().endswith('.pgn'):
+                return list(_games_from_pgn(f, source))
+            return list(_games_from_json(json.load(f), source))
+
+    def _move(self, path: str, subfolder: str, reasons: List[str] = ()) -> None:
+        target = os.path.join(self.folder, subfolder)
+        os.makedirs(target, exist_ok=True)
+        destination = os.path.join(target, os.path.basename(path))
+        os.replace(path, destination)  # A file of the same name from earlier is superseded
+        if reasons:
+            with open(destination + ".errors.txt", 'w', encoding='utf-8') as f:
+                f.write("\n".join(reasons) + "\n")
+
+    def poll(self, tournament_id: int) -> IngestReport:
+        """Read ready files, save their results and file them away."""
+        report = IngestReport()
+        games: List[FeedGame] = []
+        problems: Dict[str, List[str]] = {}  # File -> reasons it (partly) failed
+        paths = []
+        tailed: Dict[str, int] = {}  # Tailed file -> offset once this poll's lines are saved
+        for entry in self._ready_files():
+            report.files += 1
+            paths.append(entry.path)
+            try:
+                if entry.name.lower().endswith(TAILED_SUFFIXES):
+                    new_games, bad, tailed[entry.path] = self._tail(entry.path)
+                    games.extend(new_games)
+                    if bad:
+                        problems.setdefault(entry.path, []).extend(bad)
+                else:
+                    games.extend(self._read(entry.path))
+            except (OSError, ValueError, TypeError) as e:
+                problems.setdefault(entry.path, []).append(f"unreadable: {e}")
+
+        # Place each game on a board of its round; the last file for a board wins
+        rounds: Dict[int, RoundPairings] = {}
+        batches: Dict[int, Dict[int, Tuple[str, str]]] = {}  # round -> board -> (result, file)
+        for game in games:
+            path = os.path.join(self.folder, game.source)
+            result = normalize_result(game.result)
+            if result == '*':
+                report.in_progress += 1
+                continue
+            if result is None or game.round_number is None:
+                problems.setdefault(path, []).append(
+                    f"{game.label()}: " + ("no round" if result else f"unknown result '{game.result}'")
+                )
+                continue
+            if game.round_number not in rounds:
+                with self.db.get_connection() as conn:
+                    rounds[game.round_number] = RoundPairings.load(conn, tournament_id, game.round_number)
+            board, reason = rounds[game.round_number].find(game)
+            if board is not None:
+                _, white_id, black_id, _, _ = rounds[game.round_number].rows[board - 1]
+                reason = result_error(white_id, black_id, result)
+                if reason:
+                    board, reason = None, f"{game.label()}: {reason}"
+            if board is None:
+                problems.setdefault(path, []).append(f"round {game.round_number}: {reason}")
+            else:
+                batches.setdefault(game.round_number, {})[board] = (result, path)
+
+        retry = set()
+        for round_number, boards in sorted(batches.items()):
+            try:
+                outcome = set_results(
+                    self.db, tournament_id, round_number, [(b, r) for b, (r, _) in boards.items()]
+                )
+            except (RoundLockedError, ValueError) as e:
+                for _, path in boards.values():
+                    problems.setdefault(path, []).append(f"round {round_number}: {e}")
+                continue
+            except ConflictError:
+                retry.update(path for _, path in boards.values())  # Changed mid-write; try next poll
+                continue
+            report.applied += len(outcome.changed)
+            report.unchanged += len(boards) - len(outcome.changed)
+
+        # Tailed lines count as read once their rounds are saved; a conflict re-reads them next poll
+        moved = {os.path.basename(path): offset for path, offset in tailed.items() if path not in retry}
+        if any(self._offsets.get(name) != offset for name, offset in moved.items()):
+            self._offsets.update(moved)
+            self._save_offsets()
+
+        for path in paths:
+            if path in retry or path.lower().endswith(TAILED_SUFFIXES):
+                continue
+            try:
+                if path in problems:
+                    self._move(path, REJECTED_DIR, problems[path])
+                else:
+                    self._move(path, PROCESSED_DIR)
+            except OSError as e:
+                logger.warning("Could not move %s: %s", path, e)
+        for path, reasons in problems.items():
+            for reason in reasons:
+                logger.warning("Results feed %s: %s", os.path.basename(path), reason)
+            report.rejected.extend(reasons)
+        if report.files:
+            logger.info("Results feed: %d files, %d results saved, %d unchanged, %d rejected",
+                        report.files, report.applied, report.unchanged, len(report.rejected))
+        return report
@@ -0,0 +1,262 @@
+"""
+Instrumentation - timing and SQL counts per user action, kept in memory.
+"""
+
+import functools
+import json
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+
+WINDOW = 256  # Calls kept per action for the rolling histogram and percentiles
+
+N_PLUS_ONE_THRESHOLD = 10  # Same statement this many times in one action
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+_TRANSACTION = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE')
+
+
+def normalize_sql(sql: str) -> str:
+    """Statement text with literals replaced by ?, so repeats of one query compare equal."""
+    return _SPACES.sub(' ', _LITERALS.sub('?', sql)).strip()
+
+
+class _Frame:
+    """Counters of one running action."""
+    __slots__ = ('name', 'start', 'statements', 'rows', 'shapes')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.statements = 0
+        self.rows = 0
+        self.shapes = Counter()
+
+
+class ActionStats:
+    """Rolling window of one action's calls."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0  # All-time, the window only keeps the last WINDOW
+        self.total_ms = 0.0
+        self.window = deque(maxlen=WINDOW)  # (ms, statements, rows)
+        self.n_plus_one: Dict[str, int] = {}  # normalized SQL -> worst repeat count seen
+
+    def add(self, ms: float, frame: _Frame) -> None:
+        self.calls += 1
+        self.total_ms += ms
+        self.window.append((ms, frame.statements, frame.rows))
+        for sql, count in frame.shapes.items():
+            if count >= N_PLUS_ONE_THRESHOLD and count > self.n_plus_one.get(sql, 0):
+                self.n_plus_one[sql] = count
+
+    def histogram(self) -> List[int]:
+        """Call counts per BUCKETS_MS bucket (plus one open-ended bucket) over the window."""
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for ms, _, _ in self.window:
+            i = 0
+            while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+                i += 1
+            counts[i] += 1
+        return counts
+
+    def to_dict(self) -> Dict:
+        times = sorted(ms for ms, _, _ in self.window)
+        n = len(times) or 1
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'total_ms': round(self.total_ms, 2),
+            'mean_ms': round(sum(times) / n, 2),
+            'p50_ms': round(times[len(times) // 2], 2) if times else 0.0,
+            'p95_ms': round(times[min(len(times) - 1, int(len(times) * 0.95))], 2) if times else 0.0,
+            'max_ms': round(times[-1], 2) if times else 0.0,
+            'statements': round(sum(s for _, s, _ in self.window) / n, 1),
+            'rows': round(sum(r for _, _, r in self.window) / n, 1),
+            'histogram': self.histogram(),
+            'n_plus_one': [{'sql': sql, 'count': count} for sql, count in
+                           sorted(self.n_plus_one.items(), key=lambda item: -item[1])],
+        }
+
+
+class Instrumentation:
+    """
+    Collects per-action timings and SQL statement/row counts.
+
+    An action is one slot call, property read or background job (see
+    instrumented() and AsyncDatabase). Database reports every statement it
+    runs while an action is active on the calling thread; a statement shape
+    repeated N_PLUS_ONE_THRESHOLD times in one action is flagged as an N+1
+    pattern. Nested actions each get their own counts, so a slot that calls
+    another slot shows both.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        # Optional capture(name, fn, args, kwargs) that runs outermost actions,
+        # e.g. Profiler.capture to profile slow slots
+        self.slow_capture = None
+        self._local = threading.local()
+        self._stats: Dict[str, ActionStats] = {}
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    # --- Recording ---
+
+    @contextmanager
+    def action(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        stack = self._stack()
+        frame = _Frame(name)
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            ms = (time.perf_counter() - frame.start) * 1000
+            with self._lock:
+                stats = self._stats.get(name)
+                if stats is None:
+                    stats = self._stats[name] = ActionStats(name)
+                stats.add(ms, frame)
+
+    def outermost(self) -> bool:
+        """Whether the calling thread is in exactly one action (not a nested one)."""
+        return len(getattr(self._local, 'stack', None) or ()) == 1
+
+    def active(self) -> bool:
+        """Whether the calling thread is inside an action (statements are counted)."""
+        return bool(getattr(self._local, 'stack', None))
+
+    def statement(self, sql: str) -> None:
+        stack = getattr(self._local, 'stack', None)
+        if not stack:
+            return
+        shape = normalize_sql(sql)
+        if shape.upper().startswith(_TRANSACTION):
+            return  # Implicit transaction control isn't a query
+        for frame in stack:
+            frame.statements += 1
+            frame.shapes[shape] += 1
+
+    def tracer(self):
+        """
+        Callback for sqlite3's set_trace_callback, one per connection.
+
+        sqlite reports each trigger program it runs with the text of the
+        statement that fired it, so back-to-back repeats of the same
+        (parameter-expanded) text are counted once.
+        """
+        last = [None]
+
+        def trace(sql):
+            if sql != last[0]:
+                last[0] = sql
+                self.statement(sql)
+        return trace
+
+    def rows(self, count: int) -> None:
+        for frame in getattr(self._local, 'stack', None) or ():
+            frame.rows += count
+
+    # --- Reporting ---
+
+    def report(self) -> List[Dict]:
+        """Stats of every action seen, slowest total first."""
+        with self._lock:
+            stats = [s.to_dict() for s in self._stats.values()]
+        return sorted(stats, key=lambda s: -s['total_ms'])
+
+    def stats(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            stats = self._stats.get(name)
+            return stats.to_dict() if stats else None
+
+    def format_report(self, limit: Optional[int] = None) -> str:
+        """Plain-text table of report(), followed by any N+1 findings."""
+        report = self.report()[:limit]
+        lines = [f"{'action':<40} {'calls':>6} {'mean':>9} {'p95':>9} {'max':>9} {'sql':>6} {'rows':>7}"]
+        for s in report:
+            lines.append(
+                f"{s['name'][:40]:<40} {s['calls']:>6} {s['mean_ms']:>7.1f}ms {s['p95_ms']:>7.1f}ms "
+                f"{s['max_ms']:>7.1f}ms {s['statements']:>6.1f} {s['rows']:>7.1f}"
+            )
+        findings = [(s['name'], n) for s in report for n in s['n_plus_one']]
+        if findings:
+            lines.append("")
+            lines.append("Possible N+1 queries:")
+            for name, n in findings:
+                lines.append(f"  {name}: {n['count']}x {n['sql'][:100]}")
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        """Write the report to `path` (JSON if it ends in .json, text otherwise)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith('.json'):
+                json.dump({'buckets_ms': list(BUCKETS_MS), 'actions': self.report()}, f, indent=2)
+            else:
+                f.write(self.format_report() + "\n")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# Shared by Database, AsyncDatabase and the bridge
+instrumentation = Instrumentation()
+
+
+def no_capture(fn):
+    """Mark `fn` as never run under slow_capture (e.g. slots that start a profiler themselves)."""
+    fn.__no_capture__ = True
+    return fn
+
+
+def timed(name: str, fn):
+    """Wrap `fn` so each call is recorded as action `name`."""
+    capturable = not getattr(fn, '__no_capture__', False)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with instrumentation.action(name):
+            capture = instrumentation.slow_capture
+            if capture is not None and capturable and instrumentation.outermost():
+                return capture(name, fn, args, kwargs)
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def instrumented(cls):
+    """
+    Class decorator for QObjects: records every slot call and property read.
+
+    Returns a subclass that redeclares the wrapped slots and properties, so
+    the Qt meta-object (what QML calls through) sees the timed versions.
+    Slots are recognised by the signature pyqtSlot attaches to them.
+    """
+    from PyQt5.QtCore import pyqtProperty
+
+    namespace = {'__module__': cls.__module__, '__qualname__': cls.__qualname__, '__doc__': cls.__doc__}
+    for attr, value in vars(cls).items():
+        if attr.startswith('_'):
+            continue
+        if isinstance(value, pyqtProperty) and value.fget is not None:
+            namespace[attr] = value.getter(timed(f"{attr} [get]", value.fget))
+        elif callable(value) and hasattr(value, '__pyqtSignature__'):
+            namespace[attr] = timed(attr, value)
+    return type(cls)(cls.__name__, (cls,), namespace)
@@ -0,0 +1,118 @@
+"""
+Logs - logging setup: rotating file, in-memory ring buffer, per-module levels.
+
+Modules log through logging.getLogger(__name__) with %-style arguments, so
+messages are only formatted when their level is enabled.
+"""
+
+import logging
+import os
+import sys
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+
+LOG_FILE = "tournament.log"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+# Loggers the app writes to; levels are set on these, not on the root logger
+APP_LOGGERS = ('backend', 'bridge', 'main')
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records in memory for the UI."""
+
+    def __init__(self, capacity: int = 1000):
+        super().__init__()
+        self._records = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            entry = {
+                'time': datetime.fromtimestamp(record.created).strftime("%H:%M:%S"),
+                'level': record.levelname,
+                'logger': record.name,
+                'message': record.getMessage(),
+            }
+        except Exception:
+            self.handleError(record)
+            return
+        self._records.append(entry)  # handle() holds the handler lock
+
+    def records(self, min_level: str = 'DEBUG') -> List[Dict]:
+        """Buffered records, oldest first, at `min_level` or above."""
+        threshold = logging.getLevelName(min_level)
+        with self.lock:
+            return [r for r in self._records if logging.getLevelName(r['level']) >= threshold]
+
+    def clear(self) -> None:
+        with self.lock:
+            self._records.clear()
+
+
+ring_buffer = RingBufferHandler()
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """
+    Parse per-module levels, e.g. "backend.pairing=DEBUG, bridge=WARNING".
+    Unknown levels and malformed entries are skipped.
+    """
+    levels = {}
+    for entry in spec.split(','):
+        name, _, level = entry.partition('=')
+        name, level = name.strip(), level.strip().upper()
+        if name and level in LEVELS:
+            levels[name] = logging.getLevelName(level)
+    return levels
+
+
+def setup_logging(folder: Optional[str] = None, console: Optional[bool] = None) -> None:
+    """
+    Attach the ring buffer, a rotating file in `folder` and (when there is a
+    console) stderr to the app loggers. Safe to call more than once.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers: List[logging.Handler] = [ring_buffer]
+    if folder:
+        try:
+            os.makedirs(folder, exist_ok=True)
+            file_handler = RotatingFileHandler(
+                os.path.join(folder, LOG_FILE), maxBytes=1024 * 1024, backupCount=3, encoding='utf-8'
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError:
+            pass  # Read-only install folder: memory only
+    if console is None:
+        console = sys.stderr is not None  # None in a --noconsole build
+    if console:
+        stream = logging.StreamHandler()
+        stream.setFormatter(formatter)
+        handlers.append(stream)
+
+    for name in APP_LOGGERS:
+        logger = logging.getLogger(name)
+        for old in list(logger.handlers):
+            if old is not ring_buffer:
+                old.close()
+            logger.removeHandler(old)
+        for handler in handlers:
+            logger.addHandler(handler)
+        logger.propagate = False
+    configure_levels('INFO')
+
+
+def configure_levels(default: str = 'INFO', overrides: str = '') -> None:
+    """Set the app loggers to `default`, then apply per-module overrides."""
+    level = logging.getLevelName(default.upper()) if default.upper() in LEVELS else logging.INFO
+    for name in APP_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+    # Clear overrides from an earlier configuration before applying new ones
+    for name, logger in logging.Logger.manager.loggerDict.items():
+        if isinstance(logger, logging.Logger) and name.split('.')[0] in APP_LOGGERS and name not in APP_LOGGERS:
+            logger.setLevel(logging.NOTSET)
+    for name, module_level in parse_levels(overrides).items():
+        logging.getLogger(name).setLevel(module_level)
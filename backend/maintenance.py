@@ -0,0 +1,47 @@
+"""
+Maintenance - keeps the working database compact and its query plans fresh.
+"""
+
+import os
+from typing import Dict
+
+from .database import Database
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def _file_size(path: str) -> int:
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+
+def run_maintenance(db: Database) -> Dict:
+    """
+    Reclaim free pages, refresh planner statistics and fold the WAL back
+    into the main file.
+
+    The first run switches the file to incremental auto-vacuum, which needs
+    one full VACUUM; later runs only release free pages.
+
+    Returns:
+        Sizes before/after (bytes, including the WAL) and what was done
+    """
+    size_before = _file_size(db.db_path)
+    with db.get_connection() as conn:
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+            conn.execute(f"PRAGMA auto_vacuum = {AUTO_VACUUM_INCREMENTAL}")
+            conn.execute("VACUUM")
+            vacuum = 'full'
+        else:
+            conn.execute("PRAGMA incremental_vacuum")
+            vacuum = 'incremental'
+        conn.execute("ANALYZE")
+        checkpoint = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+
+    return {
+        'size_before': size_before,
+        'size_after': _file_size(db.db_path),
+        'free_pages_released': free_pages,
+        'vacuum': vacuum,
+        'checkpoint_busy': bool(checkpoint[0]),
+    }
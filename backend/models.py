@@ -1,8 +1,20 @@
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
-class Tournament:
+# Python 3.10+ generates __slots__ (no per-instance __dict__); older versions get plain dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class _RowModel:
+    """Mixin for row models: dict conversion that works with or without __slots__."""
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+@dataclass(**_SLOTS)
+class Tournament(_RowModel):
     id: int
     name: str
     type: str  # 'SWISS' or 'ROUND_ROBIN'
@@ -12,8 +24,8 @@ class Tournament:
     created_at: str
     venue: Optional[str] = None
 
-@dataclass
-class Player:
+@dataclass(**_SLOTS)
+class Player(_RowModel):
     id: int
     tournament_id: int
     name: str
@@ -22,6 +34,7 @@ class Player:
     club: Optional[str] = None
     status: str = 'ACTIVE' # 'ACTIVE', 'WITHDRAWN'
     withdraw_round: Optional[int] = None
+    registry_id: Optional[int] = None
     
     # Computed fields
     points: float = 0.0
@@ -29,22 +42,24 @@ class Player:
     buchholz: float = 0.0
     sonneborn_berger: float = 0.0
 
-@dataclass
-class Round:
+@dataclass(**_SLOTS)
+class Round(_RowModel):
     id: int
     tournament_id: int
     round_number: int
     status: str  # 'NOT_STARTED', 'IN_PROGRESS', 'LOCKED'
     locked_at: Optional[str] = None
     pairing_mode: str = 'AUTO' # 'AUTO', 'MANUAL'
+    version: int = 0  # Bumped on every update (optimistic concurrency)
 
-@dataclass
-class Pairing:
+@dataclass(**_SLOTS)
+class Pairing(_RowModel):
     id: int
     round_id: int
     white_player_id: Optional[int]
     black_player_id: Optional[int]
     result: str  # '1-0', '0-1', '0.5-0.5', '*', 'BYE', 'FORFEIT'
+    version: int = 0  # Bumped on every update (optimistic concurrency)
     
     # Helper properties for UI display (not in DB)
     white_player_name: Optional[str] = ""
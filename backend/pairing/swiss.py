@@ -1,43 +1,58 @@
+import logging
 import random
-from typing import List, Tuple, Dict, Set, Optional
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple, Dict, Set, Optional, Union
 from ..models import Player, Pairing
+from ..tables import PairingTable
+
+logger = logging.getLogger(__name__)
+
+# Results that leave a board free to re-pair: not played yet, or a bye
+OPEN_RESULTS = ('*', 'BYE')
+
+
+@dataclass
+class RepairPlan:
+    """
+    Changes to a round's pairings from SwissEngine.repair_round. Boards not
+    listed are kept as they are. Pairings are dicts like pair_round's.
+    """
+    updates: List[Tuple[int, dict]] = field(default_factory=list)  # (pairing id, new pairing) - same board
+    deletes: List[int] = field(default_factory=list)  # Pairing ids no longer needed
+    inserts: List[dict] = field(default_factory=list)  # New boards, after the existing ones
+
+    @property
+    def touched(self) -> int:
+        return len(self.updates) + len(self.deletes) + len(self.inserts)
+
 
 class SwissEngine:
+    # Backtracking steps allowed for a whole repair, shared by every widening attempt
+    REPAIR_SEARCH_LIMIT = 20000
+    # Untouched boards a repair may open up looking for a pairing without rematches
+    MAX_REPAIR_WIDEN = 3
+
     def __init__(self):
         pass
 
-    def pair_round(self, players: List[Player], past_pairings: List[Pairing], round_num: int) -> List[dict]:
+    def pair_round(self, players: List[Player], past_pairings: Union[List[Pairing], PairingTable],
+                   round_num: int) -> List[dict]:
         """
         Standard Dutch Swiss pairing.
+        `past_pairings` may be Pairing objects or a columnar PairingTable.
         Returns pairings list.
         """
 
         # Exclude withdrawn players
         active_players = [p for p in players if p.status != 'WITHDRAWN']
-        print(f"Pairing {len(active_players)} active players")
+        logger.debug("Pairing %d active players", len(active_players))
         players = active_players
 
         # Sort by points (primary) and rating (secondary)
         players.sort(key=lambda p: (p.points, p.rating), reverse=True)
 
         # Load history to avoid repeat matchups
-        played_games: Set[frozenset] = set()
-        from collections import defaultdict
-        player_colors: Dict[int, List[str]] = defaultdict(list)
-        # Initialize for active players to ensure they exist even if empty history
-        for p in players:
-            player_colors[p.id] = []
-        
-        
-        for p in past_pairings:
-            if p.white_player_id and p.black_player_id:
-                played_games.add(frozenset([p.white_player_id, p.black_player_id]))
-                player_colors[p.white_player_id].append('W')
-                player_colors[p.black_player_id].append('B')
-            elif p.result == 'BYE':
-                if p.white_player_id: player_colors[p.white_player_id].append('BYE') # Simplify bye tracking
-
-        print(f"History loaded. Played pairs: {len(played_games)}")
+        played_games, player_colors = self._load_history(players, past_pairings)
 
 
         # Handle Bye for odd number of players
@@ -126,6 +141,213 @@ class SwissEngine:
             
         return pairings
 
+    def repair_round(self, players: List[Player], past_pairings: Union[List[Pairing], PairingTable],
+                     current: List[Pairing], absent: Iterable[int] = ()) -> RepairPlan:
+        """
+        Re-pair only the players affected by withdrawals or no-shows in a
+        round that is already paired, keeping every other board as it is.
+
+        Boards with a withdrawn or `absent` player (and no result yet) are
+        broken up and their remaining players paired among themselves by
+        score group, avoiding rematches. With an odd number of them, the
+        current bye holder joins them or, without one, the lowest player who
+        hasn't had a bye gets it.
+        Only when no rematch-free pairing exists is the nearest untouched
+        board in score opened up too, one at a time and at most
+        MAX_REPAIR_WIDEN of them. If that doesn't help (or the search budget
+        runs out), only the stranded players are paired again, with as few
+        rematches as a greedy pass can manage.
+
+        `past_pairings` is the history before this round; `current` the
+        round's pairings in board order. New pairings stay on the board of
+        one of their players where possible, so printed sheets mostly hold.
+        """
+        absent = set(absent)
+        active = {p.id: p for p in players if p.status != 'WITHDRAWN' and p.id not in absent}
+        played_games, player_colors = self._load_history(list(active.values()), past_pairings)
+
+        reusable, free = [], []
+        open_games, bye_board = [], None
+        for pairing in current:
+            ids = [pid for pid in (pairing.white_player_id, pairing.black_player_id) if pid]
+            if pairing.result not in OPEN_RESULTS:
+                continue  # Already played: the result stands
+            if any(pid not in active for pid in ids):
+                reusable.append(pairing)
+                free.extend(active[pid] for pid in ids if pid in active)
+            elif len(ids) == 1:
+                bye_board = pairing
+            elif len(ids) == 2:
+                open_games.append(pairing)
+
+        if len(free) % 2 and bye_board is not None:
+            # The bye holder is needed to make the numbers even
+            reusable.append(bye_board)
+            free.append(active[bye_board.white_player_id or bye_board.black_player_id])
+            bye_board = None
+
+        if not reusable and not free:
+            return RepairPlan()
+
+        # Widen to the nearest untouched board only while no rematch-free pairing exists
+        open_games.sort(key=lambda pairing: pairing.id)
+        stranded, stranded_boards = list(free), list(reusable)
+        budget = [self.REPAIR_SEARCH_LIMIT]
+        for widened in range(self.MAX_REPAIR_WIDEN + 1):
+            matched = self._match(free, len(free) % 2 == 1, played_games, player_colors, budget)
+            if matched is not None or not open_games or budget[0] < 0 or widened == self.MAX_REPAIR_WIDEN:
+                break
+            scores = [p.points for p in free] or [0.0]
+            nearest = min(open_games, key=lambda pairing: min(
+                abs(active[pid].points - score)
+                for pid in (pairing.white_player_id, pairing.black_player_id) for score in scores
+            ))
+            open_games.remove(nearest)
+            reusable.append(nearest)
+            free.extend(active[pid] for pid in (nearest.white_player_id, nearest.black_player_id))
+        if matched is None:
+            free, reusable = stranded, stranded_boards
+            matched = self._match(free, len(free) % 2 == 1, played_games, player_colors, [self.REPAIR_SEARCH_LIMIT])
+        if matched is None:
+            matched = self._pair_fewest_rematches(free, len(free) % 2 == 1, played_games, player_colors)
+            rematches = sum(p['black'] is not None and frozenset((p['white'].id, p['black'].id)) in played_games
+                            for p in matched)
+            logger.warning("Repair: %d rematch(es) among %d stranded players", rematches, len(free))
+
+        return self._place(matched, sorted(reusable, key=lambda pairing: pairing.id))
+
+    def _match(self, pool: List[Player], needs_bye: bool, played_games: Set[frozenset],
+               player_colors: Dict[int, List[str]], budget: List[int]) -> Optional[List[dict]]:
+        """
+        Pairings for all of `pool` without rematches (one bye if `needs_bye`),
+        or None once none exists or `budget` runs out.
+        """
+        pool = sorted(pool, key=lambda p: (p.points, p.rating), reverse=True)
+        if not needs_bye:
+            games = self._pair_all(pool, played_games, budget)
+            return None if games is None else [self._game(a, b, player_colors) for a, b in games]
+        # Bye to the lowest player who hasn't had one, else the lowest
+        candidates = sorted(range(len(pool)), key=lambda i: ('BYE' in player_colors[pool[i].id], -i))
+        for i in candidates:
+            if budget[0] < 0:
+                return None
+            games = self._pair_all(pool[:i] + pool[i + 1:], played_games, budget)
+            if games is not None:
+                return [self._game(a, b, player_colors) for a, b in games] + \
+                       [{'white': pool[i], 'black': None, 'result': 'BYE'}]
+        return None
+
+    def _pair_fewest_rematches(self, pool: List[Player], needs_bye: bool, played_games: Set[frozenset],
+                               player_colors: Dict[int, List[str]]) -> List[dict]:
+        """
+        Pairings for all of `pool`, rematches allowed but counted against:
+        the player with the fewest new opponents left picks first, taking
+        the closest score among players they haven't met.
+        """
+        pool = sorted(pool, key=lambda p: (p.points, p.rating), reverse=True)
+        bye = None
+        if needs_bye:
+            # Same choice as _match: the lowest player who hasn't had a bye, else the lowest
+            bye = pool.pop(max(range(len(pool)), key=lambda i: ('BYE' not in player_colors[pool[i].id], i)))
+
+        pairings = []
+        while pool:
+            p1 = min(pool, key=lambda p: sum(
+                frozenset((p.id, q.id)) not in played_games for q in pool if q is not p
+            ))
+            pool.remove(p1)
+            p2 = min(pool, key=lambda q: (
+                frozenset((p1.id, q.id)) in played_games, abs(q.points - p1.points),
+                bool(p1.club and p1.club == q.club)
+            ))
+            pool.remove(p2)
+            pairings.append(self._game(p1, p2, player_colors))
+        if bye is not None:
+            pairings.append({'white': bye, 'black': None, 'result': 'BYE'})
+        return pairings
+
+    def _pair_all(self, pool: List[Player], played_games: Set[frozenset],
+                  budget: List[int]) -> Optional[List[Tuple[Player, Player]]]:
+        """Backtracking: each top player takes the closest score, different club first."""
+        if not pool:
+            return []
+        p1, rest = pool[0], pool[1:]
+        order = sorted(range(len(rest)), key=lambda i: (
+            abs(rest[i].points - p1.points), bool(p1.club and p1.club == rest[i].club), i
+        ))
+        for i in order:
+            if frozenset((p1.id, rest[i].id)) in played_games:
+                continue
+            budget[0] -= 1
+            if budget[0] < 0:
+                return None
+            games = self._pair_all(rest[:i] + rest[i + 1:], played_games, budget)
+            if games is not None:
+                return [(p1, rest[i])] + games
+        return None
+
+    def _game(self, p1: Player, p2: Player, player_colors: Dict[int, List[str]]) -> dict:
+        w, b = self._assign_colors(p1, p2, player_colors)
+        return {'white': w, 'black': b}
+
+    @staticmethod
+    def _place(pairings: List[dict], reusable: List[Pairing]) -> RepairPlan:
+        """Put new pairings on freed boards, preferring a board one of its players sat on."""
+        plan = RepairPlan()
+        boards = {}
+        for pairing in reusable:
+            for pid in (pairing.white_player_id, pairing.black_player_id):
+                if pid:
+                    boards.setdefault(pid, pairing)
+        free_rows = list(reusable)
+        unplaced = []
+        for new in pairings:
+            ids = [p.id for p in (new['white'], new['black']) if p]
+            row = next((boards[pid] for pid in ids if pid in boards and boards[pid] in free_rows), None)
+            if row is None:
+                unplaced.append(new)
+                continue
+            free_rows.remove(row)
+            unchanged = (row.white_player_id, row.black_player_id, row.result) == (
+                new['white'].id, new['black'].id if new['black'] else None, new.get('result', '*')
+            )
+            if not unchanged:
+                plan.updates.append((row.id, new))
+        for new in unplaced:
+            if free_rows:
+                plan.updates.append((free_rows.pop(0).id, new))
+            else:
+                plan.inserts.append(new)
+        plan.deletes = [row.id for row in free_rows]
+        return plan
+
+    @staticmethod
+    def _load_history(players: List[Player], past_pairings: Union[List[Pairing], PairingTable]
+                      ) -> Tuple[Set[frozenset], Dict[int, List[str]]]:
+        """Pairs that already played and each player's colours ('W', 'B', 'BYE') so far."""
+        played_games: Set[frozenset] = set()
+        from collections import defaultdict
+        player_colors: Dict[int, List[str]] = defaultdict(list)
+        # Initialize for active players to ensure they exist even if empty history
+        for p in players:
+            player_colors[p.id] = []
+
+        if isinstance(past_pairings, PairingTable):
+            history = past_pairings.iter_rows()
+        else:
+            history = ((p.white_player_id, p.black_player_id, p.result) for p in past_pairings)
+
+        for white_id, black_id, result in history:
+            if white_id and black_id:
+                played_games.add(frozenset([white_id, black_id]))
+                player_colors[white_id].append('W')
+                player_colors[black_id].append('B')
+            elif result == 'BYE':
+                if white_id: player_colors[white_id].append('BYE') # Simplify bye tracking
+
+        logger.debug("History loaded. Played pairs: %d", len(played_games))
+        return played_games, player_colors
+
     def _get_color_balance(self, history: List[str]) -> int:
         """Returns >0 if needs Black, <0 if needs White"""
         w = history.count('W')
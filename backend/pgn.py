@@ -0,0 +1,89 @@
+"""
+PGN - streaming reader for Portable Game Notation files.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+_TAG = re.compile(r'^\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]\s*$')
+
+
+@dataclass
+class PgnGame:
+    """One game: its tag pairs and the move text as written (comments included)."""
+    headers: Dict[str, str] = field(default_factory=dict)
+    movetext: str = ""
+
+    def get(self, tag: str, default: str = "") -> str:
+        return self.headers.get(tag, default)
+
+    def round_and_board(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Round and board numbers from the Round and Board tags. "3.12" in
+        Round means round 3, board 12 (a common convention when Board is
+        missing). None where unknown.
+        """
+        parts = self.get('Round').split('.')
+        round_number = int(parts[0]) if parts[0].isdigit() else None
+        board = self.get('Board')
+        if board.isdigit():
+            return round_number, int(board)
+        if len(parts) > 1 and parts[1].isdigit():
+            return round_number, int(parts[1])
+        return round_number, None
+
+
+def _movetext_line(line: str, in_comment: bool) -> Tuple[str, bool]:
+    """
+    A move text line ready to be joined with the next one (a ";" comment,
+    which runs to the end of the line, becomes a {} comment), and whether a
+    {} comment is still open after it. {} comments don't nest.
+    """
+    i = 0
+    while True:
+        if in_comment:
+            end = line.find('}', i)
+            if end < 0:
+                return line, True
+            in_comment, i = False, end + 1
+            continue
+        brace, semicolon = line.find('{', i), line.find(';', i)
+        if semicolon >= 0 and (brace < 0 or semicolon < brace):
+            comment = line[semicolon + 1:].replace('}', ')').strip()
+            return f"{line[:semicolon].rstrip()} {{{comment}}}".strip(), False
+        if brace < 0:
+            return line, False
+        in_comment, i = True, brace + 1
+
+
+def iter_games(lines: Iterable[str]) -> Iterator[PgnGame]:
+    """
+    Games from PGN text, one at a time, reading `lines` once (a file object
+    streams multi-MB files in constant memory).
+    """
+    game = PgnGame()
+    moves = []
+    in_comment = False  # A "[" line inside a {} comment is not a new game
+    body = False  # Past the tag section (blank line or move text), so a tag starts the next game
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line.startswith('%'):
+            continue  # Escape line
+        if not in_comment:
+            tag = _TAG.match(line)
+            if tag:
+                if body:
+                    game.movetext = " ".join(moves)
+                    yield game
+                    game, moves, body = PgnGame(), [], False
+                game.headers[tag.group(1)] = tag.group(2).replace('\\"', '"').replace('\\\\', '\\')
+                continue
+        stripped = line.strip()
+        if stripped:
+            text, in_comment = _movetext_line(stripped, in_comment)
+            moves.append(text)
+        body = body or bool(game.headers or moves)
+    if game.headers or moves:
+        game.movetext = " ".join(moves)
+        yield game
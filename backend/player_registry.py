@@ -0,0 +1,269 @@
+"""
+Player Registry - Shared player records with full-text search.
+"""
+
+import logging
+import sqlite3
+from typing import List, Dict, Optional
+
+from .database import Database
+
+logger = logging.getLogger(__name__)
+
+
+class PlayerRegistry:
+    """
+    Global player records shared by every tournament.
+
+    Tournament `players` rows keep per-event data (rating snapshot, status)
+    and point at a registry row through `registry_id`, so the same person is
+    stored once no matter how many events they play.
+    """
+
+    FTS_TABLE = "player_registry_fts"
+    MIN_TRIGRAM_LENGTH = 3  # trigram tokenizer cannot match shorter terms
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.fts_enabled = False
+        self._init_tables()
+
+    def _init_tables(self) -> None:
+        """Create registry indexes and the FTS5 search index."""
+        with self.db.get_connection() as conn:
+            # The name index exists with or without FTS5, so it marks a database set up before
+            first_run = not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_registry_name'"
+            ).fetchone()
+            existing = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.FTS_TABLE,)
+            ).fetchone()
+
+            conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_registry_fide
+                ON player_registry(fide_id) WHERE fide_id IS NOT NULL AND fide_id != ''
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_registry_name
+                ON player_registry(name COLLATE NOCASE, club COLLATE NOCASE)
+            """)
+
+            try:
+                conn.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {self.FTS_TABLE} USING fts5(
+                        name, club, fide_id,
+                        content='player_registry', content_rowid='id',
+                        tokenize='trigram'
+                    )
+                """)
+                # Keep the external-content index in sync with the registry table
+                conn.executescript(f"""
+                    CREATE TRIGGER IF NOT EXISTS player_registry_ai AFTER INSERT ON player_registry BEGIN
+                        INSERT INTO {self.FTS_TABLE}(rowid, name, club, fide_id)
+                        VALUES (new.id, new.name, new.club, new.fide_id);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS player_registry_ad AFTER DELETE ON player_registry BEGIN
+                        INSERT INTO {self.FTS_TABLE}({self.FTS_TABLE}, rowid, name, club, fide_id)
+                        VALUES ('delete', old.id, old.name, old.club, old.fide_id);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS player_registry_au AFTER UPDATE ON player_registry BEGIN
+                        INSERT INTO {self.FTS_TABLE}({self.FTS_TABLE}, rowid, name, club, fide_id)
+                        VALUES ('delete', old.id, old.name, old.club, old.fide_id);
+                        INSERT INTO {self.FTS_TABLE}(rowid, name, club, fide_id)
+                        VALUES (new.id, new.name, new.club, new.fide_id);
+                    END;
+                """)
+                if not existing:
+                    conn.execute(f"INSERT INTO {self.FTS_TABLE}({self.FTS_TABLE}) VALUES ('rebuild')")
+                self.fts_enabled = True
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5 or older than 3.34 (no trigram tokenizer)
+                logger.warning("Registry search falling back to LIKE: %s", e)
+
+        if first_run:
+            # First run on this database: link players created before the registry existed
+            self.link_players()
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict:
+        return {
+            'id': row[0],
+            'name': row[1],
+            'rating': row[2] or 0,
+            'fide_id': row[3] or '',
+            'club': row[4] or ''
+        }
+
+    def get(self, registry_id: int) -> Optional[Dict]:
+        """Get a single registry entry."""
+        rows = self.db.execute_query(
+            "SELECT id, name, rating, fide_id, club FROM player_registry WHERE id = ?", (registry_id,)
+        )
+        return self._row_to_dict(rows[0]) if rows else None
+
+    def find(self, name: str, fide_id: Optional[str] = None, club: Optional[str] = None,
+             conn=None) -> Optional[int]:
+        """
+        Return the registry id matching a FIDE id, or else name + club.
+
+        With a FIDE id, name + club only matches an entry without one: the
+        same name and club with another FIDE id is a different person.
+        `conn` runs the lookup inside the caller's transaction.
+        """
+        if conn is None:
+            with self.db.get_connection() as conn:
+                return self.find(name, fide_id, club, conn)
+
+        if fide_id:
+            row = conn.execute("SELECT id FROM player_registry WHERE fide_id = ?", (fide_id,)).fetchone()
+            if row:
+                return row[0]
+
+        row = conn.execute(
+            f"""
+            SELECT id FROM player_registry
+            WHERE name = ? COLLATE NOCASE AND IFNULL(club, '') = ? COLLATE NOCASE
+            {"AND IFNULL(fide_id, '') = ''" if fide_id else ""}
+            LIMIT 1
+            """, (name.strip(), (club or '').strip())
+        ).fetchone()
+        return row[0] if row else None
+
+    def register(self, name: str, rating: int = 0, fide_id: Optional[str] = None,
+                 club: Optional[str] = None, conn=None) -> int:
+        """
+        Return the registry id for a player, creating the entry if needed.
+
+        An existing entry has its rating refreshed so the registry tracks the
+        most recent value seen at registration, and gets the FIDE id if it
+        had none. Pass `conn` to register inside the caller's transaction,
+        so a failed tournament insert doesn't leave a new entry behind.
+        """
+        if conn is None:
+            with self.db.get_connection() as conn:
+                return self.register(name, rating, fide_id, club, conn)
+
+        name = name.strip()
+        fide_id = (fide_id or '').strip() or None
+
+        registry_id = self.find(name, fide_id, club, conn)
+        if registry_id is not None:
+            conn.execute(
+                """
+                UPDATE player_registry SET rating = ?, fide_id = IFNULL(NULLIF(fide_id, ''), ?),
+                                           updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND (rating != ? OR (IFNULL(fide_id, '') = '' AND ? IS NOT NULL))
+                """,
+                (rating, fide_id, registry_id, rating, fide_id)
+            )
+            return registry_id
+
+        return conn.execute(
+            "INSERT INTO player_registry (name, rating, fide_id, club) VALUES (?, ?, ?, ?)",
+            (name, rating, fide_id, club)
+        ).lastrowid
+
+    def link_players(self, tournament_id: Optional[int] = None) -> None:
+        """
+        Attach unlinked tournament players to registry entries in bulk.
+
+        Matches by FIDE id first, then by name + club; anyone still unmatched
+        gets a new registry entry. Runs as a handful of set-based statements
+        in one transaction.
+        """
+        def scope(alias: str) -> str:
+            where = f"{alias}.registry_id IS NULL"
+            return where + (f" AND {alias}.tournament_id = ?" if tournament_id is not None else "")
+        params = (tournament_id,) if tournament_id is not None else ()
+
+        match_fide = f"""
+            UPDATE players SET registry_id = (
+                SELECT r.id FROM player_registry r WHERE r.fide_id = players.fide_id
+            )
+            WHERE {scope('players')} AND fide_id IS NOT NULL AND fide_id != ''
+        """
+        # A player with a FIDE id only takes a name + club entry that has none
+        match_name = f"""
+            UPDATE players SET registry_id = (
+                SELECT r.id FROM player_registry r
+                WHERE r.name = players.name COLLATE NOCASE
+                  AND IFNULL(r.club, '') = IFNULL(players.club, '') COLLATE NOCASE
+                  AND (IFNULL(players.fide_id, '') = '' OR IFNULL(r.fide_id, '') = '')
+                LIMIT 1
+            )
+            WHERE {scope('players')}
+        """
+        # Entries without a FIDE id get one from a matching player (IGNORE: another entry has it)
+        backfill_fide = f"""
+            UPDATE OR IGNORE player_registry SET fide_id = (
+                SELECT MIN(p.fide_id) FROM players p
+                WHERE {scope('p')} AND IFNULL(p.fide_id, '') != ''
+                  AND p.name = player_registry.name COLLATE NOCASE
+                  AND IFNULL(p.club, '') = IFNULL(player_registry.club, '') COLLATE NOCASE
+            )
+            WHERE IFNULL(fide_id, '') = '' AND EXISTS (
+                SELECT 1 FROM players p
+                WHERE {scope('p')} AND IFNULL(p.fide_id, '') != ''
+                  AND p.name = player_registry.name COLLATE NOCASE
+                  AND IFNULL(p.club, '') = IFNULL(player_registry.club, '') COLLATE NOCASE
+            )
+        """
+
+        with self.db.get_connection() as conn:
+            conn.execute(match_fide, params)
+            conn.execute(backfill_fide, params * 2)
+            conn.execute(match_fide, params)
+            conn.execute(match_name, params)
+            conn.execute(f"""
+                INSERT OR IGNORE INTO player_registry (name, rating, fide_id, club)
+                SELECT name, MAX(rating), NULLIF(fide_id, ''), club FROM players
+                WHERE {scope('players')}
+                GROUP BY name COLLATE NOCASE, IFNULL(club, '') COLLATE NOCASE, IFNULL(fide_id, '')
+            """, params)
+            conn.execute(match_fide, params)
+            conn.execute(match_name, params)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Type-ahead search by name, club or FIDE id.
+
+        Uses the trigram index for terms of three or more characters and an
+        indexed prefix match on name otherwise.
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        terms = [t.strip(',.') for t in query.split()]
+        terms = [t for t in terms if t]
+        long_terms = [t for t in terms if len(t) >= self.MIN_TRIGRAM_LENGTH]
+
+        if self.fts_enabled and long_terms:
+            match = " AND ".join('"' + t.replace('"', '""') + '"' for t in long_terms)
+            sql = f"""
+                SELECT r.id, r.name, r.rating, r.fide_id, r.club
+                FROM {self.FTS_TABLE} f
+                JOIN player_registry r ON r.id = f.rowid
+                WHERE {self.FTS_TABLE} MATCH ?
+            """
+            params = [match]
+            # Short terms (initials) can't use trigrams; filter them on name instead
+            for t in terms:
+                if len(t) < self.MIN_TRIGRAM_LENGTH:
+                    sql += " AND r.name LIKE ?"
+                    params.append(f"%{t}%")
+            sql += " ORDER BY f.rank LIMIT ?"
+            params.append(limit)
+        else:
+            sql = """
+                SELECT id, name, rating, fide_id, club FROM player_registry
+                WHERE name LIKE ? OR fide_id = ?
+                ORDER BY name COLLATE NOCASE
+                LIMIT ?
+            """
+            if self.fts_enabled:
+                params = [f"{query}%", query, limit]
+            else:
+                params = [f"%{query}%", query, limit]
+
+        return [self._row_to_dict(row) for row in self.db.execute_query(sql, tuple(params))]
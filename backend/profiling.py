@@ -0,0 +1,141 @@
+"""
+Profiling - cProfile and tracemalloc sessions inside the running app.
+"""
+
+import cProfile
+import os
+import re
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import List, Optional
+
+
+def _stamp() -> str:
+    return datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+
+
+class Profiler:
+    """
+    Starts and stops CPU and memory profiling, writing results to `folder`.
+
+    CPU profiles are cProfile .pstats files (open with pstats or snakeviz).
+    Memory profiles are a tracemalloc snapshot (.tracemalloc, loadable with
+    tracemalloc.Snapshot.load for diffing) plus a text file of the top
+    allocation sites. File names carry a timestamp, so sessions never
+    overwrite each other.
+
+    A CPU session covers the thread that started it (the GUI thread when
+    started from a slot). Only one cProfile session runs at a time; slow-slot
+    captures are skipped while a manual session is running.
+    """
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.slow_threshold_ms = 0  # 0 = no slow-slot capture
+        self.captures: List[str] = []  # Files written by slow-slot captures
+        self._cpu: Optional[cProfile.Profile] = None
+        self._cpu_lock = threading.Lock()  # Held while any cProfile session runs
+
+    def _path(self, prefix: str, ext: str) -> str:
+        os.makedirs(self.folder, exist_ok=True)
+        return os.path.join(self.folder, f"{prefix}_{_stamp()}{ext}")
+
+    # --- CPU ---
+
+    @property
+    def cpu_running(self) -> bool:
+        return self._cpu is not None
+
+    def start_cpu(self) -> None:
+        """
+        Raises:
+            RuntimeError: If a CPU session (or a slow-slot capture) is already running
+        """
+        if not self._cpu_lock.acquire(blocking=False):
+            raise RuntimeError("A CPU profile is already running")
+        self._cpu = cProfile.Profile()
+        self._cpu.enable()
+
+    def stop_cpu(self) -> str:
+        """Stop the CPU session and write it. Returns the .pstats path."""
+        if self._cpu is None:
+            raise RuntimeError("No CPU profile is running")
+        profile, self._cpu = self._cpu, None
+        try:
+            profile.disable()
+            path = self._path("profile", ".pstats")
+            profile.dump_stats(path)
+        finally:
+            self._cpu_lock.release()
+        return path
+
+    # --- Memory ---
+
+    @property
+    def memory_running(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start_memory(self, frames: int = 25) -> None:
+        if tracemalloc.is_tracing():
+            raise RuntimeError("Memory tracing is already running")
+        tracemalloc.start(frames)
+
+    def snapshot_memory(self, top: int = 50) -> str:
+        """
+        Write the current allocations without stopping the trace.
+
+        Returns:
+            Path of the text report; the raw snapshot sits next to it
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("Memory tracing is not running")
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        path = self._path("memory", ".txt")
+        snapshot.dump(path[:-len(".txt")] + ".tracemalloc")
+
+        current, peak = tracemalloc.get_traced_memory()
+        stats = snapshot.statistics('lineno')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"Traced memory: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)\n")
+            f.write(f"Top {top} allocation sites:\n")
+            for stat in stats[:top]:
+                f.write(f"{stat}\n")
+            rest = sum(stat.size for stat in stats[top:])
+            f.write(f"Other {len(stats[top:])} sites: {rest / 1024:.1f} KiB\n")
+        return path
+
+    def stop_memory(self, top: int = 50) -> str:
+        """Snapshot the allocations and stop tracing. Returns the text report path."""
+        try:
+            return self.snapshot_memory(top)
+        finally:
+            tracemalloc.stop()
+
+    # --- Slow-slot capture ---
+
+    def capture(self, name: str, fn, args, kwargs):
+        """
+        Run fn under cProfile and keep the profile if it took longer than
+        slow_threshold_ms. Installed as Instrumentation.slow_capture.
+        """
+        if not self.slow_threshold_ms or not self._cpu_lock.acquire(blocking=False):
+            return fn(*args, **kwargs)
+        try:
+            profile = cProfile.Profile()
+            start = time.perf_counter()
+            try:
+                return profile.runcall(fn, *args, **kwargs)
+            finally:
+                ms = (time.perf_counter() - start) * 1000
+                if ms >= self.slow_threshold_ms:
+                    safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+                    path = self._path(f"slow_{safe}_{ms:.0f}ms", ".pstats")
+                    profile.dump_stats(path)
+                    self.captures.append(path)
+        finally:
+            self._cpu_lock.release()
@@ -0,0 +1,210 @@
+"""
+Remote - thin-client counterparts of Database, ScoringKernel and ChangeWatcher
+that talk to a TournamentServer (see backend.server).
+"""
+
+import itertools
+import socket
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from . import rpc
+from .instrumentation import instrumentation
+from .scoring import ScoringKernel, Standings
+
+
+class RemoteError(RuntimeError):
+    """The server reported an error that has no local exception type."""
+
+
+# Server-side exception names re-raised as the same type on the client
+_ERRORS = {
+    name: getattr(sqlite3, name) for name in (
+        'Error', 'DatabaseError', 'OperationalError', 'IntegrityError', 'ProgrammingError'
+    )
+}
+_ERRORS.update({'ValueError': ValueError, 'KeyError': KeyError})
+
+
+def _rows(rows: List) -> List[Tuple]:
+    return [tuple(row) for row in rows]
+
+
+class _Cursor:
+    """Fetched result of one statement; mirrors the parts of sqlite3.Cursor we use."""
+
+    def __init__(self, result: Dict):
+        self._rows = _rows(result['rows'])
+        self._pos = 0
+        self.rowcount = result['rowcount']
+        self.lastrowid = result['lastrowid']
+
+    def fetchone(self):
+        if self._pos >= len(self._rows):
+            return None
+        self._pos += 1
+        return self._rows[self._pos - 1]
+
+    def fetchall(self):
+        rows, self._pos = self._rows[self._pos:], len(self._rows)
+        return rows
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+
+class _Connection:
+    """A transaction held open on the server for one get_connection() block."""
+
+    def __init__(self, db: 'RemoteDatabase', sid: int):
+        self._db = db
+        self._sid = sid
+
+    def execute(self, sql: str, params=()) -> _Cursor:
+        instrumentation.statement(sql)
+        return _Cursor(self._db.rpc('session_execute', self._sid, sql, params))
+
+    def executemany(self, sql: str, seq) -> _Cursor:
+        instrumentation.statement(sql)
+        return _Cursor(self._db.rpc('session_executemany', self._sid, sql, [list(p) for p in seq]))
+
+    def executescript(self, script: str) -> _Cursor:
+        return _Cursor(self._db.rpc('session_executescript', self._sid, script))
+
+
+class RemoteDatabase:
+    """
+    Drop-in replacement for Database that runs every statement on the server.
+
+    Each thread gets its own socket, so the async reader pool and writer
+    thread keep working. `db_path` points at a local file for this client's
+    own settings (UI scale, poll interval, ...); the tournament data stays
+    on the server.
+    """
+
+    remote = True
+
+    def __init__(self, address: str, db_path: str, timeout: float = 30.0):
+        self.address = rpc.parse_address(address)
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._ids = itertools.count(1)
+
+    # --- Transport ---
+
+    def _socket(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            sock = socket.create_connection(self.address, timeout=self.timeout)
+            conn = self._local.conn = (sock, sock.makefile('rwb'))
+        return conn
+
+    def _disconnect(self) -> None:
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        if conn:
+            conn[1].close()
+            conn[0].close()
+
+    def rpc(self, method: str, *params) -> Any:
+        """Call a server method and return its result (server errors are re-raised here)."""
+        request = rpc.encode({'id': next(self._ids), 'method': method, 'params': list(params)})
+        try:
+            sock, stream = self._socket()
+            stream.write(request)
+            stream.flush()
+            line = stream.readline()
+        except OSError:
+            self._disconnect()
+            raise
+        if not line:
+            self._disconnect()
+            raise ConnectionError("Tournament server closed the connection")
+
+        response = rpc.decode(line)
+        error = response.get('error')
+        if error:
+            raise _ERRORS.get(error['type'], RemoteError)(error['message'])
+        return response.get('result')
+
+    def close(self) -> None:
+        self._disconnect()
+
+    # --- Database interface ---
+
+    @contextmanager
+    def get_connection(self):
+        sid = self.rpc('session_begin')
+        try:
+            yield _Connection(self, sid)
+        except Exception:
+            self.rpc('session_end', sid, False)
+            raise
+        self.rpc('session_end', sid, True)
+
+    def execute_query(self, query, params=()):
+        instrumentation.statement(query)
+        rows = _rows(self.rpc('query', query, params))
+        instrumentation.rows(len(rows))
+        return rows
+
+    def execute_non_query(self, query, params=()):
+        instrumentation.statement(query)
+        return self.rpc('non_query', query, params)
+
+    def schema_version(self) -> int:
+        return self.rpc('schema_version')
+
+    def migrate_if_needed(self) -> bool:
+        return False  # The server migrates its own file
+
+    def withdraw_player(self, player_id: int, current_round: int):
+        self.execute_non_query(
+            "UPDATE players SET status = 'WITHDRAWN', withdraw_round = ? WHERE id = ?",
+            (current_round, player_id)
+        )
+
+
+class RemoteScoring(ScoringKernel):
+    """ScoringKernel whose standings are computed (and cached) by the server."""
+
+    def standings(self, tournament_id: int) -> Standings:
+        with self._lock:
+            cached = self._cache.get(tournament_id)
+        data = self.db.rpc('standings', tournament_id, cached.version if cached else None)
+        if data is None:
+            return cached
+
+        result = Standings.from_rows(tournament_id, data['version'], data['rows'])
+        with self._lock:
+            self._cache[tournament_id] = result
+        return result
+
+
+class RemoteChangeWatcher:
+    """ChangeWatcher for thin clients: compares the server's per-tournament counters."""
+
+    def __init__(self, db: RemoteDatabase):
+        self.db = db
+        self._versions: Optional[Dict[int, int]] = None
+
+    def poll(self) -> Set[int]:
+        versions = dict(self.db.rpc('score_versions'))
+        previous = self._versions or {}
+        changed = {tid for tid, v in versions.items() if previous.get(tid) != v}
+        changed |= set(previous) - set(versions)
+        self._versions = versions
+        return changed
+
+    def reset(self) -> None:
+        self._versions = None
+
+    def close(self) -> None:
+        pass
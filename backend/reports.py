@@ -3,10 +3,13 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib import colors
 from .database import Database
+from .scoring import ScoringKernel
 
 class ReportGenerator:
-    def __init__(self, db_path=None):
-        self.db = Database(db_path) if db_path else Database()
+    def __init__(self, db_path=None, scoring=None, db=None):
+        self.db = db or (Database(db_path) if db_path else Database())
+        # Share the caller's kernel so a report reuses standings already computed for the UI
+        self.scoring = scoring or ScoringKernel(self.db)
 
     def generate_round_report(self, round_id: int, output_path: str):
         """Creates round PDF."""
@@ -114,45 +117,11 @@ class ReportGenerator:
             raise ValueError(f"Tournament {tournament_id} not found.")
         t_name,t_venue, current_round = t_data[0]
         
-        # 2. Fetch Players
-        players_data = self.db.execute_query(
-            "SELECT id, name, club FROM players WHERE tournament_id = ?", (tournament_id,)
-        )
-        
-        player_map = {}
-        for row in players_data:
-            pid, name, club = row
-            player_map[pid] = {
-                "name": name,
-                "club": club if club else "Independent",
-                "points": 0.0
-            }
-            
-        # 3. Calculate Points from Locked Rounds
-        pairings = self.db.execute_query(
-            """
-            SELECT p.white_player_id, p.black_player_id, p.result 
-            FROM pairings p 
-            JOIN rounds r ON p.round_id = r.id 
-            WHERE r.tournament_id = ? AND r.status = 'LOCKED'
-            """, (tournament_id,)
-        )
+        # 2. Points from locked rounds (shared, cached scoring)
+        standings = self.scoring.standings(tournament_id)
+        sorted_players = standings.ranked()
         
-        for w_id, b_id, res in pairings:
-            if res == '*': continue
-            w_pts, b_pts = 0.0, 0.0
-            if res == '1-0': w_pts = 1.0
-            elif res == '0-1': b_pts = 1.0
-            elif res == '0.5-0.5': w_pts, b_pts = 0.5, 0.5
-            elif res == 'BYE': w_pts = 1.0; b_pts = 1.0 # Handle bye cases if any
-            
-            if w_id in player_map: player_map[w_id]["points"] += w_pts
-            if b_id in player_map: player_map[b_id]["points"] += b_pts
-            
-        # 4. Sort by points
-        sorted_players = sorted(player_map.values(), key=lambda x: x["points"], reverse=True)
-        
-        # 5. Build PDF
+        # 3. Build PDF
         doc = SimpleDocTemplate(output_path, pagesize=A4)
         elements = []
         styles = getSampleStyleSheet()
@@ -165,7 +134,7 @@ class ReportGenerator:
         data = [['Rank', 'Player Name', 'Club', 'Points']]
         for i, p in enumerate(sorted_players):
             name_para = Paragraph(p["name"], styles['Normal'])
-            club_para = Paragraph(p["club"], styles['Normal'])
+            club_para = Paragraph(p["club"] or "Independent", styles['Normal'])
             data.append([str(i+1), name_para, club_para, str(p["points"])])
             
         table = Table(data, colWidths=[40, 220, 180, 60])
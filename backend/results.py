@@ -0,0 +1,175 @@
+"""
+Results - bulk result entry: parse board/result lists and store them in one transaction.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .concurrency import ConflictError, RoundLockedError
+from .database import Database
+
+# Accepted spellings, lowercase, -> value stored in pairings.result
+RESULT_ALIASES = {
+    '1-0': '1-0',
+    '0-1': '0-1',
+    '0.5-0.5': '0.5-0.5',
+    '½-½': '0.5-0.5',
+    '1/2-1/2': '0.5-0.5',
+    '.5-.5': '0.5-0.5',
+    '=': '0.5-0.5',
+    'draw': '0.5-0.5',
+    'bye': 'BYE',
+    'forfeit': 'FORFEIT',
+    'ff': 'FORFEIT',
+    '*': '*',  # Clear the result
+}
+
+# "12 1-0", "12: ½-½", "board 12 0-1", "bd. 12 =" (one entry; entries split on , ; or newlines)
+_ENTRY = re.compile(r'^(?:board|bd\.?|b)?\s*(\d+)\s*[:.)]?\s*(\S+)$', re.IGNORECASE)
+_SEPARATORS = re.compile(r'[,;\n]+')
+
+
+def normalize_result(text: str) -> Optional[str]:
+    """Stored form of a result spelling, or None if unknown."""
+    return RESULT_ALIASES.get(text.strip().lower())
+
+
+def parse_results(entries: Union[str, Iterable]) -> List[Tuple[int, str]]:
+    """
+    (board, result) pairs from a pasted text block or from a list of
+    (board, result) pairs / {'board': .., 'result': ..} dicts.
+
+    Raises:
+        ValueError: Listing every entry that can't be read, or a board given twice
+    """
+    if isinstance(entries, str):
+        raw = []
+        for text in _SEPARATORS.split(entries):
+            text = text.strip()
+            if not text:
+                continue
+            match = _ENTRY.match(text)
+            raw.append((match.group(1), match.group(2), text) if match else (None, None, text))
+    else:
+        raw = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                board, result = entry.get('board'), entry.get('result')
+            else:
+                board, result = entry
+            raw.append((board, result, f"{board} {result}"))
+
+    parsed, errors, seen = [], [], set()
+    for board, result, text in raw:
+        try:
+            board = int(board)
+        except (TypeError, ValueError):
+            errors.append(f"'{text}': expected a board number and a result")
+            continue
+        stored = normalize_result(str(result)) if result is not None else None
+        if stored is None:
+            errors.append(f"'{text}': unknown result '{result}'")
+        elif board in seen:
+            errors.append(f"Board {board} is given twice")
+        else:
+            seen.add(board)
+            parsed.append((board, stored))
+    if errors:
+        raise ValueError("; ".join(errors))
+    return parsed
+
+
+def result_error(white_id: Optional[int], black_id: Optional[int], result: str) -> Optional[str]:
+    """Why a stored result can't go on a board with these players, or None if it can."""
+    if result == '*':
+        return None
+    if white_id is not None and black_id is None:
+        return None if result == 'BYE' else f"'{result}' on a bye board (only BYE)"
+    if white_id is None or black_id is None:
+        return f"'{result}' on a board without a white player"
+    if result == 'BYE':
+        return "BYE on a board with two players"
+    return None
+
+
+@dataclass
+class BulkResult:
+    """What set_results changed: (pairing id, old result, new result) and new versions."""
+    round_id: int
+    changed: List[Tuple[int, str, str]] = field(default_factory=list)
+    versions: Dict[int, int] = field(default_factory=dict)
+
+
+def set_results(db: Database, tournament_id: int, round_number: int, results: Sequence[Tuple[int, str]],
+                expected_versions: Optional[Dict[int, int]] = None) -> BulkResult:
+    """
+    Store results by board number (1 = first pairing of the round) in one
+    transaction: either all of them are saved or none.
+
+    `expected_versions` maps pairing id to the version the caller last saw;
+    pairings missing from it are not checked (last writer wins).
+
+    Raises:
+        ValueError: If the round or a board doesn't exist
+        RoundLockedError: If the round is locked
+        ConflictError: If a pairing was changed elsewhere (`current` lists them)
+    """
+    expected_versions = expected_versions or {}
+    with db.get_connection() as conn:
+        row = conn.execute(
+            "SELECT id, status FROM rounds WHERE tournament_id = ? AND round_number = ?",
+            (tournament_id, round_number)
+        ).fetchone()
+        if not row:
+            raise ValueError(f"Round {round_number} not found")
+        round_id, status = row
+        if status == 'LOCKED':
+            raise RoundLockedError("Round is LOCKED. Unlock to edit results.")
+
+        boards = conn.execute(
+            "SELECT id, result, version, white_player_id, black_player_id FROM pairings "
+            "WHERE round_id = ? ORDER BY id", (round_id,)
+        ).fetchall()
+        missing = [board for board, _ in results if not 1 <= board <= len(boards)]
+        if missing:
+            raise ValueError(
+                f"Round {round_number} has {len(boards)} boards; no board {', '.join(map(str, missing))}"
+            )
+        errors = [f"Board {board}: {error}" for board, result in results
+                  for error in [result_error(*boards[board - 1][3:], result)] if error]
+        if errors:
+            raise ValueError("; ".join(errors))
+
+        outcome = BulkResult(round_id)
+        updates, conflicts = [], []
+        for board, result in results:
+            pid, old, version = boards[board - 1][:3]
+            expected = expected_versions.get(pid)
+            if expected is not None and expected != version:
+                conflicts.append({'id': pid, 'board': board, 'result': old, 'version': version})
+            elif old != result:
+                updates.append((result, pid, version))
+                outcome.changed.append((pid, old, result))
+                outcome.versions[pid] = version + 1
+        if conflicts:
+            raise ConflictError(
+                f"{len(conflicts)} result(s) were changed on another terminal", {'pairings': conflicts}
+            )
+
+        if updates:
+            # The version predicates make the whole batch atomic across processes
+            cursor = conn.executemany(
+                "UPDATE pairings SET result = ?, version = version + 1 WHERE id = ? AND version = ?", updates
+            )
+            if cursor.rowcount != len(updates):
+                raise ConflictError("Results were changed on another terminal")  # Rolls back the batch
+        return outcome
+
+
+def restore_results(db: Database, previous: Iterable[Sequence]) -> None:
+    """Put back (pairing id, result) pairs in one transaction (undo of set_results)."""
+    with db.get_connection() as conn:
+        conn.executemany(
+            "UPDATE pairings SET result = ? WHERE id = ?", [(result, pid) for pid, result in previous]
+        )
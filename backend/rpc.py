@@ -0,0 +1,44 @@
+"""
+RPC protocol shared by the tournament server and its clients.
+
+One JSON object per line over a local TCP socket:
+
+    request:  {"id": 1, "method": "query", "params": ["SELECT ...", [1]]}
+    response: {"id": 1, "result": [[...], ...]}
+              {"id": 1, "error": {"type": "OperationalError", "message": "..."}}
+
+SQLite values are JSON types except BLOBs, sent as {"$bytes": "<base64>"}.
+"""
+
+import base64
+import json
+from typing import Any, Tuple
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 47800
+
+
+def _default(value):
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"$bytes": base64.b64encode(bytes(value)).decode('ascii')}
+    raise TypeError(f"Cannot send {type(value).__name__} over RPC")
+
+
+def _object_hook(obj):
+    if len(obj) == 1 and "$bytes" in obj:
+        return base64.b64decode(obj["$bytes"])
+    return obj
+
+
+def encode(message: Any) -> bytes:
+    return json.dumps(message, default=_default, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def decode(line: bytes) -> Any:
+    return json.loads(line, object_hook=_object_hook)
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """'host:port', ':port' or 'host' -> (host, port)."""
+    host, _, port = address.rpartition(':') if ':' in address else (address, '', '')
+    return host or DEFAULT_HOST, int(port) if port else DEFAULT_PORT
@@ -0,0 +1,122 @@
+"""
+Scoring - one place that turns pairings into points and tie-breaks.
+"""
+
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .database import Database
+from .tables import PlayerTable, PairingTable, STATUS_NAMES, score_points
+from .tiebreaks import TieBreaks
+
+
+@dataclass
+class Standings:
+    """Scores of one tournament at one data version."""
+    tournament_id: int
+    version: int
+    players: PlayerTable
+    buchholz: array
+    sonneborn_berger: array
+    order: List[int]  # Row indices sorted by points (desc), then name
+
+    def row(self, player_id: int) -> Optional[int]:
+        return self.players.row_of(player_id)
+
+    def ranked(self) -> List[Dict]:
+        """Players in standings order as plain dicts."""
+        p = self.players
+        return [{
+            "id": p.ids[i],
+            "name": p.names[i],
+            "club": p.clubs[i],
+            "rating": p.ratings[i],
+            "points": p.points[i],
+            "buchholz": self.buchholz[i],
+            "sonneborn_berger": self.sonneborn_berger[i],
+        } for i in self.order]
+
+    def to_rows(self) -> List[List]:
+        """Plain rows (id, name, rating, club, status, points, buchholz, sb), for sending elsewhere."""
+        p = self.players
+        return [
+            [p.ids[i], p.names[i], p.ratings[i], p.clubs[i], STATUS_NAMES[p.status[i]],
+             p.points[i], self.buchholz[i], self.sonneborn_berger[i]]
+            for i in range(len(p))
+        ]
+
+    @classmethod
+    def from_rows(cls, tournament_id: int, version: int, rows: List) -> 'Standings':
+        """Rebuild standings produced by to_rows()."""
+        players = PlayerTable.from_rows(row[:5] for row in rows)
+        players.points = array('d', (row[5] for row in rows))
+        buchholz = array('d', (row[6] for row in rows))
+        sonneborn_berger = array('d', (row[7] for row in rows))
+        names = players.names
+        order = sorted(range(len(players)), key=lambda i: (-players.points[i], names[i]))
+        return cls(tournament_id, version, players, buchholz, sonneborn_berger, order)
+
+
+class ScoringKernel:
+    """
+    Computes standings from locked rounds and caches them per tournament.
+
+    Every write to players, rounds or pairings bumps the tournament's row in
+    `score_versions` (maintained by triggers, see Database.init_db). A cached
+    result is reused until that version changes, so the UI, PDF reports and
+    tie-break updates share one computation per change.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+        self._cache: Dict[int, Standings] = {}
+        self._lock = threading.Lock()
+
+    def version(self, tournament_id: int) -> int:
+        rows = self.db.execute_query(
+            "SELECT version FROM score_versions WHERE tournament_id = ?", (tournament_id,)
+        )
+        return rows[0][0] if rows else 0
+
+    def standings(self, tournament_id: int) -> Standings:
+        """Current standings, recomputed only if the tournament's data changed."""
+        version = self.version(tournament_id)
+        with self._lock:
+            cached = self._cache.get(tournament_id)
+        if cached is not None and cached.version == version:
+            return cached
+
+        result = self._compute(tournament_id, version)
+        with self._lock:
+            self._cache[tournament_id] = result
+        return result
+
+    def invalidate(self, tournament_id: Optional[int] = None) -> None:
+        """Drop cached standings (all tournaments if no id), e.g. after a restore."""
+        with self._lock:
+            if tournament_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(tournament_id, None)
+
+    def _compute(self, tournament_id: int, version: int) -> Standings:
+        players = PlayerTable.from_rows(self.db.execute_query(
+            "SELECT id, name, rating, club, status FROM players WHERE tournament_id = ?", (tournament_id,)
+        ))
+        pairings = PairingTable.from_rows(self.db.execute_query(
+            """
+            SELECT r.round_number, p.white_player_id, p.black_player_id, p.result, 1
+            FROM pairings p
+            JOIN rounds r ON p.round_id = r.id
+            WHERE r.tournament_id = ? AND r.status = 'LOCKED'
+            """, (tournament_id,)
+        ))
+
+        # Win=1, Draw=0.5, Loss=0, Bye=1 (white side only)
+        points = score_points(players, pairings)
+        buchholz, sonneborn_berger = TieBreaks.compute(players, pairings)
+        names = players.names
+        order = sorted(range(len(players)), key=lambda i: (-points[i], names[i]))
+        return Standings(tournament_id, version, players, buchholz, sonneborn_berger, order)
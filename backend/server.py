@@ -0,0 +1,241 @@
+"""
+Tournament Server - one process owns the database and serves clients over local RPC.
+"""
+
+import os
+import socket
+import socketserver
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+from . import rpc
+from .backup_manager import BackupManager
+from .database import Database, DB_PATH
+from .scoring import ScoringKernel
+from .settings_manager import SettingsManager
+
+# A client silent this long with a transaction open is dropped and its transaction rolled back
+SESSION_IDLE_TIMEOUT = 10.0
+# How long a write waits for another client's transaction; longer than the idle timeout,
+# shorter than the client's socket timeout
+WRITE_LOCK_TIMEOUT = 20.0
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One client connection; owns the SQLite transactions that client opened."""
+
+    def setup(self):
+        super().setup()
+        self.sessions: Dict[int, sqlite3.Connection] = {}
+        self.next_session = 1
+
+    def handle(self):
+        app: 'TournamentServer' = self.server.app
+        while True:
+            # Only a client with a transaction open is timed out: it holds the write lock
+            self.connection.settimeout(app.session_idle_timeout if self.sessions else None)
+            try:
+                line = self.rfile.readline()
+            except socket.timeout:
+                break  # Stalled mid-transaction; finish() rolls back and frees the lock
+            if not line:
+                break
+            try:
+                request = rpc.decode(line)
+            except ValueError:
+                break  # Not our protocol
+            try:
+                result = app.dispatch(self, request.get('method', ''), request.get('params', []))
+                response = {'id': request.get('id'), 'result': result}
+            except Exception as e:
+                response = {'id': request.get('id'), 'error': {'type': type(e).__name__, 'message': str(e)}}
+            self.wfile.write(rpc.encode(response))
+            self.wfile.flush()
+
+    def finish(self):
+        # Client went away mid-transaction: nothing it started is committed
+        for conn in self.sessions.values():
+            conn.rollback()
+            conn.close()
+            self.server.app.unlock_writes()
+        self.sessions.clear()
+        super().finish()
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class TournamentServer:
+    """
+    Serves one tournament database to thin clients (see backend.remote).
+
+    Clients run plain SQL, including multi-statement transactions that the
+    server holds open per connection, so every backend module works
+    unchanged on the client side. Transactions and plain writes take turns
+    behind one write lock, and a client that goes quiet with a transaction
+    open is disconnected after `session_idle_timeout`, so a stalled
+    terminal can't keep the others locked out. Standings come from the server's single
+    ScoringKernel, so every terminal and public display shares one warm
+    cache instead of recomputing on its own. Backups run here, next to the
+    database file.
+    """
+
+    def __init__(self, db_path: str = DB_PATH, host: str = rpc.DEFAULT_HOST, port: int = rpc.DEFAULT_PORT,
+                 session_idle_timeout: float = SESSION_IDLE_TIMEOUT, write_lock_timeout: float = WRITE_LOCK_TIMEOUT):
+        self.db = Database(db_path)  # Migrates the file if needed
+        self.session_idle_timeout = session_idle_timeout
+        self.write_lock_timeout = write_lock_timeout
+        # Re-entrant: a handler thread with a transaction open may also send plain writes
+        self._write_lock = threading.RLock()
+        self.scoring = ScoringKernel(self.db)
+        self.settings_manager = SettingsManager(db_path)
+        self.backup_manager = BackupManager()
+        self._backup_lock = threading.Lock()
+        self._server = _ThreadingServer((host, port), _Handler, bind_and_activate=True)
+        self._server.app = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self):
+        return self._server.server_address[:2]
+
+    # --- Lifecycle ---
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="tournament-server", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    # --- Write lock ---
+
+    def lock_writes(self) -> None:
+        """
+        Wait for other clients' transactions and writes to finish.
+
+        Raises:
+            sqlite3.OperationalError: If they don't within write_lock_timeout
+        """
+        if not self._write_lock.acquire(timeout=self.write_lock_timeout):
+            raise sqlite3.OperationalError("database is locked: another terminal's transaction is still open")
+
+    def unlock_writes(self) -> None:
+        self._write_lock.release()
+
+    # --- Dispatch ---
+
+    def dispatch(self, handler: _Handler, method: str, params) -> Any:
+        if method.startswith('session_'):
+            return getattr(self, f"_rpc_{method}")(handler, *params)
+        fn = getattr(self, f"_rpc_{method}", None)
+        if fn is None:
+            raise ValueError(f"Unknown method: {method}")
+        return fn(*params)
+
+    # --- Plain statements ---
+
+    def _rpc_ping(self):
+        return "pong"
+
+    def _rpc_schema_version(self):
+        return self.db.schema_version()
+
+    def _rpc_query(self, sql, params=()):
+        return self.db.execute_query(sql, params)
+
+    def _rpc_non_query(self, sql, params=()):
+        self.lock_writes()
+        try:
+            return self.db.execute_non_query(sql, params)
+        finally:
+            self.unlock_writes()
+
+    # --- Transactions (a client's get_connection() block) ---
+
+    def _rpc_session_begin(self, handler: _Handler):
+        self.lock_writes()  # Held until session_end, or until the handler drops the client
+        try:
+            conn = sqlite3.connect(self.db.db_path, check_same_thread=False)
+            conn.execute("PRAGMA foreign_keys = ON;")
+        except BaseException:
+            self.unlock_writes()
+            raise
+        sid = handler.next_session
+        handler.next_session += 1
+        handler.sessions[sid] = conn
+        return sid
+
+    def _rpc_session_execute(self, handler: _Handler, sid, sql, params=()):
+        cursor = handler.sessions[sid].execute(sql, params)
+        return {'rows': cursor.fetchall(), 'rowcount': cursor.rowcount, 'lastrowid': cursor.lastrowid}
+
+    def _rpc_session_executemany(self, handler: _Handler, sid, sql, seq):
+        cursor = handler.sessions[sid].executemany(sql, seq)
+        return {'rows': [], 'rowcount': cursor.rowcount, 'lastrowid': cursor.lastrowid}
+
+    def _rpc_session_executescript(self, handler: _Handler, sid, script):
+        conn = handler.sessions[sid]
+        # executescript() commits first, which would end the client's transaction half way
+        if conn.in_transaction:
+            raise sqlite3.ProgrammingError("executescript is not allowed inside an open transaction")
+        conn.executescript(script)
+        return {'rows': [], 'rowcount': -1, 'lastrowid': None}
+
+    def _rpc_session_end(self, handler: _Handler, sid, commit=True):
+        conn = handler.sessions.pop(sid)
+        try:
+            if commit:
+                conn.commit()
+            else:
+                conn.rollback()
+        finally:
+            conn.close()
+            self.unlock_writes()
+
+    # --- Shared state ---
+
+    def _rpc_standings(self, tournament_id, known_version=None):
+        """Serialized standings, or None if the client's copy is still current."""
+        standings = self.scoring.standings(tournament_id)
+        if standings.version == known_version:
+            return None
+        return {'version': standings.version, 'rows': standings.to_rows()}
+
+    def _rpc_score_versions(self):
+        return self.db.execute_query("SELECT tournament_id, version FROM score_versions")
+
+    # --- Backups ---
+
+    def _backup_folder(self) -> str:
+        folder = self.settings_manager.get('backup_folder', 'backups')
+        if not os.path.isabs(folder):
+            folder = os.path.join(os.path.dirname(os.path.abspath(self.db.db_path)), folder)
+        return folder
+
+    def _rpc_create_backup(self):
+        """Back up the database. Returns (path, verified)."""
+        with self._backup_lock:
+            mode = self.settings_manager.get('backup_mode', 'full')
+            folder = self._backup_folder()
+            path = self.backup_manager.create_backup(
+                self.db.db_path, folder, mode,
+                self.settings_manager.get('backup_compression', 'lzma'), stepped=True
+            )
+            verified = self.backup_manager.verify_backup(path)
+            if mode != 'full':
+                self.backup_manager.prune_backups(folder, self.settings_manager.get_int('backup_keep_chains', 5))
+            return path, verified
+
+    def _rpc_list_backups(self):
+        return [b.to_dict() for b in self.backup_manager.list_backups(self._backup_folder())]
@@ -4,33 +4,75 @@ Settings Manager - Persistent settings storage using SQLite.
 
 import sqlite3
 import json
-from typing import Any, Dict, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
 
-# Default settings with their types and values
-DEFAULT_SETTINGS = {
-    'default_rounds': '5',
-    'default_time_control': '90+30',
-    'export_folder': '',
-    'ui_scale': '100',
-    'backup_folder': 'backups',
-    'auto_backup': 'true',
-    'undo_stack_size': '10',
-    'font_size': '14'
+@dataclass(frozen=True)
+class SettingSpec:
+    """Type, default and allowed values of a setting."""
+    default: Any
+    type: type = str
+    min: Optional[int] = None
+    max: Optional[int] = None
+    choices: Optional[Tuple[str, ...]] = None
+
+
+# Settings schema: every known setting with its type and range
+SETTINGS_SCHEMA: Dict[str, SettingSpec] = {
+    'default_rounds': SettingSpec(5, int, 1, 99),
+    'default_time_control': SettingSpec('90+30'),
+    'export_folder': SettingSpec(''),
+    'ui_scale': SettingSpec(100, int, 50, 300),
+    'backup_folder': SettingSpec('backups'),
+    'auto_backup': SettingSpec(True, bool),
+    'auto_backup_interval': SettingSpec(30, int, 0, 24 * 60),  # minutes, 0 = off
+    'backup_mode': SettingSpec('full', choices=('full', 'compressed', 'incremental')),
+    'backup_compression': SettingSpec('lzma', choices=('lzma', 'gzip')),
+    'backup_keep_chains': SettingSpec(5, int, 1, 1000),
+    'materialized_standings': SettingSpec(False, bool),
+    'change_poll_interval': SettingSpec(2, int, 0, 600),  # seconds, 0 = off
+    'slow_slot_profile_ms': SettingSpec(0, int, 0, 600000),  # profile slots slower than this, 0 = off
+    'log_level': SettingSpec('INFO', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR')),
+    'log_levels': SettingSpec(''),  # per-module overrides, e.g. "backend.pairing=DEBUG, bridge=WARNING"
+    'results_feed_folder': SettingSpec(''),  # folder electronic boards drop result files into, '' = off
+    'results_feed_interval': SettingSpec(2, int, 1, 600),  # seconds between looks at that folder
+    'app_state_storage': SettingSpec('file', choices=('file', 'settings')),  # where the last session is kept
+    'undo_stack_size': SettingSpec(10, int, 1, 1000),
+    'font_size': SettingSpec(14, int, 6, 72),
 }
 
 
+def _to_str(value: Any) -> str:
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+# Default settings as stored strings
+DEFAULT_SETTINGS = {key: _to_str(spec.default) for key, spec in SETTINGS_SCHEMA.items()}
+
+INTERNAL_PREFIX = '_'  # Keys the app stores for itself (e.g. app state); not user settings
+
+SettingCallback = Callable[[str, Any], None]
+
+
 class SettingsManager:
     """
     Persist settings to SQLite.
+
+    All settings are read once into an in-memory cache; reads never touch
+    the database. Writes go through to SQLite (batched in one transaction
+    for set_many) and notify callbacks registered with subscribe().
     """
-    
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._cache: Dict[str, str] = {}
+        self._callbacks: Dict[str, List[SettingCallback]] = defaultdict(list)
         self._init_table()
-        self._ensure_defaults()
-    
+        self._load()
+
     @contextmanager
     def _get_connection(self):
         """Context manager for database connections."""
@@ -43,7 +85,7 @@ class SettingsManager:
             raise e
         finally:
             conn.close()
-    
+
     def _init_table(self) -> None:
         """Create the settings table if it doesn't exist."""
         with self._get_connection() as conn:
@@ -53,64 +95,164 @@ class SettingsManager:
                     value TEXT NOT NULL
                 )
             """)
-    
-    def _ensure_defaults(self) -> None:
-        """Ensure all default settings exist in the database."""
+
+    def _load(self) -> None:
+        """Read all settings into the cache, adding any missing defaults in one batch."""
         with self._get_connection() as conn:
-            for key, default_value in DEFAULT_SETTINGS.items():
-                # Insert only if not exists
-                conn.execute("""
-                    INSERT OR IGNORE INTO app_settings (key, value) VALUES (?, ?)
-                """, (key, default_value))
-    
+            self._cache = dict(conn.execute("SELECT key, value FROM app_settings").fetchall())
+            missing = [(k, v) for k, v in DEFAULT_SETTINGS.items() if k not in self._cache]
+            if missing:
+                conn.executemany("INSERT OR IGNORE INTO app_settings (key, value) VALUES (?, ?)", missing)
+                self._cache.update(missing)
+
+    def reload(self) -> None:
+        """Re-read settings from the database (e.g. after a restore) and notify changes."""
+        old = dict(self._cache)
+        self._load()
+        self._notify({k: v for k, v in self._cache.items() if old.get(k) != v})
+
+    # --- Typing ---
+
+    @staticmethod
+    def _parse(spec: SettingSpec, raw: str) -> Any:
+        if spec.type is bool:
+            return raw.lower() in ('true', '1', 'yes', 'on')
+        if spec.type is int:
+            return int(float(raw))
+        return raw
+
+    def validate(self, key: str, value: Any) -> str:
+        """
+        Check a value against the schema and return its stored string form.
+
+        Raises:
+            ValueError: If the value has the wrong type or is out of range
+        """
+        str_value = _to_str(value)
+        spec = SETTINGS_SCHEMA.get(key)
+        if spec is None:
+            return str_value
+
+        try:
+            typed = self._parse(spec, str_value)
+        except ValueError:
+            raise ValueError(f"{key} must be a {spec.type.__name__}")
+        if spec.type is bool and str_value.lower() not in ('true', 'false', '1', '0', 'yes', 'no', 'on', 'off'):
+            raise ValueError(f"{key} must be true or false")
+        if spec.min is not None and typed < spec.min:
+            raise ValueError(f"{key} must be at least {spec.min}")
+        if spec.max is not None and typed > spec.max:
+            raise ValueError(f"{key} must be at most {spec.max}")
+        if spec.choices and typed not in spec.choices:
+            raise ValueError(f"{key} must be one of: {', '.join(spec.choices)}")
+        return _to_str(typed)
+
+    # --- Reads (cache only) ---
+
     def get(self, key: str, default: Optional[str] = None) -> str:
         """Get a setting value by key."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT value FROM app_settings WHERE key = ?", (key,)
-            )
-            row = cursor.fetchone()
-            if row:
-                return row[0]
-            return default if default is not None else DEFAULT_SETTINGS.get(key, '')
-    
+        if key in self._cache:
+            return self._cache[key]
+        return default if default is not None else DEFAULT_SETTINGS.get(key, '')
+
     def get_int(self, key: str, default: int = 0) -> int:
         """Get a setting value as an integer."""
         try:
             return int(self.get(key, str(default)))
         except ValueError:
             return default
-    
+
     def get_bool(self, key: str, default: bool = False) -> bool:
         """Get a setting value as a boolean."""
         value = self.get(key, str(default).lower())
         return value.lower() in ('true', '1', 'yes', 'on')
-    
+
+    def value(self, key: str) -> Any:
+        """Get a setting converted to its schema type (falls back to the default if unparsable)."""
+        spec = SETTINGS_SCHEMA.get(key)
+        if spec is None:
+            return self.get(key)
+        try:
+            return self._parse(spec, self.get(key))
+        except ValueError:
+            return spec.default
+
+    def get_all(self) -> Dict[str, str]:
+        """Get all settings as a dictionary."""
+        return {k: v for k, v in self._cache.items() if not k.startswith(INTERNAL_PREFIX)}
+
+    # --- Writes (write-through) ---
+
     def set(self, key: str, value: Any) -> None:
         """Set a setting value."""
-        str_value = str(value).lower() if isinstance(value, bool) else str(value)
+        self.set_many({key: value})
+
+    def set_many(self, values: Dict[str, Any]) -> None:
+        """
+        Validate and store several settings in one transaction.
+
+        Raises:
+            ValueError: If any value is invalid (nothing is written)
+        """
+        str_values = {key: self.validate(key, value) for key, value in values.items()}
+        changed = {k: v for k, v in str_values.items() if self._cache.get(k) != v}
+        if not changed:
+            return
+
         with self._get_connection() as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT OR REPLACE INTO app_settings (key, value) VALUES (?, ?)
-            """, (key, str_value))
-    
-    def get_all(self) -> Dict[str, str]:
-        """Get all settings as a dictionary."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("SELECT key, value FROM app_settings")
-            return {row[0]: row[1] for row in cursor.fetchall()}
-    
+            """, list(changed.items()))
+        self._cache.update(changed)
+        self._notify(changed)
+
     def reset_defaults(self) -> None:
         """Reset all settings to default values."""
+        old = dict(self._cache)
         with self._get_connection() as conn:
-            conn.execute("DELETE FROM app_settings")
-            for key, value in DEFAULT_SETTINGS.items():
-                conn.execute(
-                    "INSERT INTO app_settings (key, value) VALUES (?, ?)",
-                    (key, value)
-                )
-    
+            conn.execute("DELETE FROM app_settings WHERE substr(key, 1, 1) != ?", (INTERNAL_PREFIX,))
+            conn.executemany(
+                "INSERT INTO app_settings (key, value) VALUES (?, ?)",
+                list(DEFAULT_SETTINGS.items())
+            )
+        self._cache = dict(DEFAULT_SETTINGS, **{k: v for k, v in old.items() if k.startswith(INTERNAL_PREFIX)})
+        self._notify({k: v for k, v in self._cache.items() if old.get(k) != v})
+
     def delete(self, key: str) -> None:
         """Delete a setting by key."""
         with self._get_connection() as conn:
             conn.execute("DELETE FROM app_settings WHERE key = ?", (key,))
+        self._cache.pop(key, None)
+
+    # --- Internal values ---
+
+    def get_internal(self, key: str) -> Optional[str]:
+        """Read a value the app keeps for itself (key starts with INTERNAL_PREFIX)."""
+        return self._cache.get(key)
+
+    def set_internal(self, key: str, value: str) -> None:
+        """
+        Store an internal value: no schema validation and no change
+        notification, and reset_defaults() keeps it.
+        """
+        if not key.startswith(INTERNAL_PREFIX):
+            raise ValueError(f"Internal keys must start with '{INTERNAL_PREFIX}'")
+        if self._cache.get(key) == value:
+            return
+        with self._get_connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO app_settings (key, value) VALUES (?, ?)", (key, value))
+        self._cache[key] = value
+
+    # --- Change notification ---
+
+    def subscribe(self, key: str, callback: SettingCallback) -> None:
+        """
+        Call `callback(key, typed_value)` whenever `key` changes.
+        Use '*' to be notified of every change.
+        """
+        self._callbacks[key].append(callback)
+
+    def _notify(self, changed: Dict[str, str]) -> None:
+        for key in changed:
+            for callback in self._callbacks.get(key, []) + self._callbacks.get('*', []):
+                callback(key, self.value(key))
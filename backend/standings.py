@@ -0,0 +1,234 @@
+"""
+Materialized Standings - per-player totals kept up to date by SQLite triggers.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .database import Database
+
+COLUMNS = ('points', 'games_played', 'wins', 'draws', 'byes')
+
+# Contribution of one pairing row (`{r}` = NEW, OLD or a table alias) to each side.
+# Same rules as backend.tables: win 1, draw 0.5, bye 1 for white only, forfeit 0.
+_WHITE = {
+    'points': "(CASE {r}.result WHEN '1-0' THEN 1.0 WHEN '0.5-0.5' THEN 0.5 WHEN 'BYE' THEN 1.0 ELSE 0.0 END)",
+    'wins': "({r}.result = '1-0')",
+    'byes': "({r}.result = 'BYE')",
+}
+_BLACK = {
+    'points': "(CASE {r}.result WHEN '0-1' THEN 1.0 WHEN '0.5-0.5' THEN 0.5 ELSE 0.0 END)",
+    'wins': "({r}.result = '0-1')",
+    'byes': "0",
+}
+for _side in (_WHITE, _BLACK):
+    _side['games_played'] = ("({r}.result IN ('1-0', '0-1', '0.5-0.5')"
+                             " AND {r}.white_player_id IS NOT NULL AND {r}.black_player_id IS NOT NULL)")
+    _side['draws'] = "({r}.result = '0.5-0.5')"
+
+_LOCKED = "(SELECT status FROM rounds WHERE id = {r}.round_id) = 'LOCKED'"
+
+TRIGGERS = (
+    'trg_standings_player_insert', 'trg_standings_player_delete',
+    'trg_standings_pairing_insert', 'trg_standings_pairing_delete', 'trg_standings_pairing_update',
+    'trg_standings_round_status', 'trg_standings_round_delete',
+)
+
+
+@dataclass
+class StandingsMismatch:
+    """A stored standings row that differs from a full recompute."""
+    player_id: int
+    column: str
+    stored: Optional[float]
+    expected: Optional[float]
+
+
+def _apply(r: str, sign: str) -> str:
+    """Statements adding (`sign`='+') or removing ('-') pairing row `r` if its round is locked."""
+    statements = []
+    for side, exprs in (('white', _WHITE), ('black', _BLACK)):
+        sets = ", ".join(f"{col} = {col} {sign} {exprs[col].format(r=r)}" for col in COLUMNS)
+        statements.append(
+            f"UPDATE standings SET {sets} "
+            f"WHERE player_id = {r}.{side}_player_id AND {_LOCKED.format(r=r)};"
+        )
+    return "\n".join(statements)
+
+
+def _apply_round(sign: str) -> str:
+    """Statement adding or removing every pairing of round NEW.id for its players."""
+    sets = []
+    for col in COLUMNS:
+        expr = (f"(CASE WHEN p.white_player_id = standings.player_id "
+                f"THEN {_WHITE[col].format(r='p')} ELSE {_BLACK[col].format(r='p')} END)")
+        sets.append(
+            f"{col} = {col} {sign} (SELECT TOTAL({expr}) FROM pairings p WHERE p.round_id = NEW.id "
+            f"AND standings.player_id IN (p.white_player_id, p.black_player_id))"
+        )
+    return (
+        f"UPDATE standings SET {', '.join(sets)} WHERE player_id IN ("
+        "SELECT white_player_id FROM pairings WHERE round_id = NEW.id "
+        "UNION SELECT black_player_id FROM pairings WHERE round_id = NEW.id);"
+    )
+
+
+def _recompute_sql() -> str:
+    """Full recompute of (player_id, tournament_id, *COLUMNS) from locked rounds."""
+    sides = []
+    for side, exprs in (('white', _WHITE), ('black', _BLACK)):
+        cols = ", ".join(f"{exprs[col].format(r='p')} AS {col}" for col in COLUMNS)
+        sides.append(
+            f"SELECT p.{side}_player_id AS player_id, {cols} FROM pairings p "
+            f"JOIN rounds r ON r.id = p.round_id AND r.status = 'LOCKED' "
+            f"WHERE r.tournament_id = :tid"
+        )
+    totals = ", ".join(
+        f"TOTAL(g.{col})" if col == 'points' else f"CAST(TOTAL(g.{col}) AS INTEGER)" for col in COLUMNS
+    )
+    return (
+        f"SELECT pl.id, pl.tournament_id, {totals} FROM players pl "
+        f"LEFT JOIN ({' UNION ALL '.join(sides)}) g ON g.player_id = pl.id "
+        f"WHERE pl.tournament_id = :tid GROUP BY pl.id"
+    )
+
+
+class MaterializedStandings:
+    """
+    Optional `standings` table: points, games played, wins, draws and byes
+    per player, counting only locked rounds.
+
+    Once enabled, triggers on players, pairings and rounds apply each change
+    as a delta, so reading standings is one indexed SELECT for any reader of
+    the database file. check() compares the table with a full recompute.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def is_enabled(self) -> bool:
+        rows = self.db.execute_query(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_standings_%'"
+        )
+        return rows[0][0] == len(TRIGGERS)
+
+    def enable(self) -> None:
+        """Create the table, indexes and triggers, then fill the table from scratch."""
+        with self.db.get_connection() as conn:
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS standings (
+                    player_id INTEGER PRIMARY KEY REFERENCES players(id) ON DELETE CASCADE,
+                    tournament_id INTEGER NOT NULL,
+                    points REAL NOT NULL DEFAULT 0,
+                    games_played INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    draws INTEGER NOT NULL DEFAULT 0,
+                    byes INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_standings_rank
+                    ON standings(tournament_id, points DESC);
+                CREATE INDEX IF NOT EXISTS idx_pairings_round ON pairings(round_id);
+
+                CREATE TRIGGER IF NOT EXISTS trg_standings_player_insert AFTER INSERT ON players
+                BEGIN
+                    INSERT OR REPLACE INTO standings (player_id, tournament_id) VALUES (NEW.id, NEW.tournament_id);
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_standings_player_delete AFTER DELETE ON players
+                BEGIN
+                    DELETE FROM standings WHERE player_id = OLD.id;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_standings_pairing_insert AFTER INSERT ON pairings
+                BEGIN
+                    {_apply('NEW', '+')}
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_standings_pairing_delete AFTER DELETE ON pairings
+                BEGIN
+                    {_apply('OLD', '-')}
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_standings_pairing_update
+                AFTER UPDATE OF result, white_player_id, black_player_id, round_id ON pairings
+                BEGIN
+                    {_apply('OLD', '-')}
+                    {_apply('NEW', '+')}
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_standings_round_status AFTER UPDATE OF status ON rounds
+                WHEN (OLD.status = 'LOCKED') != (NEW.status = 'LOCKED')
+                BEGIN
+                    {_apply_round("+ (CASE WHEN NEW.status = 'LOCKED' THEN 1 ELSE -1 END) *")}
+                END;
+                -- Delete a round's pairings while the round still exists, so the
+                -- pairing trigger can still see whether they counted
+                CREATE TRIGGER IF NOT EXISTS trg_standings_round_delete BEFORE DELETE ON rounds
+                BEGIN
+                    DELETE FROM pairings WHERE round_id = OLD.id;
+                END;
+            """)
+        self.rebuild()
+
+    def disable(self) -> None:
+        """Drop the triggers and the table."""
+        with self.db.get_connection() as conn:
+            for name in TRIGGERS:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute("DROP TABLE IF EXISTS standings")
+
+    def rebuild(self, tournament_id: Optional[int] = None) -> None:
+        """Recompute the table from pairings (all tournaments if no id)."""
+        sql = _recompute_sql()
+        with self.db.get_connection() as conn:
+            if tournament_id is None:
+                conn.execute("DELETE FROM standings")
+                tids = [row[0] for row in conn.execute("SELECT id FROM tournaments")]
+            else:
+                conn.execute("DELETE FROM standings WHERE tournament_id = ?", (tournament_id,))
+                tids = [tournament_id]
+            for tid in tids:
+                conn.execute(
+                    f"INSERT INTO standings (player_id, tournament_id, {', '.join(COLUMNS)}) {sql}",
+                    {'tid': tid}
+                )
+
+    def get(self, tournament_id: int) -> List[Dict]:
+        """Standings of a tournament, best first (ties by name)."""
+        rows = self.db.execute_query(f"""
+            SELECT s.player_id, p.name, p.club, p.rating, {', '.join('s.' + c for c in COLUMNS)}
+            FROM standings s JOIN players p ON p.id = s.player_id
+            WHERE s.tournament_id = ?
+            ORDER BY s.points DESC, p.name
+        """, (tournament_id,))
+        keys = ('id', 'name', 'club', 'rating') + COLUMNS
+        return [dict(zip(keys, row)) for row in rows]
+
+    def check(self, tournament_id: int, repair: bool = False) -> List[StandingsMismatch]:
+        """
+        Compare stored rows with a full recompute.
+
+        Args:
+            repair: Rebuild the tournament's rows if any differ
+
+        Returns:
+            One entry per differing value (empty if consistent)
+        """
+        expected: Dict[int, Tuple] = {
+            row[0]: row[2:] for row in self.db.execute_query(_recompute_sql(), {'tid': tournament_id})
+        }
+        stored: Dict[int, Tuple] = {
+            row[0]: row[1:] for row in self.db.execute_query(
+                f"SELECT player_id, {', '.join(COLUMNS)} FROM standings WHERE tournament_id = ?",
+                (tournament_id,)
+            )
+        }
+
+        mismatches = []
+        for pid in sorted(set(expected) | set(stored)):
+            want = expected.get(pid, (None,) * len(COLUMNS))
+            have = stored.get(pid, (None,) * len(COLUMNS))
+            for col, w, h in zip(COLUMNS, want, have):
+                if w != h:
+                    mismatches.append(StandingsMismatch(pid, col, h, w))
+
+        if mismatches and repair:
+            self.rebuild(tournament_id)
+        return mismatches
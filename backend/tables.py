@@ -0,0 +1,149 @@
+"""
+Columnar player and pairing tables for large events.
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .models import Player
+
+STATUS_CODES = {'ACTIVE': 0, 'WITHDRAWN': 1}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+# Result strings as stored in `pairings.result`, decoded once into small ints
+RESULT_CODES = {'*': 0, '1-0': 1, '0-1': 2, '0.5-0.5': 3, 'BYE': 4, 'FORFEIT': 5}
+RESULT_NAMES = {code: name for name, code in RESULT_CODES.items()}
+
+# Points per result code for (white, black): win 1, draw 0.5, bye 1
+WHITE_POINTS = (0.0, 1.0, 0.0, 0.5, 1.0, 0.0)
+BLACK_POINTS = (0.0, 0.0, 1.0, 0.5, 0.0, 0.0)
+
+NO_PLAYER = 0  # SQLite row ids start at 1, so 0 marks an empty side (bye)
+
+
+def _intern(value: Optional[str]) -> str:
+    return sys.intern(value) if value else ''
+
+
+class PlayerTable:
+    """
+    Players stored column-wise in typed arrays.
+
+    One array per numeric column (8 bytes per id, 4 per rating, 8 per
+    score, 1 per status) plus interned name/club strings, instead of one
+    object per player.
+    """
+
+    __slots__ = ('ids', 'ratings', 'points', 'status', 'names', 'clubs', '_row_of')
+
+    def __init__(self):
+        self.ids = array('q')
+        self.ratings = array('i')
+        self.points = array('d')
+        self.status = array('b')
+        self.names: List[str] = []
+        self.clubs: List[str] = []
+        self._row_of: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, player_id: int, name: str, rating: int = 0, club: Optional[str] = None,
+               status: str = 'ACTIVE') -> None:
+        self._row_of[player_id] = len(self.ids)
+        self.ids.append(player_id)
+        self.ratings.append(rating or 0)
+        self.points.append(0.0)
+        self.status.append(STATUS_CODES.get(status, 0))
+        self.names.append(_intern(name))
+        self.clubs.append(_intern(club))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> 'PlayerTable':
+        """Build from (id, name, rating, club, status) rows."""
+        table = cls()
+        for pid, name, rating, club, status in rows:
+            table.append(pid, name, rating, club, status)
+        return table
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> 'PlayerTable':
+        table = cls()
+        for p in players:
+            table.append(p.id, p.name, p.rating, p.club, p.status)
+            table.points[-1] = p.points
+        return table
+
+    def row_of(self, player_id: int) -> Optional[int]:
+        """Row index of a player id, or None if unknown."""
+        return self._row_of.get(player_id)
+
+    def points_of(self, player_id: int) -> float:
+        row = self._row_of.get(player_id)
+        return self.points[row] if row is not None else 0.0
+
+
+class PairingTable:
+    """
+    Pairings stored column-wise: round number, white id, black id and result code.
+
+    Empty sides (byes) are stored as NO_PLAYER.
+    """
+
+    __slots__ = ('rounds', 'white', 'black', 'results', 'locked')
+
+    def __init__(self):
+        self.rounds = array('i')
+        self.white = array('q')
+        self.black = array('q')
+        self.results = array('b')
+        self.locked = array('b')
+
+    def __len__(self) -> int:
+        return len(self.rounds)
+
+    def append(self, round_number: int, white_id: Optional[int], black_id: Optional[int],
+               result: str, locked: bool = True) -> None:
+        self.rounds.append(round_number)
+        self.white.append(white_id or NO_PLAYER)
+        self.black.append(black_id or NO_PLAYER)
+        self.results.append(RESULT_CODES.get(result, 0))
+        self.locked.append(1 if locked else 0)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> 'PairingTable':
+        """Build from (round_number, white_id, black_id, result, is_locked) rows."""
+        table = cls()
+        for round_number, white_id, black_id, result, locked in rows:
+            table.append(round_number, white_id, black_id, result, locked)
+        return table
+
+    def iter_rows(self) -> Iterator[Tuple[Optional[int], Optional[int], str]]:
+        """Yield (white_id, black_id, result) with None for empty sides."""
+        for w, b, code in zip(self.white, self.black, self.results):
+            yield (w or None), (b or None), RESULT_NAMES[code]
+
+
+def score_points(players: PlayerTable, pairings: PairingTable, locked_only: bool = True) -> array:
+    """
+    Recalculate every player's points from the pairings.
+
+    Unfinished games ('*') and games in unlocked rounds (when `locked_only`)
+    don't count. Writes into `players.points` and returns it.
+    """
+    points = array('d', bytes(8 * len(players)))
+    row_of = players._row_of
+    for w, b, code, locked in zip(pairings.white, pairings.black, pairings.results, pairings.locked):
+        if code == 0 or (locked_only and not locked):
+            continue
+        if w:
+            row = row_of.get(w)
+            if row is not None:
+                points[row] += WHITE_POINTS[code]
+        if b:
+            row = row_of.get(b)
+            if row is not None:
+                points[row] += BLACK_POINTS[code]
+    players.points = points
+    return points
@@ -1,77 +1,62 @@
+import logging
+from array import array
+from typing import Dict, Tuple
+
 from .database import Database
-from .models import Player
+from .tables import PlayerTable, PairingTable, WHITE_POINTS, BLACK_POINTS
+
+logger = logging.getLogger(__name__)
 
 class TieBreaks:
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, scoring=None):
         self.db = db
+        self.scoring = scoring  # ScoringKernel; created on first use if not shared
+
+    @staticmethod
+    def compute(players: PlayerTable, pairings: PairingTable) -> Tuple[array, array]:
+        """
+        Buchholz and Sonneborn-Berger for every row of `players`.
+        Expects `players.points` to be up to date (see score_points).
+        Only finished games in locked rounds count; byes add nothing.
+        """
+        n = len(players)
+        buchholz = array('d', bytes(8 * n))
+        sb_score = array('d', bytes(8 * n))
+        points = players.points
+        row_of = players._row_of
+
+        for w, b, code, locked in zip(pairings.white, pairings.black, pairings.results, pairings.locked):
+            if not w or not b or code == 0 or not locked:
+                continue
+            rw = row_of.get(w)
+            rb = row_of.get(b)
+            if rw is None or rb is None:
+                continue
+
+            # Buchholz: Sum of opponents' scores
+            buchholz[rw] += points[rb]
+            buchholz[rb] += points[rw]
 
-    def update_tiebreaks(self, tournament_id: int):
-        """Recalculate Buchholz and Sonneborn-Berger for all players in the tournament."""
-        players_data = self.db.execute_query(
-            "SELECT id, points FROM players WHERE tournament_id = ?", (tournament_id,)
-        )
-        players = {row[0]: row[1] for row in players_data} # id -> points
+            # Sonneborn-Berger: full score of beaten opponents + half of drawn ones
+            sb_score[rw] += WHITE_POINTS[code] * points[rb]
+            sb_score[rb] += BLACK_POINTS[code] * points[rw]
 
-        for player_id in players.keys():
-            buchholz = 0.0
-            sb_score = 0.0
-            
-            # Get all opponents
-            # As White
-            opponents_white = self.db.execute_query(
-                """
-                SELECT p.black_player_id, p.result FROM pairings p
-                JOIN rounds r ON p.round_id = r.id
-                WHERE r.tournament_id = ? AND p.white_player_id = ? AND p.black_player_id IS NOT NULL
-                """, (tournament_id, player_id)
-            )
-            
-            # As Black
-            opponents_black = self.db.execute_query(
-                """
-                SELECT p.white_player_id, p.result FROM pairings p
-                JOIN rounds r ON p.round_id = r.id
-                WHERE r.tournament_id = ? AND p.black_player_id = ? AND p.white_player_id IS NOT NULL
-                """, (tournament_id, player_id)
-            )
+        return buchholz, sb_score
 
-            all_games = []
-            for opp_id, res in opponents_white:
-                all_games.append({'opp_id': opp_id, 'result': res, 'role': 'white'})
-            for opp_id, res in opponents_black:
-                all_games.append({'opp_id': opp_id, 'result': res, 'role': 'black'})
-            
-            for game in all_games:
-                opp_id = game['opp_id']
-                opp_points = players.get(opp_id, 0.0)
-                
-                # Buchholz: Sum of opponents' scores
-                buchholz += opp_points
-                
-                # Sonneborn-Berger: 
-                # Sum of scores of opponents beaten + 
-                # 0.5 * Sum of scores of opponents drawn
-                result = game['result']
-                role = game['role']
-                
-                score_vs_opp = 0.0
-                if result == '1-0':
-                    score_vs_opp = 1.0 if role == 'white' else 0.0
-                elif result == '0-1':
-                    score_vs_opp = 0.0 if role == 'white' else 1.0
-                elif result == '0.5-0.5':
-                    score_vs_opp = 0.5
-                elif result == 'BYE': # Bye usually doesn't count for SB in some variations, but treating as win vs virtual 0-point opponent
-                     pass # Simplified: Bye adds nothing to SB usually as opp score is 0
-                
-                if score_vs_opp == 1.0:
-                    sb_score += opp_points
-                elif score_vs_opp == 0.5:
-                    sb_score += 0.5 * opp_points
-            
-            self.db.execute_non_query(
-                "UPDATE players SET buchholz = ?, sonneborn_berger = ?, tiebreak_score = ? WHERE id = ?",
-                (buchholz, sb_score, buchholz, player_id)
-            )
-            print(f"DEBUG: Updated player {player_id} - Points: {players.get(player_id)}, BH: {buchholz}, SB: {sb_score}")
+    def update_tiebreaks(self, tournament_id: int) -> Dict[int, Tuple[float, float]]:
+        """Buchholz and Sonneborn-Berger for all players in the tournament."""
+        if self.scoring is None:
+            from .scoring import ScoringKernel
+            self.scoring = ScoringKernel(self.db)
+        standings = self.scoring.standings(tournament_id)
+        players = standings.players
 
+        result = {}
+        debug = logger.isEnabledFor(logging.DEBUG)  # Checked once, not per player
+        for row, player_id in enumerate(players.ids):
+            bh, sb = standings.buchholz[row], standings.sonneborn_berger[row]
+            result[player_id] = (bh, sb)
+            if debug:
+                logger.debug("Updated player %d - Points: %s, BH: %s, SB: %s",
+                             player_id, players.points[row], bh, sb)
+        return result
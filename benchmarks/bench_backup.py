@@ -0,0 +1,88 @@
+"""
+Benchmark: backup size and time for full, compressed and incremental modes.
+
+Builds a season-sized database, then simulates a round of result entry
+between backups so incremental deltas reflect a realistic change set.
+
+    python benchmarks/bench_backup.py [tournaments] [players_per_tournament]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.backup_manager import BackupManager
+
+
+def build_database(db_path, tournaments, players_per_tournament):
+    db = Database(db_path)
+    with db.get_connection() as conn:
+        for t in range(tournaments):
+            tid = conn.execute(
+                "INSERT INTO tournaments (name, type, total_rounds, status) VALUES (?, 'SWISS', 9, 'FINISHED')",
+                (f"Open {t}",)
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO players (tournament_id, name, rating, club) VALUES (?, ?, ?, ?)",
+                [(tid, f"Player {t}-{i}", random.randint(1000, 2700), f"Club {i % 40}")
+                 for i in range(players_per_tournament)]
+            )
+            ids = [r[0] for r in conn.execute("SELECT id FROM players WHERE tournament_id = ?", (tid,))]
+            for rnd in range(1, 10):
+                rid = conn.execute(
+                    "INSERT INTO rounds (tournament_id, round_number, status) VALUES (?, ?, 'LOCKED')", (tid, rnd)
+                ).lastrowid
+                random.shuffle(ids)
+                conn.executemany(
+                    "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, ?, ?)",
+                    [(rid, ids[i], ids[i + 1], random.choice(['1-0', '0-1', '0.5-0.5']))
+                     for i in range(0, len(ids) - 1, 2)]
+                )
+    return db
+
+
+def simulate_round(db):
+    """Enter one round of results in the newest tournament."""
+    with db.get_connection() as conn:
+        rid = conn.execute("SELECT MAX(id) FROM rounds").fetchone()[0]
+        conn.execute("UPDATE pairings SET result = '*' WHERE round_id = ?", (rid,))
+        conn.execute("UPDATE pairings SET result = '1-0' WHERE round_id = ?", (rid,))
+
+
+def folder_size(folder):
+    return sum(os.path.getsize(os.path.join(folder, f)) for f in os.listdir(folder))
+
+
+def run(tournaments=40, players_per_tournament=250, backups=5):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmpdir, "bench.db")
+        db = build_database(db_path, tournaments, players_per_tournament)
+        print(f"Database: {os.path.getsize(db_path) / 1024 / 1024:.1f} MB, {backups} backups per mode\n")
+        print(f"{'mode':<22}{'total size':>14}{'avg time':>12}")
+
+        for mode, compression in (('full', None), ('compressed', 'gzip'), ('compressed', 'lzma'),
+                                  ('incremental', 'gzip'), ('incremental', 'lzma')):
+            folder = os.path.join(tmpdir, f"{mode}_{compression}")
+            manager = BackupManager()
+            elapsed = 0.0
+            for _ in range(backups):
+                simulate_round(db)
+                start = time.perf_counter()
+                manager.create_backup(db_path, folder, mode=mode, compression=compression)
+                elapsed += time.perf_counter() - start
+            label = mode if not compression else f"{mode} ({compression})"
+            print(f"{label:<22}{folder_size(folder) / 1024:>11.0f} KB{elapsed / backups * 1000:>9.1f} ms")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
@@ -0,0 +1,109 @@
+"""
+Benchmark: results feed ingestion, with a stand-in for electronic boards.
+
+Builds a one-round tournament, starts a dropper thread that writes one
+result file per board (JSON and PGN alternately, written to a .part file
+and renamed like a board feed does) and polls the folder until every
+result is in. Reports files per minute and the delay from drop to save.
+
+    python benchmarks/bench_feed.py [boards] [files_per_second]
+
+The dropper alone feeds a running app (set results_feed_folder to FOLDER):
+
+    python benchmarks/bench_feed.py drop FOLDER ROUND BOARDS [files_per_second]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.ingest import ResultFeed
+
+RESULTS = ('1-0', '0-1', '1/2-1/2')
+
+
+def drop(folder, round_number, boards, rate=0.0, names=None):
+    """Write one result file per board; `rate` files per second (0 = as fast as possible)."""
+    os.makedirs(folder, exist_ok=True)
+    for board in range(1, boards + 1):
+        white, black = names[board - 1] if names else ("", "")
+        result = random.choice(RESULTS)
+        name = f"r{round_number}_b{board}_{time.time_ns()}"
+        if board % 2:
+            name += ".json"
+            text = json.dumps({'round': round_number, 'board': board, 'white': white, 'black': black,
+                               'result': result})
+        else:
+            name += ".pgn"
+            text = (f'[Event "Bench"]\n[Round "{round_number}.{board}"]\n[White "{white}"]\n'
+                    f'[Black "{black}"]\n[Result "{result}"]\n\n1. e4 e5 2. Nf3 Nc6 {result}\n')
+        part = os.path.join(folder, name + ".part")
+        with open(part, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(part, os.path.join(folder, name))
+        if rate:
+            time.sleep(1 / rate)
+
+
+def build_round(db_path, boards):
+    db = Database(db_path)
+    with db.get_connection() as conn:
+        tid = conn.execute(
+            "INSERT INTO tournaments (name, type, total_rounds, current_round, status) "
+            "VALUES ('Feed Bench', 'SWISS', 9, 1, 'ACTIVE')"
+        ).lastrowid
+        rid = conn.execute("INSERT INTO rounds (tournament_id, round_number) VALUES (?, 1)", (tid,)).lastrowid
+        names = []
+        for board in range(1, boards + 1):
+            white, black = f"White {board}", f"Black {board}"
+            a = conn.execute("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, white)).lastrowid
+            b = conn.execute("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, black)).lastrowid
+            conn.execute("INSERT INTO pairings (round_id, white_player_id, black_player_id) VALUES (?, ?, ?)",
+                         (rid, a, b))
+            names.append((white, black))
+    return db, tid, names
+
+
+def run(boards=500, rate=0.0):
+    with tempfile.TemporaryDirectory() as tmp:
+        db, tid, names = build_round(os.path.join(tmp, "bench.db"), boards)
+        folder = os.path.join(tmp, "feed")
+        feed = ResultFeed(db, folder, settle_seconds=0)
+
+        start = time.perf_counter()
+        dropper = threading.Thread(target=drop, args=(folder, 1, boards, rate, names))
+        dropper.start()
+        polls = files = 0
+        poll_ms = []
+        while True:
+            t = time.perf_counter()
+            report = feed.poll(tid)
+            poll_ms.append((time.perf_counter() - t) * 1000)
+            polls += 1
+            files += report.files
+            pending = db.execute_query("SELECT COUNT(*) FROM pairings WHERE result = '*'")[0][0]
+            if pending == 0 and not dropper.is_alive():
+                break
+            time.sleep(0.1)
+        dropper.join()
+        elapsed = time.perf_counter() - start
+
+        print(f"{boards} boards, dropper {'unthrottled' if not rate else f'{rate:g} files/s'}")
+        print(f"  all results saved after {elapsed:.2f} s ({files / elapsed * 60:.0f} files/min)")
+        print(f"  {polls} polls, slowest {max(poll_ms):.1f} ms, mean {sum(poll_ms) / len(poll_ms):.1f} ms")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["drop"]:
+        folder, round_number, boards = sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+        drop(folder, round_number, boards, float(sys.argv[5]) if len(sys.argv) > 5 else 0.0)
+    else:
+        args = sys.argv[1:3]
+        run(int(args[0]) if args else 500, float(args[1]) if len(args) > 1 else 0.0)
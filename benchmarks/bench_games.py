@@ -0,0 +1,98 @@
+"""
+Benchmark: PGN import, search and export for a large event.
+
+Builds a tournament of `rounds` rounds with `boards` boards each, writes a
+PGN file with one full-length game per board and measures the import, a
+few indexed searches, the export and the peak memory of each
+(measured in a second run, as tracing slows it down).
+
+    python benchmarks/bench_games.py [rounds] [boards]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.games import GameStore
+
+ECOS = ('B90', 'C42', 'D37', 'E97', 'A45')
+RESULTS = ('1-0', '0-1', '1/2-1/2')
+PIECES = ('N', 'B', 'R', 'Q', 'K', '')
+
+
+def _movetext(plies):
+    moves = []
+    for ply in range(plies):
+        move = f"{random.choice(PIECES)}{random.choice('abcdefgh')}{random.randint(1, 8)}"
+        moves.append(f"{ply // 2 + 1}. {move}" if ply % 2 == 0 else move)
+        if ply % 17 == 0:
+            moves.append(f"{{[%clk 1:{random.randint(10, 59)}:{random.randint(10, 59)}]}}")
+    return " ".join(moves)
+
+
+def build(db_path, pgn_path, rounds, boards):
+    db = Database(db_path)
+    with db.get_connection() as conn:
+        tid = conn.execute(
+            "INSERT INTO tournaments (name, type, total_rounds, current_round, status) "
+            "VALUES ('Games Bench', 'SWISS', ?, ?, 'ACTIVE')", (rounds, rounds)
+        ).lastrowid
+        ids = [conn.execute("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, f"Player {i}")).lastrowid
+               for i in range(boards * 2)]
+        first = ids[0]
+        pairings = []
+        for r in range(1, rounds + 1):
+            rid = conn.execute("INSERT INTO rounds (tournament_id, round_number) VALUES (?, ?)", (tid, r)).lastrowid
+            random.shuffle(ids)
+            conn.executemany("INSERT INTO pairings (round_id, white_player_id, black_player_id) VALUES (?, ?, ?)",
+                             [(rid, ids[2 * b], ids[2 * b + 1]) for b in range(boards)])
+            pairings.append([(ids[2 * b] - first, ids[2 * b + 1] - first) for b in range(boards)])
+    with open(pgn_path, 'w', encoding='utf-8') as f:
+        for r, boards_ in enumerate(pairings, 1):
+            for b, (white, black) in enumerate(boards_, 1):
+                result = random.choice(RESULTS)
+                f.write(f'[Event "Games Bench"]\n[Round "{r}.{b}"]\n[White "Player {white}"]\n'
+                        f'[Black "Player {black}"]\n'
+                        f'[Result "{result}"]\n[ECO "{random.choice(ECOS)}"]\n\n'
+                        f'{_movetext(random.randint(40, 160))} {result}\n\n')
+    return db, tid
+
+
+def _timed(label, fn):
+    """Time fn, then run it again under tracemalloc for its peak memory."""
+    start = time.perf_counter()
+    value = fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"  {label:<28} {elapsed * 1000:8.1f} ms   peak {peak / 1e6:5.1f} MB")
+    return value
+
+
+def run(rounds=11, boards=300):
+    with tempfile.TemporaryDirectory() as tmp:
+        pgn = os.path.join(tmp, "event.pgn")
+        db, tid = build(os.path.join(tmp, "bench.db"), pgn, rounds, boards)
+        store = GameStore(db)
+        print(f"{rounds * boards} games, {os.path.getsize(pgn) / 1e6:.1f} MB of PGN")
+
+        result = _timed("import", lambda: store.import_pgn(pgn, tid))
+        stored = db.execute_query("SELECT SUM(length(moves)) FROM games")[0][0]
+        print(f"  {result.imported} imported, move text stored in {stored / 1e6:.1f} MB")
+        _timed("search ECO B9", lambda: store.search(tid, eco='B9'))
+        _timed("search player", lambda: store.search(tid, player_id=1))
+        _timed("search round + result", lambda: store.search(tid, round_number=5, result='1-0'))
+        _timed("export", lambda: store.export_pgn(tid, os.path.join(tmp, "out.pgn")))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:3]
+    run(int(args[0]) if args else 11, int(args[1]) if len(args) > 1 else 300)
@@ -0,0 +1,111 @@
+"""
+Benchmark: memory per player and scoring time for large fields.
+
+Compares the original dict-backed dataclass lists, the __slots__ row
+models and the columnar PlayerTable/PairingTable.
+
+    python benchmarks/bench_models.py [players] [rounds]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.models import Player
+from backend.tables import PlayerTable, PairingTable, score_points
+
+
+@dataclass
+class LegacyPlayer:
+    """The Player model as it was before __slots__ (per-instance __dict__)."""
+    id: int
+    tournament_id: int
+    name: str
+    rating: int
+    fide_id: Optional[str] = None
+    club: Optional[str] = None
+    status: str = 'ACTIVE'
+    withdraw_round: Optional[int] = None
+    points: float = 0.0
+    tiebreak_score: float = 0.0
+    buchholz: float = 0.0
+    sonneborn_berger: float = 0.0
+
+
+def make_rows(n):
+    return [(i, f"Player {i}", random.randint(1000, 2800), f"Club {i % 200}", 'ACTIVE') for i in range(1, n + 1)]
+
+
+def make_games(n, rounds):
+    games = []
+    ids = list(range(1, n + 1))
+    for rnd in range(1, rounds + 1):
+        random.shuffle(ids)
+        for i in range(0, n - 1, 2):
+            games.append((rnd, ids[i], ids[i + 1], random.choice(['1-0', '0-1', '0.5-0.5', '*']), True))
+    return games
+
+
+def measure(build):
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def legacy_score(players, games):
+    """The old bridge algorithm: dict of objects, string comparisons per game."""
+    player_map = {p.id: p for p in players}
+    for _, w_id, b_id, res, _ in games:
+        if res == '*': continue
+        w_points = b_points = 0.0
+        if res == '1-0': w_points = 1.0
+        elif res == '0-1': b_points = 1.0
+        elif res == '0.5-0.5': w_points = b_points = 0.5
+        elif res == 'BYE': w_points = 1.0
+        if w_id in player_map: player_map[w_id].points += w_points
+        if b_id in player_map: player_map[b_id].points += b_points
+
+
+def run(n=10000, rounds=9):
+    rows = make_rows(n)
+    games = make_games(n, rounds)
+
+    legacy, legacy_mem = measure(lambda: [LegacyPlayer(r[0], 1, r[1], r[2], club=r[3]) for r in rows])
+    slotted, slot_mem = measure(lambda: [Player(r[0], 1, r[1], r[2], club=r[3]) for r in rows])
+    table, table_mem = measure(lambda: PlayerTable.from_rows(rows))
+
+    print(f"{n} players, {len(games)} games\n")
+    print(f"{'representation':<26}{'bytes/player':>14}")
+    print(f"{'dataclass (__dict__)':<26}{legacy_mem / n:>14.0f}")
+    print(f"{'dataclass (__slots__)':<26}{slot_mem / n:>14.0f}")
+    print(f"{'PlayerTable':<26}{table_mem / n:>14.0f}")
+
+    start = time.perf_counter()
+    legacy_score(legacy, games)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pairings = PairingTable.from_rows(games)
+    decode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    score_points(table, pairings)
+    table_time = time.perf_counter() - start
+
+    assert abs(sum(p.points for p in legacy) - sum(table.points)) < 1e-9
+    print(f"\n{'scoring':<26}{'ms':>14}")
+    print(f"{'dataclass list':<26}{legacy_time * 1000:>14.1f}")
+    print(f"{'tables (decode once)':<26}{decode_time * 1000:>14.1f}")
+    print(f"{'tables (score)':<26}{table_time * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
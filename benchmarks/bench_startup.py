@@ -0,0 +1,57 @@
+"""
+Benchmark: time to first frame and time to interactive of the GUI.
+
+Starts main.py with --startup-benchmark several times and reports the
+median of each startup step (ms since the start of main.py, see
+main.startup_times) plus the wall time of the whole process launch. The
+app restores whatever session app_state.json in the current folder names,
+so run it from a folder holding the database and state you want to time.
+
+Uses Qt's offscreen platform unless QT_QPA_PLATFORM is already set.
+
+    python benchmarks/bench_startup.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+STEPS = ('imports', 'backend', 'qml_loaded', 'first_frame', 'interactive')
+
+
+def launch():
+    """One app start; returns (timings from main.py, wall ms until they were printed)."""
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, MAIN, "--startup-benchmark"],
+                            stdout=subprocess.PIPE, text=True, env=env)
+    timings = None
+    for line in proc.stdout:
+        if line.startswith('{'):
+            timings = json.loads(line)
+            wall = (time.perf_counter() - start) * 1000
+    proc.wait(timeout=60)
+    if timings is None:
+        raise RuntimeError(f"main.py exited ({proc.returncode}) without startup timings")
+    return timings, wall
+
+
+def run(runs=5):
+    results = [launch() for _ in range(runs)]
+    print(f"{'step':<14} {'median ms':>10} {'min ms':>10}")
+    for step in STEPS:
+        values = [timings[step] for timings, _ in results if step in timings]
+        if values:
+            print(f"{step:<14} {statistics.median(values):>10.0f} {min(values):>10.0f}")
+    walls = [wall for _, wall in results]
+    print(f"{'process wall':<14} {statistics.median(walls):>10.0f} {min(walls):>10.0f}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:2]]
+    run(*args)
@@ -2,8 +2,9 @@ import sys
 import os
 import csv
 from datetime import datetime
-import json
-from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal, pyqtProperty, QVariant, QAbstractListModel, Qt
+from functools import cached_property
+import logging
+from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal, pyqtProperty, QVariant, QAbstractListModel, QModelIndex, Qt, QTimer
 
 
 def get_app_path():
@@ -12,16 +13,179 @@ def get_app_path():
     return os.getcwd()
 
 APP_STATE_FILE = os.path.join(get_app_path(), "app_state.json")
+CLIENT_SETTINGS_DB = os.path.join(get_app_path(), "client_settings.db")  # Settings of a thin client
+TOURNAMENT_LIST_DELAY_MS = 100  # Coalesce tournament/pairing change signals into one dashboard refresh
+APP_STATE_DELAY_MS = 500  # Coalesce bursts of state changes (e.g. flicking through rounds) into one write
 
-# Backend imports
+# Backend imports (rarely used ones are imported on first use, to keep startup short)
 from backend.database import Database, DB_PATH
+from backend.async_db import AsyncDatabase
+from backend.concurrency import (
+    ChangeWatcher, ConflictError, RoundLockedError, update_result, set_round_status
+)
 from backend.models import Player, Tournament, Round, Pairing
-from backend.pairing.swiss import SwissEngine
-from backend.pairing.round_robin import RoundRobinEngine
+from backend.tables import PairingTable
+from backend.scoring import ScoringKernel
+from backend.standings import MaterializedStandings
 from backend.undo_manager import UndoManager, UndoAction
 from backend.settings_manager import SettingsManager
 from backend.backup_manager import BackupManager
+from backend.backup_scheduler import BackgroundBackup
+from backend.player_registry import PlayerRegistry
+from backend.duplicate_index import DuplicateIndex
+from backend.archive import TournamentArchive
+from backend.dashboard import PAGE_SIZE, TournamentSummaries
+from backend.games import GameStore
+from backend.results import parse_results, restore_results, set_results
+from backend.app_state import AppStateStore
+from backend.instrumentation import instrumentation, instrumented, no_capture
+from backend.logs import configure_levels, ring_buffer
+
+logger = logging.getLogger(__name__)
+
+DIAGNOSTICS_FILE = os.path.join(get_app_path(), "diagnostics.txt")
+
+
+class TournamentListModel(QAbstractListModel):
+    """
+    Dashboard tournaments with their summaries, newest first.
+
+    Views fetch a page at a time as they scroll (canFetchMore/fetchMore).
+    invalidate() re-reads only the rows already loaded, after a short delay
+    so bursts of change signals cost one query.
+    """
+
+    countChanged = pyqtSignal()
+    filtersChanged = pyqtSignal()
+
+    # Role name -> key in TournamentSummaries rows
+    ROLES = (
+        ('tid', 'id'), ('name', 'name'), ('type', 'type'), ('status', 'status'), ('date', 'created_at'),
+        ('totalRounds', 'total_rounds'), ('currentRound', 'current_round'), ('venue', 'venue'),
+        ('archived', 'archived'), ('playerCount', 'player_count'), ('roundsDone', 'rounds_done'),
+        ('resultsPending', 'results_pending'),
+    )
+
+    def __init__(self, summaries, parent=None):
+        super().__init__(parent)
+        self.summaries = summaries
+        self._rows = []
+        self._count = 0
+        self._exhausted = False  # Nothing is read until a view asks for rows
+        self._search = ""
+        self._type = ""
+        self._status = ""
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.timeout.connect(self._reload)
+
+    # --- QAbstractListModel ---
+
+    def roleNames(self):
+        return {Qt.UserRole + i: name.encode() for i, (name, _) in enumerate(self.ROLES)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        if not index.isValid() or not 0 <= row < len(self._rows) or not 0 <= role - Qt.UserRole < len(self.ROLES):
+            return QVariant()
+        value = self._rows[row][self.ROLES[role - Qt.UserRole][1]]
+        return value if value is not None else QVariant()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        if not self._rows:
+            self._update_count()
+        last = self._rows[-1] if self._rows else None
+        page = self._page(after=(last['created_at'], last['id']) if last else None)
+        self._exhausted = len(page) < PAGE_SIZE
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+
+    # --- Filters ---
+
+    @pyqtProperty(str, notify=filtersChanged)
+    def search(self):
+        return self._search
+
+    @search.setter
+    def search(self, text):
+        self._set_filter('_search', text.strip())
+
+    @pyqtProperty(str, notify=filtersChanged)
+    def typeFilter(self):
+        return self._type
+
+    @typeFilter.setter
+    def typeFilter(self, type_):
+        self._set_filter('_type', type_)
+
+    @pyqtProperty(str, notify=filtersChanged)
+    def statusFilter(self):
+        return self._status
+
+    @statusFilter.setter
+    def statusFilter(self, status):
+        self._set_filter('_status', status)
+
+    @pyqtProperty(int, notify=countChanged)
+    def count(self):
+        """Tournaments matching the filters (loaded or not)."""
+        return self._count
+
+    def _set_filter(self, attr, value):
+        if getattr(self, attr) == value:
+            return
+        setattr(self, attr, value)
+        self.filtersChanged.emit()
+        # Start over from the first page
+        self.beginResetModel()
+        self._rows = []
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore()
+
+    # --- Refresh ---
+
+    def invalidate(self):
+        """Re-read the loaded rows soon (tournaments or their summaries changed)."""
+        self._reload_timer.start(TOURNAMENT_LIST_DELAY_MS)
+
+    def _page(self, after=None, limit=PAGE_SIZE):
+        return self.summaries.page(self._search, self._type or None, self._status or None, after, limit)
+
+    def _update_count(self):
+        count = self.summaries.count(self._search, self._type or None, self._status or None)
+        if count != self._count:
+            self._count = count
+            self.countChanged.emit()
+
+    def _reload(self):
+        if not self._rows and not self._exhausted:
+            return  # Not shown yet; the first fetchMore reads fresh rows
+        self._update_count()
+        limit = max(len(self._rows), PAGE_SIZE)
+        rows = self._page(limit=limit)
+        if [r['id'] for r in rows] == [r['id'] for r in self._rows]:
+            # Same tournaments in the same order: update in place, keep the scroll position
+            self._rows = rows
+            if rows:
+                self.dataChanged.emit(self.index(0), self.index(len(rows) - 1))
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self._exhausted = len(rows) < limit
+        self.endResetModel()
 
+@instrumented  # Times every slot and property read (see backend.instrumentation)
 class BackendBridge(QObject):
     # UI Signals
     tournamentChanged = pyqtSignal()
@@ -37,20 +201,51 @@ class BackendBridge(QObject):
     undoAvailable = pyqtSignal(bool, str)
     backupCreated = pyqtSignal(str)
     backupRestored = pyqtSignal()
-
-    def __init__(self):
+    importProgress = pyqtSignal(int, float)  # rows processed, fraction done
+    backupProgress = pyqtSignal(int, int)  # pages done, pages total
+    backupRunningChanged = pyqtSignal()
+    _backupFinished = pyqtSignal(str, bool, str)  # worker thread -> GUI thread
+    _asyncDone = pyqtSignal(object, object)  # (future, handler), DB worker -> GUI thread
+    resultConflict = pyqtSignal(int, str)  # pairing id, result entered on another terminal
+    diagnosticsChanged = pyqtSignal()
+    logChanged = pyqtSignal()
+    sessionRestored = pyqtSignal()
+    tournamentOpened = pyqtSignal(int)  # Loaded and current; not sent when the load is refused
+    profilingChanged = pyqtSignal()
+
+    def __init__(self, server_address=None, profiler=None):
         super().__init__()
-        self.db = Database()
-        self.swiss_engine = SwissEngine()
-        self.rr_engine = RoundRobinEngine()
+        # With a server address, run as a thin client of a TournamentServer (see main.py --connect)
+        self.remote = server_address is not None
+        if self.remote:
+            from backend.remote import RemoteDatabase, RemoteScoring, RemoteChangeWatcher
+        self.db = RemoteDatabase(server_address, CLIENT_SETTINGS_DB) if self.remote else Database()
+        # Slots run their database work through async_db and get results back via _deliver,
+        # including the materialized standings setting and check. Only slots that hand a
+        # value straight back to QML (registry search, game text, CSV preview, backup list)
+        # and the settings store read synchronously.
+        self.async_db = AsyncDatabase(self.db)
+        self._asyncDone.connect(self._on_async_done)
         
         self.undo_manager = UndoManager(max_size=10)
         self.settings_manager = SettingsManager(self.db.db_path)
         self.backup_manager = BackupManager()
+        self.background_backup = BackgroundBackup(self.backup_manager)
+        self._backupFinished.connect(self._on_backup_finished)
+        self.registry = PlayerRegistry(self.db)
+        self.scoring = RemoteScoring(self.db) if self.remote else ScoringKernel(self.db)
+        self.materialized_standings = MaterializedStandings(self.db)
+        self.archive = TournamentArchive(self.db)
+        self.games = GameStore(self.db)
+        self.summaries = TournamentSummaries(self.db, self.archive)
+        self._tournament_list = TournamentListModel(self.summaries, self)
+        self.tournamentChanged.connect(self._tournament_list.invalidate)
+        self.pairingsChanged.connect(self._tournament_list.invalidate)  # Pending results
+        if profiler is not None:
+            self.profiler = profiler  # main.py's, started before us (--profile / --trace-memory)
         
         # Load undo stack size from settings
-        undo_size = self.settings_manager.get_int('undo_stack_size', 10)
-        self.undo_manager.max_size = undo_size
+        self.undo_manager.max_size = self.settings_manager.value('undo_stack_size')
         
         self._current_tournament = None
         self._players = []
@@ -58,44 +253,176 @@ class BackendBridge(QObject):
         self._standings = []
         self._round_status = ""
         self._viewing_round = 0  # Track which round is being viewed
+        self._duplicate_index = None  # Built lazily per tournament
+        self._duplicate_index_tid = None
+        self._round_versions = {}  # round_number -> version last seen (optimistic locking)
+        self._rounds = {}  # round_number -> (status, pairing_mode), see _load_rounds
+        self._result_writes = {}  # pairing id -> our latest result write still to be delivered
+        self._standings_version = None  # score_versions value of the shown standings
+
+        # Pick up results entered by other instances on the same database file
+        self.change_watcher = RemoteChangeWatcher(self.db) if self.remote else ChangeWatcher(self.db.db_path)
+        self.change_watcher.poll()
+        self._changes_busy = False
+        self._change_timer = QTimer(self)
+        self._change_timer.timeout.connect(self._poll_changes)
+        self._configure_change_polling()
+
+        # Results dropped into a folder by electronic boards (see backend.ingest)
+        self.results_feed = None
+        self._feed_busy = False
+        self._feed_timer = QTimer(self)
+        self._feed_timer.timeout.connect(self._poll_results_feed)
+        self._configure_results_feed()
+
+        # Periodic automatic backups
+        self._backup_is_automatic = False
+        self._auto_backup_timer = QTimer(self)
+        self._auto_backup_timer.timeout.connect(lambda: self._start_backup(automatic=True))
+        self._configure_auto_backup()
+        self._configure_materialized_standings()
+        self._configure_slow_capture()
+        self._configure_logging()
+
+        # Last session (tournament, round, window); read now so QML can place the window,
+        # written at most once per APP_STATE_DELAY_MS
+        self.app_state_store = AppStateStore(
+            APP_STATE_FILE, self.settings_manager, self.settings_manager.value('app_state_storage')
+        )
+        self._app_state = self.app_state_store.load()
+        self._app_state_dirty = False
+        self._app_state_timer = QTimer(self)
+        self._app_state_timer.setSingleShot(True)
+        self._app_state_timer.timeout.connect(self._write_app_state)
+
+        # Apply settings as soon as they change, whoever changes them
+        self.settings_manager.subscribe(
+            'undo_stack_size', lambda key, value: setattr(self.undo_manager, 'max_size', value)
+        )
+        self.settings_manager.subscribe('auto_backup', lambda key, value: self._configure_auto_backup())
+        self.settings_manager.subscribe('auto_backup_interval', lambda key, value: self._configure_auto_backup())
+        self.settings_manager.subscribe(
+            'materialized_standings', lambda key, value: self._configure_materialized_standings()
+        )
+        self.settings_manager.subscribe('change_poll_interval', lambda key, value: self._configure_change_polling())
+        self.settings_manager.subscribe('results_feed_folder', lambda key, value: self._configure_results_feed())
+        self.settings_manager.subscribe('results_feed_interval', lambda key, value: self._configure_results_feed())
+        self.settings_manager.subscribe('slow_slot_profile_ms', lambda key, value: self._configure_slow_capture())
+        self.settings_manager.subscribe('log_level', lambda key, value: self._configure_logging())
+        self.settings_manager.subscribe('log_levels', lambda key, value: self._configure_logging())
+        self.settings_manager.subscribe('app_state_storage', lambda key, value: self._configure_app_state_storage())
+        self.settings_manager.subscribe('*', lambda key, value: self.settingsChanged.emit())
+
+        # The previous session is restored by restoreSession(), once the window is up
+
+    # --- Lazily created helpers ---
+    @cached_property
+    def swiss_engine(self):
+        from backend.pairing.swiss import SwissEngine
+        return SwissEngine()
+
+    @cached_property
+    def rr_engine(self):
+        from backend.pairing.round_robin import RoundRobinEngine
+        return RoundRobinEngine()
+
+    @cached_property
+    def csv_importer(self):
+        from backend.csv_import import CSVImporter
+        return CSVImporter(self.db)
+
+    @cached_property
+    def profiler(self):
+        from backend.profiling import Profiler
+        return Profiler(get_app_path())
+
+    @pyqtSlot()
+    def restoreSession(self):
+        """
+        Reopen the last tournament. main.py calls this after the first frame;
+        players and pairings load in the background and sessionRestored fires
+        once they are shown.
+        """
+        def restored():
+            tid = self._current_tournament.id if self._current_tournament else None
+            # Keyed reads run in order, so this resolves after the restored tournament's loads
+            self._deliver(self.async_db.read(self._session_barrier, key=tid),
+                          lambda _: self.sessionRestored.emit())
+
+        if not self._restore_app_state(then=restored):
+            restored()
+
+    @staticmethod
+    def _session_barrier():
+        return None
 
-        # Try to recover previous session
-        self._restore_app_state()
+    def _restore_app_state(self, then):
+        """Start reopening the last tournament; then() runs once it is shown. False if there is none."""
+        # Anything missing or of the wrong type (older or hand-edited state) is skipped
+        last_tid = self._app_state.get('last_tournament_id')
+        last_round = self._app_state.get('last_viewing_round')
+        if not isinstance(last_tid, int) or isinstance(last_tid, bool):
+            return False
 
-    def _restore_app_state(self):
-        try:
-            if os.path.exists(APP_STATE_FILE):
-                with open(APP_STATE_FILE, 'r') as f:
-                    state = json.load(f)
-                    last_tid = state.get('last_tournament_id')
-                    last_round = state.get('last_viewing_round')
-                    
-                    if last_tid:
-                        print(f"Restoring last session: Tournament {last_tid}")
-                        self.loadTournament(last_tid)
-                        
-                        if last_round and self._current_tournament:
-                            if last_round <= self._current_tournament.current_round:
-                                self.setViewRound(last_round)
-        except Exception as e:
-            print(f"Failed to restore state: {e}")
+        def loaded():
+            if (isinstance(last_round, int) and self._current_tournament
+                    and 0 < last_round <= self._current_tournament.current_round):
+                self.setViewRound(last_round)
+            then()
+
+        logger.info("Restoring last session: Tournament %s", last_tid)
+        self._load_tournament(last_tid, then=loaded)
+        return True
 
     def _save_app_state(self):
+        self._app_state['last_tournament_id'] = self._current_tournament.id if self._current_tournament else None
+        self._app_state['last_viewing_round'] = self._viewing_round
+        self._schedule_app_state()
+
+    def _schedule_app_state(self):
+        """Mark the state changed; it is written once changes stop for APP_STATE_DELAY_MS."""
+        self._app_state_dirty = True
+        self._app_state_timer.start(APP_STATE_DELAY_MS)
+
+    def _write_app_state(self):
+        if not self._app_state_dirty:
+            return
+        self._app_state_dirty = False
         try:
-            state = {
-                'last_tournament_id': self._current_tournament.id if self._current_tournament else None,
-                'last_viewing_round': self._viewing_round
-            }
-            with open(APP_STATE_FILE, 'w') as f:
-                json.dump(state, f)
+            self.app_state_store.save(self._app_state)
         except Exception as e:
-            print(f"Failed to save state: {e}")
+            logger.warning("Failed to save state: %s", e)
+
+    def _configure_app_state_storage(self):
+        self.app_state_store.storage = self.settings_manager.value('app_state_storage')
+        self._schedule_app_state()  # Move the current state to the new place
+
+    @pyqtSlot()
+    def flushAppState(self):
+        """Write pending app state now (main.py calls this on exit)."""
+        self._app_state_timer.stop()
+        self._write_app_state()
+
+    @pyqtSlot(str, result=QVariant)
+    def uiState(self, key):
+        """UI state saved with setUiState (window geometry, filters); None if unknown."""
+        ui = self._app_state.get('ui')
+        return ui.get(key) if isinstance(ui, dict) else None
+
+    @pyqtSlot(str, QVariant)
+    def setUiState(self, key, value):
+        ui = self._app_state.get('ui')
+        if not isinstance(ui, dict):
+            ui = self._app_state['ui'] = {}
+        if ui.get(key) != value:
+            ui[key] = value
+            self._schedule_app_state()
 
     # --- Properties ---
     @pyqtProperty(QVariant, notify=tournamentChanged)
     def currentTournament(self):
         if self._current_tournament:
-            return vars(self._current_tournament)
+            return self._current_tournament.to_dict()
         return None
 
     @pyqtProperty(int, notify=tournamentChanged)
@@ -116,25 +443,19 @@ class BackendBridge(QObject):
         # Check if the currently viewed round is locked
         if not self._current_tournament: return False
         r_num = self._viewing_round if self._viewing_round > 0 else self._current_tournament.current_round
-        
-        # Query status
-        rdata = self.db.execute_query("SELECT status FROM rounds WHERE tournament_id = ? AND round_number = ?", 
-                                      (self._current_tournament.id, r_num))
-        if rdata and rdata[0][0] == 'LOCKED':
-            return True
-        return False
+        return self._rounds.get(r_num, (None, None))[0] == 'LOCKED'
 
     @pyqtProperty(list, notify=playersChanged)
     def playerList(self):
-        return [vars(p) for p in self._players]
+        return [p.to_dict() for p in self._players]
 
     @pyqtProperty(list, notify=pairingsChanged)
     def pairingList(self):
-        return [vars(p) for p in self._pairings]
+        return [p.to_dict() for p in self._pairings]
 
     @pyqtProperty(list, notify=standingsChanged)
     def standingsList(self):
-        return [vars(p) for p in self._standings]
+        return [p.to_dict() for p in self._standings]
 
     # --- Slots (Public Methods) ---
 
@@ -142,51 +463,78 @@ class BackendBridge(QObject):
 
     @pyqtSlot(str, str, int, str)
     def createTournament(self, name, t_type, rounds, venue):
-        try:
-            query = "INSERT INTO tournaments (name, type, total_rounds, status, venue) VALUES (?, ?, ?, 'SETUP', ?)"
-            tid = self.db.execute_non_query(query, (name, t_type, rounds, venue))
+        def created(tid):
             self.loadTournament(tid)
             self.notification.emit("Success", f"Tournament '{name}' created!")
-        except Exception as e:
-            self.notification.emit("Error", str(e))
+
+        query = "INSERT INTO tournaments (name, type, total_rounds, status, venue) VALUES (?, ?, ?, 'SETUP', ?)"
+        self._deliver(self.async_db.execute(query, (name, t_type, rounds, venue)),
+                      created, "Failed to create tournament")
 
     @pyqtSlot(int)
     def loadTournament(self, tid):
-        try:
-            data = self.db.execute_query("SELECT * FROM tournaments WHERE id = ?", (tid,))
-            if data:
-                row = data[0]
-                # row: id, name, type, total, current, status, created
-                self._current_tournament = Tournament(
-                    id=row[0], name=row[1], type=row[2], total_rounds=row[3],
-                    current_round=row[4], status=row[5], created_at=row[6],
-                    venue=row[7]
-                )
-                self._viewing_round = self._current_tournament.current_round # Reset view to current
-                
-                self.tournamentChanged.emit()
-                self.refreshPlayers()
-                self.updateStandings()
-                self.roundsChanged.emit() # Ensure round status/mode is refreshed
-                # Load pairings for the *viewed* round (which is current)
-                if self._current_tournament.current_round > 0:
-                    self.loadPairings(self._current_tournament.current_round)
-                
-                self._save_app_state()
-                
-                # Fix: If tournament looks done but status says active, update it
-                if self._current_tournament.status == 'ACTIVE' and self._current_tournament.current_round == self._current_tournament.total_rounds:
-                    # Check if the final round is actually locked
-                    rdata = self.db.execute_query("SELECT status FROM rounds WHERE tournament_id = ? AND round_number = ?", 
-                                                  (self._current_tournament.id, self._current_tournament.current_round))
-                    if rdata and rdata[0][0] == 'LOCKED':
-                        print(f"Auto-correcting status for Tournament {self._current_tournament.id} to FINISHED")
-                        self.db.execute_non_query("UPDATE tournaments SET status = 'FINISHED' WHERE id = ?", (self._current_tournament.id,))
-                        self._current_tournament.status = 'FINISHED'
-                        self.tournamentChanged.emit()
-        except Exception as e:
-            print(e)
-            self.notification.emit("Error", "Failed to load tournament")
+        self._load_tournament(tid)
+
+    def _load_tournament(self, tid, then=None):
+        """Read a tournament in the background and open it; then() runs afterwards, even on failure."""
+        def loaded(fetched):
+            self._apply_tournament(tid, fetched)
+            if then:
+                then()
+
+        self._deliver(self.async_db.read(self._fetch_tournament, tid, key=tid),
+                      loaded, "Failed to load tournament", on_error=then)
+
+    def _fetch_tournament(self, tid):
+        """
+        (tournament, final round locked), or (None, archived) if it is not in
+        the working database. Thread-safe.
+        """
+        data = self.db.execute_query("SELECT * FROM tournaments WHERE id = ?", (tid,))
+        if not data:
+            return None, self.archive.contains(tid)
+        row = data[0]
+        # row: id, name, type, total, current, status, created
+        tournament = Tournament(
+            id=row[0], name=row[1], type=row[2], total_rounds=row[3],
+            current_round=row[4], status=row[5], created_at=row[6],
+            venue=row[7]
+        )
+        final_locked = False
+        if tournament.status == 'ACTIVE' and tournament.current_round == tournament.total_rounds:
+            # Check if the final round is actually locked
+            rdata = self.db.execute_query("SELECT status FROM rounds WHERE tournament_id = ? AND round_number = ?",
+                                          (tid, tournament.current_round))
+            final_locked = bool(rdata) and rdata[0][0] == 'LOCKED'
+        return tournament, final_locked
+
+    def _apply_tournament(self, tid, fetched):
+        tournament, flag = fetched
+        if tournament is None:
+            if flag:
+                self.notification.emit("Info", "This tournament is archived. Restore it from its card on the dashboard to open it.")
+            return
+
+        # Fix: If tournament looks done but status says active, update it
+        if flag:
+            logger.info("Auto-correcting status for Tournament %d to FINISHED", tid)
+            self.async_db.execute("UPDATE tournaments SET status = 'FINISHED' WHERE id = ?", (tid,), key=tid)
+            tournament.status = 'FINISHED'
+
+        self._current_tournament = tournament
+        self._viewing_round = tournament.current_round # Reset view to current
+        self._round_versions = {}
+        self._rounds = {}
+
+        self.tournamentChanged.emit()
+        self.refreshPlayers()
+        self._load_rounds() # Round status/mode
+        # Load pairings for the *viewed* round (which is current)
+        if tournament.current_round > 0:
+            self.loadPairings(tournament.current_round)
+
+        self._save_app_state()
+        self.tournamentOpened.emit(tid)
 
     @pyqtSlot(int)
     def setViewRound(self, round_num):
@@ -203,320 +551,789 @@ class BackendBridge(QObject):
 
     @pyqtSlot(str, int, str, str)
     def addPlayer(self, name, rating, fide_id, club):
+        """Register a player. The UI asks findDuplicates first and confirms likely duplicates."""
         if not self._current_tournament:
             return
+        tid = self._current_tournament.id
 
-        try:
-            query = "INSERT INTO players (tournament_id, name, rating, fide_id, club) VALUES (?, ?, ?, ?, ?)"
-            self.db.execute_non_query(query, (self._current_tournament.id, name, rating, fide_id, club))
-            self.refreshPlayers()
+        def added(pid):
+            if self._current_tournament and self._current_tournament.id == tid:
+                self._get_duplicate_index().add(pid, name, club, fide_id or None)  # Checkable before the refresh lands
+                self.refreshPlayers()
             self.notification.emit("Success", "Player added")
+
+        self._write(self._insert_player, tid, name, rating, fide_id, club,
+                    then=added, error="Failed to add player")
+
+    def _insert_player(self, tid, name, rating, fide_id, club):
+        query = "INSERT INTO players (tournament_id, name, rating, fide_id, club, registry_id) VALUES (?, ?, ?, ?, ?, ?)"
+        # One transaction: a failed insert leaves no new registry entry behind
+        with self.db.get_connection() as conn:
+            registry_id = self.registry.register(name, rating, fide_id, club, conn)
+            return conn.execute(query, (tid, name, rating, fide_id, club, registry_id)).lastrowid
+
+    def _get_duplicate_index(self):
+        """Duplicate-detection index for the current tournament, built once and kept in step with the players."""
+        tid = self._current_tournament.id if self._current_tournament else None
+        if self._duplicate_index is None or self._duplicate_index_tid != tid:
+            self._duplicate_index = DuplicateIndex()
+            self._duplicate_index_tid = tid
+            for p in self._players:
+                self._duplicate_index.add(p.id, p.name, p.club, p.fide_id)
+        return self._duplicate_index
+
+    def _sync_duplicate_index(self, old_players, new_players):
+        """Add, replace or remove only the index entries of players that changed."""
+        if self._duplicate_index is None:
+            return  # Built from the new list on first use
+        old = {p.id: (p.name, p.club, p.fide_id) for p in old_players}
+        new = {p.id: (p.name, p.club, p.fide_id) for p in new_players}
+        for pid in old.keys() - new.keys():
+            self._duplicate_index.remove(pid)
+        for pid, fields in new.items():
+            if old.get(pid) != fields:
+                self._duplicate_index.add(pid, *fields)
+
+    @pyqtSlot(str, str, result=QVariant)
+    def findDuplicates(self, name, fide_id):
+        """Ranked possible duplicates of a player about to be registered."""
+        if not self._current_tournament:
+            return []
+        return [c.to_dict() for c in self._get_duplicate_index().candidates(name, fide_id)]
+
+    @pyqtSlot(int)
+    def addRegistryPlayer(self, registry_id):
+        """Register an existing registry entry in the current tournament."""
+        if not self._current_tournament:
+            return
+
+        def added(outcome):
+            status, name = outcome
+            if status == 'MISSING':
+                self.notification.emit("Error", "Player not found in registry")
+            elif status == 'ALREADY':
+                self.notification.emit("Info", f"{name} is already registered")
+            else:
+                self.refreshPlayers()
+                self.notification.emit("Success", "Player added")
+
+        self._write(self._insert_registry_player, self._current_tournament.id, registry_id,
+                    then=added, error="Failed to add player")
+
+    def _insert_registry_player(self, tid, registry_id):
+        """(status, name): 'ADDED', 'ALREADY' registered, or 'MISSING' from the registry."""
+        entry = self.registry.get(registry_id)
+        if not entry:
+            return 'MISSING', None
+        already = self.db.execute_query(
+            "SELECT 1 FROM players WHERE tournament_id = ? AND registry_id = ?", (tid, registry_id)
+        )
+        if already:
+            return 'ALREADY', entry['name']
+        self.db.execute_non_query(
+            "INSERT INTO players (tournament_id, name, rating, fide_id, club, registry_id) VALUES (?, ?, ?, ?, ?, ?)",
+            (tid, entry['name'], entry['rating'], entry['fide_id'], entry['club'], registry_id)
+        )
+        return 'ADDED', entry['name']
+
+    @pyqtSlot(str, result=QVariant)
+    def searchRegistry(self, query):
+        """Type-ahead search over every player ever registered."""
+        try:
+            return self.registry.search(query)
         except Exception as e:
-            self.notification.emit("Error", str(e))
+            logger.warning("Registry search failed: %s", e)
+            return []
 
     @pyqtSlot(int)
     def deletePlayer(self, pid):
         if not self._current_tournament: return
-        
+
+        def deleted(ok):
+            if not ok:
+                self.notification.emit("Error", "Cannot delete player who has played matches. Withdraw instead.")
+                return
+            self.refreshPlayers()
+            self.notification.emit("Success", "Player deleted")
+
+        self._write(self._delete_player, pid, then=deleted, error="Failed to delete player")
+
+    def _delete_player(self, pid):
         # Check if player has any pairings
         p_count = self.db.execute_query(
-            "SELECT COUNT(*) FROM pairings WHERE white_player_id = ? OR black_player_id = ?", 
+            "SELECT COUNT(*) FROM pairings WHERE white_player_id = ? OR black_player_id = ?",
             (pid, pid)
         )[0][0]
-        
         if p_count > 0:
-            self.notification.emit("Error", "Cannot delete player who has played matches. Withdraw instead.")
-            return
-
-        try:
-            self.db.execute_non_query("DELETE FROM players WHERE id=?", (pid,))
-            self.refreshPlayers()
-            self.notification.emit("Success", "Player deleted")
-        except Exception as e:
-            self.notification.emit("Error", f"Failed to delete player: {e}")
+            return False
+        self.db.execute_non_query("DELETE FROM players WHERE id=?", (pid,))
+        return True
 
     @pyqtProperty(bool, notify=roundsChanged)
     def isPairingModeManual(self):
         if not self._current_tournament: return False
         r_num = self._viewing_round if self._viewing_round > 0 else self._current_tournament.current_round
-        
-        rdata = self.db.execute_query("SELECT pairing_mode FROM rounds WHERE tournament_id = ? AND round_number = ?", 
-                                      (self._current_tournament.id, r_num))
-        if rdata and rdata[0][0] == 'MANUAL':
-            return True
-        return False
+        return self._rounds.get(r_num, (None, None))[1] == 'MANUAL'
 
     @pyqtSlot(str, int, int)
     def saveManualPairing(self, result_placeholder, w_id, b_id):
         # Adds a single manual pairing to the CURRENT manual round
         if not self._current_tournament: return
-        
-        # Verify valid round
         r_num = self._current_tournament.current_round
-        rdata = self.db.execute_query("SELECT id, pairing_mode FROM rounds WHERE tournament_id = ? AND round_number = ?", 
-                                      (self._current_tournament.id, r_num))
+
+        def saved(ok):
+            if not ok:
+                self.notification.emit("Error", "Current round is not in Manual Mode")
+                return
+            self.loadPairings(r_num)
+
+        self._write(self._insert_manual_pairing, self._current_tournament.id, r_num, result_placeholder,
+                    w_id if w_id > 0 else None, b_id if b_id > 0 else None,
+                    then=saved, error="Manual add failed")
+
+    def _insert_manual_pairing(self, tid, r_num, result, w_id, b_id):
+        # Verify valid round
+        rdata = self.db.execute_query("SELECT id, pairing_mode FROM rounds WHERE tournament_id = ? AND round_number = ?",
+                                      (tid, r_num))
         if not rdata or rdata[0][1] != 'MANUAL':
-            self.notification.emit("Error", "Current round is not in Manual Mode")
-            return
-        
-        rid = rdata[0][0]
-        
-        try:
-             # Basic insert
-             self.db.execute_non_query(
-                "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, ?, ?)",
-                (rid, w_id if w_id > 0 else None, b_id if b_id > 0 else None, result_placeholder)
-            )
-             self.loadPairings(r_num)
-             self.pairingsChanged.emit() # Refresh
-        except Exception as e:
-            self.notification.emit("Error", f"Manual add failed: {e}")
+            return False
+        self.db.execute_non_query(
+            "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, ?, ?)",
+            (rdata[0][0], w_id, b_id, result)
+        )
+        return True
 
     @pyqtSlot(int)
     def deletePairing(self, pairing_id):
-        try:
-            self.db.execute_non_query("DELETE FROM pairings WHERE id=?", (pairing_id,))
+        if not self._current_tournament: return
+
+        def deleted(_):
             self.loadPairings(self._current_tournament.current_round)
             self.notification.emit("Success", "Pairing removed")
-        except Exception as e:
-            self.notification.emit("Error", str(e))
+
+        self._write(self.db.execute_non_query, "DELETE FROM pairings WHERE id=?", (pairing_id,),
+                    then=deleted, error="Failed to remove pairing")
 
     @pyqtSlot(str)
     def setupNextRound(self, mode):
         if not self._current_tournament: return
-        
-        tid = self._current_tournament.id
-        current_round = self._current_tournament.current_round
-        
+        t = self._current_tournament
+        # Queued behind pending results, which must be in before pairing
+        self._write(self._start_next_round, t.id, t.type, t.current_round, t.total_rounds, mode,
+                    then=lambda outcome: self._on_round_started(t.id, outcome), error="Failed to create round")
+
+    def _start_next_round(self, tid, t_type, current_round, total_rounds, mode):
+        """
+        Create the next round and, in AUTO mode, its pairings. Runs on the DB
+        writer thread; returns (status, detail) for _on_round_started.
+        """
         # Rule: Cannot start next round if current is not LOCKED (unless it's round 0)
         if current_round > 0:
-            # Check status
             rdata = self.db.execute_query("SELECT status FROM rounds WHERE tournament_id = ? AND round_number = ?",
                                           (tid, current_round))
             if not rdata or rdata[0][0] != 'LOCKED':
-                self.notification.emit("Error", "Current round must be LOCKED before starting next round.")
-                return
+                return 'NOT_LOCKED', None
 
         next_round = current_round + 1
-        
-        if next_round > self._current_tournament.total_rounds:
-            self.notification.emit("Info", "Tournament Finished!")
-            return
+        if next_round > total_rounds:
+            return 'FINISHED', None
 
-        # 1. Create Round Record
-        try:
-            rid = self.db.execute_non_query(
+        # 1. Create Round Record and move the current pointer
+        with self.db.get_connection() as conn:
+            rid = conn.execute(
                 "INSERT INTO rounds (tournament_id, round_number, status, pairing_mode) VALUES (?, ?, 'IN_PROGRESS', ?)",
                 (tid, next_round, mode)
-            )
-        except Exception as e:
-             self.notification.emit("Error", f"Failed to create round: {e}")
-             return
-        
-        # 2. Update Tournament State (Move current pointer)
-        self.db.execute_non_query(
-            "UPDATE tournaments SET current_round = ?, status = 'ACTIVE' WHERE id = ?",
-            (next_round, tid)
-        )
-        self.loadTournament(tid) # Refresh state
+            ).lastrowid
+            conn.execute("UPDATE tournaments SET current_round = ?, status = 'ACTIVE' WHERE id = ?", (next_round, tid))
 
         if mode == 'MANUAL':
-            # Manual Mode: Round created, but no pairings. 
+            # Manual Mode: Round created, but no pairings.
             # UI checks isPairingModeManual + empty pairings list -> Shows Editor
-            self.notification.emit("Success", f"Round {next_round} Initialized (Manual Mode)")
-            self.loadPairings(next_round) # Will be empty
-            return
+            return 'MANUAL', next_round
 
         # AUTO Pairing Logic
         try:
-            self.refreshPlayers()
-            
+            # Pairing needs current scores, read here rather than from the shown list
+            _, players = self._fetch_players(tid)
+
             # Retrieve past pairings for history
-            past_pairings_data = self.db.execute_query(
+            past_pairings = PairingTable.from_rows(self.db.execute_query(
                 """
-                SELECT p.id, p.round_id, p.white_player_id, p.black_player_id, p.result 
-                FROM pairings p 
-                JOIN rounds r ON p.round_id = r.id 
+                SELECT r.round_number, p.white_player_id, p.black_player_id, p.result, r.status = 'LOCKED'
+                FROM pairings p
+                JOIN rounds r ON p.round_id = r.id
                 WHERE r.tournament_id = ?
                 """,
                 (tid,)
-            )
-            
-            past_objs = []
-            for p in past_pairings_data:
-                # schema of p: id, round_id, w_id, b_id, res
-                past_objs.append(Pairing(id=p[0], round_id=p[1], white_player_id=p[2], black_player_id=p[3], result=p[4]))
-
-            generated = []
-            if self._current_tournament.type == 'SWISS':
-                generated = self.swiss_engine.pair_round(self._players, past_objs, next_round)
+            ))
+
+            if t_type == 'SWISS':
+                generated = self.swiss_engine.pair_round(players, past_pairings, next_round)
             else:
-                generated = self.rr_engine.pair_round(self._players, next_round)
-            
-            # 3. Save Pairings to DB
-            for gp in generated:
-                w = gp['white'].id if gp.get('white') else None
-                b = gp['black'].id if gp.get('black') else None
-                res = gp.get('result', '*')
-                self.db.execute_non_query(
+                generated = self.rr_engine.pair_round(players, next_round)
+
+            # 2. Save Pairings to DB
+            with self.db.get_connection() as conn:
+                conn.executemany(
                     "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, ?, ?)",
-                    (rid, w, b, res)
+                    [(rid, gp['white'].id if gp.get('white') else None, gp['black'].id if gp.get('black') else None,
+                      gp.get('result', '*')) for gp in generated]
                 )
+        except Exception as e:
+            logger.exception("Pairing round %s of tournament %s failed", next_round, tid)
+            return 'PAIRING_FAILED', (next_round, str(e))
+        return 'AUTO', next_round
+
+    def _on_round_started(self, tid, outcome):
+        status, detail = outcome
+        if status == 'NOT_LOCKED':
+            self.notification.emit("Error", "Current round must be LOCKED before starting next round.")
+            return
+        if status == 'FINISHED':
+            self.notification.emit("Info", "Tournament Finished!")
+            return
+        self.loadTournament(tid) # Refresh state, including the new round's pairings
+        if status == 'MANUAL':
+            self.notification.emit("Success", f"Round {detail} Initialized (Manual Mode)")
+        elif status == 'AUTO':
+            self.notification.emit("Success", f"Round {detail} pairings generated (Auto)")
+        else:
+            self.notification.emit("Error", f"Pairing Failed: {detail[1]}")
+
+    @pyqtSlot(QVariant)
+    def repairPairings(self, absent_ids):
+        """
+        Re-pair the current round after late withdrawals or no-shows
+        (`absent_ids`): only boards with a withdrawn or absent player and,
+        if needed, the bye change; see SwissEngine.repair_round.
+        """
+        if not self._current_tournament: return
+        if self._current_tournament.type != 'SWISS':
+            self.notification.emit("Error", "Pairing repair is only available for Swiss tournaments")
+            return
 
-            # Reload
-            self.loadPairings(next_round)
-            self.notification.emit("Success", f"Round {next_round} pairings generated (Auto)")
+        tid = self._current_tournament.id
+        round_num = self._current_tournament.current_round
+        absent = {int(pid) for pid in (absent_ids or [])}
+        # Queued behind results still being saved, which decide which boards are played
+        self._write(self._repair_pairings, tid, round_num, absent,
+                    then=lambda outcome: self._on_pairings_repaired(round_num, outcome),
+                    error="Pairing repair failed")
+
+    def _repair_pairings(self, tid, round_num, absent):
+        """Repair the round on the DB writer thread; returns (status, detail) for _on_pairings_repaired."""
+        rdata = self.db.execute_query("SELECT id, status FROM rounds WHERE tournament_id = ? AND round_number = ?",
+                                      (tid, round_num))
+        if not rdata:
+            return 'NO_ROUND', None
+        rid, status = rdata[0]
+        if status == 'LOCKED':
+            return 'LOCKED', None
 
-        except Exception as e:
-            self.notification.emit("Error", f"Pairing Failed: {e}")
-            import traceback
-            traceback.print_exc()
+        _, players = self._fetch_players(tid)
+        past_pairings = PairingTable.from_rows(self.db.execute_query(
+            """
+            SELECT r.round_number, p.white_player_id, p.black_player_id, p.result, r.status = 'LOCKED'
+            FROM pairings p
+            JOIN rounds r ON p.round_id = r.id
+            WHERE r.tournament_id = ? AND r.round_number < ?
+            """,
+            (tid, round_num)
+        ))
+        current = [Pairing(*row) for row in self.db.execute_query(
+            "SELECT id, round_id, white_player_id, black_player_id, result, version FROM pairings "
+            "WHERE round_id = ? ORDER BY id", (rid,)
+        )]
+        plan = self.swiss_engine.repair_round(players, past_pairings, current, absent)
+        if not plan.touched:
+            return 'UNCHANGED', 0
+
+        def side(pairing, colour):
+            return pairing[colour].id if pairing.get(colour) else None
+
+        versions = {p.id: p.version for p in current}
+        try:
+            with self.db.get_connection() as conn:
+                # Only boards still as read above; a result entered meanwhile stops the repair
+                updates = [(side(new, 'white'), side(new, 'black'), new.get('result', '*'), pid, versions[pid])
+                           for pid, new in plan.updates]
+                if updates:
+                    cursor = conn.executemany(
+                        "UPDATE pairings SET white_player_id = ?, black_player_id = ?, result = ?, "
+                        "version = version + 1 WHERE id = ? AND version = ?", updates
+                    )
+                    if cursor.rowcount != len(updates):
+                        raise ConflictError("Pairings were changed on another terminal")
+                if plan.deletes:
+                    cursor = conn.executemany(
+                        "DELETE FROM pairings WHERE id = ? AND version = ?",
+                        [(pid, versions[pid]) for pid in plan.deletes]
+                    )
+                    if cursor.rowcount != len(plan.deletes):
+                        raise ConflictError("Pairings were changed on another terminal")
+                conn.executemany(
+                    "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, ?, ?)",
+                    [(rid, side(new, 'white'), side(new, 'black'), new.get('result', '*')) for new in plan.inserts]
+                )
+        except ConflictError as e:
+            return 'CONFLICT', str(e)
+        return 'REPAIRED', plan.touched
+
+    def _on_pairings_repaired(self, round_num, outcome):
+        status, detail = outcome
+        if status == 'NO_ROUND':
+            self.notification.emit("Error", "No round to repair")
+        elif status == 'LOCKED':
+            self.notification.emit("Error", "Round is LOCKED. Unlock to repair pairings.")
+        elif status == 'UNCHANGED':
+            self.notification.emit("Info", "No pairings needed repair")
+        elif status == 'CONFLICT':
+            self.loadPairings(round_num)
+            self.notification.emit("Warning", f"Pairings not repaired: {detail}. Showing the latest pairings.")
+        else:
+            self.loadPairings(round_num)
+            self.notification.emit("Success", f"Pairings repaired: {detail} board(s) changed")
 
     @pyqtSlot(int, str)
     def setResult(self, pairing_id, result):
-        # Allow editing ONLY if the round is IN_PROGRESS (which means Unlocked or Current)
-        # We need to find which round this pairing belongs to
-        pdata = self.db.execute_query("SELECT round_id FROM pairings WHERE id=?", (pairing_id,))
-        if not pdata: return
-        rid = pdata[0][0]
-        
-        rdata = self.db.execute_query("SELECT status FROM rounds WHERE id=?", (rid,))
-        if not rdata: return
-        status = rdata[0][0]
-        
+        # Allow editing ONLY if the round is IN_PROGRESS (which means Unlocked or Current).
+        # The check and the update run together on the DB writer thread.
+        # Only overwrite the result this instance has seen; another arbiter may have changed it
+        tid = self._current_tournament.id if self._current_tournament else None
+        expected = next((p.version for p in self._pairings if p.id == pairing_id), None)
+        prior = self._result_writes.get(pairing_id)
+        future = self.async_db.write(self._write_result, pairing_id, result, expected, prior, key=tid)
+        self._result_writes[pairing_id] = future
+        self._deliver(
+            future, lambda outcome: self._on_result_written(pairing_id, future, outcome), "Failed to save result"
+        )
+
+    @staticmethod
+    def _written_version(future, pairing_id):
+        """Version a finished result write of ours left a pairing at, or None."""
+        if future is None or not future.done() or future.cancelled() or future.exception() is not None:
+            return None
+        status, detail = future.result()
+        if status != 'SAVED':
+            return None
+        return detail if isinstance(detail, int) else detail.versions.get(pairing_id)
+
+    def _write_result(self, pairing_id, result, expected_version, prior=None):
+        """Store a result with an optimistic version check. Runs on the DB writer thread."""
+        # A second click before our previous write was reloaded: expect the version that write left
+        written = self._written_version(prior, pairing_id)
+        if written is not None:
+            expected_version = written
+        try:
+            return 'SAVED', update_result(self.db, pairing_id, result, expected_version)
+        except RoundLockedError as e:
+            return 'LOCKED', str(e)
+        except ConflictError as e:
+            return 'CONFLICT', e.current
+        except ValueError:
+            return None, None
+
+    def _forget_result_writes(self, future, pairing_ids):
+        for pid in pairing_ids:
+            if self._result_writes.get(pid) is future:
+                del self._result_writes[pid]
+
+    def _update_cached_versions(self, versions):
+        """Take our own writes' new versions at once, ahead of the pairings reload."""
+        for p in self._pairings:
+            if p.id in versions:
+                p.version = versions[p.id]
+
+    def _on_result_written(self, pairing_id, future, outcome):
+        self._forget_result_writes(future, [pairing_id])
+        status, detail = outcome
+        if status == 'SAVED':
+            self._update_cached_versions({pairing_id: detail})
         if status == 'LOCKED':
-            self.notification.emit("Error", "Round is LOCKED. Unlock to edit results.")
+            self.notification.emit("Error", detail)
+            return
+        if status == 'CONFLICT':
+            self.resultConflict.emit(detail.get('id', 0), detail.get('result', ''))
+            self.notification.emit(
+                "Warning", f"Result was changed on another terminal to {detail.get('result', '?')}. Showing the latest results."
+            )
+        elif status is None:
             return
-
-        self.db.execute_non_query("UPDATE pairings SET result = ? WHERE id = ?", (result, pairing_id))
         self.updateStandings() # Auto update standings (NOTE: If unlocked, these results won't count yet)
         
         # Reload if we are viewing this round
         if self._current_tournament and self.viewingRoundNumber > 0:
              self.loadPairings(self.viewingRoundNumber)
 
+    @pyqtSlot(int, QVariant)
+    def setResults(self, round_num, entries):
+        """
+        Enter many results at once: a pasted block like "12 1-0, 13 ½-½" or a
+        list of [board, result] pairs. All are validated and saved in one
+        transaction, as one undo step, then standings refresh once.
+        """
+        if not self._current_tournament:
+            return
+        try:
+            results = parse_results(entries)
+        except (TypeError, ValueError) as e:
+            self.notification.emit("Error", f"Results not saved: {e}")
+            return
+        if not results:
+            return
+        tid = self._current_tournament.id
+        expected = {p.id: p.version for p in self._pairings} if round_num == self._viewing_round else None
+        priors = {pid: self._result_writes[pid] for pid in expected or () if pid in self._result_writes}
+        future = self.async_db.write(self._write_results, tid, round_num, results, expected, priors, key=tid)
+        for pid in expected or ():
+            self._result_writes[pid] = future
+        self._deliver(
+            future, lambda outcome: self._on_results_written(round_num, future, list(expected or ()), outcome),
+            "Failed to save results"
+        )
+
+    def _write_results(self, tid, round_num, results, expected_versions, priors=None):
+        """set_results on the DB writer thread, with errors as (status, detail)."""
+        if expected_versions is not None and priors:
+            expected_versions = dict(expected_versions)
+            for pid, prior in priors.items():
+                written = self._written_version(prior, pid)
+                if written is not None:
+                    expected_versions[pid] = written
+        try:
+            return 'SAVED', set_results(self.db, tid, round_num, results, expected_versions)
+        except RoundLockedError as e:
+            return 'LOCKED', str(e)
+        except ConflictError as e:
+            return 'CONFLICT', e.current.get('pairings', [])
+        except ValueError as e:
+            return 'INVALID', str(e)
+
+    def _on_results_written(self, round_num, future, pairing_ids, outcome):
+        self._forget_result_writes(future, pairing_ids)
+        status, detail = outcome
+        if status == 'SAVED':
+            self._update_cached_versions(detail.versions)
+        if status in ('LOCKED', 'INVALID'):
+            self.notification.emit("Error", f"Results not saved: {detail}")
+            return
+        if status == 'CONFLICT':
+            boards = ", ".join(str(c['board']) for c in detail)
+            self.notification.emit(
+                "Warning", f"Results not saved: board(s) {boards} were changed on another terminal. "
+                           "Showing the latest results."
+            )
+        elif detail.changed:
+            self.undo_manager.push(UndoAction(
+                action_type='UPDATE',
+                table_name='pairings',
+                record_id=detail.round_id,
+                old_data={'results': [[pid, old] for pid, old, _ in detail.changed]},
+                new_data={'results': [[pid, new] for pid, _, new in detail.changed]},
+                description=f"Enter {len(detail.changed)} results in round {round_num}"
+            ))
+            self._emit_undo_status()
+            self.updateStandings()
+            self.notification.emit("Success", f"{len(detail.changed)} results saved")
+        else:
+            self.notification.emit("Info", "No results changed")
+        if self._current_tournament and self.viewingRoundNumber > 0:
+            self.loadPairings(self.viewingRoundNumber)
+
     @pyqtSlot(int)
     def lockRound(self, round_num):
         if not self._current_tournament: return
-        
+        t = self._current_tournament
+
+        # Update status to LOCKED and set timestamp
+        import datetime
+        now = datetime.datetime.now().isoformat()
+        # Check if this is the last round
+        finish = round_num == t.total_rounds
+        # Queued behind results still being saved, which belong to this round
+        self._write(self._write_round_status, t.id, round_num, 'LOCKED', now,
+                    self._round_versions.get(round_num), finish,
+                    then=lambda outcome: self._on_round_locked(t.id, round_num, finish, outcome),
+                    error="Failed to lock round")
+
+    def _write_round_status(self, tid, round_num, status, locked_at, expected_version, finish=False):
+        """set_round_status on the DB writer thread; ('SAVED', new version) or ('CONFLICT', message)."""
         try:
-            # Update status to LOCKED and set timestamp
-            import datetime
-            now = datetime.datetime.now().isoformat()
-            
-            self.db.execute_non_query(
-                "UPDATE rounds SET status = 'LOCKED', locked_at = ? WHERE tournament_id = ? AND round_number = ?",
-                (now, self._current_tournament.id, round_num)
-            )
-            
+            version = set_round_status(self.db, tid, round_num, status, locked_at, expected_version=expected_version)
+        except ConflictError as e:
+            return 'CONFLICT', str(e)
+        if finish:
+            self.db.execute_non_query("UPDATE tournaments SET status = 'FINISHED' WHERE id = ?", (tid,))
+        return 'SAVED', version
+
+    def _on_round_locked(self, tid, round_num, finish, outcome):
+        status, detail = outcome
+        if status == 'CONFLICT':
+            self._round_versions.pop(round_num, None)
+            self.loadTournament(tid)
+            self.notification.emit("Warning", f"{detail}. Not locked; please review and try again.")
+            return
+        self._round_versions[round_num] = detail
+
+        if finish:
+            self.loadTournament(tid) # Refresh
+            self.notification.emit("Success", f"Round {round_num} Locked. Tournament Completed! 🏆")
+        else:
             self.refreshPlayers() # Triggers FULL recalculation including this round
-            self.roundsChanged.emit() # Notify UI
-            
-            # Check if this was the last round
-            if round_num == self._current_tournament.total_rounds:
-                self.db.execute_non_query(
-                    "UPDATE tournaments SET status = 'FINISHED' WHERE id = ?",
-                    (self._current_tournament.id,)
-                )
-                self.loadTournament(self._current_tournament.id) # Refresh
-                self.notification.emit("Success", f"Round {round_num} Locked. Tournament Completed! 🏆")
-            else:
-                self.notification.emit("Success", f"Round {round_num} Locked & Standings Updated")
-            
-        except Exception as e:
-            self.notification.emit("Error", f"Failed to lock round: {e}")
+            self._load_rounds() # Notify UI
+            self.notification.emit("Success", f"Round {round_num} Locked & Standings Updated")
+
+        if self.settings_manager.get_bool('auto_backup', True):
+            self._start_backup(automatic=True)
 
     @pyqtSlot(int)
     def unlockRound(self, round_num):
         if not self._current_tournament: return
-        
-        try:
-            # Update status to IN_PROGRESS
-            self.db.execute_non_query(
-                "UPDATE rounds SET status = 'IN_PROGRESS', locked_at = NULL WHERE tournament_id = ? AND round_number = ?",
-                (self._current_tournament.id, round_num)
-            )
-            
+        tid = self._current_tournament.id
+
+        def unlocked(outcome):
+            status, detail = outcome
+            if status == 'CONFLICT':
+                self._round_versions.pop(round_num, None)
+                self.loadTournament(tid)
+                self.notification.emit("Warning", f"{detail}. Not unlocked; please review and try again.")
+                return
+            self._round_versions[round_num] = detail
             self.refreshPlayers() # Triggers FULL recalculation (Excluding this round now!)
-            self.roundsChanged.emit() # Notify UI
+            self._load_rounds() # Notify UI
             self.notification.emit("Warning", f"Round {round_num} Unlocked. Values temporarily excluded from standings.")
-            
-        except Exception as e:
-            self.notification.emit("Error", f"Failed to unlock round: {e}") 
-    
+
+        # Update status to IN_PROGRESS
+        self._write(self._write_round_status, tid, round_num, 'IN_PROGRESS', None,
+                    self._round_versions.get(round_num),
+                    then=unlocked, error="Failed to unlock round")
+
     # --- Helpers ---
+    def _deliver(self, future, on_result, error="Database error", on_error=None):
+        """Call on_result(value) on the GUI thread once `future` (from async_db) resolves."""
+        future.add_done_callback(lambda f: self._asyncDone.emit(f, (on_result, error, on_error)))
+
+    def _write(self, fn, *args, then=None, error="Database error"):
+        """Run fn(*args) on the DB writer thread, after the open tournament's earlier work; then(value) on the GUI thread."""
+        tid = self._current_tournament.id if self._current_tournament else None
+        self._deliver(self.async_db.write(fn, *args, key=tid), then or (lambda _: None), error)
+
+    def _on_async_done(self, future, handler):
+        on_result, error, on_error = handler
+        try:
+            value = future.result()
+        except Exception as e:
+            self.notification.emit("Error", f"{error}: {e}")
+            if on_error:
+                on_error()
+            return
+        on_result(value)
+
+    def _load_rounds(self):
+        """Reload round status and pairing mode in the background; roundsChanged fires when done."""
+        if not self._current_tournament: return
+        tid = self._current_tournament.id
+        self._deliver(
+            self.async_db.query("SELECT round_number, status, pairing_mode FROM rounds WHERE tournament_id = ?",
+                                (tid,), key=tid),
+            lambda rows: self._apply_rounds(tid, rows), "Failed to load rounds"
+        )
+
+    def _apply_rounds(self, tid, rows):
+        if not self._current_tournament or self._current_tournament.id != tid: return
+        self._rounds = {row[0]: (row[1], row[2]) for row in rows}
+        self.roundsChanged.emit()
+
     def refreshPlayers(self):
+        """Reload players and standings in the background; playersChanged fires when done."""
         if not self._current_tournament: return
-        
-        # 1. Fetch raw players (No ordering by points yet)
+        tid = self._current_tournament.id
+        self._deliver(
+            self.async_db.read(self._fetch_players, tid, key=tid),
+            lambda fetched: self._apply_players(tid, fetched), "Failed to load players"
+        )
+
+    def _fetch_players(self, tid):
+        """
+        Players of a tournament with points and tie-breaks, in standings order,
+        as (data version, players). Thread-safe.
+        """
         # 1. Fetch raw players (No ordering by points yet)
-        # Note: Columns are id, tournament_id, name, rating, fide_id, club, status, withdraw_round
-        # Check current schema order vs select *
-        data = self.db.execute_query("SELECT id, tournament_id, name, rating, fide_id, club, status, withdraw_round FROM players WHERE tournament_id = ?", (self._current_tournament.id,))
+        data = self.db.execute_query("SELECT id, tournament_id, name, rating, fide_id, club, status, withdraw_round, registry_id FROM players WHERE tournament_id = ?", (tid,))
         
-        self._players = []
-        player_map = {}
+        # 2. Points and tie-breaks from the shared scoring cache (recomputed only after changes),
+        # read second so its version covers every player above
+        standings = self.scoring.standings(tid)
+        version = standings.version
         
+        players = []
         for row in data:
+            i = standings.row(row[0])
+            if i is None:
+                # Changed by another writer between the two reads: show zeros, reload on the next poll
+                version = None
+                points = buchholz = sonneborn_berger = 0.0
+            else:
+                points = standings.players.points[i]
+                buchholz = standings.buchholz[i]
+                sonneborn_berger = standings.sonneborn_berger[i]
             p = Player(
                 id=row[0], tournament_id=row[1], name=row[2], rating=row[3],
                 fide_id=row[4], club=row[5], 
-                status=row[6], withdraw_round=row[7]
+                status=row[6], withdraw_round=row[7], registry_id=row[8],
+                points=points, buchholz=buchholz,
+                sonneborn_berger=sonneborn_berger, tiebreak_score=buchholz
             )
-            # Transient fields initialized to 0.0 in __post_init__ or default
-            # (Which they are in the updated model)
-            
-            self._players.append(p)
-            player_map[p.id] = p
-            
-        # 2. Recalculate Points from Scratch (In-Memory)
-        self._recalculatepoints(player_map)
+            players.append(p)
         
         # 3. Sort players (Points Descending, then Name Ascending)
-        self._players.sort(key=lambda x: (-x.points, x.name))
+        players.sort(key=lambda x: (-x.points, x.name))
+        return version, players
+
+    def _apply_players(self, tid, fetched):
+        # Drop results for a tournament that is no longer open
+        if not self._current_tournament or self._current_tournament.id != tid: return
+        old_players = self._players
+        self._standings_version, self._players = fetched
+        if self._duplicate_index_tid == tid and all(p.tournament_id == tid for p in old_players):
+            self._sync_duplicate_index(old_players, self._players)
+        else:
+            self._duplicate_index = None  # Another tournament's players: rebuilt on next use
         
         # 4. Update Standings & Signals
         self._standings = self._players
         self.playersChanged.emit()
         self.standingsChanged.emit()
 
-    def _recalculatepoints(self, player_map):
-        if not self._current_tournament: return
+    def _configure_materialized_standings(self):
+        """Create or drop the trigger-maintained standings table to match the setting."""
+        if self.remote: return  # Configured on the server's database
+        wanted = self.settings_manager.get_bool('materialized_standings', False)
+        # On the writer thread: enabling fills the table for every tournament
+        self._deliver(self.async_db.write(self._set_materialized_standings, wanted),
+                      lambda _: None, "Failed to update standings table")
+
+    def _set_materialized_standings(self, wanted):
+        if wanted != self.materialized_standings.is_enabled():
+            if wanted:
+                self.materialized_standings.enable()
+            else:
+                self.materialized_standings.disable()
 
-        # Fetch ALL pairings for this tournament, but JOIN rounds to check status
+    @pyqtSlot()
+    def checkStandings(self):
+        """Verify (and repair) the materialized standings of the open tournament in the background."""
+        if not self._current_tournament:
+            return
+
+        def checked(mismatches):
+            if mismatches is None:
+                return  # Standings table not enabled
+            if mismatches:
+                self.notification.emit("Info", f"Standings table repaired ({mismatches} values differed)")
+            else:
+                self.notification.emit("Success", "Standings table is consistent")
+
+        self._write(self._check_standings, self._current_tournament.id,
+                    then=checked, error="Standings check failed")
+
+    def _check_standings(self, tid):
+        """Number of mismatched values (repaired), or None when the table isn't enabled. Writer thread."""
+        if not self.materialized_standings.is_enabled():
+            return None
+        return len(self.materialized_standings.check(tid, repair=True))
+
+    def _configure_change_polling(self):
+        """(Re)start polling for changes made by other instances."""
+        self._change_timer.stop()
+        seconds = self.settings_manager.get_int('change_poll_interval', 2)
+        if seconds > 0:
+            self._change_timer.start(seconds * 1000)
+
+    def _configure_results_feed(self):
+        """(Re)start watching the results feed folder, if one is set."""
+        self._feed_timer.stop()
+        folder = self.settings_manager.value('results_feed_folder').strip()
+        if not folder:
+            self.results_feed = None
+            return
+        from backend.ingest import ResultFeed
+        self.results_feed = ResultFeed(self.db, folder)
+        self._feed_timer.start(self.settings_manager.value('results_feed_interval') * 1000)
+
+    def _poll_results_feed(self):
+        """Apply dropped result files to the open tournament, on the DB writer thread."""
+        if self._feed_busy or self.results_feed is None or not self._current_tournament:
+            return
+        self._feed_busy = True
         tid = self._current_tournament.id
-        all_pairings = self.db.execute_query(
-            "SELECT p.white_player_id, p.black_player_id, p.result FROM pairings p JOIN rounds r ON p.round_id = r.id WHERE r.tournament_id = ? AND r.status = 'LOCKED'",
-            (tid,)
+        self._deliver(
+            self.async_db.write(self._read_results_feed, self.results_feed, tid, key=tid),
+            lambda report: self._on_results_feed(tid, report)
         )
-        
-        # print(f"DEBUG: Recalculating points for {len(all_pairings)} locked games")
-        
-        for w_id, b_id, res in all_pairings:
-            # Skip if result is not set
-            if res == '*': continue
-            
-            # Logic: Win=1, Draw=0.5, Loss=0, Bye=1
-            w_points = 0.0
-            b_points = 0.0
-            
-            if res == '1-0':
-                w_points = 1.0
-            elif res == '0-1':
-                b_points = 1.0
-            elif res == '0.5-0.5':
-                w_points = 0.5
-                b_points = 0.5
-            elif res == 'BYE':
-                w_points = 1.0
-                b_points = 1.0 
-            
-            # Apply to map
-            if w_id and w_id in player_map:
-                player_map[w_id].points += w_points
-            
-            if b_id and b_id in player_map:
-                player_map[b_id].points += b_points
+
+    @staticmethod
+    def _read_results_feed(feed, tid):
+        # Logged rather than shown: the feed is polled every few seconds
+        try:
+            return feed.poll(tid)
+        except Exception as e:
+            logger.warning("Results feed %s failed: %s", feed.folder, e)
+            return None
+
+    def _on_results_feed(self, tid, report):
+        self._feed_busy = False
+        if report is None or not self._current_tournament or self._current_tournament.id != tid:
+            return
+        if report.changed:
+            self.updateStandings()
+            if self._viewing_round > 0:
+                self.loadPairings(self._viewing_round)
+            self.notification.emit("Success", f"{report.applied} results received from the boards")
+        if report.rejected:
+            self.notification.emit(
+                "Warning", f"{len(report.rejected)} board results could not be placed; see the feed's rejected folder"
+            )
+
+    def _poll_changes(self):
+        """Refresh the open tournament if another instance (or a background write) changed it."""
+        if self._changes_busy:
+            return
+        self._changes_busy = True
+        tid = self._current_tournament.id if self._current_tournament else None
+        self._deliver(
+            self.async_db.read(self._read_changes, tid, key=tid),
+            lambda state: self._on_changes(tid, state)
+        )
+
+    def _read_changes(self, tid):
+        """((current_round, status), score version) of the open tournament if it changed, else None."""
+        try:
+            changed = self.change_watcher.poll()
+            if tid is None or tid not in changed:
+                return None
+            row = self.db.execute_query("SELECT current_round, status FROM tournaments WHERE id = ?", (tid,))
+            if not row:
+                return None
+            return tuple(row[0]), self.scoring.version(tid)
+        except Exception:
+            return None  # Database briefly unavailable (e.g. mid-restore); try next tick
+
+    def _on_changes(self, tid, state):
+        self._changes_busy = False
+        if state is None or not self._current_tournament or self._current_tournament.id != tid:
+            return
+        row, version = state
+        if row != (self._current_tournament.current_round, self._current_tournament.status):
+            # Another terminal started a round or finished the event
+            self.loadTournament(tid)
+            return
+        if version == self._standings_version:
+            return  # Our own write, already shown
+        self.refreshPlayers()
+        if self._viewing_round > 0:
+            self.loadPairings(self._viewing_round)
+        self._load_rounds()
 
     @pyqtSlot()
     def updateStandings(self):
@@ -524,15 +1341,27 @@ class BackendBridge(QObject):
         self.refreshPlayers()
 
     def loadPairings(self, round_num):
+        """Reload a round's pairings in the background; pairingsChanged fires when done."""
         if not self._current_tournament: return
+        tid = self._current_tournament.id
+        self._deliver(
+            self.async_db.read(self._fetch_pairings, tid, round_num, key=tid),
+            lambda fetched: self._apply_pairings(tid, round_num, fetched), "Failed to load pairings"
+        )
+
+    def _fetch_pairings(self, tid, round_num):
+        """
+        (round version, pairings with player names) of one round, or None if
+        the round doesn't exist. Thread-safe.
+        """
         # Get round ID
-        rdata = self.db.execute_query("SELECT id FROM rounds WHERE tournament_id = ? AND round_number = ?", (self._current_tournament.id, round_num))
-        if not rdata: return
-        rid = rdata[0][0]
+        rdata = self.db.execute_query("SELECT id, version FROM rounds WHERE tournament_id = ? AND round_number = ?", (tid, round_num))
+        if not rdata: return None
+        rid, round_version = rdata[0]
         
         pdata = self.db.execute_query(
             """
-            SELECT p.id, p.white_player_id, wp.name, p.black_player_id, bp.name, p.result
+            SELECT p.id, p.white_player_id, wp.name, p.black_player_id, bp.name, p.result, p.version
             FROM pairings p
             LEFT JOIN players wp ON p.white_player_id = wp.id
             LEFT JOIN players bp ON p.black_player_id = bp.id
@@ -540,175 +1369,205 @@ class BackendBridge(QObject):
             """, (rid,)
         )
         
-        self._pairings = []
+        pairings = []
         for row in pdata:
             # Manually constructing model with names
             p = Pairing(
-                id=row[0], round_id=rid, white_player_id=row[1], black_player_id=row[3], result=row[5]
+                id=row[0], round_id=rid, white_player_id=row[1], black_player_id=row[3], result=row[5],
+                version=row[6]
             )
             p.white_player_name = row[2] if row[2] else "BYE"
             p.black_player_name = row[4] if row[4] else "BYE"
-            self._pairings.append(p)
+            pairings.append(p)
+        return round_version, pairings
+
+    def _apply_pairings(self, tid, round_num, fetched):
+        if fetched is None: return
+        if not self._current_tournament or self._current_tournament.id != tid: return
+        self._round_versions[round_num], self._pairings = fetched
         self.pairingsChanged.emit()
 
     # Replaced updateStandings with the one above, so this block effectively removes the old one.
 
-    @pyqtProperty(list, notify=tournamentChanged)
-    def recentTournaments(self):
-        data = self.db.execute_query("SELECT id, name, type, status, created_at, total_rounds, current_round, venue FROM tournaments ORDER BY created_at DESC")
-        result = []
-        for row in data:
-            result.append({
-                "id": row[0],
-                "name": row[1],
-                "type": row[2],
-                "status": row[3],
-                "date": row[4],
-                "total_rounds": row[5],
-                "current_round": row[6],
-                "venue": row[7]
-            })
-        return result
+    @pyqtProperty(QObject, constant=True)
+    def tournamentList(self):
+        """Paged dashboard list (live and archived tournaments), see TournamentListModel."""
+        return self._tournament_list
 
     @pyqtSlot(int)
     def deleteTournament(self, tid):
-        try:
-            self.db.execute_non_query("DELETE FROM tournaments WHERE id = ?", (tid,))
+        def deleted(outcome):
+            if outcome == 'archived':
+                self.notification.emit("Error", "This tournament is archived. Restore it before deleting it.")
+                return
+            if outcome == 'missing':
+                self.notification.emit("Error", "Tournament not found")
+                return
             self.notification.emit("Success", "Tournament deleted")
             self.tournamentChanged.emit() # Refresh list
-        except Exception as e:
-            self.notification.emit("Error", str(e))
-            
+
+        self._deliver(self.async_db.write(self._delete_tournament, tid, key=tid),
+                      deleted, "Failed to delete tournament")
+
+    def _delete_tournament(self, tid):
+        """'deleted', or 'archived'/'missing' when no live tournament has this id. Thread-safe."""
+        with self.db.get_connection() as conn:
+            if conn.execute("DELETE FROM tournaments WHERE id = ?", (tid,)).rowcount:
+                return 'deleted'
+        return 'archived' if self.archive.contains(tid) else 'missing'
+
     @pyqtSlot()
     def getRecentTournaments(self):
         # Trigger an update if needed, though property binding handles it mostly
         self.tournamentChanged.emit()
 
+    # --- Archive & Maintenance ---
+    @pyqtSlot()
+    def archiveFinishedTournaments(self):
+        """Move every finished tournament (except the open one) to the archive, then compact."""
+        if self.remote:
+            self.notification.emit("Error", "Archive tournaments on the server machine")
+            return
+
+        def archived(count):
+            self.notification.emit("Success", f"Archived {count} finished tournament(s)")
+            self.tournamentChanged.emit()
+
+        keep = [self._current_tournament.id] if self._current_tournament else []
+        # On the writer thread: the first run's VACUUM and ANALYZE can take a while
+        self._deliver(self.async_db.write(self._archive_finished, keep), archived, "Archiving failed")
+
+    def _archive_finished(self, keep):
+        archived = self.archive.archive_finished(exclude=keep)
+        if archived:
+            from backend.maintenance import run_maintenance
+            run_maintenance(self.db)
+        return len(archived)
+
+    @pyqtSlot(int)
+    def restoreArchivedTournament(self, tid):
+        """Move an archived tournament back into the working database and open it."""
+        if self.remote:
+            self.notification.emit("Error", "Restore archived tournaments on the server machine")
+            return
+
+        def restored(_):
+            self.notification.emit("Success", "Tournament restored from the archive")
+            self.loadTournament(tid)
+
+        self._deliver(self.async_db.write(self.archive.restore, tid, key=tid),
+                      restored, "Failed to restore tournament")
+
+    @pyqtSlot()
+    def runMaintenance(self):
+        """ANALYZE, incremental vacuum and WAL checkpoint on the working database (on the writer thread)."""
+        if self.remote:
+            self.notification.emit("Error", "Run maintenance on the server machine")
+            return
+        from backend.maintenance import run_maintenance
+
+        def done(stats):
+            saved = stats['size_before'] - stats['size_after']
+            self.notification.emit("Success", f"Database maintenance done ({max(saved, 0) // 1024} KB freed)")
+
+        self._deliver(self.async_db.write(run_maintenance, self.db), done, "Maintenance failed")
+
+    @pyqtSlot(int)
+    def printArchivedStandings(self, tid):
+        """Standings PDF of an archived tournament."""
+        if self.remote:
+            self.notification.emit("Error", "Print archived reports on the server machine")
+            return
+
+        def generate(filepath):
+            from backend.reports import ReportGenerator
+            with self.archive.open(tid) as adb:
+                ReportGenerator(db=adb).generate_standings_report(tid, filepath)
+
+        self._print_report(f"Tournament_{tid}_Standings.pdf", generate,
+                           "Standings report generated", "Standings report failed", open_file=False)
+
     @pyqtSlot(int)
     def withdrawPlayer(self, player_id):
         if not self._current_tournament: return
-        
-        try:
-            current_round = self._current_tournament.current_round
-            self.db.withdraw_player(player_id, current_round)
+
+        def withdrawn(_):
             self.refreshPlayers()
             self.notification.emit("Success", "Player withdrawn from tournament")
-        except Exception as e:
-            self.notification.emit("Error", f"Failed to withdraw player: {e}")
+
+        self._write(self.db.withdraw_player, player_id, self._current_tournament.current_round,
+                    then=withdrawn, error="Failed to withdraw player")
 
     @pyqtSlot(int)
     def printRoundReport(self, round_num):
         if not self._current_tournament: return
-        try:
-            from backend.reports import ReportGenerator
-            import os
-            import subprocess
-            import platform
+        tid = self._current_tournament.id
 
+        def generate(filepath):
+            from backend.reports import ReportGenerator
             # Get Round ID
-            rdata = self.db.execute_query("SELECT id FROM rounds WHERE tournament_id = ? AND round_number = ?", 
-                                          (self._current_tournament.id, round_num))
+            rdata = self.db.execute_query("SELECT id FROM rounds WHERE tournament_id = ? AND round_number = ?",
+                                          (tid, round_num))
             if not rdata:
-                self.notification.emit("Error", "Round not found")
-                return
-            rid = rdata[0][0]
-
-            # Generate Report
-            # Ensure reports directory exists
-            reports_dir = os.path.join(get_app_path(), 'reports')
-            if not os.path.exists(reports_dir):
-                os.makedirs(reports_dir)
-                
-            filename = f"Round_{round_num}_Results.pdf"
-            filepath = os.path.join(reports_dir, filename)
-            
-            generator = ReportGenerator(self.db.db_path)
-            generator.generate_round_report(rid, filepath)
-            
-            self.notification.emit("Success", f"Report generated: {filepath}")
-            
-            # Open the file
-            if platform.system() == 'Windows':
-                os.startfile(filepath)
-            elif platform.system() == 'Darwin':
-                subprocess.call(('open', filepath))
-            else:
-                subprocess.call(('xdg-open', filepath))
-                
-        except Exception as e:
-            self.notification.emit("Error", f"Report generation failed: {e}")
-            import traceback
-            traceback.print_exc()
+                raise ValueError("Round not found")
+            ReportGenerator(scoring=self.scoring, db=self.db).generate_round_report(rdata[0][0], filepath)
+
+        self._print_report(f"Round_{round_num}_Results.pdf", generate, "Report generated", "Report generation failed")
+
+    def _print_report(self, filename, generate, success, error, open_file=True):
+        """Run generate(filepath) on the reader pool, then announce (and open) the PDF on the GUI thread."""
+        # Ensure reports directory exists
+        reports_dir = os.path.join(get_app_path(), 'reports')
+        filepath = os.path.join(reports_dir, filename)
+
+        def build():
+            os.makedirs(reports_dir, exist_ok=True)
+            generate(filepath)
+            return filepath
+
+        def built(path):
+            self.notification.emit("Success", f"{success}: {path}")
+            if open_file:
+                self._open_file(path)
+
+        tid = self._current_tournament.id if self._current_tournament else None
+        self._deliver(self.async_db.read(build, key=tid), built, error)
+
+    @staticmethod
+    def _open_file(filepath):
+        import subprocess
+        import platform
+
+        if platform.system() == 'Windows':
+            os.startfile(filepath)
+        elif platform.system() == 'Darwin':
+            subprocess.call(('open', filepath))
+        else:
+            subprocess.call(('xdg-open', filepath))
 
     @pyqtSlot()
     def printStandingsReport(self):
         if not self._current_tournament: return
-        try:
+        tid = self._current_tournament.id
+
+        def generate(filepath):
             from backend.reports import ReportGenerator
-            import os
-            import subprocess
-            import platform
-
-            # Ensure reports directory exists
-            reports_dir = os.path.join(get_app_path(), 'reports')
-            if not os.path.exists(reports_dir):
-                os.makedirs(reports_dir)
-                
-            filename = f"Tournament_{self._current_tournament.id}_Standings.pdf"
-            filepath = os.path.join(reports_dir, filename)
-            
-            generator = ReportGenerator(self.db.db_path)
-            generator.generate_standings_report(self._current_tournament.id, filepath)
-            
-            self.notification.emit("Success", f"Standings report generated: {filepath}")
-            
-            # Open the file
-            if platform.system() == 'Windows':
-                os.startfile(filepath)
-            elif platform.system() == 'Darwin':
-                subprocess.call(('open', filepath))
-            else:
-                subprocess.call(('xdg-open', filepath))
-                
-        except Exception as e:
-            self.notification.emit("Error", f"Standings report failed: {e}")
-            import traceback
-            traceback.print_exc()
+            ReportGenerator(scoring=self.scoring, db=self.db).generate_standings_report(tid, filepath)
+
+        self._print_report(f"Tournament_{tid}_Standings.pdf", generate,
+                           "Standings report generated", "Standings report failed")
 
     @pyqtSlot()
     def printPlayerList(self):
         if not self._current_tournament: return
-        try:
+        tid = self._current_tournament.id
+
+        def generate(filepath):
             from backend.reports import ReportGenerator
-            import os
-            import subprocess
-            import platform
-
-            # Ensure reports directory exists
-            reports_dir = os.path.join(get_app_path(), 'reports')
-            if not os.path.exists(reports_dir):
-                os.makedirs(reports_dir)
-                
-            filename = f"Tournament_{self._current_tournament.id}_PlayerList.pdf"
-            filepath = os.path.join(reports_dir, filename)
-            
-            generator = ReportGenerator(self.db.db_path)
-            generator.generate_player_list(self._current_tournament.id, filepath)
-            
-            self.notification.emit("Success", f"Player list generated: {filepath}")
-            
-            # Open the file
-            if platform.system() == 'Windows':
-                os.startfile(filepath)
-            elif platform.system() == 'Darwin':
-                subprocess.call(('open', filepath))
-            else:
-                subprocess.call(('xdg-open', filepath))
-                
-        except Exception as e:
-            self.notification.emit("Error", f"Player list report failed: {e}")
-            import traceback
-            traceback.print_exc()
+            ReportGenerator(scoring=self.scoring, db=self.db).generate_player_list(tid, filepath)
+
+        self._print_report(f"Tournament_{tid}_PlayerList.pdf", generate,
+                           "Player list generated", "Player list report failed")
 
     # ============================================================
     # Features: Player Editing, Undo, Settings, Backup, etc.
@@ -735,24 +1594,13 @@ class BackendBridge(QObject):
         """Update player name and/or club. Does not affect results."""
         if not self._current_tournament:
             return
-        
-        try:
-            # Get current player data for undo
-            data = self.db.execute_query(
-                "SELECT name, club FROM players WHERE id = ?", (player_id,)
-            )
-            if not data:
+
+        def updated(old):
+            if old is None:
                 self.notification.emit("Error", "Player not found")
                 return
-            
-            old_name, old_club = data[0]
-            
-            # Update the database
-            self.db.execute_non_query(
-                "UPDATE players SET name = ?, club = ? WHERE id = ?",
-                (name, club, player_id)
-            )
-            
+            old_name, old_club = old
+
             # Push to undo stack
             self.undo_manager.push(UndoAction(
                 action_type='UPDATE',
@@ -762,15 +1610,23 @@ class BackendBridge(QObject):
                 new_data={'name': name, 'club': club},
                 description=f"Edit player '{old_name}'"
             ))
-            
+
             # Refresh and notify
             self.refreshPlayers()
             self.playerUpdated.emit()
             self._emit_undo_status()
             self.notification.emit("Success", f"Player updated")
-            
-        except Exception as e:
-            self.notification.emit("Error", f"Failed to update player: {e}")
+
+        self._write(self._update_player, player_id, name, club, then=updated, error="Failed to update player")
+
+    def _update_player(self, player_id, name, club):
+        """Update a player; returns the old (name, club) for undo, or None if there is no such player."""
+        with self.db.get_connection() as conn:
+            data = conn.execute("SELECT name, club FROM players WHERE id = ?", (player_id,)).fetchall()
+            if not data:
+                return None
+            conn.execute("UPDATE players SET name = ?, club = ? WHERE id = ?", (name, club, player_id))
+        return data[0]
 
     # --- Edit Tournament ---
     @pyqtSlot(str, str, int)
@@ -778,27 +1634,21 @@ class BackendBridge(QObject):
         """Update details. Rounds can only be changed if not started."""
         if not self._current_tournament:
             return
-        
-        try:
-            tid = self._current_tournament.id
-            current_round = self._current_tournament.current_round
-            
-            # Get current data for undo
-            old_name = self._current_tournament.name
-            old_venue = self._current_tournament.venue or ""
-            old_rounds = self._current_tournament.total_rounds
-            
-            # Validate: rounds can only be changed if tournament hasn't started
-            if total_rounds != old_rounds and current_round > 0:
-                self.notification.emit("Error", "Cannot change round count after tournament has started")
-                return
-            
-            # Update the database
-            self.db.execute_non_query(
-                "UPDATE tournaments SET name = ?, venue = ?, total_rounds = ? WHERE id = ?",
-                (name, venue, total_rounds, tid)
-            )
-            
+
+        tid = self._current_tournament.id
+        current_round = self._current_tournament.current_round
+
+        # Get current data for undo
+        old_name = self._current_tournament.name
+        old_venue = self._current_tournament.venue or ""
+        old_rounds = self._current_tournament.total_rounds
+
+        # Validate: rounds can only be changed if tournament hasn't started
+        if total_rounds != old_rounds and current_round > 0:
+            self.notification.emit("Error", "Cannot change round count after tournament has started")
+            return
+
+        def updated(_):
             # Push to undo stack
             self.undo_manager.push(UndoAction(
                 action_type='UPDATE',
@@ -808,57 +1658,83 @@ class BackendBridge(QObject):
                 new_data={'name': name, 'venue': venue, 'total_rounds': total_rounds},
                 description=f"Edit tournament '{old_name}'"
             ))
-            
+
             # Reload tournament
             self.loadTournament(tid)
             self._emit_undo_status()
             self.notification.emit("Success", "Tournament updated")
-            
-        except Exception as e:
-            self.notification.emit("Error", f"Failed to update tournament: {e}")
+
+        # Update the database
+        self._write(self.db.execute_non_query,
+                    "UPDATE tournaments SET name = ?, venue = ?, total_rounds = ? WHERE id = ?",
+                    (name, venue, total_rounds, tid),
+                    then=updated, error="Failed to update tournament")
 
     # --- Clone Tournament ---
     @pyqtSlot(int, str, str, int)
     def cloneTournament(self, source_tid, new_name, venue, rounds):
         """Creates a new tournament based on an existing one, copying players."""
-        try:
-            # 1. Get source tournament details (to verify and maybe copy type if needed, though usually type is passed or same)
-            # Actually, we should probably get the type from the source if not provided, or just assume same type.
-            # Let's look up the source type.
-            src_data = self.db.execute_query("SELECT type FROM tournaments WHERE id = ?", (source_tid,))
-            if not src_data:
+        def cloned(outcome):
+            if outcome is None:
                 self.notification.emit("Error", "Source tournament not found")
                 return
-            t_type = src_data[0][0]
-
-            # 2. Create new tournament
-            query = "INSERT INTO tournaments (name, type, total_rounds, status, venue) VALUES (?, ?, ?, 'SETUP', ?)"
-            new_tid = self.db.execute_non_query(query, (new_name, t_type, rounds, venue))
-
-            # 3. Copy Players
-            # Get players from source
-            players = self.db.execute_query(
-                "SELECT name, rating, fide_id, club FROM players WHERE tournament_id = ?", 
-                (source_tid,)
-            )
-            
-            # Insert into new tournament
-            count = 0
-            for p in players:
-                # p: name, rating, fide_id, club
-                self.db.execute_non_query(
-                    "INSERT INTO players (tournament_id, name, rating, fide_id, club, status) VALUES (?, ?, ?, ?, ?, 'ACTIVE')",
-                    (new_tid, p[0], p[1], p[2], p[3])
-                )
-                count += 1
-            
+            new_tid, count = outcome
             self.notification.emit("Success", f"Cloned '{new_name}' with {count} players")
             self.loadTournament(new_tid)
-            
-        except Exception as e:
-            self.notification.emit("Error", f"Failed to clone tournament: {e}")
-            import traceback
-            traceback.print_exc()
+
+        self._deliver(self.async_db.write(self._clone_tournament, source_tid, new_name, venue, rounds, key=source_tid),
+                      cloned, "Failed to clone tournament")
+
+    def _clone_tournament(self, source_tid, new_name, venue, rounds):
+        """Copy a tournament's players into a new one on the DB writer thread; (new id, players) or None."""
+        # 1. Get source tournament type (the clone has the same type)
+        src_data = self.db.execute_query("SELECT type FROM tournaments WHERE id = ?", (source_tid,))
+        if not src_data:
+            if not self.remote and self.archive.contains(source_tid):
+                return self._clone_archived(source_tid, new_name, venue, rounds)
+            return None
+        t_type = src_data[0][0]
+
+        # 2. Create new tournament
+        query = "INSERT INTO tournaments (name, type, total_rounds, status, venue) VALUES (?, ?, ?, 'SETUP', ?)"
+        new_tid = self.db.execute_non_query(query, (new_name, t_type, rounds, venue))
+
+        # 3. Copy Players (linked to the same registry entries)
+        self.registry.link_players(source_tid)
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO players (tournament_id, name, rating, fide_id, club, status, registry_id)
+                SELECT ?, name, rating, fide_id, club, 'ACTIVE', registry_id
+                FROM players WHERE tournament_id = ?
+                """,
+                (new_tid, source_tid)
+            )
+            count = cursor.rowcount
+        return new_tid, count
+
+    def _clone_archived(self, source_tid, new_name, venue, rounds):
+        """Clone from an archived tournament: its copy is attached and players are copied across."""
+        with self.archive.open(source_tid) as adb:
+            t_type = adb.execute_query("SELECT type FROM tournaments WHERE id = ?", (source_tid,))[0][0]
+            with self.db.get_connection() as conn:
+                new_tid = conn.execute(
+                    "INSERT INTO tournaments (name, type, total_rounds, status, venue) VALUES (?, ?, ?, 'SETUP', ?)",
+                    (new_name, t_type, rounds, venue)
+                ).lastrowid
+                conn.commit()  # ATTACH can't run inside a transaction
+                conn.execute("ATTACH DATABASE ? AS src", (adb.db_path,))
+                count = conn.execute(
+                    """
+                    INSERT INTO players (tournament_id, name, rating, fide_id, club, status, registry_id)
+                    SELECT ?, name, rating, fide_id, club, 'ACTIVE', registry_id
+                    FROM src.players WHERE tournament_id = ?
+                    """,
+                    (new_tid, source_tid)
+                ).rowcount
+                conn.commit()
+                conn.execute("DETACH DATABASE src")
+        return new_tid, count
 
     # --- Undo ---
     @pyqtSlot()
@@ -867,58 +1743,65 @@ class BackendBridge(QObject):
         if not self.undo_manager.can_undo():
             self.notification.emit("Info", "Nothing to undo")
             return
-        
+
         action = self.undo_manager.pop()
         if not action:
             return
-        
-        try:
+
+        def undone(_):
             if action.table_name == 'players':
-                if action.action_type == 'UPDATE':
-                    # Restore old values
-                    self.db.execute_non_query(
-                        "UPDATE players SET name = ?, club = ? WHERE id = ?",
-                        (action.old_data['name'], action.old_data.get('club', ''), action.record_id)
-                    )
-                elif action.action_type == 'ADD':
-                    # Delete the added player
-                    self.db.execute_non_query(
-                        "DELETE FROM players WHERE id = ?", (action.record_id,)
-                    )
-                elif action.action_type == 'DELETE':
-                    # Re-insert the deleted player
-                    self.db.execute_non_query(
-                        "INSERT INTO players (id, tournament_id, name, rating, fide_id, club, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                        (action.record_id, action.old_data['tournament_id'], action.old_data['name'],
-                         action.old_data.get('rating', 0), action.old_data.get('fide_id', ''),
-                         action.old_data.get('club', ''), action.old_data.get('status', 'ACTIVE'))
-                    )
                 self.refreshPlayers()
-                
             elif action.table_name == 'tournaments':
-                if action.action_type == 'UPDATE':
-                    self.db.execute_non_query(
-                        "UPDATE tournaments SET name = ?, venue = ?, total_rounds = ? WHERE id = ?",
-                        (action.old_data['name'], action.old_data.get('venue', ''),
-                         action.old_data['total_rounds'], action.record_id)
-                    )
-                    self.loadTournament(action.record_id)
-                    
+                self.loadTournament(action.record_id)
             elif action.table_name == 'pairings':
-                if action.action_type == 'UPDATE':
-                    self.db.execute_non_query(
-                        "UPDATE pairings SET result = ? WHERE id = ?",
-                        (action.old_data['result'], action.record_id)
-                    )
-                    self.updateStandings()
-                    if self._current_tournament:
-                        self.loadPairings(self.viewingRoundNumber)
-            
+                self.updateStandings()
+                if self._current_tournament:
+                    self.loadPairings(self.viewingRoundNumber)
             self._emit_undo_status()
             self.notification.emit("Success", f"Undone: {action.description}")
-            
-        except Exception as e:
-            self.notification.emit("Error", f"Undo failed: {e}")
+
+        # Queued behind the writes being undone
+        self._write(self._undo_action, action, then=undone, error="Undo failed")
+
+    def _undo_action(self, action):
+        """Write an undo action's old values back. Runs on the DB writer thread."""
+        if action.table_name == 'players':
+            if action.action_type == 'UPDATE':
+                # Restore old values
+                self.db.execute_non_query(
+                    "UPDATE players SET name = ?, club = ? WHERE id = ?",
+                    (action.old_data['name'], action.old_data.get('club', ''), action.record_id)
+                )
+            elif action.action_type == 'ADD':
+                # Delete the added player
+                self.db.execute_non_query(
+                    "DELETE FROM players WHERE id = ?", (action.record_id,)
+                )
+            elif action.action_type == 'DELETE':
+                # Re-insert the deleted player
+                self.db.execute_non_query(
+                    "INSERT INTO players (id, tournament_id, name, rating, fide_id, club, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (action.record_id, action.old_data['tournament_id'], action.old_data['name'],
+                     action.old_data.get('rating', 0), action.old_data.get('fide_id', ''),
+                     action.old_data.get('club', ''), action.old_data.get('status', 'ACTIVE'))
+                )
+
+        elif action.table_name == 'tournaments':
+            if action.action_type == 'UPDATE':
+                self.db.execute_non_query(
+                    "UPDATE tournaments SET name = ?, venue = ?, total_rounds = ? WHERE id = ?",
+                    (action.old_data['name'], action.old_data.get('venue', ''),
+                     action.old_data['total_rounds'], action.record_id)
+                )
+
+        elif action.table_name == 'pairings':
+            if action.action_type == 'UPDATE' and 'results' in action.old_data:
+                restore_results(self.db, action.old_data['results'])  # setResults batch
+            elif action.action_type == 'UPDATE':
+                self.db.execute_non_query(
+                    "UPDATE pairings SET result = ? WHERE id = ?",
+                    (action.old_data['result'], action.record_id)
+                )
 
     # --- Settings ---
     @pyqtProperty(QVariant, notify=settingsChanged)
@@ -930,13 +1813,8 @@ class BackendBridge(QObject):
     def updateSetting(self, key, value):
         """Update a single setting."""
         try:
+            # Subscribers apply the change and emit settingsChanged
             self.settings_manager.set(key, value)
-            
-            # Apply certain settings immediately
-            if key == 'undo_stack_size':
-                self.undo_manager.max_size = int(value)
-            
-            self.settingsChanged.emit()
             self.notification.emit("Success", "Setting updated")
         except Exception as e:
             self.notification.emit("Error", f"Failed to update setting: {e}")
@@ -946,8 +1824,6 @@ class BackendBridge(QObject):
         """Reset all settings to defaults."""
         try:
             self.settings_manager.reset_defaults()
-            self.undo_manager.max_size = 10
-            self.settingsChanged.emit()
             self.notification.emit("Success", "Settings reset to defaults")
         except Exception as e:
             self.notification.emit("Error", f"Failed to reset settings: {e}")
@@ -958,53 +1834,163 @@ class BackendBridge(QObject):
         return self.settings_manager.get(key, "")
 
     # --- Backup & Restore ---
+    def _backup_folder(self):
+        backup_folder = self.settings_manager.get('backup_folder', 'backups')
+        # Make backup folder absolute if relative
+        if not os.path.isabs(backup_folder):
+            backup_folder = os.path.join(os.path.dirname(self.db.db_path), backup_folder)
+        return backup_folder
+
+    def _configure_auto_backup(self):
+        """(Re)start the periodic backup timer from settings."""
+        self._auto_backup_timer.stop()
+        if self.remote: return  # Backups happen next to the database, on the server
+        minutes = self.settings_manager.get_int('auto_backup_interval', 30)
+        if self.settings_manager.get_bool('auto_backup', True) and minutes > 0:
+            self._auto_backup_timer.start(minutes * 60 * 1000)
+
+    def _start_backup(self, automatic=False):
+        """Run a backup on the worker thread; results arrive via _on_backup_finished."""
+        if self.remote:
+            self._backup_is_automatic = automatic
+            self._deliver(
+                self.async_db.read(self.db.rpc, 'create_backup'),
+                lambda result: self._on_backup_finished(result[0], result[1], ""), "Backup failed"
+            )
+            return
+        started = self.background_backup.start(
+            self.db.db_path,
+            self._backup_folder(),
+            mode=self.settings_manager.get('backup_mode', 'full'),
+            compression=self.settings_manager.get('backup_compression', 'lzma'),
+            keep_chains=self.settings_manager.get_int('backup_keep_chains', 5),
+            on_progress=self.backupProgress.emit,
+            on_finished=self._backupFinished.emit
+        )
+        if started:
+            self._backup_is_automatic = automatic
+            self.backupRunningChanged.emit()
+        elif not automatic:
+            self.notification.emit("Info", "A backup is already in progress")
+
+    def _on_backup_finished(self, backup_path, verified, error):
+        self.backupRunningChanged.emit()
+        if not backup_path:
+            self.notification.emit("Error", f"Backup failed: {error}")
+            return
+        self.backupCreated.emit(backup_path)
+        if not verified:
+            self.notification.emit("Error", f"Backup {os.path.basename(backup_path)} failed verification")
+        elif not self._backup_is_automatic:
+            self.notification.emit("Success", f"Backup created: {os.path.basename(backup_path)}")
+
+    @pyqtProperty(bool, notify=backupRunningChanged)
+    def backupRunning(self):
+        return self.background_backup.running
+
     @pyqtSlot()
     def createBackup(self):
-        """Create a manual backup of the database."""
+        """Create a manual backup of the database (runs in the background)."""
         try:
-            backup_folder = self.settings_manager.get('backup_folder', 'backups')
-            # Make backup folder absolute if relative
-            if not os.path.isabs(backup_folder):
-                backup_folder = os.path.join(os.path.dirname(self.db.db_path), backup_folder)
-            
-            backup_path = self.backup_manager.create_backup(self.db.db_path, backup_folder)
-            self.backupCreated.emit(backup_path)
-            self.notification.emit("Success", f"Backup created: {os.path.basename(backup_path)}")
+            self._start_backup(automatic=False)
         except Exception as e:
             self.notification.emit("Error", f"Backup failed: {e}")
 
     @pyqtSlot(str)
     def restoreBackup(self, backup_path):
-        """Restore from a backup file."""
+        """Restore from a backup file in place, keeping the open tournament loaded."""
+        if self.remote:
+            self.notification.emit("Error", "Restore backups on the server machine")
+            return
+        tid = self._current_tournament.id if self._current_tournament else None
+        viewing_round = self._viewing_round
+        # On the writer thread, so queued writes land first
+        self._deliver(
+            self.async_db.write(self._restore_backup, backup_path, tid, key=tid),
+            lambda outcome: self._on_backup_restored(tid, viewing_round, outcome), "Restore failed"
+        )
+
+    def _restore_backup(self, backup_path, tid):
+        """
+        Restore a backup on the DB writer thread. Returns None for an invalid
+        backup, else (helpers rebuilt on the restored file, whether `tid` is in it).
+        """
+        # Quick reject from the catalog; restore_backup checks a fresh staged copy itself
+        if not self.backup_manager.validate_backup(backup_path):
+            return None
+
+        # Don't let a running backup read the file mid-swap
+        self.background_backup.wait()
         try:
-            # Validate first
-            if not self.backup_manager.validate_backup(backup_path):
-                self.notification.emit("Error", "Invalid or corrupted backup file")
-                return
-            
             self.backup_manager.restore_backup(backup_path, self.db.db_path)
-            
-            # Reinitialize database connection
-            self.db = Database()
-            self._current_tournament = None
-            self._players = []
-            self._pairings = []
-            self._standings = []
-            
-            self.backupRestored.emit()
+        except ValueError:
+            return None
+
+        # Same file, new contents: bring an older schema up to date and
+        # make sure per-feature indexes exist
+        self.db.migrate_if_needed()
+        archive = TournamentArchive(self.db)
+        helpers = {
+            'registry': PlayerRegistry(self.db),
+            'archive': archive,
+            'games': GameStore(self.db),
+            'summaries': TournamentSummaries(self.db, archive),
+        }
+        exists = tid is not None and bool(self.db.execute_query("SELECT 1 FROM tournaments WHERE id = ?", (tid,)))
+        return helpers, exists
+
+    def _on_backup_restored(self, tid, viewing_round, outcome):
+        if outcome is None:
+            self.notification.emit("Error", "Invalid or corrupted backup file")
+            return
+        helpers, exists = outcome
+        self.registry = helpers['registry']
+        self.__dict__.pop('csv_importer', None)  # Recreated on next use
+        self.archive = helpers['archive']
+        self.games = helpers['games']
+        self.summaries = helpers['summaries']
+        self._tournament_list.summaries = self.summaries
+        self.scoring.invalidate()
+        self.change_watcher.reset()
+        self._round_versions = {}
+        self.undo_manager.clear()
+        self._emit_undo_status()
+
+        self._current_tournament = None
+        self._players = []
+        self._pairings = []
+        self._standings = []
+        self._rounds = {}
+        self._duplicate_index = None
+
+        if exists:
+            def loaded():
+                if self._current_tournament and 0 < viewing_round <= self._current_tournament.current_round:
+                    self.setViewRound(viewing_round)
+            self._load_tournament(tid, then=loaded)
+            message = "Backup restored successfully"
+        else:
+            self.playersChanged.emit()
+            self.pairingsChanged.emit()
+            self.standingsChanged.emit()
             self.tournamentChanged.emit()
-            self.notification.emit("Success", "Backup restored successfully. Please reload your tournament.")
-        except Exception as e:
-            self.notification.emit("Error", f"Restore failed: {e}")
+            message = "Backup restored successfully. The open tournament is not in this backup."
+
+        self.settings_manager.reload()
+        self._configure_materialized_standings()
+        self._configure_slow_capture()
+        self.backupRestored.emit()
+        self.notification.emit("Success", message)
 
     @pyqtProperty(list, notify=backupCreated)
     def backupList(self):
         """Get list of available backups."""
-        backup_folder = self.settings_manager.get('backup_folder', 'backups')
-        if not os.path.isabs(backup_folder):
-            backup_folder = os.path.join(os.path.dirname(self.db.db_path), backup_folder)
-        
-        backups = self.backup_manager.list_backups(backup_folder)
+        if self.remote:
+            try:
+                return self.db.rpc('list_backups')
+            except Exception:
+                return []
+        backups = self.backup_manager.list_backups(self._backup_folder())
         return [b.to_dict() for b in backups]
 
     # --- Import/Export Players (CSV) ---
@@ -1034,74 +2020,214 @@ class BackendBridge(QObject):
 
     @pyqtSlot(str, result=QVariant)
     def previewImportCSV(self, filepath):
-        """Preview players from CSV file before importing."""
+        """Preview the first players of a CSV file before importing."""
         try:
-            players = []
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    name = row.get('Name', row.get('name', '')).strip()
-                    if not name:
-                        continue
-                    players.append({
-                        'name': name,
-                        'club': row.get('Club', row.get('club', '')).strip(),
-                        'rating': int(row.get('Rating', row.get('rating', 0)) or 0)
-                    })
-            
-            # Check for duplicates with existing players
-            existing_names = {p.name.lower() for p in self._players}
-            for p in players:
-                p['duplicate'] = p['name'].lower() in existing_names
-            
-            return players
+            tid = self._current_tournament.id if self._current_tournament else None
+            index = self._get_duplicate_index() if self._current_tournament else None
+            return self.csv_importer.preview(filepath, tid, duplicate_index=index)
         except Exception as e:
             self.notification.emit("Error", f"Failed to read CSV: {e}")
             return []
 
     @pyqtSlot(str)
     def importPlayersCSV(self, filepath):
-        """Import players from CSV file."""
+        """Import players from CSV file (on the DB writer thread; importProgress reports progress)."""
         if not self._current_tournament:
             self.notification.emit("Error", "No tournament loaded")
             return
-        
+
         if self._current_tournament.current_round > 0:
             self.notification.emit("Error", "Cannot import players after tournament has started")
             return
-        
-        try:
-            imported_count = 0
-            skipped_count = 0
-            existing_names = {p.name.lower() for p in self._players}
-            
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    name = row.get('Name', row.get('name', '')).strip()
-                    if not name:
-                        continue
-                    
-                    # Skip duplicates
-                    if name.lower() in existing_names:
-                        skipped_count += 1
-                        continue
-                    
-                    club = row.get('Club', row.get('club', '')).strip()
-                    rating = int(row.get('Rating', row.get('rating', 0)) or 0)
-                    
-                    self.db.execute_non_query(
-                        "INSERT INTO players (tournament_id, name, rating, club) VALUES (?, ?, ?, ?)",
-                        (self._current_tournament.id, name, rating, club)
-                    )
-                    imported_count += 1
-                    existing_names.add(name.lower())
-            
-            self.refreshPlayers()
-            msg = f"Imported {imported_count} players"
-            if skipped_count > 0:
-                msg += f" ({skipped_count} duplicates skipped)"
+
+        tid = self._current_tournament.id
+
+        def imported(result):
+            if self._current_tournament and self._current_tournament.id == tid:
+                self.refreshPlayers()
+            msg = f"Imported {result.imported} players"
+            if result.duplicates > 0:
+                msg += f" ({result.duplicates} duplicates skipped)"
+            if result.invalid > 0:
+                msg += f" ({result.invalid} invalid rows skipped)"
             self.notification.emit("Success", msg)
-            
+
+        self._write(self._import_players, filepath, tid, then=imported, error="Import failed")
+
+    def _import_players(self, filepath, tid):
+        result = self.csv_importer.import_players(filepath, tid, progress=self.importProgress.emit)
+        self.registry.link_players(tid)
+        return result
+
+    # --- Game Scores (PGN) ---
+    @pyqtSlot(str)
+    def importPgn(self, filepath):
+        """Attach the games of a PGN file to their pairings (by round and board, or player names)."""
+        if not self._current_tournament:
+            self.notification.emit("Error", "No tournament loaded")
+            return
+        if self.remote:
+            self.notification.emit("Error", "Import games on the server machine")
+            return
+        tid = self._current_tournament.id
+        self._deliver(
+            self.async_db.write(self.games.import_pgn, filepath, tid, self.importProgress.emit, key=tid),
+            self._on_pgn_imported, "Game import failed"
+        )
+
+    def _on_pgn_imported(self, result):
+        msg = f"Imported {result.imported} games"
+        if result.unmatched:
+            msg += f" ({result.unmatched} without a matching pairing skipped)"
+            for reason in result.errors:
+                logger.warning("PGN import: %s", reason)
+        self.notification.emit("Success" if result.imported else "Warning", msg)
+
+    @pyqtSlot(str)
+    def exportPgn(self, filepath):
+        """Write every game of the tournament to a PGN file, by round and board."""
+        if not self._current_tournament:
+            self.notification.emit("Error", "No tournament loaded")
+            return
+        if self.remote:
+            self.notification.emit("Error", "Export games on the server machine")
+            return
+        tid = self._current_tournament.id
+        self._deliver(
+            self.async_db.read(self.games.export_pgn, tid, filepath, key=tid),
+            lambda count: self.notification.emit("Success", f"Exported {count} games to PGN"), "Export failed"
+        )
+
+    @pyqtSlot(int, result=str)
+    def gameText(self, pairing_id):
+        """PGN of the game played on a pairing, or "" if none was imported."""
+        try:
+            return self.games.pgn(pairing_id) or ""
+        except Exception as e:
+            logger.warning("Could not read game %s: %s", pairing_id, e)
+            return ""
+
+    # --- Diagnostics ---
+    @pyqtProperty(QVariant, notify=diagnosticsChanged)
+    def diagnostics(self):
+        """Per-action timings and SQL counts, slowest total first."""
+        return instrumentation.report()
+
+    @pyqtSlot()
+    def refreshDiagnostics(self):
+        self.diagnosticsChanged.emit()
+
+    @pyqtSlot()
+    def resetDiagnostics(self):
+        instrumentation.reset()
+        self.diagnosticsChanged.emit()
+
+    @pyqtSlot(str)
+    def dumpDiagnostics(self, filepath):
+        """Write the diagnostics report (JSON for a .json path, text otherwise)."""
+        filepath = filepath or DIAGNOSTICS_FILE
+        try:
+            instrumentation.dump(filepath)
+            self.notification.emit("Success", f"Diagnostics written to {filepath}")
+        except Exception as e:
+            self.notification.emit("Error", f"Failed to write diagnostics: {e}")
+
+    # --- Profiling ---
+    def _configure_slow_capture(self, threshold_ms=None):
+        """Profile every slot slower than the threshold (from settings unless given)."""
+        if threshold_ms is None:
+            threshold_ms = self.settings_manager.get_int('slow_slot_profile_ms', 0)
+        if threshold_ms <= 0:
+            instrumentation.slow_capture = None  # Without touching self.profiler, which may not exist yet
+            return
+        self.profiler.slow_threshold_ms = threshold_ms
+        instrumentation.slow_capture = self.profiler.capture
+
+    @pyqtSlot(int)
+    def setSlowSlotThreshold(self, threshold_ms):
+        """Profile slots slower than threshold_ms for this session only (0 = off)."""
+        self._configure_slow_capture(max(0, threshold_ms))
+        self.profilingChanged.emit()
+
+    @pyqtProperty(bool, notify=profilingChanged)
+    def cpuProfiling(self):
+        return self.profiler.cpu_running
+
+    @pyqtProperty(bool, notify=profilingChanged)
+    def memoryTracing(self):
+        return self.profiler.memory_running
+
+    @pyqtSlot()
+    @no_capture  # A capture would hold the profiler lock start_cpu needs
+    def startCpuProfile(self):
+        try:
+            self.profiler.start_cpu()
+            self.profilingChanged.emit()
+            self.notification.emit("Info", "CPU profiling started")
+        except RuntimeError as e:
+            self.notification.emit("Error", str(e))
+
+    @pyqtSlot()
+    def stopCpuProfile(self):
+        try:
+            path = self.profiler.stop_cpu()
+            self.profilingChanged.emit()
+            self.notification.emit("Success", f"CPU profile saved to {path}")
         except Exception as e:
-            self.notification.emit("Error", f"Import failed: {e}")
+            self.notification.emit("Error", f"Failed to save CPU profile: {e}")
+
+    @pyqtSlot()
+    def startMemoryTrace(self):
+        try:
+            self.profiler.start_memory()
+            self.profilingChanged.emit()
+            self.notification.emit("Info", "Memory tracing started")
+        except RuntimeError as e:
+            self.notification.emit("Error", str(e))
+
+    @pyqtSlot()
+    def takeMemorySnapshot(self):
+        try:
+            path = self.profiler.snapshot_memory()
+            self.notification.emit("Success", f"Memory snapshot saved to {path}")
+        except Exception as e:
+            self.notification.emit("Error", f"Failed to save memory snapshot: {e}")
+
+    @pyqtSlot()
+    def stopMemoryTrace(self):
+        try:
+            path = self.profiler.stop_memory()
+            self.profilingChanged.emit()
+            self.notification.emit("Success", f"Memory snapshot saved to {path}")
+        except Exception as e:
+            self.notification.emit("Error", f"Failed to save memory snapshot: {e}")
+
+    def finish_profiling(self):
+        """Write out any running CPU/memory session (on exit). Returns the written paths."""
+        if 'profiler' not in self.__dict__:
+            return []  # Never used this session
+        paths = []
+        if self.profiler.cpu_running:
+            paths.append(self.profiler.stop_cpu())
+        if self.profiler.memory_running:
+            paths.append(self.profiler.stop_memory())
+        return paths + self.profiler.captures
+
+    # --- Log ---
+    def _configure_logging(self):
+        """Apply the default and per-module log levels from settings."""
+        configure_levels(self.settings_manager.get('log_level', 'INFO'), self.settings_manager.get('log_levels', ''))
+
+    @pyqtProperty(list, notify=logChanged)
+    def logRecords(self):
+        """Recent log records (time, level, logger, message), oldest first."""
+        return ring_buffer.records()
+
+    @pyqtSlot()
+    def refreshLog(self):
+        self.logChanged.emit()
+
+    @pyqtSlot()
+    def clearLog(self):
+        ring_buffer.clear()
+        self.logChanged.emit()
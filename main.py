@@ -1,17 +1,34 @@
+import time
+STARTED = time.perf_counter()  # Before the other imports, so the startup timings include them
+
 import sys
 import os
-from PyQt5.QtCore import QCoreApplication, Qt
+import argparse
+import json
+import logging
+from PyQt5.QtCore import QCoreApplication, Qt, QTimer
 from PyQt5.QtGui import QGuiApplication, QIcon
 from PyQt5.QtQml import QQmlApplicationEngine, QQmlContext
-from PyQt5.QtWidgets import QMessageBox, QApplication
 
-from bridge import BackendBridge
+from bridge import BackendBridge, get_app_path
+from backend.logs import setup_logging
+
+logger = logging.getLogger("main")
+
+# Milliseconds since STARTED at each startup step (see benchmarks/bench_startup.py)
+startup_times = {}
+
+
+def mark(step):
+    startup_times[step] = round((time.perf_counter() - STARTED) * 1000, 1)
+
 
 def excepthook(exc_type, exc_value, exc_tb):
     """Catch-all for exceptions - pops up a message box so the user isn't left wondering what broke."""
     import traceback
+    from PyQt5.QtWidgets import QMessageBox, QApplication
     error_msg = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
-    print(error_msg)
+    logger.critical("Unhandled exception\n%s", error_msg)
     
     # Create a dummy app if one doesn't exist to show the message box
     if not QApplication.instance():
@@ -26,14 +43,64 @@ def excepthook(exc_type, exc_value, exc_tb):
     msg.exec_()
     sys.exit(1)
 
+def parse_args(argv):
+    """Our own options; anything else is left for Qt."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--server", nargs="?", const=":", metavar="HOST:PORT",
+                        help="Run as a tournament server (no window) that other instances connect to")
+    parser.add_argument("--connect", metavar="HOST:PORT",
+                        help="Use the tournament server at HOST:PORT instead of a local database")
+    parser.add_argument("--db", metavar="PATH", help="Database file served by --server")
+    parser.add_argument("--profile", action="store_true",
+                        help="cProfile the GUI thread from startup; the .pstats is written on exit")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Trace allocations from startup; a snapshot is written on exit")
+    parser.add_argument("--profile-slow", type=int, metavar="MS",
+                        help="Save a cProfile of every slot that takes longer than MS milliseconds")
+    parser.add_argument("--startup-benchmark", action="store_true",
+                        help="Print startup timings as JSON once the app is interactive, then quit")
+    return parser.parse_known_args(argv)
+
+
+def run_server(address, db_path=None):
+    from backend.database import DB_PATH
+    from backend.rpc import parse_address
+    from backend.server import TournamentServer
+
+    host, port = parse_address(address)
+    server = TournamentServer(db_path or DB_PATH, host, port)
+    print(f"Tournament server on {server.address[0]}:{server.address[1]} serving {server.db.db_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
+    mark('imports')
+    args, qt_argv = parse_args(sys.argv[1:])
+    setup_logging(get_app_path())
+    if args.server:
+        run_server(args.server, args.db)
+        return
+
     # Crash handler
     sys.excepthook = excepthook
 
+    # Profiling from startup (also available from the diagnostics panel)
+    profiler = None
+    if args.trace_memory or args.profile:
+        from backend.profiling import Profiler
+        profiler = Profiler(get_app_path())
+        if args.trace_memory:
+            profiler.start_memory()
+        if args.profile:
+            profiler.start_cpu()
+
     # High DPI support
     QCoreApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     
-    app = QGuiApplication(sys.argv)
+    app = QGuiApplication(sys.argv[:1] + qt_argv)
     app.setOrganizationName("IshantBishnoi")
     app.setOrganizationDomain("ishant.dev")
     app.setApplicationName("Chess Tournament Manager")
@@ -52,7 +119,10 @@ def main():
     engine = QQmlApplicationEngine()
     
     # Backend init
-    bridge = BackendBridge()
+    bridge = BackendBridge(args.connect, profiler)
+    if args.profile_slow:
+        bridge.setSlowSlotThreshold(args.profile_slow)
+    mark('backend')
     
     # Connect to QML
     context = engine.rootContext()
@@ -74,8 +144,40 @@ def main():
     
     if not engine.rootObjects():
         sys.exit(-1)
-        
-    sys.exit(app.exec_())
+    mark('qml_loaded')
+
+    # Show the window first, then reopen the last tournament (loads in the background)
+    restore_started = []
+
+    def restore_session():
+        if not restore_started:
+            restore_started.append(True)
+            bridge.restoreSession()
+
+    def on_first_frame():
+        if 'first_frame' not in startup_times:
+            mark('first_frame')
+            restore_session()
+
+    def on_interactive():
+        mark('interactive')
+        logger.info("Startup: first frame %s ms, interactive %s ms",
+                    startup_times.get('first_frame', '-'), startup_times['interactive'])
+        if args.startup_benchmark:
+            print(json.dumps(startup_times), flush=True)
+            app.quit()
+
+    window = engine.rootObjects()[0]
+    # frameSwapped comes from the render thread; queue it to this one
+    window.frameSwapped.connect(on_first_frame, Qt.QueuedConnection)
+    bridge.sessionRestored.connect(on_interactive)
+    QTimer.singleShot(2000, restore_session)  # In case nothing gets drawn (e.g. started minimized)
+
+    code = app.exec_()
+    bridge.flushAppState()  # A state change less than APP_STATE_DELAY_MS before exit
+    for path in bridge.finish_profiling():
+        logger.info("Profile written: %s", path)
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,52 @@
+import sys
+import os
+import json
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.app_state import STATE_KEY, AppStateStore, write_atomic
+from backend.database import Database
+from backend.settings_manager import SettingsManager
+
+
+def test_write_atomic_replaces_and_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / "app_state.json")
+    write_atomic(path, '{"a": 1}')
+    write_atomic(path, '{"a": 2}')
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {"a": 2}
+    assert os.listdir(tmp_path) == ["app_state.json"]
+
+
+def test_load_tolerates_missing_and_corrupt_files(tmp_path):
+    path = tmp_path / "app_state.json"
+    store = AppStateStore(str(path), None)
+    assert store.load() == {}
+
+    path.write_text('{"last_tournament_id": 3, "last_viewing', encoding='utf-8')  # Cut off mid-write
+    assert store.load() == {}
+    path.write_text('[1, 2]', encoding='utf-8')
+    assert store.load() == {}
+    path.write_bytes(b'{"a":1, \xff\xfe')  # Not even UTF-8
+    assert store.load() == {}
+
+    store.save({'last_tournament_id': 3, 'ui': {'dashboardFilter': 'SWISS'}})
+    assert store.load() == {'last_tournament_id': 3, 'ui': {'dashboardFilter': 'SWISS'}}
+
+
+def test_settings_storage_is_internal(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    settings = SettingsManager(db.db_path)
+    path = tmp_path / "app_state.json"
+    AppStateStore(str(path), settings).save({'last_tournament_id': 1})
+
+    store = AppStateStore(str(path), settings, storage='settings')
+    assert store.load() == {'last_tournament_id': 1}  # Nothing in the database yet: file
+    store.save({'last_tournament_id': 2})
+    assert store.load() == {'last_tournament_id': 2}
+
+    # Not a user setting: hidden from get_all, kept by reset_defaults, survives a reopen
+    assert STATE_KEY not in settings.get_all()
+    settings.reset_defaults()
+    assert AppStateStore(str(path), SettingsManager(db.db_path), 'settings').load() == {'last_tournament_id': 2}
@@ -0,0 +1,79 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.archive import TournamentArchive
+from backend.database import Database
+from backend.maintenance import run_maintenance
+from backend.scoring import ScoringKernel
+
+
+def _finished_tournament(db, name="Spring Open", finished=True):
+    tid = db.execute_non_query(
+        "INSERT INTO tournaments (name, type, total_rounds, current_round, status) VALUES (?, 'SWISS', 1, 1, ?)",
+        (name, 'FINISHED' if finished else 'ACTIVE')
+    )
+    reg = db.execute_non_query("INSERT INTO player_registry (name, rating) VALUES ('Alice', 2000)")
+    a = db.execute_non_query(
+        "INSERT INTO players (tournament_id, name, rating, registry_id) VALUES (?, 'Alice', 2000, ?)", (tid, reg)
+    )
+    b = db.execute_non_query("INSERT INTO players (tournament_id, name, rating) VALUES (?, 'Bob', 1900)", (tid,))
+    rid = db.execute_non_query(
+        "INSERT INTO rounds (tournament_id, round_number, status) VALUES (?, 1, 'LOCKED')", (tid,)
+    )
+    db.execute_non_query(
+        "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, ?, '0-1')",
+        (rid, a, b)
+    )
+    return tid
+
+
+def test_archive_moves_only_finished_tournaments(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    archive = TournamentArchive(db)
+    done = _finished_tournament(db)
+    running = _finished_tournament(db, "Summer Open", finished=False)
+
+    assert archive.archive_finished() == [done]
+    assert db.execute_query("SELECT id FROM tournaments") == [(running,)]
+    assert db.execute_query("SELECT COUNT(*) FROM pairings") == [(1,)]
+    assert [(t['id'], t['name'], t['player_count']) for t in archive.list()] == [(done, "Spring Open", 2)]
+    assert os.path.exists(archive.archive_path)
+
+
+def test_archived_tournament_is_readable(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    archive = TournamentArchive(db)
+    tid = _finished_tournament(db)
+    archive.archive(tid)
+
+    with archive.open(tid) as adb:
+        ranked = ScoringKernel(adb).standings(tid).ranked()
+        assert [(p['name'], p['points']) for p in ranked] == [("Bob", 1.0), ("Alice", 0.0)]
+
+
+def test_restore_brings_back_the_same_rows(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    archive = TournamentArchive(db)
+    tid = _finished_tournament(db)
+    before = db.execute_query("SELECT * FROM players ORDER BY id")
+
+    archive.archive(tid)
+    archive.restore(tid)
+    assert db.execute_query("SELECT * FROM players ORDER BY id") == before
+    assert archive.list() == []
+    assert not archive.contains(tid)
+
+
+def test_maintenance(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    for i in range(20):
+        _finished_tournament(db, f"T{i}")
+    db.execute_non_query("DELETE FROM pairings")
+
+    first = run_maintenance(db)
+    assert first['vacuum'] == 'full'
+    assert run_maintenance(db)['vacuum'] == 'incremental'
+    assert db.execute_query("SELECT COUNT(*) FROM sqlite_stat1")[0][0] > 0
@@ -0,0 +1,97 @@
+import sys
+import os
+import threading
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from backend.async_db import AsyncDatabase
+from backend.database import Database
+
+
+def _facade(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    return AsyncDatabase(db, readers=3)
+
+
+def test_writes_run_in_order_on_one_thread(tmp_path):
+    adb = _facade(tmp_path)
+    threads = set()
+
+    def insert(i):
+        threads.add(threading.current_thread().name)
+        return adb.db.execute_non_query(
+            "INSERT INTO tournaments (name, type, total_rounds) VALUES (?, 'SWISS', 5)", (f"T{i}",)
+        )
+
+    futures = [adb.write(insert, i) for i in range(20)]
+    assert [f.result() for f in futures] == sorted(f.result() for f in futures)
+    assert len(threads) == 1
+    adb.close()
+
+
+def test_keyed_read_sees_earlier_write(tmp_path):
+    adb = _facade(tmp_path)
+
+    def slow_insert():
+        time.sleep(0.1)
+        return adb.db.execute_non_query(
+            "INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)"
+        )
+
+    adb.write(slow_insert, key=1)
+    rows = adb.query("SELECT name FROM tournaments", key=1).result(timeout=5)
+    assert rows == [("Open",)]
+    adb.close()
+
+
+def test_keyed_reads_complete_in_submission_order(tmp_path):
+    adb = _facade(tmp_path)
+    done = []
+
+    def work(label, delay):
+        time.sleep(delay)
+        done.append(label)
+        return label
+
+    first = adb.read(work, "a", 0.15, key=7)
+    second = adb.read(work, "b", 0.0, key=7)
+    other = adb.read(work, "x", 0.0, key=8)
+
+    assert other.result(timeout=5) == "x"
+    assert second.result(timeout=5) == "b"
+    assert first.done()
+    assert done.index("x") < done.index("a") < done.index("b")
+    adb.close()
+
+
+def test_errors_surface_on_the_future(tmp_path):
+    adb = _facade(tmp_path)
+    failed = adb.execute("INSERT INTO missing_table VALUES (1)", key=1)
+    after = adb.query("SELECT COUNT(*) FROM tournaments", key=1)
+
+    with pytest.raises(Exception):
+        failed.result(timeout=5)
+    assert after.result(timeout=5) == [(0,)]
+    adb.close()
+
+
+def test_keyed_write_waits_for_earlier_read(tmp_path):
+    adb = _facade(tmp_path)
+
+    def slow_count():
+        time.sleep(0.15)
+        return adb.db.execute_query("SELECT COUNT(*) FROM tournaments")[0][0]
+
+    read = adb.read(slow_count, key=3)
+    adb.execute("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)", key=3)
+    later = adb.execute("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Rapid', 'SWISS', 5)")
+
+    assert read.result(timeout=5) == 0
+    adb.flush(timeout=5)
+    assert later.done()
+    assert adb.db.execute_query("SELECT name FROM tournaments ORDER BY id") == [("Open",), ("Rapid",)]
+    adb.close()
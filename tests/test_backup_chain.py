@@ -0,0 +1,229 @@
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.backup_manager import BackupManager
+
+
+def _player_names(db_path):
+    return sorted(r[0] for r in Database(db_path).execute_query("SELECT name FROM players"))
+
+
+def test_incremental_chain_restores_each_point():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        folder = os.path.join(tmpdir, "backups")
+        db = Database(db_path)
+        tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+
+        manager = BackupManager(compression='gzip')
+        points = []
+        for i in range(3):
+            db.execute_non_query(
+                "INSERT INTO players (tournament_id, name, rating) VALUES (?, ?, 1500)", (tid, f"Player {i}")
+            )
+            points.append((manager.create_backup(db_path, folder, mode='incremental'), _player_names(db_path)))
+
+        kinds = [b.kind for b in manager.list_backups(folder)]
+        assert sorted(kinds) == ['delta', 'delta', 'snapshot']
+
+        for backup_file, expected in points:
+            assert manager.validate_backup(backup_file)
+            target = os.path.join(tmpdir, "restored.db")
+            manager.restore_backup(backup_file, target)
+            assert _player_names(target) == expected
+            os.remove(target)
+
+
+def test_prune_keeps_newest_chains():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        folder = os.path.join(tmpdir, "backups")
+        Database(db_path)
+
+        manager = BackupManager()
+        for _ in range(3):
+            manager.create_backup(db_path, folder, mode='compressed')
+            manager.create_backup(db_path, folder, mode='incremental')
+
+        manager.prune_backups(folder, keep_chains=1)
+        assert sorted(b.kind for b in manager.list_backups(folder)) == ['delta', 'snapshot']
+
+
+
+def test_chains_sort_by_same_second_sequence():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        folder = os.path.join(tmpdir, "backups")
+        Database(db_path)
+
+        manager = BackupManager()
+        manager._generate_base_name = lambda _folder: names.pop(0)
+        names = ["backup_2026-01-01_10-00-00"] + [f"backup_2026-01-01_10-00-00_{n}" for n in range(1, 12)]
+        for _ in range(12):
+            manager.create_backup(db_path, folder, mode='compressed')
+
+        order = [os.path.basename(p) for p in manager.chain_store.chain_paths(folder)]
+        assert order[0] == "backup_2026-01-01_10-00-00.chain.json"
+        assert order[-3:] == [f"backup_2026-01-01_10-00-00_{n}.chain.json" for n in (9, 10, 11)]
+
+        manager.prune_backups(folder, keep_chains=2)
+        assert [os.path.basename(p) for p in manager.chain_store.chain_paths(folder)] == order[-2:]
+
+def test_deleting_delta_drops_later_deltas():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        folder = os.path.join(tmpdir, "backups")
+        db = Database(db_path)
+        tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+
+        manager = BackupManager()
+        created = []
+        for i in range(3):
+            db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, f"P{i}"))
+            created.append(manager.create_backup(db_path, folder, mode='incremental'))
+
+        manager.delete_backup(created[1])
+        assert [b.filepath for b in manager.list_backups(folder)] == [created[0]]
+
+        # Chain continues from the surviving tip
+        new_delta = manager.create_backup(db_path, folder, mode='incremental')
+        target = os.path.join(tmpdir, "restored.db")
+        manager.restore_backup(new_delta, target)
+        assert _player_names(target) == ["P0", "P1", "P2"]
+
+
+def test_background_backup_is_verified():
+    from backend.backup_scheduler import BackgroundBackup
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        db = Database(db_path)
+        tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+        with db.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO players (tournament_id, name, club) VALUES (?, ?, ?)",
+                [(tid, f"Player {i}", "x" * 200) for i in range(2000)]
+            )
+
+        results = []
+        progress = []
+        runner = BackgroundBackup(BackupManager())
+        assert runner.start(db_path, os.path.join(tmpdir, "backups"),
+                            on_progress=lambda done, total: progress.append((done, total)),
+                            on_finished=lambda *args: results.append(args))
+        # Writers keep working while the stepped copy runs
+        db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Late entry')", (tid,))
+        runner.wait(10)
+
+        path, verified, error = results[0]
+        assert verified and not error
+        assert progress and progress[-1][0] == progress[-1][1]
+        assert len(_player_names(path)) >= 2000
+
+
+def test_catalog_records_metadata_and_caches_validation():
+    import shutil
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        folder = os.path.join(tmpdir, "backups")
+        db = Database(db_path)
+        tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+        db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'A')", (tid,))
+
+        manager = BackupManager()
+        path = manager.create_backup(db_path, folder)
+        info = manager.list_backups(folder)[0]
+        assert info.tournament_count == 1 and info.player_count == 1
+        assert info.validated is True and len(info.checksum) == 64
+
+        # A second manager instance reads the manifest instead of re-validating
+        fresh = BackupManager()
+        assert fresh.catalog(folder).cached(os.path.basename(path), 'validated') is True
+        assert fresh.verify_backup(path)
+        assert fresh.catalog(folder).get(os.path.basename(path))['quick_check'] is True
+
+        # Files copied in by hand are picked up; deleted ones disappear
+        shutil.copy2(path, os.path.join(folder, "backup_2020-01-01_00-00-00.db"))
+        assert len(fresh.list_backups(folder)) == 2
+        fresh.delete_backup(path)
+        assert [b.filename for b in fresh.list_backups(folder)] == ["backup_2020-01-01_00-00-00.db"]
+
+
+def test_restore_into_open_database():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        folder = os.path.join(tmpdir, "backups")
+        db = Database(db_path)
+        tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+        db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Before')", (tid,))
+
+        manager = BackupManager()
+        backup = manager.create_backup(db_path, folder)
+        db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'After')", (tid,))
+
+        manager.restore_backup(backup, db_path)
+        assert _player_names(db_path) == ["Before"]
+        assert not db.migrate_if_needed()
+
+
+def test_busy_stepped_copy_falls_back_and_compression_is_per_call():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        folder = os.path.join(tmpdir, "backups")
+        db = Database(db_path)
+        tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+        with db.get_connection() as conn:
+            conn.executemany("INSERT INTO players (tournament_id, name, club) VALUES (?, ?, ?)",
+                             [(tid, f"Player {i}", "x" * 500) for i in range(2000)])
+
+        manager = BackupManager(compression='lzma')
+        manager.STEP_PAGES = 8
+        manager.MAX_STEP_RESTARTS = 3
+        steps = []
+
+        def progress(status, remaining, total):
+            # A writer commits between every step, so the stepped copy never completes on its own
+            steps.append(remaining)
+            db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Late')", (tid,))
+
+        backup = manager.create_backup(db_path, folder, mode='compressed', compression='gzip',
+                                       stepped=True, progress=progress)
+        assert backup.endswith('.gz')
+        assert manager.chain_store.compression == 'lzma'
+        assert len(steps) < 10
+        assert manager.validate_backup(backup)
+
+
+def test_restore_checks_a_fresh_copy_not_the_catalog():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "live.db")
+        folder = os.path.join(tmpdir, "backups")
+        db = Database(db_path)
+        tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+        db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Live')", (tid,))
+
+        manager = BackupManager()
+        backup = manager.create_backup(db_path, folder)
+        assert manager.validate_backup(backup) and manager.verify_backup(backup)  # Cached as good
+
+        # Damaged in place: same size and mtime, so the catalog still trusts it
+        st = os.stat(backup)
+        with open(backup, 'r+b') as f:
+            f.seek(4096)
+            f.write(b'\xff' * 4096)
+        os.utime(backup, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert manager.verify_backup(backup)
+
+        try:
+            manager.restore_backup(backup, db_path)
+            assert False, "corrupt backup was restored"
+        except ValueError:
+            pass
+        assert _player_names(db_path) == ["Live"]
+        assert not os.path.exists(db_path + ".staged_restore")
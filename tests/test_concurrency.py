@@ -0,0 +1,107 @@
+import sys
+import os
+import multiprocessing
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from backend.concurrency import (
+    ChangeWatcher, ConflictError, RoundLockedError, set_round_status, update_result
+)
+from backend.database import Database
+
+
+def _setup(path):
+    db = Database(path)
+    tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+    a = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Alice')", (tid,))
+    b = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Bob')", (tid,))
+    rid = db.execute_non_query(
+        "INSERT INTO rounds (tournament_id, round_number, status) VALUES (?, 1, 'IN_PROGRESS')", (tid,)
+    )
+    pid = db.execute_non_query(
+        "INSERT INTO pairings (round_id, white_player_id, black_player_id) VALUES (?, ?, ?)", (rid, a, b)
+    )
+    return db, tid, pid
+
+
+def test_stale_result_is_rejected(tmp_path):
+    db, tid, pid = _setup(str(tmp_path / "t.db"))
+
+    assert update_result(db, pid, '1-0', expected_version=0) == 1
+    with pytest.raises(ConflictError) as err:
+        update_result(db, pid, '0-1', expected_version=0)
+    assert err.value.current == {'id': pid, 'result': '1-0', 'version': 1}
+    assert db.execute_query("SELECT result FROM pairings WHERE id = ?", (pid,)) == [('1-0',)]
+
+
+def test_plain_updates_still_bump_version(tmp_path):
+    db, tid, pid = _setup(str(tmp_path / "t.db"))
+    db.execute_non_query("UPDATE pairings SET result = '0.5-0.5' WHERE id = ?", (pid,))
+    with pytest.raises(ConflictError):
+        update_result(db, pid, '1-0', expected_version=0)
+
+
+def test_round_lock_conflicts_and_blocks_results(tmp_path):
+    db, tid, pid = _setup(str(tmp_path / "t.db"))
+
+    assert set_round_status(db, tid, 1, 'LOCKED', 'now', expected_version=0) == 1
+    with pytest.raises(ConflictError):
+        set_round_status(db, tid, 1, 'IN_PROGRESS', expected_version=0)
+    with pytest.raises(RoundLockedError):
+        update_result(db, pid, '1-0')
+
+
+def test_watcher_reports_changed_tournaments(tmp_path):
+    path = str(tmp_path / "t.db")
+    db, tid, pid = _setup(path)
+    other = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('B', 'SWISS', 5)")
+    db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Carol')", (other,))
+
+    watcher = ChangeWatcher(path)
+    watcher.poll()
+    assert watcher.poll() == set()
+
+    update_result(Database(path), pid, '1-0')
+    assert watcher.poll() == {tid}
+    assert watcher.poll() == set()
+    watcher.close()
+
+
+def _arbiter(path, pid, attempts, queue):
+    """One terminal: read the pairing, then try to write with the version it saw."""
+    db = Database(path)
+    saved = []
+    conflicts = 0
+    for i in range(attempts):
+        version = db.execute_query("SELECT version FROM pairings WHERE id = ?", (pid,))[0][0]
+        try:
+            update_result(db, pid, ('1-0', '0-1', '0.5-0.5')[i % 3], expected_version=version)
+            saved.append(version)
+        except ConflictError:
+            conflicts += 1
+    queue.put((saved, conflicts))
+
+
+def test_processes_never_lose_updates(tmp_path):
+    path = str(tmp_path / "t.db")
+    db, tid, pid = _setup(path)
+    workers, attempts = 4, 25
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=_arbiter, args=(path, pid, attempts, queue)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    outcomes = [queue.get(timeout=60) for _ in procs]
+    for p in procs:
+        p.join(timeout=60)
+
+    saved = [v for s, _ in outcomes for v in s]
+    assert len(saved) + sum(c for _, c in outcomes) == workers * attempts
+    # Each successful write started from a different version: no blind overwrite
+    assert len(saved) == len(set(saved))
+    final = db.execute_query("SELECT version FROM pairings WHERE id = ?", (pid,))[0][0]
+    assert final == len(saved)
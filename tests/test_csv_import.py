@@ -0,0 +1,85 @@
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.csv_import import CSVImporter
+
+
+def _setup(tmpdir):
+    db = Database(os.path.join(tmpdir, "test.db"))
+    tid = db.execute_non_query(
+        "INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)"
+    )
+    db.execute_non_query(
+        "INSERT INTO players (tournament_id, name, rating, fide_id) VALUES (?, 'Alice Cooper', 1900, '111')",
+        (tid,)
+    )
+    return db, tid
+
+
+def _write_csv(tmpdir, text):
+    path = os.path.join(tmpdir, "players.csv")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def test_import_dedupes_and_skips_invalid():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, tid = _setup(tmpdir)
+        path = _write_csv(tmpdir, (
+            "Name,Club,Rating,FIDE ID\n"
+            "alice cooper,Club A,1900,\n"      # duplicate by name
+            "Alicia C,Club A,1880,111\n"       # duplicate by FIDE id
+            "Bob Marley,Club B,1700,222\n"
+            "Bob  Marley,Club B,1700,\n"       # duplicate within the file
+            "Carl Sagan,,abc,\n"               # invalid rating
+            ",Club C,1500,\n"                  # no name
+            "Dana Scully,Club C,,\n"
+        ))
+
+        progress = []
+        result = CSVImporter(db).import_players(path, tid, progress=lambda n, f: progress.append((n, f)))
+
+        assert result.imported == 2
+        assert result.duplicates == 3
+        assert result.invalid == 1
+        assert progress and progress[-1][1] == 1.0
+        names = {r[0] for r in db.execute_query("SELECT name FROM players WHERE tournament_id = ?", (tid,))}
+        assert names == {"Alice Cooper", "Bob Marley", "Dana Scully"}
+
+
+def test_preview_reads_only_first_rows():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, tid = _setup(tmpdir)
+        lines = ["name,rating"] + [f"Player {i},{1000 + i}" for i in range(1000)]
+        lines.insert(2, "ALICE COOPER,1900")
+        path = _write_csv(tmpdir, "\n".join(lines) + "\n")
+
+        preview = CSVImporter(db).preview(path, tid, limit=5)
+
+        assert len(preview) == 5
+        assert preview[1]['name'] == "ALICE COOPER"
+        assert preview[1]['duplicate'] is True
+        assert not preview[0]['duplicate']
+
+
+def test_progress_counts_bytes_and_lines_are_physical():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, tid = _setup(tmpdir)
+        path = os.path.join(tmpdir, "players.csv")
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            f.write('Name,Club,Rating\r\nZoë Ødegård,"Club\r\nÅrhus",1800\r\nJürgen Müller,Köln,1700\r\n')
+
+        importer = CSVImporter(db)
+        progress = []
+        importer.import_players(path, tid, progress=lambda n, f: progress.append(f))
+        assert progress[-1] == 1.0
+
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = list(importer.normalize(importer.iter_rows(f), None))
+        assert [(r.line, r.name) for r in rows] == [(2, "Zoë Ødegård"), (4, "Jürgen Müller")]
@@ -0,0 +1,77 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.archive import TournamentArchive
+from backend.dashboard import TournamentSummaries
+from backend.database import Database
+
+
+def _tournament(db, name, created_at, type_='SWISS', status='ACTIVE'):
+    return db.execute_non_query(
+        "INSERT INTO tournaments (name, type, total_rounds, status, created_at) VALUES (?, ?, 5, ?, ?)",
+        (name, type_, status, created_at)
+    )
+
+
+def test_summaries_follow_changes(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    summaries = TournamentSummaries(db)
+    tid = _tournament(db, "Open", "2024-01-01")
+    a = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Alice')", (tid,))
+    b = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Bob')", (tid,))
+    c = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Carol')", (tid,))
+    rid = db.execute_non_query("INSERT INTO rounds (tournament_id, round_number) VALUES (?, 1)", (tid,))
+    pid = db.execute_non_query(
+        "INSERT INTO pairings (round_id, white_player_id, black_player_id) VALUES (?, ?, ?)", (rid, a, b)
+    )
+    db.execute_non_query("INSERT INTO pairings (round_id, white_player_id, result) VALUES (?, ?, 'BYE')", (rid, c))
+
+    def summary():
+        row = summaries.page()[0]
+        return row['player_count'], row['rounds_done'], row['results_pending']
+
+    assert summary() == (3, 0, 1)
+    db.execute_non_query("UPDATE pairings SET result = '1-0' WHERE id = ?", (pid,))
+    db.execute_non_query("UPDATE rounds SET status = 'LOCKED' WHERE id = ?", (rid,))
+    assert summary() == (3, 1, 0)
+
+    db.execute_non_query("UPDATE pairings SET result = '*' WHERE id = ?", (pid,))
+    db.execute_non_query("DELETE FROM rounds WHERE id = ?", (rid,))
+    db.execute_non_query("DELETE FROM players WHERE id = ?", (c,))
+    assert summary() == (2, 0, 0)
+    assert summaries.check(tid)
+
+
+def test_pages_filters_and_archived(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    archive = TournamentArchive(db)
+    for i in range(5):
+        _tournament(db, f"Club Night {i}", f"2024-01-0{i + 1}", type_='ROUND_ROBIN' if i % 2 else 'SWISS')
+    done = _tournament(db, "Spring 100% Open", "2024-02-01", status='FINISHED')
+    archive.archive(done)
+    summaries = TournamentSummaries(db, archive)
+
+    first = summaries.page(limit=4)
+    assert [t['name'] for t in first] == ["Spring 100% Open", "Club Night 4", "Club Night 3", "Club Night 2"]
+    assert first[0]['archived'] and not first[1]['archived']
+    rest = summaries.page(after=(first[-1]['created_at'], first[-1]['id']), limit=4)
+    assert [t['name'] for t in rest] == ["Club Night 1", "Club Night 0"]
+
+    assert summaries.count() == 6
+    assert summaries.count(type_='ROUND_ROBIN') == 2
+    assert [t['name'] for t in summaries.page(search="100%")] == ["Spring 100% Open"]
+    assert summaries.page(search="1%") == []  # % is literal
+    assert [t['id'] for t in summaries.page(status='ARCHIVED')] == [done]
+    assert summaries.count(status='ACTIVE') == 5
+
+
+def test_existing_tournaments_are_summarized_once(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    tid = _tournament(db, "Old", "2020-01-01")
+    db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Alice')", (tid,))
+    TournamentSummaries(db)
+    TournamentSummaries(db)  # Second start: no rebuild, no double counting
+    assert TournamentSummaries(db).page()[0]['player_count'] == 1
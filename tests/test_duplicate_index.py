@@ -0,0 +1,41 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.duplicate_index import DuplicateIndex, name_tokens, soundex
+
+
+def test_name_normalization():
+    assert name_tokens("Sharma, R.") == ["r", "sharma"]
+    assert name_tokens("R Sharma") == ["r", "sharma"]
+    assert name_tokens("José Müller") == ["jose", "muller"]
+    assert soundex("robert") == soundex("rupert") == "R163"
+
+
+def test_candidates_ranked():
+    index = DuplicateIndex()
+    index.add(1, "Rahul Sharma", "Delhi CC")
+    index.add(2, "Rohit Sharma", "Mumbai CC")
+    index.add(3, "Anna Berg", "Oslo SK", fide_id="1500")
+    index.add(4, "Peter Svidler")
+
+    matches = index.candidates("Sharma, R.")
+    assert [m.entry_id for m in matches] == [1, 2]  # Equal scores: lower id first
+    assert matches[0].score == matches[1].score >= index.threshold
+
+    best = index.candidates("Rahul Sharmaa")[0]
+    assert best.entry_id == 1
+
+    assert [m.entry_id for m in index.candidates("Ana Bergh")] == [3]
+    assert index.candidates("Different Person", fide_id="1500")[0].score == 1.0
+    assert index.candidates("Magnus Carlsen") == []
+
+
+def test_remove_entry():
+    index = DuplicateIndex()
+    index.add(1, "Peter Svidler")
+    index.remove(1)
+    assert len(index) == 0
+    assert index.candidates("Peter Svidler") == []
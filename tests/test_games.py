@@ -0,0 +1,107 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.archive import TournamentArchive
+from backend.database import Database
+from backend.games import GameStore
+from backend.pgn import iter_games
+
+NAMES = (("Anna Smith", "Bo Lee"), ("Cy Diaz", "Dee Park"), ("Eve Ng", "Fay Ito"))
+MOVES = ("1. e4 c5 2. Nf3 d6 3. d4 cxd4 4. Nxd4 Nf6 5. Nc3 a6 6. Be3 e5 7. Nb3 Be6 8. f3 Be7 "
+         "9. Qd2 O-O 10. O-O-O Nbd7 11. g4 b5 12. g5 b4 13. Ne2 Ne8 14. f4 a5 15. f5 a4")
+
+
+def _event(path):
+    db = Database(path)
+    tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+    rid = db.execute_non_query("INSERT INTO rounds (tournament_id, round_number) VALUES (?, 1)", (tid,))
+    for white, black in NAMES:
+        a = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, white))
+        b = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, black))
+        db.execute_non_query(
+            "INSERT INTO pairings (round_id, white_player_id, black_player_id) VALUES (?, ?, ?)", (rid, a, b)
+        )
+    return db, tid
+
+
+def _write_pgn(path, games):
+    with open(path, 'w', encoding='utf-8') as f:
+        for tags, moves in games:
+            f.write("".join(f'[{tag} "{value}"]\n' for tag, value in tags.items()) + f"\n{moves}\n\n")
+
+
+def test_games_are_matched_to_pairings_and_compressed(tmp_path):
+    db, tid = _event(str(tmp_path / "t.db"))
+    store = GameStore(db)
+    pgn = str(tmp_path / "r1.pgn")
+    _write_pgn(pgn, [
+        ({'Round': '1.1', 'White': 'Smith, Anna', 'Black': 'Lee, Bo', 'Result': '1-0', 'ECO': 'B90'},
+         MOVES + " { a long game ; really } 1-0"),
+        ({'Round': '1', 'White': 'Eve Ng', 'Black': 'Fay Ito', 'Result': '1/2-1/2', 'ECO': 'C42'},
+         "1. e4 e5 2. Nf3 Nf6 ; Petroff\n3. Nxe5 d6 1/2-1/2"),
+        ({'Round': '1', 'White': 'Dee Park', 'Black': 'Cy Diaz', 'Result': '0-1'}, "1. d4 0-1"),  # Colours swapped
+        ({'Round': '4', 'White': 'Anna Smith', 'Black': 'Bo Lee', 'Result': '*'}, "*"),  # No such round
+    ])
+    progress = []
+    result = store.import_pgn(pgn, tid, progress=lambda n, f: progress.append((n, f)))
+
+    assert (result.imported, result.unmatched, len(result.errors)) == (2, 2, 2)
+    assert progress[-1] == (4, 1.0)
+    rows = db.execute_query("SELECT board, white_player_id, result, eco, length(moves) FROM games ORDER BY board")
+    assert [r[:4] for r in rows] == [(1, 1, '1-0', 'B90'), (3, 5, '1/2-1/2', 'C42')]
+    assert rows[0][4] < len(MOVES)  # Move text is stored compressed
+    assert "{Petroff} 3. Nxe5" in store.pgn(3)
+
+    # Importing again replaces the games rather than adding copies
+    assert store.import_pgn(pgn, tid).imported == 2
+    assert store.count(tid) == 2
+
+
+def test_search_by_player_eco_and_result_and_streamed_export(tmp_path):
+    db, tid = _event(str(tmp_path / "t.db"))
+    store = GameStore(db)
+    pgn = str(tmp_path / "in.pgn")
+    _write_pgn(pgn, [
+        ({'Event': 'Open', 'Round': '1', 'Board': str(board), 'White': w, 'Black': b, 'Result': res, 'ECO': eco,
+          'WhiteElo': '2000'}, f"1. e4 e5 {res}")
+        for board, ((w, b), res, eco) in enumerate(zip(NAMES, ('1-0', '0-1', '1-0'), ('C20', 'B01', 'C44')), 1)
+    ])
+    store.import_pgn(pgn, tid)
+
+    assert [g['board'] for g in store.search(tid, eco='c')] == [1, 3]
+    assert [g['board'] for g in store.search(tid, result='0-1')] == [2]
+    assert [g['black'] for g in store.search(player_id=4)] == ['Dee Park']  # Either colour
+    plan = " ".join(r[-1] for r in db.execute_query(
+        "EXPLAIN QUERY PLAN SELECT * FROM games WHERE eco GLOB 'C4*' AND tournament_id = 1"))
+    assert "idx_games_eco" in plan
+
+    out = str(tmp_path / "out.pgn")
+    assert store.export_pgn(tid, out) == 3
+    with open(out, encoding='utf-8') as f:
+        first = f.readline()
+        f.seek(0)
+        games = list(iter_games(f))
+    assert first == '[Event "Open"]\n'  # Seven Tag Roster first
+    assert [(g.get('White'), g.get('Board'), g.get('WhiteElo'), g.movetext) for g in games] == [
+        (w, str(i), '2000', f"1. e4 e5 {res}") for i, ((w, _), res) in enumerate(zip(NAMES, ('1-0', '0-1', '1-0')), 1)
+    ]
+
+
+def test_games_go_into_the_archive_and_come_back(tmp_path):
+    db, tid = _event(str(tmp_path / "t.db"))
+    store = GameStore(db)
+    pgn = str(tmp_path / "in.pgn")
+    _write_pgn(pgn, [({'Round': '1.2', 'White': 'Cy Diaz', 'Black': 'Dee Park', 'Result': '1-0'}, MOVES + " 1-0")])
+    store.import_pgn(pgn, tid)
+    before = store.pgn(2)
+    db.execute_non_query("UPDATE tournaments SET status = 'FINISHED' WHERE id = ?", (tid,))
+
+    archive = TournamentArchive(db, str(tmp_path / "archive.db"))
+    assert archive.archive(tid)
+    assert store.count(tid) == 0  # Deleted with the pairings
+
+    archive.restore(tid)
+    assert store.pgn(2) == before
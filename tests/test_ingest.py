@@ -0,0 +1,128 @@
+import sys
+import os
+import json
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.concurrency import set_round_status
+from backend.database import Database
+from backend import ingest
+from backend.ingest import PROCESSED_DIR, REJECTED_DIR, ResultFeed
+
+
+def _round(path, names=(("Anna Smith", "Bo Lee"), ("Cy Diaz", "Dee Park"), ("Eve Ng", "Fay Ito"))):
+    db = Database(path)
+    tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+    rid = db.execute_non_query("INSERT INTO rounds (tournament_id, round_number) VALUES (?, 1)", (tid,))
+    for white, black in names:
+        a = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, white))
+        b = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, black))
+        db.execute_non_query(
+            "INSERT INTO pairings (round_id, white_player_id, black_player_id) VALUES (?, ?, ?)", (rid, a, b)
+        )
+    return db, tid
+
+
+def _drop(folder, name, text):
+    """Write like a board feed: temp file, then rename into place."""
+    tmp = os.path.join(folder, name + ".part")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, os.path.join(folder, name))
+
+
+def _results(db):
+    return [r[0] for r in db.execute_query("SELECT result FROM pairings ORDER BY id")]
+
+
+def test_json_and_pgn_files_are_applied_and_filed(tmp_path):
+    db, tid = _round(str(tmp_path / "t.db"))
+    inbox = tmp_path / "feed"
+    inbox.mkdir()
+    feed = ResultFeed(db, str(inbox), settle_seconds=0)
+
+    _drop(inbox, "b1.json", json.dumps({"round": 1, "board": 1, "white": "Smith, Anna", "black": "Lee, Bo",
+                                        "result": "1-0"}))
+    _drop(inbox, "b2.pgn", '[Event "Open"]\n[Round "1.2"]\n[White "Diaz, Cy"]\n[Black "Park, Dee"]\n'
+                           '[Result "1/2-1/2"]\n\n1. e4 e5 1/2-1/2\n\n'
+                           '[Round "1"]\n[White "Eve Ng"]\n[Black "Fay Ito"]\n[Result "*"]\n\n1. d4 *\n')
+    report = feed.poll(tid)
+
+    assert (report.files, report.applied, report.in_progress, report.rejected) == (2, 2, 1, [])
+    assert _results(db) == ['1-0', '0.5-0.5', '*']
+    assert sorted(os.listdir(inbox / PROCESSED_DIR)) == ["b1.json", "b2.pgn"]
+    assert feed.poll(tid).files == 0  # Nothing left to read
+
+
+def test_unplaceable_games_are_rejected(tmp_path):
+    db, tid = _round(str(tmp_path / "t.db"))
+    inbox = tmp_path / "feed"
+    inbox.mkdir()
+    feed = ResultFeed(db, str(inbox), settle_seconds=0)
+
+    _drop(inbox, "swapped.json", json.dumps([
+        {"round": 1, "board": 3, "white": "Eve Ng", "black": "Fay Ito", "result": "0-1"},
+        {"round": 1, "board": 1, "white": "Bo Lee", "black": "Anna Smith", "result": "1-0"},
+    ]))
+    _drop(inbox, "broken.json", "{not json")
+    report = feed.poll(tid)
+
+    assert report.applied == 1 and len(report.rejected) == 2
+    assert _results(db) == ['*', '*', '0-1']  # The good game in the file still counts
+    assert sorted(os.listdir(inbox / REJECTED_DIR)) == [
+        "broken.json", "broken.json.errors.txt", "swapped.json", "swapped.json.errors.txt"
+    ]
+
+    set_round_status(db, tid, 1, 'LOCKED')
+    _drop(inbox, "late.json", json.dumps({"round": 1, "board": 2, "result": "1-0"}))
+    assert "LOCKED" in feed.poll(tid).rejected[0]
+    assert _results(db) == ['*', '*', '0-1']
+
+
+def test_jsonl_is_tailed(tmp_path):
+    db, tid = _round(str(tmp_path / "t.db"))
+    inbox = tmp_path / "feed"
+    inbox.mkdir()
+    feed = ResultFeed(db, str(inbox), settle_seconds=0)
+    live = inbox / "live.jsonl"
+
+    live.write_text(json.dumps({"round": 1, "board": 1, "result": "0-1"}) + "\n" + '{"round": 1, "bo', encoding='utf-8')
+    assert feed.poll(tid).applied == 1
+    with open(live, 'a', encoding='utf-8') as f:
+        f.write('ard": 2, "result": "1-0"}\n')
+    assert feed.poll(tid).applied == 1  # Only the completed line is new
+    assert feed.poll(tid).files == 0
+    assert _results(db) == ['0-1', '1-0', '*']
+
+
+def test_tailed_offsets_survive_bad_lines_conflicts_and_restarts(tmp_path, monkeypatch):
+    db, tid = _round(str(tmp_path / "t.db"))
+    inbox = tmp_path / "feed"
+    inbox.mkdir()
+    feed = ResultFeed(db, str(inbox), settle_seconds=0)
+    live = inbox / "live.jsonl"
+
+    # A malformed line is rejected on its own; the good lines around it are saved
+    live.write_text(json.dumps({"round": 1, "board": 1, "result": "1-0"}) + "\n{not json\n"
+                    + json.dumps({"round": 1, "board": 2, "result": "0-1"}) + "\n", encoding='utf-8')
+    report = feed.poll(tid)
+    assert report.applied == 2 and len(report.rejected) == 1
+    assert _results(db) == ['1-0', '0-1', '*']
+
+    # A write conflict leaves the offset alone, so the line is read again next poll
+    def conflict(*args, **kwargs):
+        raise ingest.ConflictError("changed")
+    with open(live, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({"round": 1, "board": 3, "result": "0.5-0.5"}) + "\n")
+    with monkeypatch.context() as m:
+        m.setattr(ingest, "set_results", conflict)
+        assert feed.poll(tid).applied == 0
+    assert feed.poll(tid).applied == 1
+    assert _results(db) == ['1-0', '0-1', '0.5-0.5']
+
+    # An arbiter's correction isn't overwritten by a restarted feed replaying the file
+    db.execute_non_query("UPDATE pairings SET result = '0-1' WHERE id = 1")
+    restarted = ResultFeed(db, str(inbox), settle_seconds=0)
+    assert restarted.poll(tid).files == 0
+    assert _results(db) == ['0-1', '0-1', '0.5-0.5']
@@ -0,0 +1,78 @@
+import sys
+import os
+import json
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import instrumentation as instr
+from backend.database import Database
+from backend.instrumentation import Instrumentation, instrumentation, normalize_sql, timed
+
+
+def test_normalize_sql_ignores_literals_and_spacing():
+    assert normalize_sql("SELECT * FROM players\n  WHERE id = 12 AND name = 'O''Neil'") == \
+        "SELECT * FROM players WHERE id = ? AND name = ?"
+
+
+def test_statements_and_rows_are_counted_per_action(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('T', 'SWISS', 5)")
+    instrumentation.reset()
+
+    def add_players():
+        for i in range(3):
+            db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, f"P{i}"))
+        return db.execute_query("SELECT id FROM players WHERE tournament_id = ?", (tid,))
+
+    with instrumentation.action("outer"):
+        timed("addPlayers", add_players)()
+    db.execute_query("SELECT 1")  # Outside any action: not recorded
+
+    stats = instrumentation.stats("addPlayers")
+    assert stats['calls'] == 1
+    assert stats['statements'] == 4  # Trigger programs aren't counted as statements
+    assert stats['rows'] >= 6  # 3 fetched + 3 inserted (plus rows written by triggers)
+    assert instrumentation.stats("outer")['statements'] == 4
+    assert [s['name'] for s in instrumentation.report()] == ["outer", "addPlayers"]
+
+
+def test_repeated_statement_is_flagged_as_n_plus_one(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    instrumentation.reset()
+
+    with instrumentation.action("loop"):
+        for i in range(instr.N_PLUS_ONE_THRESHOLD):
+            db.execute_query("SELECT name FROM players WHERE id = ?", (i,))
+    with instrumentation.action("batch"):
+        db.execute_query("SELECT name FROM players WHERE id IN (1, 2, 3)")
+
+    assert instrumentation.stats("loop")['n_plus_one'] == [
+        {'sql': "SELECT name FROM players WHERE id = ?", 'count': instr.N_PLUS_ONE_THRESHOLD}
+    ]
+    assert instrumentation.stats("batch")['n_plus_one'] == []
+
+
+def test_histogram_window_and_dump(tmp_path):
+    recorder = Instrumentation()
+    for _ in range(instr.WINDOW + 10):
+        with recorder.action("click"):
+            pass
+    stats = recorder.stats("click")
+    assert stats['calls'] == instr.WINDOW + 10
+    assert sum(stats['histogram']) == instr.WINDOW
+    assert stats['histogram'][0] == instr.WINDOW  # Everything under 1 ms
+
+    path = str(tmp_path / "report.json")
+    recorder.dump(path)
+    with open(path) as f:
+        assert json.load(f)['actions'][0]['name'] == "click"
+    assert "click" in recorder.format_report()
+
+
+def test_disabled_records_nothing():
+    recorder = Instrumentation()
+    recorder.enabled = False
+    with recorder.action("click"):
+        recorder.statement("SELECT 1")
+    assert recorder.report() == []
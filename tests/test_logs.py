@@ -0,0 +1,54 @@
+import sys
+import os
+import logging
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.logs import LOG_FILE, configure_levels, parse_levels, ring_buffer, setup_logging
+from backend.tiebreaks import TieBreaks
+
+
+def test_parse_levels_skips_bad_entries():
+    assert parse_levels("backend.pairing=debug, bridge = WARNING, nonsense, x=LOUD") == {
+        'backend.pairing': logging.DEBUG, 'bridge': logging.WARNING
+    }
+
+
+def test_records_go_to_ring_buffer_and_file(tmp_path):
+    setup_logging(str(tmp_path), console=False)
+    try:
+        ring_buffer.clear()
+        logging.getLogger("backend.test").info("Loaded %d players", 12)
+        logging.getLogger("backend.test").debug("not shown at INFO")
+
+        assert [(r['level'], r['logger'], r['message']) for r in ring_buffer.records()] == [
+            ('INFO', 'backend.test', "Loaded 12 players")
+        ]
+        with open(tmp_path / LOG_FILE, encoding='utf-8') as f:
+            assert "Loaded 12 players" in f.read()
+    finally:
+        setup_logging(None, console=False)
+
+
+def test_per_module_levels(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('T', 'SWISS', 5)")
+    db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Alice')", (tid,))
+    setup_logging(None, console=False)
+    try:
+        ring_buffer.clear()
+        TieBreaks(db).update_tiebreaks(tid)
+        assert ring_buffer.records() == []  # Debug output off by default
+
+        configure_levels('WARNING', "backend.tiebreaks=DEBUG")
+        TieBreaks(db).update_tiebreaks(tid)
+        assert [r['logger'] for r in ring_buffer.records()] == ['backend.tiebreaks']
+
+        configure_levels('INFO')  # Overrides from before are dropped
+        ring_buffer.clear()
+        TieBreaks(db).update_tiebreaks(tid)
+        assert ring_buffer.records() == []
+    finally:
+        configure_levels('INFO')
@@ -0,0 +1,114 @@
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.models import Player, Pairing
+from backend.pairing.swiss import SwissEngine
+
+
+def _players(points):
+    return [Player(id=i, tournament_id=1, name=f"P{i}", rating=2000 - i, points=pts)
+            for i, pts in enumerate(points, 1)]
+
+
+def _round(boards, first_id=100):
+    """Pairings of the round being repaired: (white, black) ids, black None for a bye."""
+    return [Pairing(id=first_id + n, round_id=2, white_player_id=w, black_player_id=b,
+                    result='BYE' if b is None else '*')
+            for n, (w, b) in enumerate(boards)]
+
+
+def _ids(pairing):
+    return pairing['white'].id, pairing['black'].id if pairing['black'] else None
+
+
+def test_withdrawal_gives_the_opponent_the_bye_and_keeps_other_boards():
+    players = _players([1, 1, 1, 1, 0, 0, 0, 0])
+    current = _round([(1, 2), (3, 4), (5, 6), (7, 8)])
+    players[3].status = 'WITHDRAWN'
+
+    plan = SwissEngine().repair_round(players, [], current)
+
+    assert plan.touched == 1
+    assert [(pid, _ids(p), p.get('result')) for pid, p in plan.updates] == [(101, (3, None), 'BYE')]
+
+    # A board with a result already entered is left alone, even with an absent player
+    current[1].result = '1-0'
+    assert SwissEngine().repair_round(players, [], current).touched == 0
+
+
+def test_stranded_players_are_paired_together_or_with_the_nearest_board():
+    players = _players([2, 2, 1, 1, 1, 1, 0, 0, 0, 0])
+    current = _round([(1, 2), (3, 4), (5, 6), (7, 8), (9, 10)])
+
+    # No-shows on two boards: their opponents meet on the first of them, the other board goes
+    plan = SwissEngine().repair_round(players, [], current, absent={4, 5})
+    assert [(pid, sorted(_ids(p))) for pid, p in plan.updates] == [(101, [3, 6])]
+    assert (plan.deletes, plan.inserts) == ([102], [])
+
+    # If those two already played, the nearest board in score is opened up as well
+    history = [Pairing(id=1, round_id=1, white_player_id=3, black_player_id=6, result='1-0')]
+    plan = SwissEngine().repair_round(players, history, current, absent={4, 5})
+    assert plan.touched == 3
+    assert {pid: set(_ids(p)) for pid, p in plan.updates} == {100: {1, 3}, 102: {2, 6}}
+    assert plan.deletes == [101]
+
+
+def test_bye_holder_rejoins_and_large_rounds_repair_quickly():
+    players = _players([1, 1, 1, 1, 0, 0, 0])
+    current = _round([(1, 2), (3, 4), (5, 6), (7, None)])
+    players[0].status = 'WITHDRAWN'
+
+    plan = SwissEngine().repair_round(players, [], current)
+    assert [(pid, set(_ids(p))) for pid, p in plan.updates] == [(100, {2, 7})]
+    assert plan.deletes == [103]
+
+    # 400 boards, three withdrawals: only their boards change
+    players = _players([r % 5 for r in range(800)])
+    current = _round([(2 * n + 1, 2 * n + 2) for n in range(400)])
+    for pid in (10, 400, 777):
+        players[pid - 1].status = 'WITHDRAWN'
+    history = [Pairing(id=n, round_id=1, white_player_id=2 * n + 2, black_player_id=2 * n + 3, result='1-0')
+               for n in range(399)]
+    start = time.perf_counter()
+    plan = SwissEngine().repair_round(players, history, current)
+    elapsed = time.perf_counter() - start
+
+    assert plan.touched == 3 and not plan.inserts
+    assert sum(p['black'] is None for _, p in plan.updates) == 1  # Three stranded players: one bye
+    assert sorted([pid for pid, _ in plan.updates] + plan.deletes) == [100 + (pid - 1) // 2 for pid in (10, 400, 777)]
+    assert elapsed < 0.1
+
+
+def test_forced_rematch_stays_on_the_stranded_boards():
+    # The two stranded players have already met everyone, so no widening can help
+    players = _players([(100 - i) // 10 for i in range(100)])
+    current = _round([(2 * n + 1, 2 * n + 2) for n in range(50)])
+    history = [Pairing(id=n, round_id=1, white_player_id=pid, black_player_id=other, result='1-0')
+               for n, (pid, other) in enumerate((pid, other) for pid in (3, 6)
+                                                for other in range(1, 101) if other != pid)]
+    start = time.perf_counter()
+    plan = SwissEngine().repair_round(players, history, current, absent={4, 5})
+    elapsed = time.perf_counter() - start
+
+    assert [(pid, sorted(_ids(p))) for pid, p in plan.updates] == [(101, [3, 6])]
+    assert (plan.deletes, plan.inserts) == ([102], [])
+    assert elapsed < 0.1
+
+
+def test_out_of_budget_repair_still_avoids_rematches():
+    players = _players([1, 1, 1, 1, 1, 1, 1, 1, 0, 0])
+    current = _round([(1, 2), (3, 4), (5, 6), (7, 8), (9, 10)])
+    history = [Pairing(id=1, round_id=1, white_player_id=1, black_player_id=3, result='1-0'),
+               Pairing(id=2, round_id=1, white_player_id=5, black_player_id=7, result='1-0')]
+    engine = SwissEngine()
+    engine.REPAIR_SEARCH_LIMIT = 0  # Every backtracking search gives up at once
+
+    plan = engine.repair_round(players, history, current, absent={2, 4, 6, 8})
+
+    pairs = [set(_ids(p)) for _, p in plan.updates]
+    assert len(pairs) == 2 and {1, 3} not in pairs and {5, 7} not in pairs
+    assert sorted([pid for pid, _ in plan.updates] + plan.deletes) == [100, 101, 102, 103]
@@ -0,0 +1,111 @@
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.player_registry import PlayerRegistry
+
+
+def _make_registry(tmpdir):
+    db = Database(os.path.join(tmpdir, "test.db"))
+    return db, PlayerRegistry(db)
+
+
+def test_register_reuses_entry():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, registry = _make_registry(tmpdir)
+
+        first = registry.register("Rahul Sharma", 1800, "123456", "Delhi CC")
+        # Same FIDE id, different spelling -> same person
+        second = registry.register("R. Sharma", 1825, "123456", "Delhi CC")
+        # No FIDE id, same name + club (case-insensitive) -> same person
+        third = registry.register("Anna Berg", 1500, None, "Oslo SK")
+        fourth = registry.register("anna berg", 1510, "", "oslo sk")
+
+        assert first == second
+        assert third == fourth
+        assert registry.get(first)['rating'] == 1825
+
+
+def test_search_by_name_club_and_fide():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, registry = _make_registry(tmpdir)
+        registry.register("Magnus Carlsen", 2830, "1503014", "Offerspill")
+        registry.register("Hikaru Nakamura", 2780, "2016192", "Saint Louis")
+        registry.register("Anish Giri", 2760, "24116068", "HSG")
+
+        assert [r['name'] for r in registry.search("carl")] == ["Magnus Carlsen"]
+        assert [r['name'] for r in registry.search("saint")] == ["Hikaru Nakamura"]
+        assert [r['name'] for r in registry.search("2411606")] == ["Anish Giri"]
+        # Short query falls back to prefix search
+        assert [r['name'] for r in registry.search("an")] == ["Anish Giri"]
+        assert registry.search("   ") == []
+
+
+def test_link_players_backfills_registry():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, registry = _make_registry(tmpdir)
+        t1 = db.execute_non_query(
+            "INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)"
+        )
+        t2 = db.execute_non_query(
+            "INSERT INTO tournaments (name, type, total_rounds) VALUES ('Rapid', 'SWISS', 7)"
+        )
+        for tid in (t1, t2):
+            db.execute_non_query(
+                "INSERT INTO players (tournament_id, name, rating, club) VALUES (?, 'Lena Fischer', 1700, 'Berlin')",
+                (tid,)
+            )
+
+        registry.link_players()
+
+        rows = db.execute_query("SELECT registry_id FROM players")
+        assert len({r[0] for r in rows}) == 1
+        assert rows[0][0] is not None
+        assert db.execute_query("SELECT COUNT(*) FROM player_registry")[0][0] == 1
+
+
+def test_fide_id_keeps_namesakes_apart_and_is_backfilled():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, registry = _make_registry(tmpdir)
+        first = registry.register("Ivan Petrov", 1900, "111", "Sofia CC")
+        namesake = registry.register("Ivan Petrov", 1700, "222", "Sofia CC")
+        assert namesake != first
+
+        # An entry without a FIDE id is matched by name + club and gets the id
+        anna = registry.register("Anna Berg", 1500, None, "Oslo SK")
+        assert registry.register("Anna Berg", 1500, "333", "Oslo SK") == anna
+        assert registry.get(anna)['fide_id'] == "333"
+
+        # Bulk linking follows the same rules
+        tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+        lena = registry.register("Lena Fischer", 1700, None, "Berlin")
+        for fide in ("444", "555"):
+            db.execute_non_query(
+                "INSERT INTO players (tournament_id, name, rating, fide_id, club) VALUES (?, 'Lena Fischer', 1700, ?, 'Berlin')",
+                (tid, fide)
+            )
+        registry.link_players(tid)
+        linked = [r[0] for r in db.execute_query("SELECT registry_id FROM players ORDER BY fide_id")]
+        assert linked[0] == lena and linked[1] != lena
+        assert registry.get(lena)['fide_id'] == "444"
+        assert registry.get(linked[1])['fide_id'] == "555"
+
+
+def test_register_rolls_back_with_the_callers_transaction():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, registry = _make_registry(tmpdir)
+        try:
+            with db.get_connection() as conn:
+                registry.register("Ghost Player", 1500, "999", "Nowhere", conn)
+                # No such tournament: the foreign key fails and the whole transaction rolls back
+                conn.execute("INSERT INTO players (tournament_id, name) VALUES (12345, 'Ghost Player')")
+            assert False, "insert should have failed"
+        except sqlite3.IntegrityError:
+            pass
+        assert registry.find("Ghost Player", "999", "Nowhere") is None
+        assert registry.search("ghost") == []
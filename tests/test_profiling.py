@@ -0,0 +1,54 @@
+import sys
+import os
+import pstats
+import time
+import tracemalloc
+
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.instrumentation import instrumentation, timed
+from backend.profiling import Profiler
+
+
+def test_cpu_session_writes_pstats(tmp_path):
+    profiler = Profiler(str(tmp_path))
+    profiler.start_cpu()
+    with pytest.raises(RuntimeError):
+        profiler.start_cpu()
+    sum(i * i for i in range(10000))
+    path = profiler.stop_cpu()
+
+    assert not profiler.cpu_running
+    assert path.endswith(".pstats") and os.path.dirname(path) == str(tmp_path)
+    assert pstats.Stats(path).total_calls > 0
+
+
+def test_memory_session_writes_snapshot(tmp_path):
+    profiler = Profiler(str(tmp_path))
+    profiler.start_memory()
+    data = [bytearray(1024) for _ in range(100)]
+    path = profiler.stop_memory(top=5)
+
+    assert not tracemalloc.is_tracing()
+    with open(path, encoding='utf-8') as f:
+        assert f.readline().startswith("Traced memory:")
+    assert tracemalloc.Snapshot.load(path[:-len(".txt")] + ".tracemalloc").traces
+    del data
+
+
+def test_slow_slots_are_captured(tmp_path):
+    profiler = Profiler(str(tmp_path))
+    profiler.slow_threshold_ms = 20
+    instrumentation.slow_capture = profiler.capture
+    try:
+        assert timed("fastSlot", lambda: 1)() == 1
+        assert timed("slowSlot", lambda: time.sleep(0.03) or 2)() == 2
+    finally:
+        instrumentation.slow_capture = None
+
+    assert len(profiler.captures) == 1
+    assert os.path.basename(profiler.captures[0]).startswith("slow_slowSlot_")
+    assert not profiler.cpu_running  # The capture released the profiler
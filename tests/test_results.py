@@ -0,0 +1,80 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from backend.concurrency import ConflictError, RoundLockedError, set_round_status
+from backend.database import Database
+from backend.results import parse_results, restore_results, set_results
+
+
+def _round(path, boards=3):
+    db = Database(path)
+    tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+    rid = db.execute_non_query("INSERT INTO rounds (tournament_id, round_number) VALUES (?, 1)", (tid,))
+    pids = []
+    for i in range(boards):
+        a = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, f"W{i}"))
+        b = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, ?)", (tid, f"B{i}"))
+        pids.append(db.execute_non_query(
+            "INSERT INTO pairings (round_id, white_player_id, black_player_id) VALUES (?, ?, ?)", (rid, a, b)
+        ))
+    return db, tid, pids
+
+
+def _results(db, pids):
+    return [db.execute_query("SELECT result FROM pairings WHERE id = ?", (pid,))[0][0] for pid in pids]
+
+
+def test_parse_text_and_lists():
+    assert parse_results("12 1-0, 13 ½-½\nboard 14: 0-1; 15 =") == [
+        (12, '1-0'), (13, '0.5-0.5'), (14, '0-1'), (15, '0.5-0.5')
+    ]
+    assert parse_results([[1, '1/2-1/2'], {'board': 2, 'result': 'BYE'}]) == [(1, '0.5-0.5'), (2, 'BYE')]
+    with pytest.raises(ValueError) as err:
+        parse_results("1 1-0, 2 2-0, x 1-0, 1 0-1")
+    assert "unknown result '2-0'" in str(err.value) and "'x 1-0'" in str(err.value)
+    assert "Board 1 is given twice" in str(err.value)
+
+
+def test_all_or_nothing(tmp_path):
+    db, tid, pids = _round(str(tmp_path / "t.db"))
+
+    with pytest.raises(ValueError):
+        set_results(db, tid, 1, [(1, '1-0'), (4, '0-1')])  # No board 4
+    assert _results(db, pids) == ['*', '*', '*']
+
+    db.execute_non_query("UPDATE pairings SET result = '0-1' WHERE id = ?", (pids[1],))  # Another terminal
+    with pytest.raises(ConflictError) as err:
+        set_results(db, tid, 1, [(1, '1-0'), (2, '1-0')], expected_versions={pids[0]: 0, pids[1]: 0})
+    assert err.value.current['pairings'][0]['board'] == 2
+    assert _results(db, pids) == ['*', '0-1', '*']
+
+    outcome = set_results(db, tid, 1, [(1, '1-0'), (2, '0-1'), (3, '0.5-0.5')])
+    assert outcome.changed == [(pids[0], '*', '1-0'), (pids[2], '*', '0.5-0.5')]  # Board 2 unchanged
+    restore_results(db, [(pid, old) for pid, old, _ in outcome.changed])
+    assert _results(db, pids) == ['*', '0-1', '*']
+
+
+def test_locked_round_is_rejected(tmp_path):
+    db, tid, pids = _round(str(tmp_path / "t.db"))
+    set_round_status(db, tid, 1, 'LOCKED', 'now')
+    with pytest.raises(RoundLockedError):
+        set_results(db, tid, 1, [(1, '1-0')])
+
+
+def test_results_must_fit_the_board(tmp_path):
+    db, tid, pids = _round(str(tmp_path / "t.db"))
+    db.execute_non_query("UPDATE pairings SET black_player_id = NULL WHERE id = ?", (pids[2],))  # Bye board
+
+    with pytest.raises(ValueError) as err:
+        set_results(db, tid, 1, [(1, 'BYE'), (2, '1-0'), (3, '0.5-0.5')])
+    assert str(err.value) == ("Board 1: BYE on a board with two players; "
+                              "Board 3: '0.5-0.5' on a bye board (only BYE)")
+    assert _results(db, pids) == ['*', '*', '*']
+
+    set_results(db, tid, 1, [(1, 'FORFEIT'), (2, '0-1'), (3, 'BYE')])
+    assert _results(db, pids) == ['FORFEIT', '0-1', 'BYE']
@@ -0,0 +1,64 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.scoring import ScoringKernel
+from backend.tiebreaks import TieBreaks
+
+
+def _tournament(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    tid = db.execute_non_query(
+        "INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 3)"
+    )
+    ids = [db.execute_non_query(
+        "INSERT INTO players (tournament_id, name, rating) VALUES (?, ?, ?)", (tid, name, 1500)
+    ) for name in ("Alice", "Bob", "Carol")]
+    rid = db.execute_non_query(
+        "INSERT INTO rounds (tournament_id, round_number, status) VALUES (?, 1, 'LOCKED')", (tid,)
+    )
+    db.execute_non_query(
+        "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, ?, '0-1')",
+        (rid, ids[0], ids[1])
+    )
+    bye = db.execute_non_query(
+        "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, NULL, 'BYE')",
+        (rid, ids[2])
+    )
+    return db, tid, ids, bye
+
+
+def test_standings_cached_until_data_changes(tmp_path):
+    db, tid, ids, bye = _tournament(tmp_path)
+    kernel = ScoringKernel(db)
+
+    first = kernel.standings(tid)
+    assert [p["name"] for p in first.ranked()] == ["Bob", "Carol", "Alice"]
+    assert kernel.standings(tid) is first
+
+    db.execute_non_query("UPDATE pairings SET result = '0.5-0.5' WHERE id = ?", (bye - 1,))
+    second = kernel.standings(tid)
+    assert second is not first
+    assert second.version > first.version
+    assert [p["points"] for p in second.ranked()] == [1.0, 0.5, 0.5]
+
+
+def test_bye_credits_only_the_present_player(tmp_path):
+    db, tid, ids, bye = _tournament(tmp_path)
+    standings = ScoringKernel(db).standings(tid)
+    assert standings.players.points_of(ids[2]) == 1.0
+    assert sum(standings.players.points) == 2.0
+
+
+def test_tiebreaks_share_the_kernel(tmp_path):
+    db, tid, ids, bye = _tournament(tmp_path)
+    kernel = ScoringKernel(db)
+    standings = kernel.standings(tid)
+
+    result = TieBreaks(db, kernel).update_tiebreaks(tid)
+    assert kernel.standings(tid) is standings
+    assert result[ids[0]] == (1.0, 0.0)
+    assert result[ids[1]] == (0.0, 0.0)
@@ -0,0 +1,132 @@
+import sys
+import os
+import sqlite3
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from backend.concurrency import ConflictError, update_result
+from backend.player_registry import PlayerRegistry
+from backend.remote import RemoteChangeWatcher, RemoteDatabase, RemoteScoring
+from backend.server import TournamentServer
+
+
+@pytest.fixture
+def remote(tmp_path):
+    server = TournamentServer(str(tmp_path / "server.db"), port=0)
+    server.start()
+    host, port = server.address
+    db = RemoteDatabase(f"{host}:{port}", str(tmp_path / "client.db"))
+    yield server, db
+    db.close()
+    server.shutdown()
+
+
+def _tournament(db):
+    tid = db.execute_non_query("INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 5)")
+    a = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Alice')", (tid,))
+    b = db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Bob')", (tid,))
+    rid = db.execute_non_query(
+        "INSERT INTO rounds (tournament_id, round_number, status) VALUES (?, 1, 'IN_PROGRESS')", (tid,)
+    )
+    pid = db.execute_non_query(
+        "INSERT INTO pairings (round_id, white_player_id, black_player_id) VALUES (?, ?, ?)", (rid, a, b)
+    )
+    return tid, rid, pid, a
+
+
+def test_statements_and_transactions(remote):
+    server, db = remote
+    tid, rid, pid, alice = _tournament(db)
+    assert db.execute_query("SELECT name FROM players WHERE id = ?", (alice,)) == [("Alice",)]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.get_connection() as conn:
+            conn.execute("UPDATE players SET name = 'Alicia' WHERE id = ?", (alice,))
+            conn.execute("INSERT INTO rounds (tournament_id, round_number) VALUES (?, 1)", (tid,))
+    # Rolled back as a whole
+    assert server.db.execute_query("SELECT name FROM players WHERE id = ?", (alice,)) == [("Alice",)]
+
+
+def test_backend_modules_work_remotely(remote):
+    server, db = remote
+    tid, rid, pid, alice = _tournament(db)
+
+    assert update_result(db, pid, '1-0', expected_version=0) == 1
+    with pytest.raises(ConflictError):
+        update_result(db, pid, '0-1', expected_version=0)
+
+    registry = PlayerRegistry(db)
+    registry.register("Magnus Carlsen", 2830, "1503014", "Norway")
+    assert [r['name'] for r in registry.search("carl")] == ["Magnus Carlsen"]
+
+
+def test_standings_are_served_from_the_shared_cache(remote):
+    server, db = remote
+    tid, rid, pid, alice = _tournament(db)
+    db.execute_non_query("UPDATE pairings SET result = '1-0' WHERE id = ?", (pid,))
+    db.execute_non_query("UPDATE rounds SET status = 'LOCKED' WHERE id = ?", (rid,))
+
+    scoring = RemoteScoring(db)
+    first = scoring.standings(tid)
+    assert [p["name"] for p in first.ranked()] == ["Alice", "Bob"]
+    assert first.players.points_of(alice) == 1.0
+    assert scoring.standings(tid) is first
+    assert server.scoring.standings(tid).version == first.version
+
+
+def test_remote_watcher(remote):
+    server, db = remote
+    tid, rid, pid, alice = _tournament(db)
+    watcher = RemoteChangeWatcher(db)
+    watcher.poll()
+    assert watcher.poll() == set()
+    server.db.execute_non_query("UPDATE pairings SET result = '0-1' WHERE id = ?", (pid,))
+    assert watcher.poll() == {tid}
+
+
+def test_executescript_cannot_end_a_client_transaction(remote):
+    server, db = remote
+    tid, rid, pid, alice = _tournament(db)
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        with db.get_connection() as conn:
+            conn.execute("UPDATE players SET name = 'Alicia' WHERE id = ?", (alice,))
+            conn.executescript("UPDATE players SET name = 'Bob' WHERE 0;")
+    # The half-done transaction was rolled back, not committed by the script
+    assert server.db.execute_query("SELECT name FROM players WHERE id = ?", (alice,)) == [("Alice",)]
+
+    # Outside a transaction (schema setup), scripts still run
+    with db.get_connection() as conn:
+        conn.executescript("CREATE TABLE IF NOT EXISTS notes (id INTEGER PRIMARY KEY);")
+    assert server.db.execute_query("SELECT COUNT(*) FROM notes") == [(0,)]
+
+
+def test_stalled_transaction_is_rolled_back_and_writes_take_turns(tmp_path):
+    server = TournamentServer(str(tmp_path / "server.db"), port=0, session_idle_timeout=0.3)
+    server.start()
+    address = "%s:%d" % server.address
+    stalled = RemoteDatabase(address, str(tmp_path / "a.db"))
+    other = RemoteDatabase(address, str(tmp_path / "b.db"))
+    try:
+        tid, rid, pid, alice = _tournament(other)
+
+        # A terminal starts a write and goes quiet: the other's write waits, then goes through
+        sid = stalled.rpc('session_begin')
+        stalled.rpc('session_execute', sid, "UPDATE players SET name = 'Stalled' WHERE id = ?", [alice])
+        start = time.perf_counter()
+        other.execute_non_query("UPDATE players SET name = 'Alicia' WHERE id = ?", (alice,))
+        assert 0.2 < time.perf_counter() - start < 5
+        assert server.db.execute_query("SELECT name FROM players WHERE id = ?", (alice,)) == [("Alicia",)]
+
+        # The stalled terminal was dropped; it reconnects on its next call
+        with pytest.raises((ConnectionError, OSError)):
+            stalled.rpc('session_end', sid, True)
+        assert stalled.execute_query("SELECT name FROM players WHERE id = ?", (alice,)) == [("Alicia",)]
+    finally:
+        stalled.close()
+        other.close()
+        server.shutdown()
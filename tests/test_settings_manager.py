@@ -0,0 +1,53 @@
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from backend.settings_manager import SettingsManager, DEFAULT_SETTINGS
+
+
+def test_defaults_and_typed_values():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        settings = SettingsManager(os.path.join(tmpdir, "test.db"))
+        assert settings.get_all() == DEFAULT_SETTINGS
+        assert settings.value('undo_stack_size') == 10
+        assert settings.value('auto_backup') is True
+        assert settings.value('backup_mode') == 'full'
+
+
+def test_write_through_and_validation():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "test.db")
+        settings = SettingsManager(path)
+        settings.set_many({'undo_stack_size': '25', 'auto_backup': False})
+
+        with pytest.raises(ValueError):
+            settings.set('undo_stack_size', '0')
+        with pytest.raises(ValueError):
+            settings.set_many({'font_size': '16', 'backup_mode': 'sometimes'})
+
+        reopened = SettingsManager(path)
+        assert reopened.value('undo_stack_size') == 25
+        assert reopened.get('auto_backup') == 'false'
+        assert reopened.get('font_size') == '14'  # rejected batch wrote nothing
+
+
+def test_change_callbacks():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        settings = SettingsManager(os.path.join(tmpdir, "test.db"))
+        seen = []
+        settings.subscribe('undo_stack_size', lambda key, value: seen.append((key, value)))
+        everything = []
+        settings.subscribe('*', lambda key, value: everything.append(key))
+
+        settings.set('undo_stack_size', 20)
+        settings.set('undo_stack_size', 20)  # unchanged: no callback
+        settings.set('font_size', 16)
+        settings.reset_defaults()
+
+        assert seen == [('undo_stack_size', 20), ('undo_stack_size', 10)]
+        assert sorted(everything) == ['font_size', 'font_size', 'undo_stack_size', 'undo_stack_size']
@@ -0,0 +1,96 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.database import Database
+from backend.scoring import ScoringKernel
+from backend.standings import MaterializedStandings
+
+
+def _setup(tmp_path):
+    db = Database(str(tmp_path / "t.db"))
+    standings = MaterializedStandings(db)
+    standings.enable()
+    tid = db.execute_non_query(
+        "INSERT INTO tournaments (name, type, total_rounds) VALUES ('Open', 'SWISS', 3)"
+    )
+    ids = [db.execute_non_query(
+        "INSERT INTO players (tournament_id, name, rating) VALUES (?, ?, 1500)", (tid, name)
+    ) for name in ("Alice", "Bob", "Carol", "Dave")]
+    return db, standings, tid, ids
+
+
+def _play_round(db, tid, number, games):
+    rid = db.execute_non_query(
+        "INSERT INTO rounds (tournament_id, round_number, status) VALUES (?, ?, 'IN_PROGRESS')", (tid, number)
+    )
+    pids = [db.execute_non_query(
+        "INSERT INTO pairings (round_id, white_player_id, black_player_id, result) VALUES (?, ?, ?, ?)",
+        (rid, w, b, res)
+    ) for w, b, res in games]
+    return rid, pids
+
+
+def _points(standings, tid):
+    return {row['id']: row['points'] for row in standings.get(tid)}
+
+
+def test_triggers_follow_locks_and_result_edits(tmp_path):
+    db, standings, tid, (a, b, c, d) = _setup(tmp_path)
+    rid, (g1, g2) = _play_round(db, tid, 1, [(a, b, '1-0'), (c, d, '0.5-0.5')])
+
+    # Unlocked rounds don't count
+    assert set(_points(standings, tid).values()) == {0.0}
+
+    db.execute_non_query("UPDATE rounds SET status = 'LOCKED' WHERE id = ?", (rid,))
+    assert _points(standings, tid) == {a: 1.0, b: 0.0, c: 0.5, d: 0.5}
+    assert standings.get(tid)[0]['name'] == "Alice"
+
+    db.execute_non_query("UPDATE pairings SET result = '0-1' WHERE id = ?", (g1,))
+    assert _points(standings, tid)[b] == 1.0
+    assert _points(standings, tid)[a] == 0.0
+
+    db.execute_non_query("UPDATE rounds SET status = 'IN_PROGRESS' WHERE id = ?", (rid,))
+    assert set(_points(standings, tid).values()) == {0.0}
+    assert standings.check(tid) == []
+
+
+def test_matches_scoring_kernel_and_counts(tmp_path):
+    db, standings, tid, (a, b, c, d) = _setup(tmp_path)
+    r1, _ = _play_round(db, tid, 1, [(a, b, '1-0'), (c, None, 'BYE')])
+    r2, _ = _play_round(db, tid, 2, [(c, a, '0.5-0.5'), (b, d, 'FORFEIT')])
+    db.execute_non_query("UPDATE rounds SET status = 'LOCKED' WHERE tournament_id = ?", (tid,))
+
+    kernel = ScoringKernel(db).standings(tid)
+    rows = {row['id']: row for row in standings.get(tid)}
+    for pid, row in rows.items():
+        assert row['points'] == kernel.players.points_of(pid)
+    assert (rows[a]['games_played'], rows[a]['wins'], rows[a]['draws']) == (2, 1, 1)
+    assert (rows[c]['games_played'], rows[c]['byes']) == (1, 1)
+    assert rows[d]['games_played'] == 0
+
+    # Deleting a locked round takes its results out again
+    db.execute_non_query("DELETE FROM rounds WHERE id = ?", (r2,))
+    assert _points(standings, tid) == {a: 1.0, b: 0.0, c: 1.0, d: 0.0}
+    assert standings.check(tid) == []
+
+
+def test_check_reports_and_repairs_drift(tmp_path):
+    db, standings, tid, (a, b, c, d) = _setup(tmp_path)
+    rid, _ = _play_round(db, tid, 1, [(a, b, '1-0')])
+    db.execute_non_query("UPDATE rounds SET status = 'LOCKED' WHERE id = ?", (rid,))
+
+    db.execute_non_query("UPDATE standings SET points = 5 WHERE player_id = ?", (b,))
+    mismatches = standings.check(tid, repair=True)
+    assert [(m.player_id, m.column, m.stored, m.expected) for m in mismatches] == [(b, 'points', 5.0, 0.0)]
+    assert standings.check(tid) == []
+
+
+def test_disable_drops_triggers(tmp_path):
+    db, standings, tid, ids = _setup(tmp_path)
+    assert standings.is_enabled()
+    standings.disable()
+    assert not standings.is_enabled()
+    db.execute_non_query("INSERT INTO players (tournament_id, name) VALUES (?, 'Eve')", (tid,))
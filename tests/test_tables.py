@@ -0,0 +1,61 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.models import Player, Pairing
+from backend.pairing.swiss import SwissEngine
+from backend.tables import PlayerTable, PairingTable, score_points
+from backend.tiebreaks import TieBreaks
+
+
+def _tables():
+    players = PlayerTable.from_rows([
+        (1, "Alice", 2000, "A", "ACTIVE"),
+        (2, "Bob", 1900, "B", "ACTIVE"),
+        (3, "Carol", 1800, "A", "ACTIVE"),
+        (4, "Dave", 1700, "B", "WITHDRAWN"),
+    ])
+    pairings = PairingTable.from_rows([
+        (1, 1, 2, '1-0', True),
+        (1, 3, 4, '0.5-0.5', True),
+        (2, 1, 3, '0-1', True),
+        (2, 2, None, 'BYE', True),
+        (3, 1, 4, '1-0', False),  # round not locked yet
+    ])
+    return players, pairings
+
+
+def test_score_points():
+    players, pairings = _tables()
+    score_points(players, pairings)
+    assert list(players.points) == [1.0, 1.0, 1.5, 0.5]
+
+    score_points(players, pairings, locked_only=False)
+    assert players.points_of(1) == 2.0
+
+
+def test_tiebreaks_from_tables():
+    players, pairings = _tables()
+    score_points(players, pairings)
+    buchholz, sb = TieBreaks.compute(players, pairings)
+
+    # Alice met Bob (1.0) and Carol (1.5); beat Bob
+    assert buchholz[players.row_of(1)] == 2.5
+    assert sb[players.row_of(1)] == 1.0
+    # Carol drew Dave (0.5) and beat Alice (1.0)
+    assert sb[players.row_of(3)] == 1.25
+
+
+def test_swiss_accepts_pairing_table():
+    players = [Player(id=i, tournament_id=1, name=f"P{i}", rating=2000 - i) for i in range(1, 5)]
+    history = PairingTable.from_rows([(1, 1, 2, '1-0', True), (1, 3, 4, '0-1', True)])
+    legacy = [Pairing(id=1, round_id=1, white_player_id=1, black_player_id=2, result='1-0'),
+              Pairing(id=2, round_id=1, white_player_id=3, black_player_id=4, result='0-1')]
+
+    engine = SwissEngine()
+    from_table = engine.pair_round(list(players), history, 2)
+    from_objects = engine.pair_round(list(players), legacy, 2)
+    as_ids = lambda pairs: [(p['white'].id, p['black'].id if p['black'] else None) for p in pairs]
+    assert as_ids(from_table) == as_ids(from_objects)
@@ -6,12 +6,52 @@ import "components"
 import "design"
 
 Page {
+    id: dashboardPage
     title: "Tournament Library"
     background: Rectangle { color: "transparent" }
     
+    // Tournament whose card was clicked; Players opens once the backend has loaded it
+    property int openingTid: -1
+    
     // Properties for filtering
     property string searchText: ""
     property string filterType: "All"
+    property string filterStatus: ""  // "" = any status
+    
+    // Keep the filters between sessions
+    Component.onCompleted: {
+        var saved = backend ? backend.uiState("dashboardFilter") : null
+        if (typeof saved === "string")
+            filterType = saved
+        var savedStatus = backend ? backend.uiState("dashboardStatus") : null
+        if (typeof savedStatus === "string")
+            filterStatus = savedStatus
+    }
+    onFilterTypeChanged: if (backend) backend.setUiState("dashboardFilter", filterType)
+    onFilterStatusChanged: if (backend) backend.setUiState("dashboardStatus", filterStatus)
+    
+    // The list model filters in the database
+    Binding { target: backend ? backend.tournamentList : null; property: "search"; value: searchText }
+    Binding { target: backend ? backend.tournamentList : null; property: "typeFilter"; value: filterType === "All" ? "" : filterType }
+    Binding { target: backend ? backend.tournamentList : null; property: "statusFilter"; value: filterStatus }
+    
+    Connections {
+        target: backend
+        function onTournamentOpened(tid) {
+            if (tid !== openingTid)
+                return
+            openingTid = -1
+            var obj = dashboardPage
+            while (obj) {
+                if (obj.objectName === "mainStackView") {
+                    obj.push("Players.qml")
+                    return
+                }
+                obj = obj.parent
+            }
+            console.error("Could not find stackView!")
+        }
+    }
     
     ColumnLayout {
         anchors.fill: parent
@@ -52,6 +92,22 @@ Page {
                     }
                 }
                 
+                AppButton {
+                    text: "Archive Finished"
+                    iconLeft: "🗄"
+                    size: "lg"
+                    variant: "secondary"
+                    onClicked: backend.archiveFinishedTournaments()
+                }
+                
+                AppButton {
+                    text: "Maintenance"
+                    iconLeft: "🔧"
+                    size: "lg"
+                    variant: "ghost"
+                    onClicked: backend.runMaintenance()
+                }
+                
                 AppButton {
                     text: "New Tournament"
                     iconLeft: "+"
@@ -121,16 +177,46 @@ Page {
                     }
                 }
                 
+                ComboBox {
+                    id: statusBox
+                    textRole: "label"
+                    model: [
+                        { label: "Any status", value: "" },
+                        { label: "Setup", value: "SETUP" },
+                        { label: "Active", value: "ACTIVE" },
+                        { label: "Finished", value: "FINISHED" },
+                        { label: "Archived", value: "ARCHIVED" }
+                    ]
+                    currentIndex: {
+                        for (var i = 0; i < model.length; i++)
+                            if (model[i].value === filterStatus) return i
+                        return 0
+                    }
+                    onActivated: filterStatus = model[index].value
+                    Layout.preferredWidth: ScaleManager.scaleSize(160)
+                    
+                    background: Rectangle {
+                        implicitHeight: ScaleManager.scaleSize(36)
+                        color: Colors.surfaceHighlight
+                        radius: ScaleManager.scaleRadius(Spacing.radiusFull)
+                    }
+                }
+                
                 Item { Layout.fillWidth: true }
+                
+                Text {
+                    text: backend ? backend.tournamentList.count + " tournaments" : ""
+                    color: Colors.textSecondary
+                    font.family: Typography.primary
+                    font.pixelSize: ScaleManager.scaleFontSize(Typography.small)
+                }
             }
         }
         
-        // Grid
-        ScrollView {
+        // Grid (fetches more tournaments as it scrolls)
+        Item {
             Layout.fillWidth: true
             Layout.fillHeight: true
-            clip: true
-            contentWidth: availableWidth
             
             // Empty State
             Column {
@@ -159,7 +245,9 @@ Page {
                     }
                     
                     Text {
-                        text: "Create your first tournament to get started"
+                        text: searchText !== "" || filterType !== "All" || filterStatus !== ""
+                              ? "Try another search or filter"
+                              : "Create your first tournament to get started"
                         color: Colors.textSecondary
                         font.family: Typography.primary
                         font.pixelSize: ScaleManager.scaleFontSize(Typography.body)
@@ -177,63 +265,60 @@ Page {
                 }
             }
             
-            Flow {
-                width: parent.width
-                spacing: ScaleManager.scaleSpacing(Spacing.lg)
-                padding: ScaleManager.scaleSpacing(Spacing.paddingPage)
+            GridView {
+                id: grid
+                anchors.fill: parent
+                anchors.margins: ScaleManager.scaleSpacing(Spacing.paddingPage)
+                clip: true
+                model: backend ? backend.tournamentList : null
+                cellWidth: ScaleManager.scaleSize(320) + ScaleManager.scaleSpacing(Spacing.lg)
+                cellHeight: ScaleManager.scaleSize(200) + ScaleManager.scaleSpacing(Spacing.lg)
                 
-                Repeater {
-                    id: grid
-                    model: backend ? backend.recentTournaments : []
+                ScrollBar.vertical: ScrollBar {}
+                
+                delegate: Item {
+                    width: grid.cellWidth
+                    height: grid.cellHeight
                     
-                    delegate: Item {
-                        property bool matchesSearch: model.modelData.name.toLowerCase().includes(searchText.toLowerCase())
-                        property bool matchesType: filterType === "All" || model.modelData.type === filterType
-                        visible: matchesSearch && matchesType
+                    TournamentCard {
+                        id: card
+                        width: parent.width - ScaleManager.scaleSpacing(Spacing.lg)
                         
-                        width: visible ? card.width : 0
-                        height: visible ? card.height : 0
+                        tName: model.name
+                        tType: model.type
+                        tStatus: model.status
+                        tDate: model.date || ""
+                        tCurrentRound: model.currentRound || 0
+                        tTotalRounds: model.totalRounds || 0
+                        tId: model.tid
+                        tVenue: model.venue || ""
+                        tPlayerCount: model.playerCount || 0
+                        tPendingResults: model.resultsPending || 0
+                        tArchived: model.archived || false
                         
-                        TournamentCard {
-                            id: card
-                            visible: parent.visible
-                            
-                            tName: model.modelData.name
-                            tType: model.modelData.type
-                            tStatus: model.modelData.status
-                            tDate: model.modelData.date
-                            tCurrentRound: model.modelData.current_round
-                            tTotalRounds: model.modelData.total_rounds
-                            tId: model.modelData.id
-                            tVenue: model.modelData.venue || ""
-                            
-                            onCardClicked: {
-                                console.log("Card clicked, loading tournament ID:", tid)
-                                backend.loadTournament(tid)
-                                
-                                var obj = parent
-                                while (obj) {
-                                    if (obj.objectName === "mainStackView") {
-                                        obj.push("Players.qml")
-                                        return
-                                    }
-                                    obj = obj.parent
-                                }
-                                console.error("Could not find stackView!")
-                            }
-                            
-                            onDeleteClicked: {
-                                confirmDeleteDialog.targetId = tid
-                                confirmDeleteDialog.open()
-                            }
-                            
-                            onCloneClicked: {
-                                cloneDialog.sourceTid = tid
-                                cloneName.text = "Copy of " + tName
-                                cloneVenue.text = tVenue
-                                cloneRounds.value = tTotalRounds
-                                cloneDialog.open()
+                        onCardClicked: {
+                            if (tArchived) {
+                                archivedDialog.targetId = tid
+                                archivedDialog.targetName = tName
+                                archivedDialog.open()
+                                return
                             }
+                            console.log("Card clicked, loading tournament ID:", tid)
+                            openingTid = tid
+                            backend.loadTournament(tid)
+                        }
+                        
+                        onDeleteClicked: {
+                            confirmDeleteDialog.targetId = tid
+                            confirmDeleteDialog.open()
+                        }
+                        
+                        onCloneClicked: {
+                            cloneDialog.sourceTid = tid
+                            cloneName.text = "Copy of " + tName
+                            cloneVenue.text = tVenue
+                            cloneRounds.value = tTotalRounds
+                            cloneDialog.open()
                         }
                     }
                 }
@@ -615,5 +700,86 @@ Page {
             }
         }
     }
+    
+    // ArchivedDialog
+    Dialog {
+        id: archivedDialog
+        property int targetId: -1
+        property string targetName: ""
+        
+        x: (parent.width - width) / 2
+        y: (parent.height - height) / 2
+        width: ScaleManager.scaleSize(440)
+        modal: true
+        parent: Overlay.overlay
+        
+        background: Rectangle {
+            color: Colors.surfaceElevated
+            radius: ScaleManager.scaleRadius(Spacing.radiusLg)
+            
+            layer.enabled: true
+            layer.effect: DropShadow {
+                radius: 32
+                samples: 48
+                color: Colors.shadowDark
+                verticalOffset: ScaleManager.scaleSize(8)
+            }
+        }
+        
+        contentItem: ColumnLayout {
+            spacing: ScaleManager.scaleSpacing(Spacing.xl)
+            
+            Text {
+                text: archivedDialog.targetName
+                color: Colors.textPrimary
+                font.family: Typography.primary
+                font.pixelSize: ScaleManager.scaleFontSize(Typography.h3)
+                font.weight: Typography.bold
+                elide: Text.ElideRight
+                Layout.fillWidth: true
+            }
+            
+            Text {
+                text: "This tournament is archived. Print its standings as they are, or restore it to the working database to open and edit it."
+                color: Colors.textSecondary
+                font.family: Typography.primary
+                font.pixelSize: ScaleManager.scaleFontSize(Typography.body)
+                wrapMode: Text.WordWrap
+                Layout.fillWidth: true
+            }
+            
+            // Actions
+            RowLayout {
+                Layout.alignment: Qt.AlignRight
+                spacing: ScaleManager.scaleSpacing(Spacing.md)
+                
+                AppButton {
+                    text: "Cancel"
+                    variant: "ghost"
+                    onClicked: archivedDialog.close()
+                }
+                
+                AppButton {
+                    text: "Print Standings"
+                    variant: "secondary"
+                    iconLeft: "🖨"
+                    onClicked: {
+                        backend.printArchivedStandings(archivedDialog.targetId)
+                        archivedDialog.close()
+                    }
+                }
+                
+                AppButton {
+                    text: "Restore & Open"
+                    variant: "primary"
+                    onClicked: {
+                        // Restoring loads the tournament, which opens Players
+                        openingTid = archivedDialog.targetId
+                        backend.restoreArchivedTournament(archivedDialog.targetId)
+                        archivedDialog.close()
+                    }
+                }
+            }
+        }
+    }
 }
-
@@ -1,6 +1,7 @@
 import QtQuick 2.15
 import QtQuick.Controls 2.15
 import QtQuick.Layouts 1.15
+import QtQuick.Window 2.15
 import QtGraphicalEffects 1.15
 import "components"
 import "design"
@@ -13,6 +14,34 @@ ApplicationWindow {
     title: "Chess Tournament Manager"
     color: Colors.background
     
+    // Window geometry from the last session (saved through the debounced app state)
+    Component.onCompleted: {
+        var geometry = backend ? backend.uiState("window") : null
+        if (!geometry || typeof geometry.width !== "number" || typeof geometry.height !== "number")
+            return
+        width = Math.max(geometry.width, 800)
+        height = Math.max(geometry.height, 600)
+        if (typeof geometry.x === "number" && typeof geometry.y === "number") {
+            x = geometry.x
+            y = geometry.y
+        }
+        if (geometry.maximized === true)
+            visibility = Window.Maximized
+    }
+    
+    onClosing: {
+        if (backend) {
+            var maximized = visibility === Window.Maximized
+            // Keep the normal size of a maximized window, so it restores sensibly
+            var previous = backend.uiState("window")
+            if (maximized && previous && typeof previous.width === "number")
+                backend.setUiState("window", { x: previous.x, y: previous.y, width: previous.width,
+                                               height: previous.height, maximized: true })
+            else
+                backend.setUiState("window", { x: x, y: y, width: width, height: height, maximized: maximized })
+        }
+    }
+    
     // Zoom shortcuts
     Shortcut {
         sequence: "Ctrl++"
@@ -39,6 +68,12 @@ ApplicationWindow {
         }
     }
     
+    // Ctrl+Shift+D Diagnostics
+    Shortcut {
+        sequence: "Ctrl+Shift+D"
+        onActivated: diagnosticsPanel.open()
+    }
+    
     // Layout
     RowLayout {
         anchors.fill: parent
@@ -312,6 +347,10 @@ ApplicationWindow {
         }
     }
     
+    DiagnosticsPanel {
+        id: diagnosticsPanel
+    }
+    
     // Notifications
     AppToast {
         id: globalToast
@@ -1,6 +1,7 @@
 import QtQuick 2.15
 import QtQuick.Controls 2.15
 import QtQuick.Layouts 1.15
+import QtQuick.Dialogs 1.3 as Dialogs
 import QtGraphicalEffects 1.15
 import "components"
 import "design"
@@ -97,6 +98,38 @@ Page {
                     }
                 }
                 
+                AppButton {
+                    text: "Paste Results"
+                    variant: "ghost"
+                    iconLeft: "📝"
+                    enabled: backend && backend.viewingRoundNumber > 0 && !backend.isRoundLocked
+                    onClicked: bulkResultsDialog.open()
+                }
+                
+                AppButton {
+                    text: "Repair Pairings"
+                    variant: "ghost"
+                    iconLeft: "🩹"
+                    visible: backend && backend.viewingRoundNumber > 0 && !backend.isViewingPastRound && !backend.isRoundLocked
+                    onClicked: repairDialog.open()
+                }
+                
+                AppButton {
+                    text: "Import PGN"
+                    variant: "ghost"
+                    iconLeft: "♟"
+                    enabled: backend && backend.currentTournament
+                    onClicked: { pgnFileDialog.exporting = false; pgnFileDialog.open() }
+                }
+                
+                AppButton {
+                    text: "Export PGN"
+                    variant: "ghost"
+                    iconLeft: "💾"
+                    enabled: backend && backend.currentTournament
+                    onClicked: { pgnFileDialog.exporting = true; pgnFileDialog.open() }
+                }
+                
                 AppButton {
                     text: "Print Sheet"
                     variant: "ghost"
@@ -541,9 +574,178 @@ Page {
         }
     }
 
+    // Bulk Result Entry Dialog
+    Dialog {
+        id: bulkResultsDialog
+        modal: true
+        x: (parent.width - width) / 2
+        y: (parent.height - height) / 2
+        width: ScaleManager.scaleSize(480)
+        parent: Overlay.overlay
+        onOpened: {
+            bulkResultsText.text = ""
+            bulkResultsText.forceActiveFocus()
+        }
+        
+        background: Rectangle {
+            color: Colors.surfaceElevated
+            radius: ScaleManager.scaleRadius(Spacing.radiusLg)
+        }
+        
+        contentItem: ColumnLayout {
+            spacing: ScaleManager.scaleSpacing(Spacing.xl)
+            
+            Text {
+                text: "Enter Results - Round " + (backend ? backend.viewingRoundNumber : "")
+                font.family: Typography.primary
+                font.pixelSize: ScaleManager.scaleFontSize(Typography.h3)
+                font.weight: Typography.bold
+                color: Colors.textPrimary
+            }
+
+            Text {
+                text: "One board and result per entry, separated by commas or new lines, e.g. \"12 1-0, 13 ½-½, 14 0-1\". Nothing is saved unless every entry is valid."
+                font.family: Typography.primary
+                color: Colors.textSecondary
+                wrapMode: Text.WordWrap
+                Layout.fillWidth: true
+            }
+            
+            ScrollView {
+                Layout.fillWidth: true
+                Layout.preferredHeight: ScaleManager.scaleSize(200)
+                
+                TextArea {
+                    id: bulkResultsText
+                    placeholderText: "12 1-0\n13 ½-½\n14 0-1"
+                    wrapMode: TextEdit.Wrap
+                    color: Colors.textPrimary
+                    font.family: Typography.primary
+                    background: Rectangle {
+                        color: Colors.background
+                        radius: ScaleManager.scaleRadius(Spacing.radiusMd)
+                        border.color: Colors.border
+                        border.width: Spacing.borderNormal
+                    }
+                }
+            }
+            
+            RowLayout {
+                Layout.alignment: Qt.AlignRight
+                spacing: ScaleManager.scaleSpacing(Spacing.md)
+                
+                AppButton { text: "Cancel"; variant: "ghost"; onClicked: bulkResultsDialog.close() }
+                AppButton {
+                    text: "Save Results"; variant: "primary"
+                    enabled: bulkResultsText.text.trim() !== ""
+                    onClicked: {
+                        backend.setResults(backend.viewingRoundNumber, bulkResultsText.text)
+                        bulkResultsDialog.close()
+                    }
+                }
+            }
+        }
+    }
+
+    // Pairing Repair Dialog (late withdrawals / no-shows)
+    Dialog {
+        id: repairDialog
+        modal: true
+        x: (parent.width - width) / 2
+        y: (parent.height - height) / 2
+        width: ScaleManager.scaleSize(480)
+        parent: Overlay.overlay
+        
+        property var absentIds: []
+        property var roundPlayers: []
+        
+        onOpened: {
+            var list = []
+            if (backend) {
+                for (var i = 0; i < backend.pairingList.length; i++) {
+                    var p = backend.pairingList[i]
+                    if (p.result !== "*" && p.result !== "BYE") continue
+                    if (p.white_player_id) list.push({ id: p.white_player_id, name: p.white_player_name })
+                    if (p.black_player_id) list.push({ id: p.black_player_id, name: p.black_player_name })
+                }
+            }
+            roundPlayers = list
+            absentIds = []
+        }
+        
+        background: Rectangle {
+            color: Colors.surfaceElevated
+            radius: ScaleManager.scaleRadius(Spacing.radiusLg)
+        }
+        
+        contentItem: ColumnLayout {
+            spacing: ScaleManager.scaleSpacing(Spacing.xl)
+            
+            Text {
+                text: "Repair Pairings - Round " + (backend ? backend.viewingRoundNumber : "")
+                font.family: Typography.primary
+                font.pixelSize: ScaleManager.scaleFontSize(Typography.h3)
+                font.weight: Typography.bold
+                color: Colors.textPrimary
+            }
+
+            Text {
+                text: "Withdrawn players are taken out automatically. Tick players who did not show up. Only their boards and the bye are re-paired; every other board stays as printed."
+                font.family: Typography.primary
+                color: Colors.textSecondary
+                wrapMode: Text.WordWrap
+                Layout.fillWidth: true
+            }
+            
+            ListView {
+                Layout.fillWidth: true
+                Layout.preferredHeight: ScaleManager.scaleSize(240)
+                clip: true
+                model: repairDialog.roundPlayers
+                delegate: CheckBox {
+                    text: modelData.name
+                    checked: repairDialog.absentIds.indexOf(modelData.id) >= 0
+                    onToggled: {
+                        var ids = repairDialog.absentIds.filter(function(pid) { return pid !== modelData.id })
+                        if (checked) ids.push(modelData.id)
+                        repairDialog.absentIds = ids
+                    }
+                }
+            }
+            
+            RowLayout {
+                Layout.alignment: Qt.AlignRight
+                spacing: ScaleManager.scaleSpacing(Spacing.md)
+                
+                AppButton { text: "Cancel"; variant: "ghost"; onClicked: repairDialog.close() }
+                AppButton {
+                    text: "Repair"; variant: "primary"
+                    onClicked: {
+                        backend.repairPairings(repairDialog.absentIds)
+                        repairDialog.close()
+                    }
+                }
+            }
+        }
+    }
+
     PairingChoiceDialog {
         id: pairingChoiceDialog
         onAutoSelected: backend.setupNextRound("AUTO")
         onManualSelected: backend.setupNextRound("MANUAL")
     }
+    
+    Dialogs.FileDialog {
+        id: pgnFileDialog
+        property bool exporting: false
+        title: exporting ? "Export Games" : "Import Games"
+        nameFilters: ["PGN files (*.pgn)"]
+        selectExisting: !exporting
+        selectFolder: false
+        onAccepted: {
+            var path = fileUrl.toString().replace("file:///", "")
+            if (exporting) backend.exportPgn(path)
+            else backend.importPgn(path)
+        }
+    }
 }
@@ -309,6 +309,72 @@ Page {
                         Layout.fillWidth: true
                         iconPrefix: "👤"
                         onAccepted: addButton.clicked()
+                        // Players from earlier tournaments, looked up as the name is typed
+                        onTextChanged: registryTimer.restart()
+                        
+                        Timer {
+                            id: registryTimer
+                            interval: 150
+                            onTriggered: {
+                                var query = pName.text.trim()
+                                registryPopup.matches = (query.length >= 2 && pName.activeFocus && backend)
+                                    ? backend.searchRegistry(query) : []
+                                if (registryPopup.matches.length > 0)
+                                    registryPopup.open()
+                                else
+                                    registryPopup.close()
+                            }
+                        }
+                        
+                        Popup {
+                            id: registryPopup
+                            property var matches: []
+                            y: pName.height + ScaleManager.scaleSpacing(Spacing.xs)
+                            width: pName.width
+                            height: Math.min(registryList.contentHeight, ScaleManager.scaleSize(240)) + padding * 2
+                            padding: ScaleManager.scaleSpacing(Spacing.xs)
+                            closePolicy: Popup.CloseOnEscape | Popup.CloseOnPressOutside
+                            
+                            background: Rectangle {
+                                color: Colors.surfaceElevated
+                                radius: ScaleManager.scaleRadius(Spacing.radiusMd)
+                                border.color: Colors.border
+                                border.width: Spacing.borderThin
+                            }
+                            
+                            contentItem: ListView {
+                                id: registryList
+                                clip: true
+                                model: registryPopup.matches
+                                delegate: ItemDelegate {
+                                    width: registryList.width
+                                    contentItem: Column {
+                                        Text {
+                                            text: modelData.name + (modelData.rating ? " (" + modelData.rating + ")" : "")
+                                            color: Colors.textPrimary
+                                            font.family: Typography.primary
+                                            font.pixelSize: ScaleManager.scaleFontSize(Typography.body)
+                                        }
+                                        Text {
+                                            visible: text !== ""
+                                            text: [modelData.club, modelData.fide_id ? "FIDE " + modelData.fide_id : ""]
+                                                  .filter(function(part) { return part }).join(" · ")
+                                            color: Colors.textSecondary
+                                            font.family: Typography.primary
+                                            font.pixelSize: ScaleManager.scaleFontSize(Typography.small)
+                                        }
+                                    }
+                                    onClicked: {
+                                        // Registered from the registry entry itself, keeping one record per person
+                                        backend.addRegistryPlayer(modelData.id)
+                                        registryPopup.close()
+                                        pName.text = ""
+                                        pClub.text = ""
+                                        pName.forceActiveFocus()
+                                    }
+                                }
+                            }
+                        }
                     }
                     
                     AppTextField {
@@ -326,13 +392,24 @@ Page {
                         iconLeft: "+"
                         Layout.fillWidth: true
                         variant: "primary"
+                        function submit() {
+                            backend.addPlayer(pName.text, 0, "", pClub.text)
+                            pName.text = ""
+                            pClub.text = ""
+                            pName.forceActiveFocus()
+                            globalToast.show("Player Added", "Successfully registered to tournament", "success")
+                        }
                         onClicked: {
                             if(pName.text !== "") {
-                                backend.addPlayer(pName.text, 0, "", pClub.text)
-                                pName.text = ""
-                                pClub.text = ""
-                                pName.forceActiveFocus()
-                                globalToast.show("Player Added", "Successfully registered to tournament", "success")
+                                // Check before adding, so a likely duplicate is never registered by accident
+                                var matches = backend.findDuplicates(pName.text, "")
+                                if (matches.length > 0) {
+                                    confirmDuplicate.dialogMessage = "'" + pName.text + "' looks like '" + matches[0].name
+                                        + "' (" + Math.round(matches[0].score * 100) + "% match), who is already registered. Add anyway?"
+                                    confirmDuplicate.open()
+                                } else {
+                                    submit()
+                                }
                             }
                         }
                     }
@@ -518,6 +595,15 @@ Page {
         }
     }
     
+    // Possible Duplicate Confirmation
+    ConfirmDialog {
+        id: confirmDuplicate
+        dialogTitle: "Possible Duplicate"
+        confirmText: "Add Anyway"
+        variant: "warning"
+        onConfirmed: addButton.submit()
+    }
+    
     // Edit Tournament
     EditTournamentDialog {
         id: editTournamentDialog
@@ -0,0 +1,198 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Layouts 1.15
+import "../design"
+
+Dialog {
+    id: diagnosticsPanel
+
+    x: parent ? (parent.width - width) / 2 : 0
+    y: parent ? (parent.height - height) / 2 : 0
+    width: ScaleManager.scaleSize(900)
+    height: ScaleManager.scaleSize(600)
+    modal: true
+    parent: Overlay.overlay
+    closePolicy: Popup.CloseOnEscape
+
+    onOpened: backend.refreshDiagnostics()
+
+    // Refresh while open
+    Timer {
+        interval: 2000
+        repeat: true
+        running: diagnosticsPanel.visible
+        onTriggered: tabs.currentIndex === 1 ? backend.refreshLog() : backend.refreshDiagnostics()
+    }
+
+    background: Rectangle {
+        color: Colors.surfaceElevated
+        radius: ScaleManager.scaleRadius(Spacing.radiusLg)
+        border.color: Colors.border
+        border.width: Spacing.borderThin
+    }
+
+    contentItem: ColumnLayout {
+        spacing: ScaleManager.scaleSpacing(Spacing.md)
+
+        // Title & Actions
+        RowLayout {
+            Layout.fillWidth: true
+            spacing: ScaleManager.scaleSpacing(Spacing.md)
+
+            Text {
+                text: "Diagnostics"
+                color: Colors.textPrimary
+                font.family: Typography.primary
+                font.pixelSize: ScaleManager.scaleFontSize(Typography.h3)
+                font.weight: Typography.bold
+                Layout.fillWidth: true
+            }
+
+            AppButton {
+                text: "Reset"
+                variant: "ghost"
+                onClicked: backend.resetDiagnostics()
+            }
+
+            AppButton {
+                text: "Save Report"
+                variant: "secondary"
+                onClicked: backend.dumpDiagnostics("")
+            }
+
+            AppButton {
+                text: "Close"
+                variant: "ghost"
+                onClicked: diagnosticsPanel.close()
+            }
+        }
+
+        // Profiling (files go to the app folder)
+        RowLayout {
+            Layout.fillWidth: true
+            spacing: ScaleManager.scaleSpacing(Spacing.md)
+
+            AppButton {
+                text: backend && backend.cpuProfiling ? "Stop CPU Profile" : "Start CPU Profile"
+                variant: backend && backend.cpuProfiling ? "danger" : "secondary"
+                onClicked: backend.cpuProfiling ? backend.stopCpuProfile() : backend.startCpuProfile()
+            }
+
+            AppButton {
+                text: backend && backend.memoryTracing ? "Stop Memory Trace" : "Start Memory Trace"
+                variant: backend && backend.memoryTracing ? "danger" : "secondary"
+                onClicked: backend.memoryTracing ? backend.stopMemoryTrace() : backend.startMemoryTrace()
+            }
+
+            AppButton {
+                text: "Memory Snapshot"
+                variant: "ghost"
+                enabled: backend && backend.memoryTracing
+                onClicked: backend.takeMemorySnapshot()
+            }
+
+            Item { Layout.fillWidth: true }
+        }
+
+        TabBar {
+            id: tabs
+            Layout.fillWidth: true
+            TabButton { text: "Actions" }
+            TabButton { text: "Log" }
+            onCurrentIndexChanged: if (currentIndex === 1) backend.refreshLog()
+        }
+
+        StackLayout {
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            currentIndex: tabs.currentIndex
+
+            ColumnLayout {
+                spacing: ScaleManager.scaleSpacing(Spacing.sm)
+
+                // Header
+                RowLayout {
+                    Layout.fillWidth: true
+                    spacing: ScaleManager.scaleSpacing(Spacing.sm)
+
+                    Repeater {
+                        model: ["Action", "Calls", "Mean ms", "p95 ms", "Max ms", "SQL", "Rows"]
+                        Text {
+                            text: modelData
+                            color: Colors.textTertiary
+                            font.family: Typography.primary
+                            font.pixelSize: ScaleManager.scaleFontSize(Typography.tiny)
+                            font.weight: Typography.bold
+                            Layout.fillWidth: index === 0
+                            Layout.preferredWidth: index === 0 ? -1 : ScaleManager.scaleSize(80)
+                            horizontalAlignment: index === 0 ? Text.AlignLeft : Text.AlignRight
+                        }
+                    }
+                }
+
+                // Actions, slowest total first
+                ListView {
+                    Layout.fillWidth: true
+                    Layout.fillHeight: true
+                    clip: true
+                    model: backend ? backend.diagnostics : []
+
+                    delegate: Column {
+                        width: ListView.view.width
+
+                        RowLayout {
+                            width: parent.width
+                            spacing: ScaleManager.scaleSpacing(Spacing.sm)
+
+                            Repeater {
+                                model: [modelData.name, modelData.calls, modelData.mean_ms, modelData.p95_ms,
+                                        modelData.max_ms, modelData.statements, modelData.rows]
+                                Text {
+                                    text: modelData
+                                    color: Colors.textPrimary
+                                    font.family: index === 0 ? Typography.primary : Typography.mono
+                                    font.pixelSize: ScaleManager.scaleFontSize(Typography.small)
+                                    elide: Text.ElideRight
+                                    Layout.fillWidth: index === 0
+                                    Layout.preferredWidth: index === 0 ? -1 : ScaleManager.scaleSize(80)
+                                    horizontalAlignment: index === 0 ? Text.AlignLeft : Text.AlignRight
+                                }
+                            }
+                        }
+
+                        // N+1 findings
+                        Repeater {
+                            model: modelData.n_plus_one
+                            Text {
+                                width: parent.width
+                                text: "⚠ " + modelData.count + "× " + modelData.sql
+                                color: Colors.warning
+                                font.family: Typography.mono
+                                font.pixelSize: ScaleManager.scaleFontSize(Typography.tiny)
+                                elide: Text.ElideRight
+                            }
+                        }
+                    }
+                }
+            }
+
+            // Recent log records, newest at the bottom
+            ListView {
+                id: logView
+                clip: true
+                model: backend ? backend.logRecords : []
+                onCountChanged: positionViewAtEnd()
+
+                delegate: Text {
+                    width: ListView.view.width
+                    text: modelData.time + "  " + modelData.level + "  " + modelData.logger + ": " + modelData.message
+                    color: modelData.level === "ERROR" || modelData.level === "CRITICAL" ? Colors.danger :
+                           modelData.level === "WARNING" ? Colors.warning : Colors.textSecondary
+                    font.family: Typography.mono
+                    font.pixelSize: ScaleManager.scaleFontSize(Typography.tiny)
+                    wrapMode: Text.WrapAnywhere
+                }
+            }
+        }
+    }
+}
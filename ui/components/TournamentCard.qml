@@ -20,6 +20,9 @@ AppCard {
     property int tTotalRounds: 5
     property int tId: -1
     property string tVenue: ""
+    property int tPlayerCount: 0
+    property int tPendingResults: 0
+    property bool tArchived: false  // In the archive: can't be opened or deleted until restored
     
     signal cardClicked(int tid)
     signal deleteClicked(int tid)
@@ -49,7 +52,7 @@ AppCard {
             
             // Status with dot indicator
             AppBadge {
-                text: tStatus
+                text: tArchived ? "ARCHIVED" : tStatus
                 variant: getStatusVariant()
                 showDot: tStatus === "ACTIVE"
                 pulse: tStatus === "ACTIVE"
@@ -110,7 +113,7 @@ AppCard {
             RowLayout {
                 Layout.fillWidth: true
                 Text {
-                    text: "Progress"
+                    text: tPlayerCount + " players" + (tPendingResults > 0 ? " · " + tPendingResults + " results pending" : "")
                     color: Colors.textSecondary
                     font.family: Typography.primary
                     font.pixelSize: ScaleManager.scaleFontSize(Typography.small)
@@ -156,6 +159,7 @@ AppCard {
         }
 
         IconButton {
+            visible: !tArchived
             btnIcon: "×"
             btnVariant: "danger"
             btnSize: "md"